@@ -3,10 +3,12 @@
 from authorization.client import AuthorizationClient
 from authorization.exceptions import (
     AuthorizationClientError,
+    BatchChunkError,
     ConfigurationError,
     NotFoundError,
     ParseError,
     ServiceUnavailableError,
+    TransportError,
     UnexpectedError,
     ValidationError,
 )
@@ -31,6 +33,8 @@ from authorization.models import (
     PermissionCheckResponse,
     PermissionEntry,
     RelationMetadata,
+    ResourceAccessEntry,
+    ResourceAccessList,
     ResourceListItem,
     ResourceListResponse,
     ResourceObject,
@@ -55,6 +59,7 @@ __all__ = [
     "AuthorizationClient",
     "AuthorizationClientError",
     "AuthorizationModelMetadata",
+    "BatchChunkError",
     "BatchError",
     "BatchOperation",
     "BatchOperationModel",
@@ -78,6 +83,8 @@ __all__ = [
     "PermissionCheckResponse",
     "PermissionEntry",
     "RelationMetadata",
+    "ResourceAccessEntry",
+    "ResourceAccessList",
     "ResourceListItem",
     "ResourceListResponse",
     "ResourceObject",
@@ -88,6 +95,7 @@ __all__ = [
     "SetParentsRequestModel",
     "SigV4Transport",
     "StructuralRelationMetadata",
+    "TransportError",
     "TypeMetadata",
     "UnexpectedError",
     "UpdateResourceRequest",
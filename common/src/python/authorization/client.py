@@ -5,9 +5,12 @@ import logging
 import math
 import re
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from authorization.concurrency import AdaptiveLimit
 from authorization.exceptions import (
+    BatchChunkError,
     NotFoundError,
     ParseError,
     UnexpectedError,
@@ -27,6 +30,7 @@ from authorization.models import (
     ParentRelationshipModel,
     PermissionCheckRequest,
     PermissionCheckResponse,
+    ResourceAccessList,
     ResourceListResponse,
     ResourceParents,
     RevokeRequest,
@@ -72,6 +76,7 @@ class AuthorizationClient:
         max_retries: int = 3,
         base_backoff: float = 1.0,
         sleep: Callable[[float], None] | None = None,
+        max_concurrency: int = 1,
     ) -> None:
         """Initialize the authorization client.
 
@@ -81,11 +86,14 @@ class AuthorizationClient:
             base_backoff: Base delay in seconds for exponential backoff.
             sleep: Optional sleep callable for testing. If None, uses
                 time.sleep via the retry module default.
+            max_concurrency: Maximum number of batch chunks in flight.
+                Defaults to 1 (chunks are sent one after another).
         """
         self._transport = transport
         self._max_retries = max_retries
         self._base_backoff = base_backoff
         self._sleep = sleep
+        self._max_concurrency = max(max_concurrency, 1)
 
     def _retry_kwargs(self) -> dict[str, Any]:
         """Build keyword arguments for retry_on_503."""
@@ -323,7 +331,12 @@ class AuthorizationClient:
 
         Splits operations into chunks of at most 100, preserving order,
         and sends each chunk as a separate POST to /grants/batch. Results
-        are aggregated across all chunks.
+        are aggregated across all chunks, in chunk order, and the index of
+        each error is the position of the operation in ``operations``.
+
+        If the client allows more than one chunk in flight, chunks are
+        sent concurrently. Concurrency is reduced while the API responds
+        with 503, and a failing chunk does not stop the other chunks.
 
         Per-operation errors are classified:
         - conflict/not_found: counted as idempotent success
@@ -340,6 +353,9 @@ class AuthorizationClient:
             ValidationError: If the API returns 400 for the batch.
             ServiceUnavailableError: If retries are exhausted on 503.
             UnexpectedError: On other unexpected HTTP errors.
+            TransportError: If a request fails without a response.
+            BatchChunkError: If chunks sent concurrently fail, with the
+                result of the other chunks and the errors per chunk.
         """
         if not operations:
             return BatchResult(total=0, succeeded=0, failed=0, errors=[])
@@ -350,13 +366,70 @@ class AuthorizationClient:
             for i in range(num_chunks)
         ]
 
+        if self._max_concurrency == 1 or num_chunks == 1:
+            return self._aggregate_batch_results(
+                [
+                    self._execute_batch_chunk(chunk, chunk_index)
+                    for chunk_index, chunk in enumerate(chunks)
+                ]
+            )
+
+        return self._execute_batch_chunks(chunks)
+
+    def _execute_batch_chunks(self, chunks: list[list[BatchOperation]]) -> BatchResult:
+        """Execute the batch chunks concurrently and aggregate the results
+        in chunk order.
+
+        Args:
+            chunks: Lists of operations (at most 100 each).
+
+        Returns:
+            Aggregate BatchResult with totals across all chunks.
+
+        Raises:
+            BatchChunkError: If any chunk fails.
+        """
+        limit = AdaptiveLimit(self._max_concurrency)
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_concurrency, len(chunks))
+        ) as pool:
+            futures = [
+                pool.submit(self._execute_batch_chunk, chunk, chunk_index, limit)
+                for chunk_index, chunk in enumerate(chunks)
+            ]
+
+        results: list[BatchResult] = []
+        chunk_errors: dict[int, Exception] = {}
+        failed_operations: list[BatchOperation] = []
+        for chunk_index, future in enumerate(futures):
+            error = future.exception()
+            if error is None:
+                results.append(future.result())
+                continue
+
+            log.error("Batch chunk %d failed: %s", chunk_index, error)
+            chunk_errors[chunk_index] = error  # type: ignore[assignment]
+            failed_operations.extend(chunks[chunk_index])
+
+        result = self._aggregate_batch_results(results)
+        if chunk_errors:
+            raise BatchChunkError(
+                message=(f"{len(chunk_errors)} of {len(chunks)} batch chunks failed"),
+                result=result,
+                chunk_errors=chunk_errors,
+                failed_operations=failed_operations,
+            ) from next(iter(chunk_errors.values()))
+
+        return result
+
+    def _aggregate_batch_results(self, results: list[BatchResult]) -> BatchResult:
+        """Sum the chunk results, keeping the errors in chunk order."""
         total = 0
         succeeded = 0
         failed = 0
         errors: list[BatchError] = []
 
-        for chunk_index, chunk in enumerate(chunks):
-            chunk_result = self._execute_batch_chunk(chunk, chunk_index)
+        for chunk_result in results:
             total += chunk_result.total
             succeeded += chunk_result.succeeded
             failed += chunk_result.failed
@@ -373,12 +446,15 @@ class AuthorizationClient:
         self,
         chunk: list[BatchOperation],
         chunk_index: int,
+        limit: AdaptiveLimit | None = None,
     ) -> BatchResult:
         """Execute a single batch chunk and classify results.
 
         Args:
             chunk: List of operations (at most 100).
             chunk_index: Zero-based index of this chunk for logging.
+            limit: Optional concurrency limit to hold a slot of for each
+                request attempt, so that retry backoff does not hold one.
 
         Returns:
             BatchResult for this chunk with classified outcomes.
@@ -405,7 +481,17 @@ class AuthorizationClient:
                 body=body,
             )
 
-        response = retry_on_503(do_request, **self._retry_kwargs())
+        def do_limited_request() -> HttpResponse:
+            assert limit is not None
+            with limit.slot():
+                response = do_request()
+            limit.record(response.status_code)
+            return response
+
+        response = retry_on_503(
+            do_limited_request if limit is not None else do_request,
+            **self._retry_kwargs(),
+        )
 
         if response.status_code == 400:
             error_resp = self._parse_error_response(response)
@@ -454,10 +540,12 @@ class AuthorizationClient:
             chunk_index: Zero-based chunk index for logging.
 
         Returns:
-            A new BatchResult with adjusted counts.
+            A new BatchResult with adjusted counts, and error indexes
+            offset by the position of the chunk in the batch.
         """
         idempotent_count = 0
         real_errors: list[BatchError] = []
+        offset = chunk_index * _BATCH_CHUNK_SIZE
 
         for error in raw_result.errors:
             if error.error in _IDEMPOTENT_ERROR_CODES:
@@ -469,7 +557,9 @@ class AuthorizationClient:
                     error.error,
                 )
             else:
-                real_errors.append(error)
+                real_errors.append(
+                    error.model_copy(update={"index": offset + error.index})
+                )
                 if error.error in _RETRIABLE_ERROR_CODES:
                     log.warning(
                         "Batch chunk %d operation %d: retriable error (%s)",
@@ -789,6 +879,94 @@ class AuthorizationClient:
             message=error_msg,
         )
 
+    def get_resource_access(
+        self,
+        resource_type: str,
+        resource_id: str,
+        relation_filter: str | None = None,
+    ) -> ResourceAccessList:
+        """Get the users with access to a resource.
+
+        Sends a GET request to /resources/{type}/{resourceId}/access
+        with an optional relation filter.
+
+        Args:
+            resource_type: The type of resource.
+            resource_id: The resource identifier.
+            relation_filter: Optional relation to filter by.
+
+        Returns:
+            ResourceAccessList with each user's relation and whether the
+            access is direct, inherited, or both.
+
+        Raises:
+            ValidationError: If the API returns 400.
+            NotFoundError: If the resource is not found (404).
+            ServiceUnavailableError: If retries are exhausted on 503.
+            UnexpectedError: On other unexpected HTTP errors.
+            ParseError: If the response body cannot be parsed.
+        """
+        path = f"/resources/{resource_type}/{resource_id}/access"
+        query_params: dict[str, str] = {}
+        if relation_filter is not None:
+            query_params["relation"] = relation_filter
+
+        def do_request() -> HttpResponse:
+            return self._transport.request(
+                method="GET",
+                path=path,
+                body=None,
+                query_params=query_params or None,
+            )
+
+        response = retry_on_503(do_request, **self._retry_kwargs())
+
+        if response.status_code == 200:
+            log.debug(
+                "Get resource access succeeded: type=%s, resource=%s",
+                resource_type,
+                resource_id,
+            )
+            try:
+                return ResourceAccessList.model_validate_json(response.body)
+            except Exception as exc:
+                raise ParseError(
+                    message=f"Failed to parse get resource access response: {exc}",
+                    raw_content=response.body,
+                ) from exc
+
+        if response.status_code == 400:
+            error_resp = self._parse_error_response(response)
+            log.error(
+                "Get resource access validation error: %s",
+                error_resp.message,
+            )
+            raise ValidationError(
+                message=error_resp.message,
+                details=error_resp.details,
+            )
+
+        if response.status_code == 404:
+            log.debug(
+                "Resource not found: type=%s, resource=%s",
+                resource_type,
+                resource_id,
+            )
+            raise NotFoundError(
+                message=(f"Resource not found: type={resource_type}, id={resource_id}"),
+            )
+
+        error_msg = self._extract_error_message(response)
+        log.error(
+            "Get resource access unexpected error %d: %s",
+            response.status_code,
+            error_msg,
+        )
+        raise UnexpectedError(
+            status_code=response.status_code,
+            message=error_msg,
+        )
+
     def list_resources(
         self,
         resource_type: str,
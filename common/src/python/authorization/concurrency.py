@@ -0,0 +1,75 @@
+"""Adaptive concurrency limit for concurrent Authorization API requests."""
+
+import logging
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+log = logging.getLogger(__name__)
+
+
+class AdaptiveLimit:
+    """Limit on concurrent requests that backs off when the API is overloaded.
+
+    The limit starts at the maximum. It is halved when a request receives
+    a 503 response, and grows by one after a number of consecutive
+    successful requests, up to the maximum (additive increase,
+    multiplicative decrease).
+
+    Instances are thread-safe.
+    """
+
+    def __init__(self, maximum: int, increase_after: int = 5) -> None:
+        """Initialize the limit.
+
+        Args:
+            maximum: Maximum number of concurrent requests.
+            increase_after: Number of consecutive successful requests
+                after which the limit grows by one.
+        """
+        self._maximum = max(maximum, 1)
+        self._increase_after = increase_after
+        self._limit = self._maximum
+        self._in_flight = 0
+        self._successes = 0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """The current concurrency limit."""
+        with self._condition:
+            return self._limit
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Context manager that holds one of the concurrent request slots,
+        waiting until one is available."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight < self._limit)
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def record(self, status_code: int) -> None:
+        """Adjust the limit for the status code of a response.
+
+        Args:
+            status_code: HTTP status code of the response.
+        """
+        with self._condition:
+            if status_code == 503:
+                self._successes = 0
+                if self._limit > 1:
+                    self._limit = max(self._limit // 2, 1)
+                    log.warning("Received 503, reducing concurrency to %d", self._limit)
+                return
+
+            self._successes += 1
+            if self._successes >= self._increase_after and self._limit < self._maximum:
+                self._successes = 0
+                self._limit += 1
+                self._condition.notify_all()
@@ -1,5 +1,7 @@
 """Exception hierarchy for the authorization client library."""
 
+from authorization.models import BatchOperation, BatchResult
+
 
 class AuthorizationClientError(Exception):
     """Base exception for authorization client errors."""
@@ -18,6 +20,11 @@ class ValidationError(AuthorizationClientError):
         self.details = details
 
 
+class TransportError(AuthorizationClientError):
+    """Raised when a request cannot be sent or no response is received
+    (e.g., a connection error or timeout)."""
+
+
 class ServiceUnavailableError(AuthorizationClientError):
     """Raised when retries are exhausted on 503."""
 
@@ -46,3 +53,25 @@ class ParseError(AuthorizationClientError):
         super().__init__(message)
         self.message = message
         self.raw_content = raw_content
+
+
+class BatchChunkError(AuthorizationClientError):
+    """Raised when one or more chunks of a concurrent batch fail.
+
+    The chunks that succeeded are still applied. Their aggregate result is
+    available as ``result``, and the failures are reported per chunk so
+    that the failed operations can be resubmitted.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        result: BatchResult,
+        chunk_errors: dict[int, Exception],
+        failed_operations: list[BatchOperation],
+    ) -> None:
+        super().__init__(message)
+        self.message = message
+        self.result = result
+        self.chunk_errors = chunk_errors
+        self.failed_operations = failed_operations
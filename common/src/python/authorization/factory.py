@@ -10,6 +10,7 @@ def create_authorization_client(
     max_retries: int = 3,
     base_backoff: float = 1.0,
     timeout: float = 30.0,
+    max_concurrency: int = 4,
 ) -> AuthorizationClient:
     """Create an AuthorizationClient with SigV4 transport.
 
@@ -18,6 +19,8 @@ def create_authorization_client(
         max_retries: Maximum retry attempts on 503 responses.
         base_backoff: Base delay in seconds for exponential backoff.
         timeout: HTTP request timeout in seconds. Defaults to 30.
+        max_concurrency: Maximum number of batch chunks in flight.
+            Defaults to 4.
 
     Returns:
         A configured AuthorizationClient instance.
@@ -28,9 +31,12 @@ def create_authorization_client(
     if not base_url:
         raise ConfigurationError("Authorization API base URL is required")
 
-    transport = SigV4Transport(base_url=base_url, timeout=timeout)
+    transport = SigV4Transport(
+        base_url=base_url, timeout=timeout, pool_size=max(max_concurrency, 10)
+    )
     return AuthorizationClient(
         transport=transport,
         max_retries=max_retries,
         base_backoff=base_backoff,
+        max_concurrency=max_concurrency,
     )
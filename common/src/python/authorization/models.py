@@ -226,6 +226,29 @@ class ResourceParents(BaseModel):
     resource: ResourceObject | None = None
 
 
+class ResourceAccessEntry(BaseModel):
+    """A single user with access to a resource."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    user_id: str = Field(alias="userId")
+    relation: str
+    access: Literal["direct", "inherited", "both"] | None = None
+    inherited_from: InheritanceSource | None = Field(
+        default=None, alias="inheritedFrom"
+    )
+
+
+class ResourceAccessList(BaseModel):
+    """Response model for the users with access to a resource."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    type: str
+    resource_id: str = Field(alias="resourceId")
+    users: list[ResourceAccessEntry]
+
+
 class HealthResult(BaseModel):
     """Response model for the health check endpoint."""
 
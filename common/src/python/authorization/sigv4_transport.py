@@ -1,17 +1,26 @@
 """SigV4-signed HTTP transport for the Authorization API."""
 
+import hashlib
+import hmac
 import logging
-import urllib.error
-import urllib.request
+import threading
 from dataclasses import dataclass
+from typing import Any
 from urllib.parse import urlencode
 
 from botocore.auth import SigV4Auth
 from botocore.awsrequest import AWSRequest
+from botocore.credentials import ReadOnlyCredentials
 from botocore.session import Session
+from requests import RequestException
+from utils.http_session import HTTPSessionConfig, create_session
+
+from authorization.exceptions import TransportError
 
 log = logging.getLogger(__name__)
 
+SERVICE_NAME = "execute-api"
+
 
 @dataclass(frozen=True)
 class _Response:
@@ -21,6 +30,39 @@ class _Response:
     body: bytes
 
 
+class _CachingSigV4Auth(SigV4Auth):
+    """SigV4 signer that reuses the derived signing key.
+
+    The signing key depends only on the secret key, the date, the region
+    and the service, so it is derived once per day rather than with four
+    HMACs on every request. An instance is used for a single set of
+    frozen credentials.
+    """
+
+    def __init__(self, credentials: ReadOnlyCredentials, region_name: str) -> None:
+        super().__init__(credentials, SERVICE_NAME, region_name)
+        self._region = region_name
+        self._signing_key: tuple[str, bytes] | None = None
+
+    def signature(self, string_to_sign: str, request: Any) -> str:
+        date = request.context["timestamp"][0:8]
+        signing_key = self._signing_key
+        if signing_key is None or signing_key[0] != date:
+            key = f"AWS4{self.credentials.secret_key}".encode()
+            for part in (date, self._region, SERVICE_NAME, "aws4_request"):
+                key = _hmac(key, part).digest()
+            signing_key = (date, key)
+            # a single assignment, so concurrent requests see either key
+            self._signing_key = signing_key
+
+        return _hmac(signing_key[1], string_to_sign).hexdigest()
+
+
+def _hmac(key: bytes, message: str) -> hmac.HMAC:
+    """Return the SHA256 HMAC of the message."""
+    return hmac.new(key, message.encode("utf-8"), hashlib.sha256)
+
+
 class SigV4Transport:
     """HTTP transport that signs requests with AWS SigV4.
 
@@ -28,6 +70,10 @@ class SigV4Transport:
     shared credentials file, IAM role, etc.) to sign requests against
     the ``execute-api`` service.
 
+    Requests are sent over a pooled session, so connections are kept
+    alive across requests, and the transport may be used from multiple
+    threads. The signer is reused until the credentials are refreshed.
+
     This class satisfies the ``HttpTransport`` protocol via structural
     subtyping — no explicit inheritance is needed.
     """
@@ -37,6 +83,7 @@ class SigV4Transport:
         base_url: str,
         region: str | None = None,
         timeout: float = 30.0,
+        pool_size: int = 10,
     ) -> None:
         """Initialize the SigV4 transport.
 
@@ -47,6 +94,9 @@ class SigV4Transport:
                 is resolved from the botocore session (environment or
                 config file).
             timeout: Request timeout in seconds. Defaults to 30 seconds.
+            pool_size: Max number of connections kept alive, should be at
+                least the number of threads sending requests. Defaults
+                to 10.
         """
         self._base_url = base_url.rstrip("/")
         self._session = Session()
@@ -56,6 +106,20 @@ class SigV4Transport:
             raise RuntimeError("Unable to resolve AWS credentials for SigV4 signing")
         self._credentials = credentials
         self._timeout = timeout
+        self._signer_lock = threading.Lock()
+        self._signer: _CachingSigV4Auth | None = None
+
+        # 503 responses are retried by the client, so only connection
+        # errors (e.g., a dropped keep-alive connection) are retried here
+        self._http = create_session(
+            HTTPSessionConfig(
+                pool_size=pool_size,
+                max_retries=2,
+                retry_status_codes=(),
+                connect_timeout=timeout,
+                read_timeout=timeout,
+            )
+        )
 
     def request(
         self,
@@ -74,6 +138,10 @@ class SigV4Transport:
 
         Returns:
             An object with ``status_code`` and ``body`` attributes.
+
+        Raises:
+            TransportError: If the request fails without a response, after
+                retrying connection errors.
         """
         url = self._build_url(path, query_params)
 
@@ -88,27 +156,37 @@ class SigV4Transport:
             data=body,
             headers=headers,
         )
-        SigV4Auth(self._credentials, "execute-api", self._region).add_auth(aws_request)
-
-        # Build urllib request with signed headers
-        req = urllib.request.Request(
-            url=url,
-            data=body,
-            headers=dict(aws_request.headers),
-            method=method.upper(),
-        )
+        self._get_signer().add_auth(aws_request)
 
         try:
-            with urllib.request.urlopen(req, timeout=self._timeout) as response:
-                return _Response(
-                    status_code=response.status,
-                    body=response.read(),
-                )
-        except urllib.error.HTTPError as error:
-            return _Response(
-                status_code=error.code,
-                body=error.read(),
+            response = self._http.request(
+                method=method.upper(),
+                url=url,
+                data=body,
+                headers=dict(aws_request.headers),
             )
+        except RequestException as error:
+            raise TransportError(f"{method.upper()} {path} failed: {error}") from error
+
+        return _Response(status_code=response.status_code, body=response.content)
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self._http.close()
+
+    def _get_signer(self) -> _CachingSigV4Auth:
+        """Return the signer for the current credentials.
+
+        Refreshable credentials are frozen for each request, so that a
+        refresh does not change them part way through signing. A new
+        signer is created when the frozen credentials change.
+        """
+        credentials = self._credentials.get_frozen_credentials()
+        with self._signer_lock:
+            if self._signer is None or self._signer.credentials != credentials:
+                self._signer = _CachingSigV4Auth(credentials, self._region)
+
+            return self._signer
 
     def _build_url(
         self,
@@ -42,5 +42,8 @@ class HttpTransport(Protocol):
 
         Returns:
             An HttpResponse with status_code and body.
+
+        Raises:
+            TransportError: If the request fails without a response.
         """
         ...
@@ -6,6 +6,7 @@ from authorization_sync.resource_ids import (
     build_label_for_resource_prefix,
     build_resource_id,
 )
+from authorization_sync.snapshot import GrantSnapshot
 from authorization_sync.sync_service import (
     AuthorizationClientProtocol,
     AuthorizationSyncService,
@@ -22,6 +23,7 @@ __all__ = [
     "AuthorizationClientProtocol",
     "AuthorizationSyncService",
     "DesiredGrant",
+    "GrantSnapshot",
     "build_label_for_resource_prefix",
     "build_resource_id",
     "check_assignable",
@@ -0,0 +1,202 @@
+"""In-memory snapshot of the current grants in the Authorization API.
+
+The snapshot is loaded by paging through the resources of each synced
+type and reading the users with access to each resource, so that a sync
+over the whole user directory reads grants per resource rather than per
+user and type.
+"""
+
+import logging
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Protocol
+
+from authorization.models import ResourceAccessList, ResourceListResponse
+
+from authorization_sync.models import DesiredGrant
+
+log = logging.getLogger(__name__)
+
+# Maximum page size accepted by the list resources endpoint.
+SNAPSHOT_PAGE_SIZE = 100
+
+# Number of resource access reads in flight while loading a snapshot.
+SNAPSHOT_MAX_WORKERS = 4
+
+
+class SnapshotClientProtocol(Protocol):
+    """Protocol defining the client interface needed to load a snapshot."""
+
+    def list_resources(
+        self,
+        resource_type: str,
+        parent_type: str | None = None,
+        parent_id: str | None = None,
+        search: str | None = None,
+        limit: int | None = None,
+        next_token: str | None = None,
+    ) -> ResourceListResponse: ...
+
+    def get_resource_access(
+        self,
+        resource_type: str,
+        resource_id: str,
+        relation_filter: str | None = None,
+    ) -> ResourceAccessList: ...
+
+
+class GrantSnapshot:
+    """Index of the direct grants in the Authorization API by user and
+    resource.
+
+    Inherited access is not included, since it is not granted to the
+    user and cannot be revoked from the user.
+    """
+
+    def __init__(self, grants: Iterable[DesiredGrant] = ()) -> None:
+        """Initialize the index with the grants.
+
+        Args:
+            grants: The grants held by users.
+        """
+        self._grants: dict[str, dict[tuple[str, str], set[str]]] = defaultdict(
+            lambda: defaultdict(set)
+        )
+        self._count = 0
+        for grant in grants:
+            self.add(grant)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, grant: DesiredGrant) -> None:
+        """Add a grant to the index.
+
+        Args:
+            grant: The grant held by the user.
+        """
+        relations = self._grants[grant.user_id][
+            (grant.resource_type, grant.resource_id)
+        ]
+        if grant.relation not in relations:
+            relations.add(grant.relation)
+            self._count += 1
+
+    def users(self) -> set[str]:
+        """Return the IDs of the users holding grants."""
+        return set(self._grants)
+
+    def grants_for(self, user_id: str) -> set[DesiredGrant]:
+        """Return the grants held by the user.
+
+        Args:
+            user_id: The user's registry ID.
+
+        Returns:
+            The set of grants, empty if the user holds none.
+        """
+        resources = self._grants.get(user_id, {})
+        return {
+            DesiredGrant(
+                user_id=user_id,
+                resource_type=resource_type,
+                resource_id=resource_id,
+                relation=relation,
+            )
+            for (resource_type, resource_id), relations in resources.items()
+            for relation in relations
+        }
+
+    @classmethod
+    def load(
+        cls,
+        client: SnapshotClientProtocol,
+        resource_types: Iterable[str],
+        max_workers: int = SNAPSHOT_MAX_WORKERS,
+    ) -> "GrantSnapshot":
+        """Load the grants on all resources of the types.
+
+        Args:
+            client: The authorization client for API calls.
+            resource_types: The resource types to load grants for.
+            max_workers: The number of resource access reads in flight.
+
+        Returns:
+            The snapshot of the direct grants.
+
+        Raises:
+            AuthorizationClientError: If a read fails, after which the
+                remaining reads are cancelled.
+        """
+        resources = [
+            (resource_type, resource_id)
+            for resource_type in sorted(resource_types)
+            for resource_id in _list_resource_ids(client, resource_type)
+        ]
+
+        def read_access(resource: tuple[str, str]) -> ResourceAccessList:
+            resource_type, resource_id = resource
+            return client.get_resource_access(
+                resource_type=resource_type, resource_id=resource_id
+            )
+
+        snapshot = cls()
+        with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as pool:
+            futures = {
+                pool.submit(read_access, resource): resource for resource in resources
+            }
+            try:
+                for future in as_completed(futures):
+                    resource_type, resource_id = futures[future]
+                    for entry in future.result().users:
+                        if entry.access == "inherited":
+                            continue
+
+                        snapshot.add(
+                            DesiredGrant(
+                                user_id=entry.user_id,
+                                resource_type=resource_type,
+                                resource_id=resource_id,
+                                relation=entry.relation,
+                            )
+                        )
+            except BaseException:
+                # the snapshot is discarded, so skip the remaining reads
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+
+        log.info(
+            "Loaded snapshot of %d grants for %d users on %d resources",
+            len(snapshot),
+            len(snapshot.users()),
+            len(resources),
+        )
+        return snapshot
+
+
+def _list_resource_ids(
+    client: SnapshotClientProtocol, resource_type: str
+) -> Iterator[str]:
+    """Page through the IDs of the resources of the type.
+
+    Args:
+        client: The authorization client for API calls.
+        resource_type: The resource type.
+
+    Returns:
+        Iterator over the resource IDs.
+    """
+    next_token: str | None = None
+    while True:
+        page = client.list_resources(
+            resource_type=resource_type,
+            limit=SNAPSHOT_PAGE_SIZE,
+            next_token=next_token,
+        )
+        for item in page.resources:
+            yield item.resource_id
+
+        next_token = page.next_token
+        if not next_token:
+            return
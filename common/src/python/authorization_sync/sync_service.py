@@ -2,9 +2,10 @@
 operations."""
 
 import logging
+import threading
 from typing import Protocol
 
-from authorization.exceptions import AuthorizationClientError
+from authorization.exceptions import AuthorizationClientError, BatchChunkError
 from authorization.models import (
     AuthorizationModelMetadata,
     BatchOperation,
@@ -24,6 +25,7 @@ from users.event_models import (
 from users.user_entry import UserEntry
 
 from authorization_sync.models import DesiredGrant
+from authorization_sync.snapshot import GrantSnapshot, SnapshotClientProtocol
 from authorization_sync.translator import (
     ACTIVITY_RELATION_MAP,
     translate,
@@ -43,7 +45,7 @@ _SYNC_RESOURCE_TYPES: frozenset[str] = frozenset(
 )
 
 
-class AuthorizationClientProtocol(Protocol):
+class AuthorizationClientProtocol(SnapshotClientProtocol, Protocol):
     """Protocol defining the client interface needed by the sync service."""
 
     def get_user_permissions(
@@ -69,7 +71,15 @@ class AuthorizationClientProtocol(Protocol):
 
 class AuthorizationSyncService:
     """Orchestrates the query-diff-apply cycle for user grant
-    synchronization."""
+    synchronization.
+
+    By default each call to sync_user queries the user's current grants
+    and applies the diff. In a bulk sync, started with start_bulk_sync,
+    the current grants of all users are loaded once into a snapshot,
+    sync_user only collects the desired grants, and finish_bulk_sync
+    diffs each user against the snapshot and applies all changes as one
+    batch.
+    """
 
     def __init__(
         self,
@@ -84,6 +94,9 @@ class AuthorizationSyncService:
         """
         self._client = client
         self._collector = collector
+        self._lock = threading.Lock()
+        self._snapshot: GrantSnapshot | None = None
+        self._pending: dict[str, set[DesiredGrant]] = {}
 
     def validate_model(self) -> None:
         """Validate the activity-relation map against the live model.
@@ -134,6 +147,9 @@ class AuthorizationSyncService:
         grants from the API, computes the diff, and applies changes via
         batch.
 
+        During a bulk sync, the desired grants are collected instead, and
+        the changes are applied by finish_bulk_sync.
+
         Catches all AuthorizationClientError exceptions and reports via
         the event collector without raising.
 
@@ -149,6 +165,8 @@ class AuthorizationSyncService:
                 authorizations=authorizations,
                 center_group_id=center_group_id,
             )
+            if self._collect_desired(registry_id, desired):
+                return
 
             # Query current permissions per type (type is required per ADR-015)
             current: set[DesiredGrant] = set()
@@ -194,6 +212,118 @@ class AuthorizationSyncService:
             )
             self._report_failure(registry_id, "sync", error)
 
+    def start_bulk_sync(self) -> bool:
+        """Start a bulk sync by loading a snapshot of the current grants.
+
+        If the snapshot cannot be loaded for any reason, users continue to
+        be synced individually.
+
+        Returns:
+            True if the bulk sync was started, False otherwise.
+        """
+        try:
+            snapshot = GrantSnapshot.load(self._client, _SYNC_RESOURCE_TYPES)
+        except Exception as error:
+            log.warning(
+                "Could not load grant snapshot, syncing users individually: %s",
+                error,
+            )
+            return False
+
+        with self._lock:
+            self._snapshot = snapshot
+            self._pending = {}
+
+        return True
+
+    def finish_bulk_sync(self) -> None:
+        """Apply the grant changes collected during a bulk sync.
+
+        Each user synced since start_bulk_sync is diffed against the
+        snapshot, using the desired grants from all of the user's
+        sync_user calls, and the changes for all users are submitted as
+        one batch. Users that were not synced are not changed.
+
+        Catches all exceptions, since this runs after the users are
+        processed, and reports them via the event collector without
+        raising. Does nothing if no bulk sync was started.
+        """
+        with self._lock:
+            snapshot = self._snapshot
+            pending = self._pending
+            self._snapshot = None
+            self._pending = {}
+
+        if snapshot is None:
+            return
+
+        operations: list[BatchOperation] = []
+        num_added = 0
+        num_revoked = 0
+        for registry_id, desired in pending.items():
+            current = snapshot.grants_for(registry_id)
+            grants_to_add = desired - current
+            grants_to_revoke = current - desired
+            num_added += len(grants_to_add)
+            num_revoked += len(grants_to_revoke)
+            operations.extend(g.to_batch_op("grant") for g in grants_to_add)
+            operations.extend(g.to_batch_op("revoke") for g in grants_to_revoke)
+
+        if not operations:
+            log.info("No grant changes needed for %d users", len(pending))
+            return
+
+        try:
+            result = self._client.batch(operations)
+        except BatchChunkError as error:
+            for registry_id in sorted(
+                {operation.user_id for operation in error.failed_operations}
+            ):
+                self._report_failure(registry_id, "sync", error)
+            result = error.result
+        except Exception as error:
+            log.error("Authorization bulk sync failed: %s", error)
+            for registry_id in sorted({operation.user_id for operation in operations}):
+                self._report_failure(registry_id, "sync", error)
+            return
+
+        for batch_error in result.errors:
+            registry_id = (
+                operations[batch_error.index].user_id
+                if 0 <= batch_error.index < len(operations)
+                else ""
+            )
+            self._report_batch_error(registry_id, batch_error.message)
+
+        log.info(
+            "Authorization bulk sync for %d users: %d added, %d revoked, %d failed",
+            len(pending),
+            num_added,
+            num_revoked,
+            result.failed,
+        )
+
+    def _collect_desired(
+        self,
+        registry_id: str,
+        desired: set[DesiredGrant],
+    ) -> bool:
+        """Collect the desired grants for the user during a bulk sync.
+
+        Args:
+            registry_id: The user's registry ID.
+            desired: The desired grants for the user.
+
+        Returns:
+            True if a bulk sync is active, False otherwise.
+        """
+        with self._lock:
+            if self._snapshot is None:
+                return False
+
+            self._pending.setdefault(registry_id, set()).update(desired)
+            return True
+
     def sync_profile(
         self,
         registry_id: str,
@@ -271,13 +401,22 @@ class AuthorizationSyncService:
             result: The batch result containing error details.
         """
         for error in result.errors:
-            event = UserProcessEvent(
-                event_type=EventType.ERROR,
-                category=EventCategory.AUTHORIZATION_SYNC,
-                user_context=UserContext(
-                    registry_id=registry_id,
-                    email="",
-                ),
-                message=(f"Authorization sync batch operation failed: {error.message}"),
-            )
-            self._collector.collect(event)
+            self._report_batch_error(registry_id, error.message)
+
+    def _report_batch_error(self, registry_id: str, message: str) -> None:
+        """Report a failed batch operation via the event collector.
+
+        Args:
+            registry_id: The user's registry ID.
+            message: The error message for the operation.
+        """
+        event = UserProcessEvent(
+            event_type=EventType.ERROR,
+            category=EventCategory.AUTHORIZATION_SYNC,
+            user_context=UserContext(
+                registry_id=registry_id,
+                email="",
+            ),
+            message=(f"Authorization sync batch operation failed: {message}"),
+        )
+        self._collector.collect(event)
@@ -174,3 +174,59 @@ class CenterMapInfo(BaseModel):
             for center in [self.centers.get(key) for key in keys if key in self.centers]
             if center.active  # type: ignore
         }
+
+
+class PipelineCenterInfo(BaseModel):
+    """Represents the center for an ingest pipeline ADCID.
+
+    Attributes:
+        adcid (int): The ADC ID of the center.
+        group (str): The symbolic ID for the center
+    """
+
+    adcid: int
+    group: str
+
+
+class PipelineRegistryInfo(BaseModel):
+    """Represents the pipeline ADCID registry in nacc/metadata project.
+
+    Maps each ingest pipeline ADCID to the center that owns the pipeline.
+    The version is incremented each time the registry is recomputed.
+
+    Attributes:
+        version (int): The version of the registry.
+        pipelines (Dict[str, PipelineCenterInfo]): map of pipeline ADCID to center
+    """
+
+    version: int = 0
+    pipelines: Dict[str, PipelineCenterInfo] = {}
+
+    def add(self, pipeline_adcid: int, center_info: PipelineCenterInfo) -> None:
+        """Adds the center for the pipeline ADCID to the registry.
+
+        Keeps the first center added for a pipeline ADCID.
+
+        Args:
+            pipeline_adcid: the pipeline ADCID
+            center_info: the center for the pipeline
+        """
+        self.pipelines.setdefault(str(pipeline_adcid), center_info)
+
+    def get(self, pipeline_adcid: int) -> Optional[PipelineCenterInfo]:
+        """Gets the center for the pipeline ADCID.
+
+        Args:
+            pipeline_adcid: the pipeline ADCID
+        Returns:
+            the center for the pipeline. None if no center is found.
+        """
+        return self.pipelines.get(str(pipeline_adcid), None)
+
+    def get_pipeline_adcids(self) -> List[int]:
+        """Returns the list of all pipeline ADCIDs.
+
+        Returns:
+          the list of pipeline ADCIDs
+        """
+        return [int(adcid) for adcid in self.pipelines]
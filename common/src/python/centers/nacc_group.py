@@ -11,10 +11,18 @@ from redcap_api.redcap_repository import REDCapParametersRepository
 
 from centers.center_adaptor import CenterAdaptor
 from centers.center_group import CenterGroup, CenterMetadata
-from centers.center_info import CenterInfo, CenterMapInfo
+from centers.center_info import (
+    CenterInfo,
+    CenterMapInfo,
+    PipelineCenterInfo,
+    PipelineRegistryInfo,
+)
 
 log = logging.getLogger(__name__)
 
+# key for the pipeline ADCID registry in the metadata project info
+PIPELINE_REGISTRY_KEY = "pipeline-registry"
+
 
 class LegacyModuleInfo(BaseModel):
     """Represents information about a legacy module in nacc/metadata project.
@@ -35,6 +43,7 @@ class NACCGroup(CenterAdaptor):
         super().__init__(group=group, proxy=proxy)
         self.__admin_project: Optional[ProjectAdaptor] = None
         self.__redcap_param_repo: Optional[REDCapParametersRepository] = None
+        self.__pipeline_registry: Optional[PipelineRegistryInfo] = None
 
     @classmethod
     def create(cls, *, proxy: FlywheelProxy, group_id: str = "nacc") -> "NACCGroup":
@@ -181,8 +190,17 @@ class NACCGroup(CenterAdaptor):
         if not center_info:
             return None
 
-        group_id = center_info.group
-        group = self._fw.find_group(group_id=str(group_id))
+        return self.__create_center_group(str(center_info.group))
+
+    def __create_center_group(self, group_id: str) -> Optional[CenterGroup]:
+        """Returns the center group for the given group ID.
+
+        Args:
+            group_id: the ID of the center group
+        Returns:
+            The CenterGroup for the center. None if no group is found.
+        """
+        group = self._fw.find_group(group_id=group_id)
         if not group:
             return None
 
@@ -248,14 +266,14 @@ class NACCGroup(CenterAdaptor):
 
         return self.__admin_project
 
-    def get_all_ingest_pipeline_adcids(self) -> List[int]:
-        """Pull list of pipeline ADCIDs by traversing metadata projects for all
-        centers.
+    def __compute_pipeline_registry(self) -> PipelineRegistryInfo:
+        """Computes the pipeline ADCID registry by traversing metadata projects
+        for all centers.
 
         Returns:
-            List[int]: List of pipeline ADCIDs
+            PipelineRegistryInfo: the registry of pipeline ADCIDs
         """
-        pipeline_adcids = []
+        registry = PipelineRegistryInfo()
 
         center_map = self.get_center_map()
         for center in center_map.centers.values():
@@ -276,10 +294,80 @@ class NACCGroup(CenterAdaptor):
             center_metadata: CenterMetadata = center_group.get_project_info()
             for study_metadata in center_metadata.studies.values():
                 for project_info in study_metadata.ingest_projects.values():
-                    if project_info.pipeline_adcid not in pipeline_adcids:
-                        pipeline_adcids.append(project_info.pipeline_adcid)
+                    registry.add(
+                        project_info.pipeline_adcid,
+                        PipelineCenterInfo(adcid=center.adcid, group=center.group),
+                    )
+
+        return registry
+
+    def __read_pipeline_registry(self) -> Optional[PipelineRegistryInfo]:
+        """Reads the pipeline ADCID registry stored in the metadata project.
+
+        Returns:
+            PipelineRegistryInfo: the stored registry, None if not stored or invalid
+        """
+        info = self.get_metadata().get_info()
+        if not info or PIPELINE_REGISTRY_KEY not in info:
+            return None
+
+        try:
+            return PipelineRegistryInfo.model_validate(info[PIPELINE_REGISTRY_KEY])
+        except ValidationError as error:
+            log.error("unable to parse pipeline registry: %s", str(error))
+            return None
+
+    def get_pipeline_registry(self) -> PipelineRegistryInfo:
+        """Returns the pipeline ADCID registry.
 
-        return pipeline_adcids
+        The registry stored in the metadata project is read once and
+        reused for the lifetime of this object. If no registry is stored,
+        the registry is computed from the center metadata projects.
+
+        Returns:
+            PipelineRegistryInfo: the registry of pipeline ADCIDs
+        """
+        if self.__pipeline_registry is None:
+            registry = self.__read_pipeline_registry()
+            if registry is None:
+                log.warning("No stored pipeline registry, reading center metadata")
+                registry = self.__compute_pipeline_registry()
+
+            self.__pipeline_registry = registry
+
+        return self.__pipeline_registry
+
+    def update_pipeline_registry(self) -> PipelineRegistryInfo:
+        """Recomputes the pipeline ADCID registry from the center metadata
+        projects, and stores it in the metadata project with the next
+        version number.
+
+        Should be called whenever center or ingest project metadata changes.
+
+        Returns:
+            PipelineRegistryInfo: the updated registry
+        """
+        stored_registry = self.__read_pipeline_registry()
+        registry = self.__compute_pipeline_registry()
+        registry.version = stored_registry.version + 1 if stored_registry else 1
+
+        self.get_metadata().update_info({PIPELINE_REGISTRY_KEY: registry.model_dump()})
+        log.info(
+            "Updated pipeline registry to version %s with %s pipelines",
+            registry.version,
+            len(registry.pipelines),
+        )
+
+        self.__pipeline_registry = registry
+        return registry
+
+    def get_all_ingest_pipeline_adcids(self) -> List[int]:
+        """Returns the list of pipeline ADCIDs from the pipeline registry.
+
+        Returns:
+            List[int]: List of pipeline ADCIDs
+        """
+        return self.get_pipeline_registry().get_pipeline_adcids()
 
     def get_center_by_pipeline_adcid(
         self, pipeline_adcid: int
@@ -298,7 +386,15 @@ class NACCGroup(CenterAdaptor):
         if center:
             return center
 
-        # Look in center metadata projects for a matching ingest pipeline
+        # Look up the pipeline in the registry
+        pipeline_center = self.get_pipeline_registry().get(pipeline_adcid)
+        if pipeline_center:
+            center = self.__create_center_group(pipeline_center.group)
+            if center:
+                return center
+
+        # Look in center metadata projects for a matching ingest pipeline,
+        # in case the registry is out of date
         centers = self.get_centers()
         for center in centers:
             center_metadata: CenterMetadata = center.get_project_info()
@@ -3,12 +3,16 @@
 import json
 import logging
 from json import JSONDecodeError
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, Iterable, List, Literal, Optional, Set, Tuple
 
 from flywheel_adaptor.flywheel_proxy import ProjectAdaptor
+from flywheel_adaptor.subject_adaptor import SubjectAdaptor
 from keys.keys import DefaultValues, MetadataKeys
+from nacc_common.field_names import FieldNames
 from pydantic import BaseModel
 
+from datastore.visit_snapshot import FILE_COLUMNS, SubjectVisitSnapshot, VisitFilter
+
 log = logging.getLogger(__name__)
 
 SearchOperator = Literal["=", ">", "<", "!=", ">=", "<=", "=|"]
@@ -39,17 +43,39 @@ class FormQueryArgs(BaseModel):
     find_all: bool = False
 
 
+# form metadata fields included in each subject visit snapshot by default
+DEFAULT_SNAPSHOT_FIELDS = [
+    FieldNames.PACKET,
+    FieldNames.VISITNUM,
+    FieldNames.DATE_COLUMN,
+]
+
+
 class FormsStore:
-    """Class to extract/query form data from Flywheel for ingest projects."""
+    """Class to extract/query form data from Flywheel for ingest projects.
+
+    Visit queries are answered from a snapshot of all visits for the
+    subject, which is retrieved with a single dataview on the first
+    query for the subject. The snapshot is reloaded if a query requests
+    a field not included in the snapshot, and the set of fields is
+    widened for subsequent subjects. Subjects resolved when prefetching
+    visits are not looked up again by the queries.
+    """
 
     def __init__(
         self,
         ingest_project: ProjectAdaptor,
         legacy_project: Optional[ProjectAdaptor] = None,
+        snapshot_fields: Optional[Iterable[str]] = None,
     ) -> None:
         self.__ingest_project = ingest_project
         self.__legacy_project = legacy_project
         self.__proxy = self.__ingest_project.proxy
+        self.__snapshot_fields: Set[str] = set(
+            snapshot_fields if snapshot_fields else DEFAULT_SNAPSHOT_FIELDS
+        )
+        self.__snapshots: Dict[Tuple[str, str], SubjectVisitSnapshot] = {}
+        self.__prefetched_subjects: Dict[Tuple[str, str], Optional[SubjectAdaptor]] = {}
 
     def is_new_subject(self, subject_lbl: str) -> bool:
         """Check whether the given subject exists.
@@ -61,14 +87,34 @@ class FormsStore:
             bool: True, if this is a new subject
         """
 
-        if self.__ingest_project.find_subject(subject_lbl):
+        if self.__find_subject(self.__ingest_project, subject_lbl):
             return False
 
         return not (
-            self.__legacy_project and self.__legacy_project.find_subject(subject_lbl)
+            self.__legacy_project
+            and self.__find_subject(self.__legacy_project, subject_lbl)
         )
 
-    def query_form_data(  # noqa: C901
+    def __find_subject(
+        self, project: ProjectAdaptor, subject_lbl: str
+    ) -> Optional[SubjectAdaptor]:
+        """Find the subject with the label in the project, using the result
+        of prefetching visits if the subject was prefetched.
+
+        Args:
+            project: Flywheel project to search
+            subject_lbl: Flywheel subject label
+
+        Returns:
+            SubjectAdaptor (optional): the subject if found
+        """
+        key = (project.id, subject_lbl)
+        if key in self.__prefetched_subjects:
+            return self.__prefetched_subjects[key]
+
+        return project.find_subject(subject_lbl)
+
+    def query_form_data(
         self,
         *,
         subject_lbl: str,
@@ -114,7 +160,7 @@ class FormsStore:
                 f"Project not found to query data for subject {subject_lbl}/{module}"
             )
 
-        subject = project.find_subject(subject_lbl)
+        subject = self.__find_subject(project, subject_lbl)
         if not subject:
             log.warning(
                 "Subject %s is not found in project %s/%s",
@@ -134,54 +180,38 @@ class FormsStore:
                 "search_val and search_op must be set if find_all is False"
             )
 
-        if isinstance(search_val, str) and search_op == DefaultValues.FW_SEARCH_OR:
-            search_val = [search_val.replace(", ", ",")]
-
-        # remove spaces for OR search (=|)
-        if isinstance(search_val, List) and search_op == DefaultValues.FW_SEARCH_OR:
-            search_val = f"[{','.join(search_val)}]"
-
-        # Dataview to retrieve the previous visits
-        title = f"Visits for {project.group}/{project.label}/{subject_lbl}/{module}"
-
-        search_col = f"{MetadataKeys.FORM_METADATA_PATH}.{search_col}"
-        columns = [
-            "file.name",
-            "file.file_id",
-            "file.parents.acquisition",
-            "file.parents.session",
-            search_col,
-        ]
-
+        fields = [search_col]
         if extra_columns:
-            for extra_lbl in extra_columns:
-                extra_col = f"{MetadataKeys.FORM_METADATA_PATH}.{extra_lbl}"
-                columns.append(extra_col)
+            fields.extend(extra_columns)
 
-        filters = f"acquisition.label={module}"
+        search_col = f"{MetadataKeys.FORM_METADATA_PATH}.{search_col}"
+        filters = []
         if not find_all:
-            filters += f",{search_col}{search_op}{search_val}"
+            filters.append(
+                VisitFilter(column=search_col, operator=search_op, value=search_val)  # type: ignore
+            )
 
+        tags = None
         if qc_gear:
-            # filters += f",file.info.qc.{qc_gear}.validation.state=PASS"
             if isinstance(qc_gear, str):
                 qc_gear = [qc_gear]
+            tags = [f"{gear}-PASS" for gear in qc_gear]
 
-            tags = []
-            for gear in qc_gear:
-                tags.append(f"{gear}-PASS")
-            filters += f",file.tags=|[{','.join(tags)}]"
-
-        log.info("Searching for visits matching with filters: %s", filters)
-
-        visits = self.__proxy.get_matching_acquisition_files_info(
-            container_id=subject.id, dv_title=title, columns=columns, filters=filters
+        log.info(
+            "Searching for %s visits for subject %s matching with filters: %s",
+            module,
+            subject_lbl,
+            f"{search_col}{search_op}{search_val}" if not find_all else None,
         )
 
-        if not visits:
-            return None
-
-        return sorted(visits, key=lambda d: d[search_col], reverse=True)
+        snapshot = self.__get_snapshot(project=project, subject=subject, fields=fields)
+        return snapshot.find(
+            modules=[module],
+            columns=[*FILE_COLUMNS, *(MetadataKeys.get_column_key(f) for f in fields)],
+            order_by=search_col,
+            filters=filters,
+            tags=tags,
+        )
 
     def query_form_data_with_custom_filters(
         self,
@@ -222,7 +252,7 @@ class FormsStore:
                 f"Project not found to query data for subject {subject_lbl}/{module}"
             )
 
-        subject = project.find_subject(subject_lbl)
+        subject = self.__find_subject(project, subject_lbl)
         if not subject:
             log.warning(
                 "Subject %s is not found in project %s/%s",
@@ -232,45 +262,148 @@ class FormsStore:
             )
             return None
 
-        # Dataview to retrieve the previous visits
-        title = f"Visits for {project.group}/{project.label}/{subject_lbl}/{module}"
-
-        orderby_col = f"{MetadataKeys.FORM_METADATA_PATH}.{order_by}"
-        columns = [
-            "file.name",
-            "file.file_id",
-            "file.parents.acquisition",
-            "file.parents.session",
-            orderby_col,
-        ]
-
-        comp_op = "="
-        modules = module
-        # remove spaces for OR search (=|)
-        if isinstance(module, List):
-            modules = f"[{','.join(module)}]"
-            comp_op = DefaultValues.FW_SEARCH_OR
-
-        filters = f"acquisition.label{comp_op}{modules}"
-
+        fields = [order_by]
+        filters = []
         if list_filters:
             for filter_obj in list_filters:
-                column_lbl = f"{MetadataKeys.FORM_METADATA_PATH}.{filter_obj.field}"
-                if filter_obj.field != order_by:
-                    columns.append(column_lbl)
-                filters += f",{column_lbl}{filter_obj.operator}{filter_obj.value}"
-
-        log.info("Searching for visits matching with filters: %s", filters)
+                if filter_obj.field not in fields:
+                    fields.append(filter_obj.field)
+                filters.append(
+                    VisitFilter(
+                        column=MetadataKeys.get_column_key(filter_obj.field),
+                        operator=filter_obj.operator,
+                        value=filter_obj.value,
+                    )
+                )
+
+        log.info(
+            "Searching for %s visits for subject %s matching with filters: %s",
+            module,
+            subject_lbl,
+            list_filters,
+        )
 
-        visits = self.__proxy.get_matching_acquisition_files_info(
-            container_id=subject.id, dv_title=title, columns=columns, filters=filters
+        snapshot = self.__get_snapshot(project=project, subject=subject, fields=fields)
+        visits = snapshot.find(
+            modules=module if isinstance(module, List) else [module],
+            columns=[*FILE_COLUMNS, *(MetadataKeys.get_column_key(f) for f in fields)],
+            order_by=MetadataKeys.get_column_key(order_by),
+            filters=filters,
         )
 
         if not visits:
             log.info("No matches found for %s", subject_lbl)
             return None
 
-        return sorted(visits, key=lambda d: d[orderby_col], reverse=True)
+        return visits
+
+    def __get_snapshot(
+        self, *, project: ProjectAdaptor, subject: SubjectAdaptor, fields: List[str]
+    ) -> SubjectVisitSnapshot:
+        """Get the visit snapshot for the subject, loads the snapshot if not
+        already loaded or if it does not include the requested fields.
+
+        Args:
+            project: Flywheel project the subject belongs to
+            subject: Flywheel subject
+            fields: form metadata fields required for the query
+
+        Returns:
+            SubjectVisitSnapshot: visit snapshot for the subject
+        """
+        self.__snapshot_fields.update(fields)
+
+        key = (project.id, subject.id)
+        snapshot = self.__snapshots.get(key)
+        if snapshot and snapshot.covers(
+            MetadataKeys.get_column_key(field) for field in fields
+        ):
+            return snapshot
+
+        snapshot = SubjectVisitSnapshot.load(
+            proxy=self.__proxy,
+            subject_id=subject.id,
+            title=f"Visits for {project.group}/{project.label}/{subject.label}",
+            fields=self.__snapshot_fields,
+        )
+        self.__snapshots[key] = snapshot
+        return snapshot
+
+    def prefetch_visits(
+        self,
+        *,
+        subject_lbls: List[str],
+        fields: Optional[Iterable[str]] = None,
+        batch_size: int = 100,
+    ) -> None:
+        """Load the visit snapshots for the given subjects in batches, so that
+        subsequent visit queries for these subjects are answered locally.
+
+        Subjects are resolved through the subject index shared with the
+        project adaptors, so labels already looked up are not queried
+        again. Visits are retrieved for a batch of subjects per request,
+        for both ingest and legacy projects. Snapshots already loaded are
+        not retrieved again.
+
+        Args:
+            subject_lbls: list of Flywheel subject labels
+            fields (optional): form metadata fields to include in the snapshots
+            batch_size (optional): number of subjects per request
+        """
+        if fields:
+            self.__snapshot_fields.update(fields)
+
+        labels = list(dict.fromkeys(subject_lbls))
+        for project in [self.__ingest_project, self.__legacy_project]:
+            if not project or not labels:
+                continue
+
+            subjects = project.load_subjects(labels, batch_size=batch_size)
+            found = {subject.label: subject for subject in subjects}
+            for label in labels:
+                self.__prefetched_subjects[(project.id, label)] = found.get(label)
+
+            subject_ids = [
+                subject.id
+                for subject in subjects
+                if (project.id, subject.id) not in self.__snapshots
+            ]
+
+            for start in range(0, len(subject_ids), batch_size):
+                batch = subject_ids[start : start + batch_size]
+                snapshots = SubjectVisitSnapshot.load_batch(
+                    proxy=self.__proxy,
+                    container_id=project.id,
+                    subject_ids=batch,
+                    title=f"Visits for {project.group}/{project.label}",
+                    fields=self.__snapshot_fields,
+                )
+                for subject_id, snapshot in snapshots.items():
+                    self.__snapshots[(project.id, subject_id)] = snapshot
+
+            log.info(
+                "Prefetched visits for %d subjects in project %s/%s",
+                len(subject_ids),
+                project.group,
+                project.label,
+            )
+
+    def clear_snapshots(self, subject_id: Optional[str] = None) -> None:
+        """Remove the cached visit snapshots, must be called if visits are
+        added or modified after querying. Also removes the prefetched
+        subjects if all snapshots are removed, so that subjects added
+        since are found.
+
+        Args:
+            subject_id (optional): remove only the snapshots for this subject
+        """
+        if not subject_id:
+            self.__snapshots.clear()
+            self.__prefetched_subjects.clear()
+            return
+
+        for key in [key for key in self.__snapshots if key[1] == subject_id]:
+            self.__snapshots.pop(key)
 
     def get_visit_data(self, *, file_name: str, acq_id: str) -> Dict[str, Any] | None:
         """Read the visit file and convert to python dictionary.
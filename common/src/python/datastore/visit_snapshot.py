@@ -0,0 +1,309 @@
+"""Module for a subject scoped snapshot of form visit metadata.
+
+A snapshot holds the metadata for all visit files of a subject (across
+modules), so that the visit queries run by the preprocessing and QC
+checks can be answered locally instead of building a dataview per
+query.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from flywheel_adaptor.flywheel_proxy import FlywheelProxy
+from keys.keys import DefaultValues, MetadataKeys
+
+log = logging.getLogger(__name__)
+
+MODULE_COLUMN = "acquisition.label"
+SUBJECT_COLUMN = "file.parents.subject"
+TAGS_COLUMN = "file.tags"
+
+# columns included in every visit query result
+FILE_COLUMNS = [
+    "file.name",
+    "file.file_id",
+    "file.parents.acquisition",
+    "file.parents.session",
+]
+
+
+class VisitFilter:
+    """Filter on a visit metadata column, evaluated locally using the
+    dataview filter semantics."""
+
+    def __init__(self, *, column: str, operator: str, value: Any) -> None:
+        self.__column = column
+        self.__operator = operator
+        self.__value = value
+
+    @property
+    def column(self) -> str:
+        return self.__column
+
+    def matches(self, visit: Dict[str, Any]) -> bool:
+        """Check whether the given visit matches this filter.
+
+        Args:
+            visit: visit metadata row
+
+        Returns:
+            bool: True if the column value satisfies the filter
+        """
+        value = visit.get(self.__column)
+        if value is None:
+            return False
+
+        if self.__operator == DefaultValues.FW_SEARCH_OR:
+            values = to_value_list(self.__value)
+            if isinstance(value, list):
+                return any(
+                    compare_values(item, "=", val) for item in value for val in values
+                )
+            return any(compare_values(value, "=", val) for val in values)
+
+        return compare_values(value, self.__operator, self.__value)
+
+
+def to_value_list(value: Any) -> List[Any]:
+    """Convert a search value for the OR operator (=|) to a list.
+
+    Args:
+        value: a list of values or a comma separated string
+
+    Returns:
+        List: list of values
+    """
+    if isinstance(value, list):
+        return value
+
+    return str(value).replace(", ", ",").strip("[]").split(",")
+
+
+def _to_number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def compare_values(value: Any, operator: str, search_val: Any) -> bool:
+    """Compare a metadata value with a search value.
+
+    Values are compared as numbers if both are numeric, otherwise as
+    strings.
+
+    Args:
+        value: metadata value
+        operator: comparison operator
+        search_val: value to compare with
+
+    Returns:
+        bool: result of the comparison
+    """
+    lhs: Any = _to_number(value)
+    rhs: Any = _to_number(search_val)
+    if lhs is None or rhs is None:
+        lhs = str(value)
+        rhs = str(search_val)
+
+    if operator == "=":
+        return lhs == rhs
+    if operator == "!=":
+        return lhs != rhs
+    if operator == "<":
+        return lhs < rhs
+    if operator == "<=":
+        return lhs <= rhs
+    if operator == ">":
+        return lhs > rhs
+    if operator == ">=":
+        return lhs >= rhs
+
+    raise ValueError(f"Unsupported search operator {operator}")
+
+
+class SubjectVisitSnapshot:
+    """Metadata for all visit files of a subject, fetched with a single
+    dataview."""
+
+    def __init__(
+        self, *, subject_id: str, columns: Iterable[str], visits: List[Dict[str, Any]]
+    ) -> None:
+        self.__subject_id = subject_id
+        self.__columns = set(columns)
+        self.__visits = visits
+
+    @property
+    def subject_id(self) -> str:
+        return self.__subject_id
+
+    @property
+    def columns(self) -> Set[str]:
+        return self.__columns
+
+    @property
+    def visits(self) -> List[Dict[str, Any]]:
+        return self.__visits
+
+    def covers(self, columns: Iterable[str]) -> bool:
+        """Check whether the snapshot includes all given columns.
+
+        Args:
+            columns: list of column names
+
+        Returns:
+            bool: True if all columns are included in the snapshot
+        """
+        return self.__columns.issuperset(columns)
+
+    @classmethod
+    def load(
+        cls,
+        *,
+        proxy: FlywheelProxy,
+        subject_id: str,
+        title: str,
+        fields: Iterable[str],
+    ) -> "SubjectVisitSnapshot":
+        """Retrieve the visit metadata for all modules of the subject.
+
+        Args:
+            proxy: the Flywheel proxy
+            subject_id: Flywheel subject ID
+            title: dataview title
+            fields: form metadata fields to include in the snapshot
+
+        Returns:
+            SubjectVisitSnapshot: snapshot for the subject
+        """
+        columns = snapshot_columns(fields)
+        visits = proxy.get_matching_acquisition_files_info(
+            container_id=subject_id,
+            dv_title=title,
+            columns=columns,
+            missing_data_strategy="none",
+        )
+
+        return cls(subject_id=subject_id, columns=columns, visits=visits or [])
+
+    @classmethod
+    def load_batch(
+        cls,
+        *,
+        proxy: FlywheelProxy,
+        container_id: str,
+        subject_ids: List[str],
+        title: str,
+        fields: Iterable[str],
+    ) -> Dict[str, "SubjectVisitSnapshot"]:
+        """Retrieve the visit metadata for all modules of the given subjects
+        with a single dataview using the OR-list filter syntax.
+
+        Args:
+            proxy: the Flywheel proxy
+            container_id: Flywheel project ID the subjects belong to
+            subject_ids: list of Flywheel subject IDs
+            title: dataview title
+            fields: form metadata fields to include in the snapshots
+
+        Returns:
+            Dict[str, SubjectVisitSnapshot]: snapshots keyed by subject ID,
+                includes an empty snapshot for subjects without any visits
+        """
+        columns = snapshot_columns(fields)
+        visits = proxy.get_matching_acquisition_files_info(
+            container_id=container_id,
+            dv_title=title,
+            columns=columns,
+            filters=f"{SUBJECT_COLUMN}=|[{','.join(subject_ids)}]",
+            missing_data_strategy="none",
+        )
+
+        subject_visits: Dict[str, List[Dict[str, Any]]] = {
+            subject_id: [] for subject_id in subject_ids
+        }
+        for visit in visits or []:
+            subject_id = visit.get(SUBJECT_COLUMN)
+            if subject_id in subject_visits:
+                subject_visits[subject_id].append(visit)
+
+        return {
+            subject_id: cls(subject_id=subject_id, columns=columns, visits=visit_list)
+            for subject_id, visit_list in subject_visits.items()
+        }
+
+    def find(
+        self,
+        *,
+        modules: List[str],
+        columns: List[str],
+        order_by: str,
+        filters: Optional[List[VisitFilter]] = None,
+        tags: Optional[List[str]] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Find the visits matching the given modules and filters.
+
+        Same as the dataview query, visits with a missing value for any
+        of the requested columns are dropped.
+
+        Args:
+            modules: list of module names
+            columns: list of columns to return
+            order_by: column to sort the visits
+            filters (optional): list of filters to apply on the visits
+            tags (optional): return only the visits with any of these file tags
+
+        Returns:
+            List[Dict] (optional): List of visits matching the filters,
+                                sorted in descending order or None
+        """
+        if not self.covers(columns):
+            raise ValueError(
+                f"Columns {set(columns) - self.__columns} not included in snapshot"
+            )
+
+        tag_filter = (
+            VisitFilter(
+                column=TAGS_COLUMN, operator=DefaultValues.FW_SEARCH_OR, value=tags
+            )
+            if tags
+            else None
+        )
+
+        matches = []
+        for visit in self.__visits:
+            if visit.get(MODULE_COLUMN) not in modules:
+                continue
+            if tag_filter and not tag_filter.matches(visit):
+                continue
+            if filters and not all(filter_obj.matches(visit) for filter_obj in filters):
+                continue
+
+            match = {column: visit.get(column) for column in columns}
+            if any(value is None for value in match.values()):
+                continue
+
+            matches.append(match)
+
+        if not matches:
+            return None
+
+        return sorted(matches, key=lambda d: d[order_by], reverse=True)
+
+
+def snapshot_columns(fields: Iterable[str]) -> List[str]:
+    """Get the dataview columns for a snapshot including the given form
+    metadata fields.
+
+    Args:
+        fields: form metadata fields
+
+    Returns:
+        List[str]: list of dataview columns
+    """
+    columns = [*FILE_COLUMNS, SUBJECT_COLUMN, MODULE_COLUMN, TAGS_COLUMN]
+    columns.extend(MetadataKeys.get_column_key(field) for field in sorted(set(fields)))
+    return columns
@@ -1,6 +1,7 @@
 import logging
+import re
 from datetime import datetime as dt
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Set, Tuple
 
 from flywheel.models.file_entry import FileEntry
 from flywheel.rest import ApiException
@@ -22,6 +23,22 @@ log = logging.getLogger(__name__)
 
 MetadataCleanupFlag = Literal["ALL", "GEAR", "NA"]
 
+# number of entries in a QC status log that triggers compaction
+LOG_COMPACTION_THRESHOLD = 50
+
+# number of most recent entries kept in full when a log is compacted
+LOG_TAIL_ENTRIES = 10
+
+# log entries start with a timestamp in DEFAULT_DATE_TIME_FORMAT
+LOG_ENTRY_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} ")
+LOG_STATUS_PATTERN = re.compile(r"QC Status: (.+) - ")
+
+# marks the summary row of a compacted log, which counts the removed entries
+LOG_COMPACTION_MARKER = "QC Log Compacted"
+LOG_COMPACTION_PATTERN = re.compile(
+    rf"{LOG_COMPACTION_MARKER}: (\d+) earlier entries removed, (\d+) with errors"
+)
+
 
 class ErrorLogIdentificationVisitor(AbstractIdentificationVisitor):
     """Visitor that collects identification attributes for error log file
@@ -246,6 +263,129 @@ def create_log_entry(*, gear_name: str, state: str, errors: FileErrorList) -> st
     return entry
 
 
+def split_log_entries(contents: str) -> List[str]:
+    """Splits the contents of a QC status log into entries.
+
+    Each entry starts with a time-stamped row, followed by the serialized
+    errors (if any) on subsequent rows. Any rows before the first
+    time-stamped row are returned as a separate entry.
+
+    Args:
+      contents: the contents of the log
+    Returns:
+      the list of log entries, each including the trailing newline
+    """
+    entries: List[str] = []
+    for line in contents.splitlines(keepends=True):
+        if not entries or LOG_ENTRY_PATTERN.match(line):
+            entries.append(line)
+        else:
+            entries[-1] += line
+
+    return entries
+
+
+def compact_log_contents(
+    contents: str,
+    *,
+    threshold: int = LOG_COMPACTION_THRESHOLD,
+    tail_entries: int = LOG_TAIL_ENTRIES,
+) -> str:
+    """Compacts the contents of a QC status log if the number of entries
+    exceeds the threshold.
+
+    The compacted log starts with a summary row counting the removed
+    entries and those of them with errors, including the counts from
+    earlier compactions. It is followed by the latest of the earlier
+    entries for each gear and the latest of the earlier entries with
+    errors for each gear, kept in full. The most recent entries are kept
+    in full. So the log is bounded even if a visit keeps failing QC.
+
+    Only the log contents are compacted. The QC metadata in file.info.qc,
+    which FileQCModel.create and the nacc_common.qc_report readers use,
+    is not changed.
+
+    Args:
+      contents: the contents of the log
+      threshold: the number of entries that triggers compaction
+      tail_entries: the number of most recent entries to keep in full
+    Returns:
+      the compacted contents, or the given contents if below the threshold
+      or there are no entries to remove
+    """
+    entries = split_log_entries(contents)
+    if len(entries) <= threshold:
+        return contents
+
+    split_index = len(entries) - tail_entries
+    earlier = entries[:split_index]
+
+    num_removed, num_removed_errors = _compacted_counts(earlier)
+    kept_indexes = _latest_gear_entries(earlier)
+    kept: List[str] = []
+    dropped = 0
+    for index, entry in enumerate(earlier):
+        if index in kept_indexes:
+            kept.append(entry)
+        elif not _is_compaction_summary(entry):
+            dropped += 1
+            if _has_error_rows(entry):
+                num_removed_errors += 1
+
+    if not dropped:
+        return contents
+
+    timestamp = (dt.now()).strftime(DEFAULT_DATE_TIME_FORMAT)
+    summary_row = (
+        f"{timestamp} {LOG_COMPACTION_MARKER}: {num_removed + dropped} earlier "
+        f"entries removed, {num_removed_errors} with errors, keeping the latest "
+        "entry and the latest errors of each gear\n"
+    )
+    return summary_row + "".join(kept) + "".join(entries[split_index:])
+
+
+def _compacted_counts(entries: List[str]) -> Tuple[int, int]:
+    """Returns the numbers of removed entries and removed entries with errors
+    counted by the summary rows of earlier compactions."""
+    num_removed = 0
+    num_removed_errors = 0
+    for entry in entries:
+        summary = LOG_COMPACTION_PATTERN.search(entry.splitlines()[0])
+        if summary:
+            num_removed += int(summary.group(1))
+            num_removed_errors += int(summary.group(2))
+
+    return num_removed, num_removed_errors
+
+
+def _latest_gear_entries(entries: List[str]) -> Set[int]:
+    """Returns the indexes of the latest entry and the latest entry with
+    errors for each gear."""
+    latest_entry: Dict[str, int] = {}
+    latest_errors: Dict[str, int] = {}
+    for index, entry in enumerate(entries):
+        match = LOG_STATUS_PATTERN.search(entry.splitlines()[0])
+        if not match:
+            continue
+
+        latest_entry[match.group(1)] = index
+        if _has_error_rows(entry):
+            latest_errors[match.group(1)] = index
+
+    return set(latest_entry.values()) | set(latest_errors.values())
+
+
+def _is_compaction_summary(entry: str) -> bool:
+    """Indicates whether the log entry is the summary row of a compaction."""
+    return LOG_COMPACTION_MARKER in entry.splitlines()[0]
+
+
+def _has_error_rows(entry: str) -> bool:
+    """Indicates whether the log entry has rows after its time-stamped
+    row."""
+    return len(entry.splitlines()) > 1
+
+
 @retry_with_backoff(
     max_retries=3,
     backoff_factor=2.0,
@@ -259,10 +399,14 @@ def update_error_log_and_qc_metadata(
     state: str,
     errors: FileErrorList,
     reset_qc_metadata: MetadataCleanupFlag = "NA",
+    reset_gears: Optional[List[str]] = None,
 ) -> bool:
     """Update project level error log file and store error metadata in
     file.info.qc.
 
+    The log is compacted if it grows beyond LOG_COMPACTION_THRESHOLD
+    entries.
+
     Args:
         error_log_name: error log file name
         destination_prj: Flywheel project adaptor
@@ -273,6 +417,8 @@ def update_error_log_and_qc_metadata(
             ALL - clean all, set this for the first gear in submission pipeline.
             GEAR - reset only current gear metadata from previous runs.
             NA - do not reset (Default).
+        reset_gears (optional): other gears to remove from the QC metadata
+            in the same metadata write
 
     Returns:
         bool: True if metadata update is successful, else False
@@ -302,7 +448,9 @@ def update_error_log_and_qc_metadata(
     )
 
     new_file = destination_prj.upload_file_contents(
-        filename=error_log_name, contents=contents, content_type="text"
+        filename=error_log_name,
+        contents=compact_log_contents(contents),
+        content_type="text",
     )
     if new_file is None:
         return False
@@ -319,6 +467,9 @@ def update_error_log_and_qc_metadata(
         status=state.upper(),  # type: ignore
         errors=error_list,
     )
+    for reset_gear in reset_gears or []:
+        qc_info.reset(reset_gear)
+
     try:
         update_file_info(file=new_file, custom_info=qc_info.model_dump(by_alias=True))
     except ApiException as error:
@@ -332,6 +483,64 @@ def update_error_log_and_qc_metadata(
     return True
 
 
+def compact_error_log(
+    *,
+    error_log_name: str,
+    destination_prj: ProjectAdaptor,
+    threshold: int = LOG_COMPACTION_THRESHOLD,
+    tail_entries: int = LOG_TAIL_ENTRIES,
+) -> bool:
+    """Compacts an existing project level error log file, if the number of
+    entries exceeds the threshold. The QC metadata in file.info.qc is
+    preserved.
+
+    Args:
+        error_log_name: error log file name
+        destination_prj: Flywheel project adaptor
+        threshold: the number of entries that triggers compaction
+        tail_entries: the number of most recent entries to keep in full
+
+    Returns:
+        bool: True if the log is compacted or does not need compaction,
+          False if an error occurred
+    """
+    current_log = destination_prj.get_file(error_log_name)
+    if not current_log:
+        log.warning(
+            f"Cannot find error log file {error_log_name} in "
+            f"project {destination_prj.group}/{destination_prj.label}"
+        )
+        return False
+
+    try:
+        qc_info = FileQCModel.create(current_log)
+    except ValidationError as error:
+        log.error("Error loading QC metadata for file %s: %s", current_log.name, error)
+        return False
+
+    contents = get_log_contents(current_log)
+    compacted = compact_log_contents(
+        contents, threshold=threshold, tail_entries=tail_entries
+    )
+    if compacted == contents:
+        return True
+
+    new_file = destination_prj.upload_file_contents(
+        filename=error_log_name, contents=compacted, content_type="text"
+    )
+    if new_file is None:
+        return False
+
+    try:
+        update_file_info(file=new_file, custom_info=qc_info.model_dump(by_alias=True))
+    except ApiException as error:
+        log.error(f"Error in setting QC metadata in file {error_log_name}: {error}")
+        return False
+
+    log.info(f"Compacted error log file {error_log_name}")
+    return True
+
+
 def update_gear_qc_status(
     *,
     error_log_name: str,
@@ -378,37 +587,3 @@ def update_gear_qc_status(
         )
     except ApiException as error:
         log.error(f"Error in setting QC status in file {current_log.name}: {error}")
-
-
-def reset_error_log_metadata_for_gears(
-    *, error_log_name: str, destination_prj: ProjectAdaptor, gear_names: List[str]
-) -> None:
-    """Reset error log file QC metadata in file.info.qc.<gear_name> for the
-    specified gears.
-
-    Args:
-        error_log_name: error log file name
-        destination_prj: Flywheel project adaptor
-        gear_names: list of gears to clear qc metadata
-    """
-    current_log = destination_prj.get_file(error_log_name)
-    if not current_log:
-        return
-
-    try:
-        qc_info = FileQCModel.create(current_log)
-    except ValidationError:
-        # If we can't parse the QC info, there's nothing to reset
-        return
-
-    # Remove specified gears from the QC model
-    for gear_name in gear_names:
-        if gear_name in qc_info.qc:
-            del qc_info.qc[gear_name]
-
-    try:
-        update_file_info(
-            file=current_log, custom_info=qc_info.model_dump(by_alias=True)
-        )
-    except ApiException as error:
-        log.error(f"Error in resetting QC metadata in file {current_log.name}: {error}")
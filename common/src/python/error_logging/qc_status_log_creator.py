@@ -1,7 +1,7 @@
 """QC Status Log Creator and File Visit Annotator."""
 
 import logging
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 from flywheel.models.file_entry import FileEntry
 from flywheel.rest import ApiException
@@ -156,6 +156,7 @@ class QCStatusLogManager:
         errors: FileErrorList,
         reset_qc_metadata: MetadataCleanupFlag = "NA",
         add_visit_metadata: bool = False,
+        reset_gears: Optional[List[str]] = None,
     ) -> Optional[str]:
         """Updates or creates QC status log file at project level.
 
@@ -172,6 +173,7 @@ class QCStatusLogManager:
             errors: Error list for the gear
             reset_qc_metadata: Metadata reset strategy (ALL, GEAR, NA)
             add_visit_metadata: Whether to add visit metadata (for initial creation)
+            reset_gears: Gears to remove from the QC metadata in the same update
 
         Returns:
             The QC log filename if update was successful, None otherwise
@@ -196,6 +198,7 @@ class QCStatusLogManager:
             state=status,
             errors=errors,
             reset_qc_metadata=reset_qc_metadata,
+            reset_gears=reset_gears,
         )
 
         if success:
@@ -35,9 +35,13 @@ from fw_utils import AttrDict
 from utils.decorators import api_retry
 
 from flywheel_adaptor.subject_adaptor import SubjectAdaptor
+from flywheel_adaptor.subject_index import SUBJECT_INDEXES, SubjectIndex
 
 log = logging.getLogger(__name__)
 
+# max number of subject labels in a single subject search
+SUBJECT_QUERY_BATCH_SIZE = 100
+
 
 class FlywheelError(Exception):
     """Exception class for Flywheel errors."""
@@ -906,6 +910,7 @@ class FlywheelProxy:
             log.error("Failed to delete subject %s: %s", subject_id, error)
             return False
 
+        SUBJECT_INDEXES.remove_subject(subject_id)
         return True
 
 
@@ -1170,7 +1175,16 @@ class ProjectError(Exception):
 
 
 class ProjectAdaptor:
-    """Defines an adaptor for a flywheel project."""
+    """Defines an adaptor for a flywheel project.
+
+    Project files are looked up by name in an index built from the file
+    list of the loaded project. The index is updated when files are
+    uploaded or deleted through the adaptor, and rebuilt when the project
+    is reloaded.
+    """
+
+    # index of project files by name, built on first use
+    __file_index: Optional[Dict[str, FileEntry]] = None
 
     def __init__(self, *, project: flywheel.Project, proxy: FlywheelProxy) -> None:
         self._project = project.reload()
@@ -1204,6 +1218,7 @@ class ProjectAdaptor:
             return
 
         self._project = projects[0]
+        self.__file_index = None
 
     @property
     def proxy(self) -> FlywheelProxy:
@@ -1287,10 +1302,24 @@ class ProjectAdaptor:
         """
         self._project.update(description=description)
 
+    def __get_file_index(self) -> Dict[str, FileEntry]:
+        """Returns the index of project files by name.
+
+        Returns:
+          the dictionary mapping file name to file entry
+        """
+        if self.__file_index is None:
+            file_index: Dict[str, FileEntry] = {}
+            for file_entry in self._project.files:
+                file_index.setdefault(file_entry.name, file_entry)
+            self.__file_index = file_index
+
+        return self.__file_index
+
     @property
     def files(self) -> List[FileEntry]:
         """The list of files associated with this project."""
-        return self._project.files
+        return list(self.__get_file_index().values())
 
     def get_file(self, name: str) -> Optional[FileEntry]:
         """Gets the file from the enclosed project.
@@ -1300,7 +1329,7 @@ class ProjectAdaptor:
         Returns:
           the named file
         """
-        return self._project.get_file(name)
+        return self.__get_file_index().get(name)
 
     def get_file_by_id(self, file_id: str) -> Optional[FileEntry]:
         """Returns the file by id.
@@ -1333,6 +1362,7 @@ class ProjectAdaptor:
     def reload(self) -> Self:
         """Forces a reload on the project."""
         self._project = self._project.reload()
+        self.__file_index = None
 
         return self
 
@@ -1347,13 +1377,44 @@ class ProjectAdaptor:
         return self._project.read_file(name)
 
     @api_retry
-    def upload_file(self, file_spec: flywheel.FileSpec) -> None:
+    def upload_file(self, file_spec: flywheel.FileSpec) -> Any:
         """Uploads the indicated file to enclosed project.
 
         Args:
           file_spec: the file specification
+        Returns:
+          the upload response
+        """
+        return self._project.upload_file(file_spec)
+
+    def __find_uploaded_file(self, filename: str, response: Any) -> Optional[FileEntry]:
+        """Finds the file entry for a file uploaded to this project.
+
+        Uses the file ID from the upload response if it is included,
+        otherwise finds the file by name within this project.
+
+        Args:
+          filename: the file name
+          response: the upload response
+        Returns:
+          the file entry for the uploaded file, None if not found
         """
-        self._project.upload_file(file_spec)
+        if isinstance(response, list):
+            for file_info in response:
+                if not isinstance(file_info, dict):
+                    continue
+                if file_info.get("name") != filename:
+                    continue
+
+                file_id = file_info.get("file_id") or file_info.get("_id")
+                if file_id:
+                    return self._fw.get_file(file_id)
+
+        files = self.get_matching_files(f'parent_ref.type=project,name="{filename}"')
+        if not files:
+            return None
+
+        return files[0].reload()
 
     def upload_file_contents(
         self, *, filename: str, contents: str, content_type: str = "text"
@@ -1375,9 +1436,8 @@ class ProjectAdaptor:
             size=len(contents),
         )
         try:
-            self.upload_file(file_spec)
-            self.reload()
-            return self.get_file(filename)
+            response = self.upload_file(file_spec)
+            file_entry = self.__find_uploaded_file(filename, response)
         except ApiException as error:
             log.error(
                 f"Failed to upload file {filename} to "
@@ -1385,6 +1445,17 @@ class ProjectAdaptor:
             )
             return None
 
+        if file_entry is None:
+            log.error(
+                f"Failed to find uploaded file {filename} in {self.group}/{self.label}"
+            )
+            return None
+
+        if self.__file_index is not None:
+            self.__file_index[filename] = file_entry
+
+        return file_entry
+
     def delete_file(self, filename: str) -> bool:
         """Delete the specified file from enclosed project.
 
@@ -1403,6 +1474,9 @@ class ProjectAdaptor:
             )
             return False
 
+        if self.__file_index is not None:
+            self.__file_index.pop(filename, None)
+
         return True
 
     def get_user_roles(self, user_id: str) -> List[str]:
@@ -1662,6 +1736,7 @@ class ProjectAdaptor:
           the dictionary object with info for project
         """
         self._project = self._project.reload()
+        self.__file_index = None
         return self._project.info
 
     def update_info(self, info: Dict[str, Any]) -> None:
@@ -1692,6 +1767,16 @@ class ProjectAdaptor:
 
         return info
 
+    def __get_subject_index(self) -> SubjectIndex:
+        """Returns the subject index for this project.
+
+        The index is shared by all adaptors for this project.
+
+        Returns:
+          the subject index
+        """
+        return SUBJECT_INDEXES.get(self.id)
+
     def add_subject(self, label: str) -> SubjectAdaptor:
         """Adds a subject with the given label.
 
@@ -1700,22 +1785,69 @@ class ProjectAdaptor:
         Returns:
           the created Subject object
         """
-        return SubjectAdaptor(self._project.add_subject(label=label))
+        subject = self._project.add_subject(label=label)
+        self.__get_subject_index().add(subject)
+        return SubjectAdaptor(subject)
 
     def find_subject(self, label: str) -> Optional[SubjectAdaptor]:
         """Finds the subject with the label.
 
+        Uses the subject index if the label has already been looked up.
+
         Args:
           label: the subject label
         Returns:
           the Subject object with the label. None, otherwise
         """
-        subject = self._project.subjects.find_first(f"label={label}")
-        if subject:
-            return SubjectAdaptor(subject)
+        subject_index = self.__get_subject_index()
+        if label not in subject_index:
+            subject = self._project.subjects.find_first(f"label={label}")
+            if subject:
+                subject_index.add(subject)
+            else:
+                subject_index.add_missing([label])
+
+        found: Optional[Subject] = subject_index.get(label)
+        if found:
+            return SubjectAdaptor(found)
 
         return None
 
+    def load_subjects(
+        self,
+        labels: Optional[Iterable[str]] = None,
+        batch_size: int = SUBJECT_QUERY_BATCH_SIZE,
+    ) -> List[SubjectAdaptor]:
+        """Loads the subjects with the labels into the subject index.
+
+        Issues one query per batch of labels not already in the index.
+        Labels without a subject are marked as missing in the index. If
+        no labels are given, loads all subjects of this project.
+
+        Args:
+          labels (optional): the subject labels
+          batch_size (optional): max labels per query batch
+        Returns:
+          the subjects with the labels, or all subjects if no labels given
+        """
+        subject_index = self.__get_subject_index()
+        if labels is None:
+            subjects = list(self._project.subjects.iter())
+            for subject in subjects:
+                subject_index.add(subject)
+            return [SubjectAdaptor(subject) for subject in subjects]
+
+        labels = list(dict.fromkeys(labels))
+        missing = subject_index.missing(labels)
+        for start in range(0, len(missing), batch_size):
+            batch = missing[start : start + batch_size]
+            for subject in self._project.subjects.find(f"label=|[{','.join(batch)}]"):
+                subject_index.add(subject)
+            subject_index.add_missing(batch)
+
+        found = [subject_index.get(label) for label in labels]
+        return [SubjectAdaptor(subject) for subject in found if subject]
+
     def get_subject_by_id(self, subject_id: str) -> Optional[SubjectAdaptor]:
         """Gets the subject with the given id.
 
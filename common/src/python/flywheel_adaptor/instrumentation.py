@@ -0,0 +1,353 @@
+"""Opt-in profiling of the calls to the Flywheel adaptors.
+
+While profiling, the public methods of FlywheelProxy, GroupAdaptor,
+ProjectAdaptor and SubjectAdaptor are wrapped to record the latency, the
+bytes sent and received, and the calling function outside of the
+adaptors for each call. Profiles summarize the calls per method, and per
+method and caller, with latency percentiles.
+"""
+
+import csv
+import functools
+import inspect
+import io
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from flywheel.file_spec import FileSpec
+from inputs.environment import get_environment_variable
+from pydantic import BaseModel
+
+from flywheel_adaptor.flywheel_proxy import (
+    FlywheelProxy,
+    GroupAdaptor,
+    ProjectAdaptor,
+)
+from flywheel_adaptor.subject_adaptor import SubjectAdaptor
+
+log = logging.getLogger(__name__)
+
+ADAPTOR_CLASSES = (FlywheelProxy, GroupAdaptor, ProjectAdaptor, SubjectAdaptor)
+
+# environment variable that enables profiling
+PROFILING_VARIABLE = "PROFILE_ADAPTORS"
+
+PROFILE_JSON_FILENAME = "adaptor-profile.json"
+PROFILE_CSV_FILENAME = "adaptor-profile.csv"
+
+# callers are reported as the first function outside of these modules
+ADAPTOR_MODULE_PREFIX = "flywheel_adaptor."
+
+ALL_CALLERS = "ALL"
+
+
+def is_profiling_enabled() -> bool:
+    """Indicates whether adaptor profiling is enabled by the environment
+    variable.
+
+    Returns:
+      True if the environment variable is set to true
+    """
+    return is_true(get_environment_variable(PROFILING_VARIABLE))
+
+
+def is_true(value: Any) -> bool:
+    """Indicates whether the config or environment value is true."""
+    if isinstance(value, bool):
+        return value
+    if value is None:
+        return False
+
+    return str(value).strip().lower() in ("1", "true", "yes")
+
+
+def payload_size(value: Any) -> int:
+    """Returns the number of bytes in file contents sent or received.
+
+    Other values, such as labels, IDs and query strings, are not file
+    contents and are not counted.
+
+    Args:
+      value: the argument or return value
+    Returns:
+      the size in bytes of bytes or file spec contents, 0 otherwise
+    """
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, FileSpec):
+        contents = getattr(value, "contents", None)
+        if isinstance(contents, str):
+            return len(contents.encode("utf-8"))
+        return payload_size(contents)
+
+    return 0
+
+
+def find_caller() -> str:
+    """Returns the name of the first function on the stack outside of the
+    adaptor modules."""
+    frame = inspect.currentframe()
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if not module.startswith(ADAPTOR_MODULE_PREFIX):
+            return f"{module}.{frame.f_code.co_name}"
+        frame = frame.f_back  # type: ignore
+
+    return "unknown"
+
+
+def percentile(samples: List[float], percent: float) -> float:
+    """Returns the nearest-rank percentile of the sorted samples.
+
+    Args:
+      samples: the sorted samples
+      percent: the percentile between 0 and 100
+    Returns:
+      the percentile, 0 if there are no samples
+    """
+    if not samples:
+        return 0.0
+
+    rank = max(math.ceil(percent / 100 * len(samples)), 1)
+    return samples[rank - 1]
+
+
+class MethodProfile(BaseModel):
+    """Summary of the calls to an adaptor method from a caller."""
+
+    method: str
+    caller: str
+    calls: int
+    errors: int
+    total_seconds: float
+    p50_seconds: float
+    p95_seconds: float
+    p99_seconds: float
+    max_seconds: float
+    bytes_sent: int
+    bytes_received: int
+
+
+class ProfileDocument(BaseModel):
+    """The JSON document for an adaptor profile."""
+
+    methods: List[MethodProfile]
+    callers: List[MethodProfile]
+
+
+class CallSamples:
+    """Recorded calls for a method and caller."""
+
+    def __init__(self) -> None:
+        self.durations: List[float] = []
+        self.errors = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def add(self, other: "CallSamples") -> None:
+        """Adds the samples of the other to these samples."""
+        self.durations.extend(other.durations)
+        self.errors += other.errors
+        self.bytes_sent += other.bytes_sent
+        self.bytes_received += other.bytes_received
+
+    def summarize(self, *, method: str, caller: str) -> MethodProfile:
+        """Returns the profile for these samples."""
+        durations = sorted(self.durations)
+        return MethodProfile(
+            method=method,
+            caller=caller,
+            calls=len(durations),
+            errors=self.errors,
+            total_seconds=sum(durations),
+            p50_seconds=percentile(durations, 50),
+            p95_seconds=percentile(durations, 95),
+            p99_seconds=percentile(durations, 99),
+            max_seconds=durations[-1] if durations else 0.0,
+            bytes_sent=self.bytes_sent,
+            bytes_received=self.bytes_received,
+        )
+
+
+class AdaptorProfiler:
+    """Collects the calls to adaptor methods.
+
+    The profiler is thread safe, so that calls from worker threads are
+    recorded.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__samples: Dict[Tuple[str, str], CallSamples] = {}
+
+    def record(
+        self,
+        *,
+        method: str,
+        caller: str,
+        seconds: float,
+        failed: bool = False,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+    ) -> None:
+        """Records a call to the method.
+
+        Args:
+          method: the qualified method name
+          caller: the calling function
+          seconds: the duration of the call
+          failed: whether the call raised an exception
+          bytes_sent: the bytes of file contents sent
+          bytes_received: the bytes of file contents received
+        """
+        with self.__lock:
+            samples = self.__samples.setdefault((method, caller), CallSamples())
+            samples.durations.append(seconds)
+            samples.errors += int(failed)
+            samples.bytes_sent += bytes_sent
+            samples.bytes_received += bytes_received
+
+    def clear(self) -> None:
+        """Removes all recorded calls."""
+        with self.__lock:
+            self.__samples.clear()
+
+    def caller_profiles(self) -> List[MethodProfile]:
+        """Returns the profiles per method and caller, by total time."""
+        with self.__lock:
+            profiles = [
+                samples.summarize(method=method, caller=caller)
+                for (method, caller), samples in self.__samples.items()
+            ]
+
+        return sorted(profiles, key=lambda profile: -profile.total_seconds)
+
+    def method_profiles(self) -> List[MethodProfile]:
+        """Returns the profiles per method for all callers, by total
+        time."""
+        methods: Dict[str, CallSamples] = {}
+        with self.__lock:
+            for (method, _), samples in self.__samples.items():
+                methods.setdefault(method, CallSamples()).add(samples)
+
+        profiles = [
+            samples.summarize(method=method, caller=ALL_CALLERS)
+            for method, samples in methods.items()
+        ]
+        return sorted(profiles, key=lambda profile: -profile.total_seconds)
+
+    def to_json(self) -> str:
+        """Returns the profile as a JSON document with the method and
+        caller profiles."""
+        profile = {
+            "methods": [item.model_dump() for item in self.method_profiles()],
+            "callers": [item.model_dump() for item in self.caller_profiles()],
+        }
+        return ProfileDocument.model_validate(profile).model_dump_json(indent=2)
+
+    def to_csv(self) -> str:
+        """Returns the profile as CSV, with the method totals followed by
+        the profiles per caller."""
+        output = io.StringIO()
+        writer = csv.DictWriter(output, fieldnames=list(MethodProfile.model_fields))
+        writer.writeheader()
+        for profile in self.method_profiles() + self.caller_profiles():
+            writer.writerow(profile.model_dump())
+
+        return output.getvalue()
+
+    def log_summary(self, limit: int = 10) -> None:
+        """Logs the methods with the most total time.
+
+        Args:
+          limit: the number of methods to log
+        """
+        for profile in self.method_profiles()[:limit]:
+            log.info(
+                "%s: %d calls, %.3fs total, p95 %.3fs",
+                profile.method,
+                profile.calls,
+                profile.total_seconds,
+                profile.p95_seconds,
+            )
+
+
+def wrap_method(
+    profiler: AdaptorProfiler, method_name: str, method: Callable
+) -> Callable:
+    """Wraps the method to record calls with the profiler.
+
+    Args:
+      profiler: the profiler
+      method_name: the qualified method name
+      method: the method
+    Returns:
+      the wrapped method
+    """
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        caller = find_caller()
+        failed = False
+        result = None
+        start = time.perf_counter()
+        try:
+            result = method(*args, **kwargs)
+            return result
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            profiler.record(
+                method=method_name,
+                caller=caller,
+                seconds=time.perf_counter() - start,
+                failed=failed,
+                bytes_sent=sum(
+                    payload_size(value) for value in (*args, *kwargs.values())
+                ),
+                bytes_received=payload_size(result),
+            )
+
+    return wrapper
+
+
+@contextmanager
+def profile_adaptors(
+    classes: Sequence[type] = ADAPTOR_CLASSES,
+    profiler: Optional[AdaptorProfiler] = None,
+) -> Iterator[AdaptorProfiler]:
+    """Context manager that records calls to the public methods of the
+    adaptor classes.
+
+    Methods are patched on the classes, so that calls through any
+    instance, including instances of subclasses, are recorded. The
+    original methods are restored on exit.
+
+    Args:
+      classes (optional): the classes to profile
+      profiler (optional): the profiler to record calls with
+    Returns:
+      the profiler
+    """
+    profiler = profiler if profiler is not None else AdaptorProfiler()
+    originals: List[Tuple[type, str, Any]] = []
+    for cls in classes:
+        for name, attribute in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.isfunction(attribute):
+                continue
+
+            originals.append((cls, name, attribute))
+            setattr(
+                cls, name, wrap_method(profiler, f"{cls.__name__}.{name}", attribute)
+            )
+
+    try:
+        yield profiler
+    finally:
+        for cls, name, attribute in reversed(originals):
+            setattr(cls, name, attribute)
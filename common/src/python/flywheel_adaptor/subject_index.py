@@ -0,0 +1,138 @@
+"""Index of project subjects by label, shared within a gear run."""
+
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from flywheel.models.subject import Subject
+
+
+class SubjectIndex:
+    """Index of the subjects of a project keyed by subject label.
+
+    Labels are either mapped to the subject, or marked as missing if a
+    lookup found no subject with the label. Labels that are not in the
+    index have not been looked up. The index is thread safe.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__subjects: Dict[str, Optional[Subject]] = {}
+
+    def __contains__(self, label: str) -> bool:
+        with self.__lock:
+            return label in self.__subjects
+
+    def get(self, label: str) -> Optional[Subject]:
+        """Returns the indexed subject with the label.
+
+        Args:
+          label: the subject label
+        Returns:
+          the subject if indexed, None if not indexed or known missing
+        """
+        with self.__lock:
+            return self.__subjects.get(label)
+
+    def add(self, subject: Subject) -> None:
+        """Adds the subject to the index.
+
+        Args:
+          subject: the subject
+        """
+        with self.__lock:
+            self.__subjects[subject.label] = subject
+
+    def add_missing(self, labels: Iterable[str]) -> None:
+        """Marks the labels as not having a subject, unless already indexed.
+
+        Args:
+          labels: the subject labels
+        """
+        with self.__lock:
+            for label in labels:
+                self.__subjects.setdefault(label, None)
+
+    def missing(self, labels: Iterable[str]) -> List[str]:
+        """Returns the labels that have not been looked up.
+
+        Args:
+          labels: the subject labels
+        Returns:
+          the labels not in the index, without duplicates
+        """
+        with self.__lock:
+            return [
+                label for label in dict.fromkeys(labels) if label not in self.__subjects
+            ]
+
+    def remove(self, label: str) -> None:
+        """Removes the label from the index.
+
+        Args:
+          label: the subject label
+        """
+        with self.__lock:
+            self.__subjects.pop(label, None)
+
+    def remove_id(self, subject_id: str) -> None:
+        """Removes the subject with the ID from the index.
+
+        Args:
+          subject_id: the subject ID
+        """
+        with self.__lock:
+            for label, subject in list(self.__subjects.items()):
+                if subject is not None and subject.id == subject_id:
+                    del self.__subjects[label]
+
+    def clear(self) -> None:
+        """Removes all labels from the index."""
+        with self.__lock:
+            self.__subjects.clear()
+
+
+class SubjectIndexRegistry:
+    """Subject indexes by project ID.
+
+    Allows adaptors for the same project to share the subject index.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__indexes: Dict[str, SubjectIndex] = {}
+
+    def get(self, project_id: str) -> SubjectIndex:
+        """Returns the subject index for the project, creating it if needed.
+
+        Args:
+          project_id: the project ID
+        Returns:
+          the subject index for the project
+        """
+        with self.__lock:
+            index = self.__indexes.get(project_id)
+            if index is None:
+                index = SubjectIndex()
+                self.__indexes[project_id] = index
+
+            return index
+
+    def remove_subject(self, subject_id: str) -> None:
+        """Removes the subject with the ID from all subject indexes.
+
+        Args:
+          subject_id: the subject ID
+        """
+        with self.__lock:
+            indexes = list(self.__indexes.values())
+
+        for index in indexes:
+            index.remove_id(subject_id)
+
+    def clear(self) -> None:
+        """Removes all subject indexes."""
+        with self.__lock:
+            self.__indexes.clear()
+
+
+SUBJECT_INDEXES = SubjectIndexRegistry()
@@ -5,7 +5,8 @@ import os
 import re
 import sys
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Type, TypeVar
 
 import flywheel
 from centers.nacc_group import NACCGroup
@@ -16,6 +17,13 @@ from flywheel.models.project import Project
 from flywheel.models.subject import Subject
 from flywheel.rest import ApiException
 from flywheel_adaptor.flywheel_proxy import FlywheelError, FlywheelProxy
+from flywheel_adaptor.instrumentation import (
+    PROFILE_CSV_FILENAME,
+    PROFILE_JSON_FILENAME,
+    AdaptorProfiler,
+    is_profiling_enabled,
+    profile_adaptors,
+)
 from fw_client.client import FWClient
 from fw_gear import GearContext
 from fw_gear.utils.sdk_helpers import get_container_from_ref
@@ -579,15 +587,58 @@ class GearEngine:
             with GearContext() as context:
                 context.init_logging()
                 context.log_config()
-                visitor = gear_type.create(
-                    context=context, parameter_store=self.parameter_store
-                )
-                visitor.run(context)
+                with adaptor_profiling(context):
+                    visitor = gear_type.create(
+                        context=context, parameter_store=self.parameter_store
+                    )
+                    visitor.run(context)
         except GearExecutionError as error:
             log.error("Error: %s", error)
             sys.exit(1)
 
 
+def write_adaptor_profile(context: GearContext, profiler: AdaptorProfiler) -> None:
+    """Writes the adaptor profile as JSON and CSV gear output files.
+
+    Args:
+        context: the gear context
+        profiler: the profiler with the recorded calls
+    """
+    profiler.log_summary()
+    try:
+        with context.open_output(
+            PROFILE_JSON_FILENAME, mode="w", encoding="utf-8"
+        ) as fh:
+            fh.write(profiler.to_json())
+        with context.open_output(
+            PROFILE_CSV_FILENAME, mode="w", encoding="utf-8"
+        ) as fh:
+            fh.write(profiler.to_csv())
+    except OSError as error:
+        log.warning("Failed to write adaptor profile: %s", error)
+
+
+@contextmanager
+def adaptor_profiling(context: GearContext) -> Iterator[None]:
+    """Profiles the calls to the Flywheel adaptors if enabled by the
+    PROFILE_ADAPTORS environment variable, and writes the profile as gear
+    output when done.
+
+    Args:
+        context: the gear context
+    """
+    if not is_profiling_enabled():
+        yield
+        return
+
+    log.info("Profiling Flywheel adaptor calls")
+    with profile_adaptors() as profiler:
+        try:
+            yield
+        finally:
+            write_adaptor_profile(context, profiler)
+
+
 def get_project_from_destination(
     context: GearContext, proxy: FlywheelProxy
 ) -> flywheel.Project:
@@ -0,0 +1,136 @@
+"""In-memory index of identifier records."""
+
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from identifiers.model import IdentifierObject, clean_ptid
+
+
+class IdentifierIndex:
+    """Index of identifier records keyed by (ADCID, PTID), NACCID and GUID.
+
+    A NACCID or GUID may have several identifier records, only the
+    active record is indexed for those keys. The index is thread safe,
+    so that it can be shared by concurrent lookups.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__by_ptid: Dict[Tuple[int, str], IdentifierObject] = {}
+        self.__by_naccid: Dict[str, IdentifierObject] = {}
+        self.__by_guid: Dict[str, IdentifierObject] = {}
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__by_ptid)
+
+    def add(self, identifier: IdentifierObject) -> None:
+        """Adds the identifier record to the index.
+
+        Args:
+          identifier: the identifier record
+        """
+        with self.__lock:
+            self.__by_ptid[(identifier.adcid, identifier.ptid)] = identifier
+            if not identifier.active:
+                return
+
+            self.__by_naccid[identifier.naccid] = identifier
+            if identifier.guid:
+                self.__by_guid[identifier.guid] = identifier
+
+    def add_all(self, identifiers: Iterable[IdentifierObject]) -> None:
+        """Adds the identifier records to the index.
+
+        Args:
+          identifiers: the identifier records
+        """
+        for identifier in identifiers:
+            self.add(identifier)
+
+    def get(
+        self,
+        *,
+        naccid: Optional[str] = None,
+        adcid: Optional[int] = None,
+        ptid: Optional[str] = None,
+        guid: Optional[str] = None,
+    ) -> Optional[IdentifierObject]:
+        """Returns the indexed identifier record for the IDs given.
+
+        Uses the same precedence of arguments as IdentifierRepository.get.
+
+        Args:
+          naccid: the NACCID
+          adcid: the center ID
+          ptid: the participant ID assigned by the center
+          guid: the NIA GUID
+        Returns:
+          the identifier record if indexed, None otherwise
+        """
+        with self.__lock:
+            if naccid is not None:
+                return self.__by_naccid.get(naccid)
+
+            if adcid is not None and ptid:
+                return self.__by_ptid.get((adcid, clean_ptid(ptid)))
+
+            if guid:
+                return self.__by_guid.get(guid)
+
+        return None
+
+    def clear(self) -> None:
+        """Removes all records from the index."""
+        with self.__lock:
+            self.__by_ptid.clear()
+            self.__by_naccid.clear()
+            self.__by_guid.clear()
+
+
+class SearchResultCache:
+    """Cache of identifier search results, keyed by NACCID and the search
+    options.
+
+    Only NACCIDs with matching identifier records are cached, so missing
+    NACCIDs are always searched again. The cache is thread safe.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__entries: Dict[Tuple[str, ...], List[IdentifierObject]] = {}
+
+    def get(
+        self, options: Tuple[str, ...], naccid: str
+    ) -> Optional[List[IdentifierObject]]:
+        """Returns the cached search result for the NACCID.
+
+        Args:
+          options: the search options
+          naccid: the NACCID
+        Returns:
+          the identifier records if cached, None otherwise
+        """
+        with self.__lock:
+            return self.__entries.get((*options, naccid))
+
+    def put(
+        self, options: Tuple[str, ...], naccid: str, identifiers: List[IdentifierObject]
+    ) -> None:
+        """Adds the search result for the NACCID to the cache.
+
+        Args:
+          options: the search options
+          naccid: the NACCID
+          identifiers: the identifier records found for the NACCID
+        """
+        if not identifiers:
+            return
+
+        with self.__lock:
+            self.__entries[(*options, naccid)] = identifiers
+
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        with self.__lock:
+            self.__entries.clear()
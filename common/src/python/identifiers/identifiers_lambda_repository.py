@@ -1,11 +1,20 @@
 """Identifiers repository using AWS Lambdas."""
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import List, Literal, Optional, overload
+from typing import Callable, Dict, List, Literal, Optional, overload
 
-from lambdas.lambda_function import BaseRequest, LambdaClient, LambdaInvocationError
+from lambdas.lambda_function import (
+    BaseRequest,
+    LambdaClient,
+    LambdaInvocationError,
+    LambdaThrottlingError,
+)
 from pydantic import BaseModel, Field, ValidationError, model_validator
+from utils.decorators import retry_with_backoff
 
+from identifiers.identifier_index import IdentifierIndex, SearchResultCache
 from identifiers.identifiers_repository import (
     DateQueryObject,
     IdentifierQueryObject,
@@ -24,6 +33,15 @@ from identifiers.model import (
     NACCIDField,
 )
 
+# max number of records returned by a single list lambda invocation
+LIST_PAGE_LIMIT = 100
+
+# max number of concurrent list lambda invocations
+DEFAULT_MAX_WORKERS = 4
+
+# NACCID search results shared by all repositories in the process
+SEARCH_RESULT_CACHE = SearchResultCache()
+
 
 class ListRequest(BaseRequest):
     """Model for requests that could result in a list."""
@@ -161,11 +179,30 @@ class EnrollmentDurationRequest(BaseRequest, CenterIdentifiers):
 
 
 class IdentifiersLambdaRepository(IdentifierRepository):
-    """Implementation of IdentifierRepository based on AWS Lambdas."""
+    """Implementation of IdentifierRepository based on AWS Lambdas.
 
-    def __init__(self, client: LambdaClient, mode: IdentifiersMode) -> None:
+    Identifier records retrieved from the lambdas are kept in an index,
+    so that repeated lookups for the same identifiers do not invoke the
+    lambdas again. The index is cleared whenever identifiers are created
+    or updated through the repository.
+    """
+
+    def __init__(
+        self,
+        client: LambdaClient,
+        mode: IdentifiersMode,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        """
+        Args:
+          client: the lambda client
+          mode: the identifiers database mode
+          max_workers (optional): max number of concurrent list invocations
+        """
         self.__client = client
         self.__mode: Literal["dev", "prod"] = mode
+        self.__max_workers = max(1, max_workers)
+        self.__index = IdentifierIndex()
 
     def create(self, adcid: int, ptid: str, guid: Optional[str]) -> IdentifierObject:
         """Creates an Identifier in the repository.
@@ -192,6 +229,8 @@ class IdentifiersLambdaRepository(IdentifierRepository):
         if response.statusCode not in (200, 201):
             raise IdentifierRepositoryError("No identifier created")
 
+        self.__index.clear()
+        SEARCH_RESULT_CACHE.clear()
         return IdentifierObject.model_validate_json(response.body)
 
     def create_list(self, identifiers: List[IdentifierQueryObject]) -> IdentifierList:
@@ -216,6 +255,8 @@ class IdentifiersLambdaRepository(IdentifierRepository):
         if response.statusCode != 200:
             raise IdentifierRepositoryError("No identifier created")
 
+        self.__index.clear()
+        SEARCH_RESULT_CACHE.clear()
         return IdentifierList.model_validate_json(response.body)
 
     @overload
@@ -253,16 +294,23 @@ class IdentifiersLambdaRepository(IdentifierRepository):
           IdentifierRepositoryError: if no Identifier record was found
           TypeError: if the arguments are nonsensical
         """
-        if naccid is not None:
-            return self.__get_by_naccid(naccid)
+        identifier = self.__index.get(naccid=naccid, adcid=adcid, ptid=ptid, guid=guid)
+        if identifier:
+            return identifier
 
-        if adcid is not None and ptid:
-            return self.__get_by_ptid(adcid=adcid, ptid=ptid, guid=guid)
+        if naccid is not None:
+            identifier = self.__get_by_naccid(naccid)
+        elif adcid is not None and ptid:
+            identifier = self.__get_by_ptid(adcid=adcid, ptid=ptid, guid=guid)
+        elif guid:
+            identifier = self.__get_by_guid(guid)
+        else:
+            raise TypeError("Invalid arguments")
 
-        if guid:
-            return self.__get_by_guid(guid)
+        if identifier:
+            self.__index.add(identifier)
 
-        raise TypeError("Invalid arguments")
+        return identifier
 
     @overload
     def list(self, *, naccid: str) -> List[IdentifierObject]: ...
@@ -389,45 +437,105 @@ class IdentifiersLambdaRepository(IdentifierRepository):
 
         raise IdentifierRepositoryError(response.body)
 
-    def __list_for_adcid(self, adcid: int) -> List[IdentifierObject]:
-        """Get the identifier records for the provided ADCID.
+    def __list_page(
+        self,
+        name: str,
+        create_request: Callable[[int, int], ListRequest],
+        offset: int,
+    ) -> List[IdentifierObject]:
+        """Gets a single page of identifier records from a list lambda.
 
         Args:
-            adcid: ADCID to lookup the identifiers
+            name: the name of the lambda function
+            create_request: function to create the request for offset and limit
+            offset: the offset of the page
 
         Raises:
-            IdentifierRepositoryError: if no Identifier record was found
+            IdentifierRepositoryError: if the lambda invocation has an error
 
         Returns:
-            List[IdentifierObject]: the identifiers list for the adcid
+            List[IdentifierObject]: the identifiers in the page
         """
-        identifier_list: List[IdentifierObject] = []
-        index = 0
-        limit = 100
-        read_length = limit
-        while read_length == limit:
-            try:
-                response = self.__client.invoke(
-                    name="identifier-adcid-lambda-function",
-                    request=ADCIDRequest(
-                        mode=self.__mode, adcid=adcid, offset=index, limit=limit
+        try:
+            response = self.__client.invoke(
+                name=name, request=create_request(offset, LIST_PAGE_LIMIT)
+            )
+        except (LambdaInvocationError, ValidationError) as error:
+            raise IdentifierRepositoryError(error) from error
+
+        if response.statusCode != 200:
+            raise IdentifierRepositoryError(response.body)
+
+        try:
+            response_object = ListResponseObject.model_validate_json(response.body)
+        except ValidationError as error:
+            raise IdentifierRepositoryError(error) from error
+
+        return response_object.data
+
+    def __list_pages(
+        self, name: str, create_request: Callable[[int, int], ListRequest]
+    ) -> List[IdentifierObject]:
+        """Gets all identifier records from a list lambda.
+
+        The lambdas do not report the total number of records, so the first
+        page is read on its own, and if it is full, the following pages are
+        read concurrently in groups of max_workers pages until a page that
+        is not full is found. The records are returned in page order.
+
+        Args:
+            name: the name of the lambda function
+            create_request: function to create the request for offset and limit
+
+        Raises:
+            IdentifierRepositoryError: if the lambda invocation has an error
+
+        Returns:
+            List[IdentifierObject]: the identifiers from all pages
+        """
+        page = self.__list_page(name, create_request, 0)
+        identifier_list: List[IdentifierObject] = list(page)
+        if len(page) < LIST_PAGE_LIMIT:
+            return identifier_list
+
+        offset = LIST_PAGE_LIMIT
+        with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+            while True:
+                offsets = [
+                    offset + i * LIST_PAGE_LIMIT for i in range(self.__max_workers)
+                ]
+                pages = executor.map(
+                    lambda page_offset: self.__list_page(
+                        name, create_request, page_offset
                     ),
+                    offsets,
                 )
-            except (LambdaInvocationError, ValidationError) as error:
-                raise IdentifierRepositoryError(error) from error
+                for page in pages:
+                    identifier_list += page
+                    if len(page) < LIST_PAGE_LIMIT:
+                        return identifier_list
 
-            if response.statusCode != 200:
-                raise IdentifierRepositoryError(response.body)
+                offset = offsets[-1] + LIST_PAGE_LIMIT
 
-            try:
-                response_object = ListResponseObject.model_validate_json(response.body)
-            except ValidationError as error:
-                raise IdentifierRepositoryError(error) from error
+    def __list_for_adcid(self, adcid: int) -> List[IdentifierObject]:
+        """Get the identifier records for the provided ADCID.
 
-            identifier_list += response_object.data
-            read_length = len(response_object.data)
-            index += limit
+        Args:
+            adcid: ADCID to lookup the identifiers
+
+        Raises:
+            IdentifierRepositoryError: if no Identifier record was found
 
+        Returns:
+            List[IdentifierObject]: the identifiers list for the adcid
+        """
+        identifier_list = self.__list_pages(
+            "identifier-adcid-lambda-function",
+            lambda offset, limit: ADCIDRequest(
+                mode=self.__mode, adcid=adcid, offset=offset, limit=limit
+            ),
+        )
+        self.__index.add_all(identifier_list)
         return identifier_list
 
     def __list_for_naccid(self, naccid: str) -> List[IdentifierObject]:
@@ -442,34 +550,114 @@ class IdentifiersLambdaRepository(IdentifierRepository):
         Returns:
             List[IdentifierObject]: the identifiers list for the naccid
         """
+        identifier_list = self.__list_pages(
+            "list-identifiers-for-naccid-lambda-function",
+            lambda offset, limit: NACCIDListRequest(
+                mode=self.__mode, naccid=naccid, offset=offset, limit=limit
+            ),
+        )
+        self.__index.add_all(identifier_list)
+        return identifier_list
+
+    def __search_batch(
+        self,
+        naccids: List[str],
+        allow_missing: bool,
+        allow_multiple: bool,
+        active_only: bool,
+    ) -> List[IdentifierObject]:
+        """Get the identifier records for a batch of NACCIDs.
+
+        A batch may match more records than fit in a page when NACCIDs
+        have multiple identifiers, so pages are read until a page that is
+        not full is found.
+
+        Args:
+            naccids: batch of NACCIDs, at most LIST_PAGE_LIMIT
+            allow_missing: allow a NACCID in the list to be missing
+            allow_multiple: allow a NACCID to have multiple identifiers
+            active_only: only return active NACCIDs
+
+        Raises:
+            IdentifierRepositoryError: if the lambda invocation has an error
+            LambdaThrottlingError: if an invocation is still throttled after
+              retries
+
+        Returns:
+            List[IdentifierObject]: the identifiers list for the batch
+        """
         identifier_list: List[IdentifierObject] = []
-        index = 0
-        limit = 100
-        read_length = limit
-        while read_length == limit:
-            try:
-                response = self.__client.invoke(
-                    name="list-identifiers-for-naccid-lambda-function",
-                    request=NACCIDListRequest(
-                        mode=self.__mode, naccid=naccid, offset=index, limit=limit
-                    ),
-                )
-            except (LambdaInvocationError, ValidationError) as error:
-                raise IdentifierRepositoryError(error) from error
+        offset = 0
+        while True:
+            page = self.__search_page(
+                naccids, allow_missing, allow_multiple, active_only, offset
+            )
+            identifier_list += page
+            if len(page) < LIST_PAGE_LIMIT:
+                return identifier_list
 
-            if response.statusCode != 200:
-                raise IdentifierRepositoryError(response.body)
+            offset += LIST_PAGE_LIMIT
 
-            try:
-                response_object = ListResponseObject.model_validate_json(response.body)
-            except ValidationError as error:
-                raise IdentifierRepositoryError(error) from error
+    @retry_with_backoff(
+        max_retries=3, backoff_factor=2.0, exceptions=LambdaThrottlingError
+    )
+    def __search_page(
+        self,
+        naccids: List[str],
+        allow_missing: bool,
+        allow_multiple: bool,
+        active_only: bool,
+        offset: int,
+    ) -> List[IdentifierObject]:
+        """Get a page of the identifier records for a batch of NACCIDs.
 
-            identifier_list += response_object.data
-            read_length = len(response_object.data)
-            index += limit
+        Retried with backoff if the invocation is throttled.
 
-        return identifier_list
+        Args:
+            naccids: batch of NACCIDs, at most LIST_PAGE_LIMIT
+            allow_missing: allow a NACCID in the list to be missing
+            allow_multiple: allow a NACCID to have multiple identifiers
+            active_only: only return active NACCIDs
+            offset: the offset of the page
+
+        Raises:
+            IdentifierRepositoryError: if the lambda invocation has an error
+            LambdaThrottlingError: if the invocation is still throttled after
+              retries
+
+        Returns:
+            List[IdentifierObject]: the identifiers in the page
+        """
+        try:
+            response = self.__client.invoke(
+                name="identifier-search-naccids-lambda-function",
+                request=NACCIDsListRequest(
+                    mode=self.__mode,
+                    naccids=naccids,
+                    allow_missing=allow_missing,
+                    allow_multiple=allow_multiple,
+                    active_only=active_only,
+                    offset=offset,
+                    limit=LIST_PAGE_LIMIT,
+                ),
+            )
+        except LambdaThrottlingError:
+            raise
+        except (LambdaInvocationError, ValidationError) as error:
+            raise IdentifierRepositoryError(error) from error
+
+        if response.statusCode == 429:
+            raise LambdaThrottlingError(response.body)
+
+        if response.statusCode != 200:
+            raise IdentifierRepositoryError(response.body)
+
+        try:
+            response_object = ListResponseObject.model_validate_json(response.body)
+        except ValidationError as error:
+            raise IdentifierRepositoryError(error) from error
+
+        return response_object.data
 
     def search_naccids(
         self,
@@ -491,45 +679,64 @@ class IdentifiersLambdaRepository(IdentifierRepository):
         and active_only to Fales. If you only want the active identifier, set
         allow_multiple to False and active_only to True.
 
+        NACCIDs are searched in batches of LIST_PAGE_LIMIT, with up to
+        max_workers batches searched concurrently. Results are cached for
+        the process, so only NACCIDs not found by an earlier search are
+        searched again.
+
         Raises:
             IdentifierRepositoryError: if no Identifier record was found
 
         Returns:
-            List[IdentifierObject]: the identifiers list for the list of NACCIDs
+            List[IdentifierObject]: the identifiers list for the list of NACCIDs,
+              in the order of the NACCIDs
         """
-        identifier_list: List[IdentifierObject] = []
-        limit = 100
-
-        for i in range(0, len(naccids), limit):
-            batch = naccids[i : i + limit]
+        options = (
+            self.__mode,
+            str(allow_missing),
+            str(allow_multiple),
+            str(active_only),
+        )
+        results: Dict[str, List[IdentifierObject]] = {}
+        search_list: List[str] = []
+        for naccid in dict.fromkeys(naccids):
+            cached = SEARCH_RESULT_CACHE.get(options, naccid)
+            if cached is not None:
+                results[naccid] = cached
+            else:
+                search_list.append(naccid)
 
+        batches = [
+            search_list[i : i + LIST_PAGE_LIMIT]
+            for i in range(0, len(search_list), LIST_PAGE_LIMIT)
+        ]
+        with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
             try:
-                response = self.__client.invoke(
-                    name="identifier-search-naccids-lambda-function",
-                    request=NACCIDsListRequest(
-                        mode=self.__mode,
-                        naccids=batch,
-                        allow_missing=allow_missing,
-                        allow_multiple=allow_multiple,
-                        active_only=active_only,
-                        offset=0,
-                        limit=limit,
-                    ),
+                batch_results = list(
+                    executor.map(
+                        lambda batch: self.__search_batch(
+                            batch, allow_missing, allow_multiple, active_only
+                        ),
+                        batches,
+                    )
                 )
-            except (LambdaInvocationError, ValidationError) as error:
+            except LambdaThrottlingError as error:
                 raise IdentifierRepositoryError(error) from error
 
-            if response.statusCode != 200:
-                raise IdentifierRepositoryError(response.body)
+        found: Dict[str, List[IdentifierObject]] = defaultdict(list)
+        for batch_result in batch_results:
+            for identifier in batch_result:
+                found[identifier.naccid].append(identifier)
 
-            try:
-                response_object = ListResponseObject.model_validate_json(response.body)
-            except ValidationError as error:
-                raise IdentifierRepositoryError(error) from error
-
-            identifier_list += response_object.data
+        for naccid in search_list:
+            results[naccid] = found.get(naccid, [])
+            SEARCH_RESULT_CACHE.put(options, naccid, results[naccid])
 
-        return identifier_list
+        return [
+            identifier
+            for naccid in dict.fromkeys(naccids)
+            for identifier in results[naccid]
+        ]
 
     def add_or_update(self, identifier: IdentifierUpdateObject) -> bool:
         """Adds/updates an identifier record with known NACCID to the database.
@@ -557,6 +764,8 @@ class IdentifiersLambdaRepository(IdentifierRepository):
                 f"No identifier created or updated: {response.body}"
             )
 
+        self.__index.clear()
+        SEARCH_RESULT_CACHE.clear()
         return True
 
     def check_enrollment_period(
@@ -2,35 +2,71 @@
 
 import logging
 import time
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Set
 
 from flywheel.models.job import Job
 from flywheel_adaptor.flywheel_proxy import FlywheelProxy
 from gear_execution.gear_execution import GearExecutionError
+from pydantic import BaseModel
 
 log = logging.getLogger(__name__)
 
+ACTIVE_JOB_STATES = ["pending", "running"]
+
+# interval to log the status of long running jobs (30 mins)
+RESPONSE_INTERVAL = 1800
+
+# max number of job IDs in a single job search
+JOB_SEARCH_BATCH_SIZE = 100
+
+
+class PollBackoff(BaseModel):
+    """Polling interval that starts short and grows up to a cap, so that
+    short jobs are detected quickly without polling long running jobs too
+    often."""
+
+    initial_interval: float = 2
+    max_interval: float = 30
+    factor: float = 2
+
+    def intervals(self) -> Iterator[float]:
+        """Generates the sleep intervals between polls.
+
+        Returns:
+            Iterator of sleep intervals in seconds
+        """
+        interval = self.initial_interval
+        while True:
+            yield interval
+            interval = min(interval * self.factor, self.max_interval)
+
+
+DEFAULT_BACKOFF = PollBackoff()
+
 
 class JobPoll:
     @staticmethod
-    def poll_job_status(job: Job) -> str:
+    def poll_job_status(job: Job, backoff: PollBackoff = DEFAULT_BACKOFF) -> str:
         """Check for the completion status of a gear job.
 
         Args:
             job: Flywheel Job object
+            backoff (optional): the polling interval policy
 
         Returns:
             str: job completion status
         """
 
-        sleep_total = 0
-        sleep_interval = 30
-        response_interval = 1800  # 30 mins
-        while job.state in ["pending", "running"]:
+        sleep_total = 0.0
+        next_response = 0.0
+        intervals = backoff.intervals()
+        while job.state in ACTIVE_JOB_STATES:
             # add log message to prevent being unresponsive
-            if (sleep_total % response_interval) == 0:
+            if sleep_total >= next_response:
                 log.info("Job %s is still %s", job.id, job.state)
+                next_response += RESPONSE_INTERVAL
 
+            sleep_interval = next(intervals)
             time.sleep(sleep_interval)
             sleep_total += sleep_interval
             job = job.reload()
@@ -115,26 +151,123 @@ class JobPoll:
         return result.rstrip(",")
 
     @staticmethod
-    def wait_for_pipeline(proxy: FlywheelProxy, search_str: str) -> None:
+    def find_jobs_by_id(proxy: FlywheelProxy, job_ids: List[str]) -> Dict[str, Job]:
+        """Find the jobs with the given IDs, in batches of job IDs.
+
+        Args:
+            proxy: the proxy for the Flywheel instance
+            job_ids: Flywheel job IDs
+
+        Returns:
+            Dict[str, Job]: jobs found keyed by job ID
+        """
+        jobs: Dict[str, Job] = {}
+        for start in range(0, len(job_ids), JOB_SEARCH_BATCH_SIZE):
+            batch = job_ids[start : start + JOB_SEARCH_BATCH_SIZE]
+            for job in proxy.find_jobs(f"_id=|[{','.join(batch)}]"):
+                jobs[job.id] = job
+
+        return jobs
+
+    @staticmethod
+    def wait_for_jobs(
+        proxy: FlywheelProxy,
+        job_ids: Iterable[str],
+        backoff: PollBackoff = DEFAULT_BACKOFF,
+    ) -> Iterator[Job]:
+        """Wait for a set of jobs, yields each job as it finishes.
+
+        The status of the pending jobs is retrieved with a single query
+        per poll (per batch of job IDs). A failed job is checked again on
+        the next poll, since Flywheel may not have retried it yet. If a
+        failed job is retried, the retry is tracked in place of the failed
+        job.
+
+        Args:
+            proxy: the proxy for the Flywheel instance
+            job_ids: IDs of the jobs to wait for
+            backoff (optional): the polling interval policy
+
+        Returns:
+            Iterator of finished jobs, in the order they finish
+        """
+        pending = list(dict.fromkeys(job_ids))
+        rechecked: Set[str] = set()
+        sleep_total = 0.0
+        next_response = RESPONSE_INTERVAL
+        intervals = backoff.intervals()
+        while pending:
+            jobs = JobPoll.find_jobs_by_id(proxy, pending)
+            still_pending = []
+            for job_id in pending:
+                job = jobs.get(job_id)
+                if not job:
+                    log.warning("Unable to find job: %s", job_id)
+                    continue
+
+                if job.state in ACTIVE_JOB_STATES:
+                    still_pending.append(job_id)
+                    continue
+
+                if job.state == "failed" and job.retried is not None:
+                    retried_job = proxy.find_job(f'previous_job_id="{job_id}"')
+                    if retried_job:
+                        log.info("Job %s was retried as %s", job_id, retried_job.id)
+                        still_pending.append(retried_job.id)
+                        continue
+
+                if job.state == "failed" and job_id not in rechecked:
+                    # wait to see if the job gets retried
+                    rechecked.add(job_id)
+                    still_pending.append(job_id)
+                    continue
+
+                log.info("Job %s finished with status: %s", job.id, job.state)
+                yield job
+
+            pending = still_pending
+            if not pending:
+                break
+
+            # add log message to prevent being unresponsive
+            if sleep_total >= next_response:
+                log.info("Waiting for %d jobs to finish", len(pending))
+                next_response += RESPONSE_INTERVAL
+
+            sleep_interval = next(intervals)
+            time.sleep(sleep_interval)
+            sleep_total += sleep_interval
+
+    @staticmethod
+    def wait_for_pipeline(
+        proxy: FlywheelProxy, search_str: str, backoff: PollBackoff = DEFAULT_BACKOFF
+    ) -> None:
         """Wait for a pipeline to finish executing before continuing.
 
+        Waits for all jobs matching the search string, and repeats the
+        search until no matching jobs are found, so that jobs triggered
+        by the finished jobs are also waited for.
+
         Args:
             proxy: the proxy for the Flywheel instance
             search_str: The search string to search for the pipeline
+            backoff (optional): the polling interval policy
         """
-        running = True
-        while running:
-            job = proxy.find_job(search_str)
-            if job:
-                log.info(
-                    f"A pipeline with current job {job.id} is "
-                    + "running, waiting for completion"
-                )
-                # at least for now we don't really care about the state
-                # of other submission pipelines, we just wait for it to finish
-                JobPoll.poll_job_status(job)
-            else:
-                running = False
+        while True:
+            jobs = proxy.find_jobs(search_str)
+            if not jobs:
+                return
+
+            log.info(
+                f"A pipeline with current jobs {[job.id for job in jobs]} is "
+                + "running, waiting for completion"
+            )
+            # at least for now we don't really care about the state
+            # of other submission pipelines, we just wait for it to finish
+            for _ in JobPoll.wait_for_jobs(
+                proxy, [job.id for job in jobs], backoff=backoff
+            ):
+                pass
 
     @classmethod
     def is_another_gear_instance_running(
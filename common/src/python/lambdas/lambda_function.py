@@ -11,6 +11,9 @@ from pydantic import BaseModel, ValidationError
 
 log = logging.getLogger(__name__)
 
+# error codes for invocations rejected due to the concurrency/rate limits
+THROTTLING_ERROR_CODES = {"TooManyRequestsException", "ThrottlingException"}
+
 
 def create_lambda_client():
     """Creates a boto3 lambda client if AWS credentials are set.
@@ -73,6 +76,7 @@ class LambdaClient:
         Returns:
           the response object from invoking the lambda function
         Raises:
+          LambdaThrottlingError if the invocation is throttled
           LambdaInvocationError if the response format is unexpected
         """
         try:
@@ -84,6 +88,8 @@ class LambdaClient:
                 LogType="None",
             )
         except ClientError as error:
+            if error.response.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES:
+                raise LambdaThrottlingError(str(error)) from error
             raise LambdaInvocationError(str(error)) from error
 
         payload = response["Payload"].read()
@@ -103,3 +109,7 @@ class LambdaClient:
 
 class LambdaInvocationError(Exception):
     """Error class for error related to invoking lambda."""
+
+
+class LambdaThrottlingError(LambdaInvocationError):
+    """Error class for lambda invocations rejected due to throttling."""
@@ -2,7 +2,9 @@
 
 from typing import Optional
 
-import requests
+from utils.http_session import get_session
+
+LONI_SESSION = "loni"
 
 
 class LONIConnectionError(Exception):
@@ -24,7 +26,7 @@ class LONIConnection:
         Returns:
           List of tables in the database.
         """
-        response = requests.get(
+        response = get_session(LONI_SESSION).get(
             url=LONIConnection.url(f"{database_name}/tables"),
             params={"key": self.__key, "format": "json"},
         )
@@ -52,7 +54,7 @@ class LONIConnection:
         Returns:
           The columns of the table.
         """
-        response = requests.get(
+        response = get_session(LONI_SESSION).get(
             url=LONIConnection.url(f"{database_name}/{table_name}/columns"),
             params={"key": self.__key, "format": "json"},
         )
@@ -77,7 +79,7 @@ class LONIConnection:
         Raises:
           LONIConnectionError when access is denied or there is a system error
         """
-        response = requests.get(
+        response = get_session(LONI_SESSION).get(
             url=LONIConnection.url(f"{database_name}/download"),
             params={"table": table_name, "key": self.__key},
         )
@@ -119,7 +121,7 @@ class LONIConnection:
           A LONI IDA connection for the account.
         """
         user_params = {"email": email, "format": "json"}
-        response = requests.post(
+        response = get_session(LONI_SESSION).post(
             url=cls.url("sync/v1/auth"),
             headers={"Content-Type": "text/plain"},
             params=user_params,
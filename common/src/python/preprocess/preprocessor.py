@@ -33,6 +33,9 @@ from preprocess.preprocessor_helpers import (
 
 log = logging.getLogger(__name__)
 
+# MLST fields compared against the NP form
+MLST_FIELDS = ["deathyr", "deathmo", "deathdy", "deceased", "autopsy"]
+
 
 class FormPreprocessor:
     """Class to carryout preprocessing checks for a participant visit
@@ -83,6 +86,32 @@ class FormPreprocessor:
                 if check in self.__module_configs.preprocess_checks:
                     self.__preprocess_checks.append(check_function)
 
+    def prefetch_visits(self, subject_lbls: List[str]) -> None:
+        """Load the existing visits for the given subjects in batches, so that
+        the preprocessing checks do not query Flywheel per visit.
+
+        Args:
+            subject_lbls: list of subject labels to be preprocessed
+        """
+        module_configs = self.__module_configs
+        if not module_configs.preprocess_checks:
+            return
+
+        fields = [
+            module_configs.date_field,
+            FieldNames.DATE_COLUMN,
+            FieldNames.VISITNUM,
+            FieldNames.PACKET,
+        ]
+        if module_configs.legacy_module:
+            fields.append(module_configs.legacy_module.date_field)
+        if module_configs.supplement_module:
+            fields.append(module_configs.supplement_module.date_field)
+        if PreprocessingChecks.NP_MLST_RESTRICTIONS in module_configs.preprocess_checks:
+            fields.extend(MLST_FIELDS)
+
+        self.__forms_store.prefetch_visits(subject_lbls=subject_lbls, fields=fields)
+
     def is_accepted_packet(self, pp_context: PreprocessingContext) -> bool:
         """Validate whether the provided packet code matches with an expected
         code for the module.
@@ -1233,14 +1262,13 @@ class FormPreprocessor:
         assert pp_context.subject_lbl, "pp_context.subject_lbl required"
 
         # get most recent MLST form
-        mlst_fields = ["deathyr", "deathmo", "deathdy", "deceased", "autopsy"]
         all_mlst_forms = self.__forms_store.query_form_data(
             subject_lbl=pp_context.subject_lbl,
             module=DefaultValues.MLST_MODULE,
             legacy=False,
             search_col=FieldNames.DATE_COLUMN,
             find_all=True,
-            extra_columns=mlst_fields,
+            extra_columns=MLST_FIELDS,
             qc_gear=self.__qc_gear,
         )
 
@@ -1252,7 +1280,7 @@ class FormPreprocessor:
                 legacy=True,
                 search_col=FieldNames.DATE_COLUMN,
                 find_all=True,
-                extra_columns=mlst_fields,
+                extra_columns=MLST_FIELDS,
                 qc_gear=self.__legacy_qc_gear,
             )
 
@@ -0,0 +1,225 @@
+"""Module for caching RxCUI history statuses.
+
+The RxNav API is rate limited (20 requests per second), so validating
+the drug IDs in a visit one request at a time can be slow. The status
+store keeps the history status of each RxCUI so that the active date
+window check can be answered locally. The cached statuses can be
+persisted as a JSON snapshot and reused across runs.
+"""
+
+import json
+import logging
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Optional, TextIO
+
+from pydantic import BaseModel, ValidationError
+
+from rxnav.rxnav_connection import (
+    RxCuiConnection,
+    RxNavConnectionError,
+    is_active_status,
+)
+
+log = logging.getLogger(__name__)
+
+
+class RxCuiStatusRecord(BaseModel):
+    """History status of a RxCUI."""
+
+    rxcui: str
+    status: str
+    active_start_date: Optional[str] = None
+    active_end_date: Optional[str] = None
+    retrieved: datetime
+
+    def is_active(self, target_date: Optional[date] = None) -> bool:
+        """Returns whether or not the RxCUI is active.
+
+        Args:
+            target_date: If provided, checks if the RxCUI was active at that
+                time. Otherwise, just checks if it's currently active.
+
+        Returns:
+            boolean: Whether or not the RxCUI is active.
+        """
+        return is_active_status(
+            status=self.status,
+            active_start_date=self.active_start_date,
+            active_end_date=self.active_end_date,
+            target_date=target_date,
+        )
+
+
+def normalize_rxcui(rxcui: int | str) -> Optional[str]:
+    """Normalize the RxCUI to use as the cache key.
+
+    Args:
+        rxcui: the RxCUI
+
+    Returns:
+        Optional[str]: the RxCUI as a string, None if not a valid number
+    """
+    try:
+        return str(int(str(rxcui).strip()))
+    except ValueError:
+        return None
+
+
+class RxCuiStatusStore:
+    """Least recently used cache of RxCUI history statuses."""
+
+    def __init__(
+        self, max_size: int = 10000, ttl: timedelta = timedelta(days=7)
+    ) -> None:
+        """
+        Args:
+            max_size: maximum number of statuses to keep in memory
+            ttl: time after which a status is retrieved again from RxNav
+        """
+        self.__max_size = max_size
+        self.__ttl = ttl
+        self.__records: OrderedDict[str, RxCuiStatusRecord] = OrderedDict()
+        self.__modified = False
+
+    @property
+    def modified(self) -> bool:
+        """Whether statuses were retrieved since the last load/dump."""
+        return self.__modified
+
+    def __len__(self) -> int:
+        return len(self.__records)
+
+    def __is_expired(self, record: RxCuiStatusRecord) -> bool:
+        return datetime.now() - record.retrieved > self.__ttl
+
+    def __add(self, record: RxCuiStatusRecord) -> None:
+        self.__records[record.rxcui] = record
+        self.__records.move_to_end(record.rxcui)
+        while len(self.__records) > self.__max_size:
+            self.__records.popitem(last=False)
+
+    def __lookup(self, rxcui: str) -> Optional[RxCuiStatusRecord]:
+        record = self.__records.get(rxcui)
+        if not record or self.__is_expired(record):
+            return None
+
+        self.__records.move_to_end(rxcui)
+        return record
+
+    def __retrieve(self, rxcui: str) -> RxCuiStatusRecord:
+        metadata = RxCuiConnection.get_rxcui_history_metadata(rxcui)
+        record = RxCuiStatusRecord(
+            rxcui=rxcui,
+            status=metadata["status"],
+            active_start_date=metadata.get("activeStartDate") or None,
+            active_end_date=metadata.get("activeEndDate") or None,
+            retrieved=datetime.now(),
+        )
+        self.__add(record)
+        self.__modified = True
+        return record
+
+    def get(self, rxcui: int | str) -> Optional[RxCuiStatusRecord]:
+        """Get the history status for the RxCUI, retrieves from RxNav if not
+        cached or expired.
+
+        Args:
+            rxcui: the RxCUI
+
+        Returns:
+            Optional[RxCuiStatusRecord]: the status, None if not a valid RxCUI
+
+        Raises:
+            RxNavConnectionError: if error occurs connecting to RxNav
+        """
+        key = normalize_rxcui(rxcui)
+        if key is None:
+            return None
+
+        record = self.__lookup(key)
+        if record:
+            return record
+
+        return self.__retrieve(key)
+
+    def is_rxcui_active(
+        self, rxcui: int | str, target_date: Optional[date] = None
+    ) -> bool:
+        """Returns whether or not the RxCUI is active.
+
+        Args:
+            rxcui: the RxCUI
+            target_date: If provided, checks if the RxCUI was active at that
+                time. Otherwise, just checks if it's currently active.
+
+        Returns:
+            boolean: Whether or not the RxCUI is active.
+        """
+        record = self.get(rxcui)
+        if not record:
+            return False
+
+        return record.is_active(target_date)
+
+    def warm(self, rxcuis: Iterable[int | str]) -> int:
+        """Retrieve the statuses for the given RxCUIs that are not already
+        cached, so subsequent lookups are answered locally.
+
+        Args:
+            rxcuis: list of RxCUIs
+
+        Returns:
+            int: number of statuses retrieved from RxNav
+        """
+        keys = {normalize_rxcui(rxcui) for rxcui in rxcuis}
+        missing = [key for key in keys if key is not None and not self.__lookup(key)]
+
+        for key in missing:
+            try:
+                self.__retrieve(key)
+            except RxNavConnectionError as error:
+                log.warning("Failed to retrieve status for RxCUI %s: %s", key, error)
+
+        log.info(
+            "RxCUI status cache: %d requested, %d retrieved", len(keys), len(missing)
+        )
+        return len(missing)
+
+    def load(self, stream: TextIO) -> None:
+        """Load cached statuses from a JSON snapshot. Expired statuses are
+        skipped.
+
+        Args:
+            stream: input stream for the snapshot keyed by RxCUI
+        """
+        try:
+            snapshot: Dict[str, Dict] = json.load(stream)
+        except json.JSONDecodeError as error:
+            log.warning("Failed to load RxCUI status snapshot: %s", error)
+            return
+
+        for rxcui, data in snapshot.items():
+            try:
+                record = RxCuiStatusRecord.model_validate({**data, "rxcui": rxcui})
+            except ValidationError as error:
+                log.warning("Invalid RxCUI status for %s: %s", rxcui, error)
+                continue
+
+            if not self.__is_expired(record):
+                self.__add(record)
+
+        self.__modified = False
+
+    def dump(self, stream: TextIO) -> None:
+        """Write the cached statuses as a JSON snapshot keyed by RxCUI.
+
+        Args:
+            stream: output stream
+        """
+        snapshot = {
+            rxcui: record.model_dump(mode="json", exclude={"rxcui"})
+            for rxcui, record in self.__records.items()
+        }
+        json.dump(snapshot, stream)
+        self.__modified = False
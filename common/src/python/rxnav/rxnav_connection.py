@@ -5,17 +5,24 @@ https://lhncbc.nlm.nih.gov/RxNav/APIs
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime
 from json import JSONDecodeError
-from typing import Any, Dict, List, MutableMapping, Optional
+from typing import IO, Any, Dict, List, MutableMapping, Optional, Tuple
 
 import requests
 from ratelimit import limits, sleep_and_retry
 from requests import Response
+from utils.http_session import HTTPSessionConfig, get_session
 
 log = logging.getLogger(__name__)
 
+# max number of concurrent RxNav requests, also the size of the connection pool
+RXNAV_MAX_WORKERS = 8
+
+RXNAV_SESSION_CONFIG = HTTPSessionConfig(pool_size=RXNAV_MAX_WORKERS)
+
 
 def error_message(message: str, response: Response) -> str:
     """Build an error message from the given message and HTTP response.
@@ -79,6 +86,8 @@ class RxNavConnection:
         NLM requires users send no more than 20 requests per second per IP address:
         https://lhncbc.nlm.nih.gov/RxNav/TermsofService.html
 
+        Requests share a pooled session, so connections are reused.
+
         Returns:
           The response from posting the request.
 
@@ -87,10 +96,11 @@ class RxNavConnection:
         """
         target_url = cls.url(path)
         try:
-            response = requests.get(target_url)
+            response = get_session("rxnav", RXNAV_SESSION_CONFIG).get(target_url)
         except (
             requests.exceptions.SSLError,
             requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
         ) as error:
             raise RxNavConnectionError(
                 message=f"Error connecting to {target_url} - {error}"
@@ -128,12 +138,28 @@ class RxCuiConnection(RxNavConnection):
         Returns:
             RxcuiStatus: The RxcuiStatus
         """
+        return cls.get_rxcui_history_metadata(rxcui)["status"]
+
+    @classmethod
+    def get_rxcui_history_metadata(cls, rxcui: int | str) -> Dict[str, Any]:
+        """Get the RxCUI history status metadata, which includes the status
+        and the active start/end dates - uses the getRxcuiHistoryStatus
+        endpoint:
+
+        https://lhncbc.nlm.nih.gov/RxNav/APIs/api-RxNorm.getRxcuiHistoryStatus.html
+
+        Args:
+            rxcui: the RXCUI
+
+        Returns:
+            Dict[str, Any]: the metaData section of the response
+        """
         record = cls.handle_response(
             message=f"Getting the RXCUI history status for {rxcui}",
             path=f"REST/rxcui/{rxcui}/historystatus.json",
         )
 
-        return record["rxcuiStatusHistory"]["metaData"]["status"]
+        return record["rxcuiStatusHistory"]["metaData"]
 
     @classmethod
     def is_rxcui_active(cls, rxcui: int, target_date: Optional[date] = None) -> bool:
@@ -154,37 +180,55 @@ class RxCuiConnection(RxNavConnection):
         Returns:
             boolean: Whether or not the RxCUI is active.
         """
-        record = cls.handle_response(
-            message=f"Getting the RXCUI history status for {rxcui}",
-            path=f"REST/rxcui/{rxcui}/historystatus.json",
+        metadata = cls.get_rxcui_history_metadata(rxcui)
+
+        return is_active_status(
+            status=metadata["status"],
+            active_start_date=metadata.get("activeStartDate"),
+            active_end_date=metadata.get("activeEndDate"),
+            target_date=target_date,
         )
 
-        metadata = record["rxcuiStatusHistory"]["metaData"]
 
-        # If no target date, just check if currently active
-        if not target_date:
-            return metadata["status"] == RxCuiStatus.ACTIVE
+def is_active_status(
+    *,
+    status: str,
+    active_start_date: Optional[str],
+    active_end_date: Optional[str],
+    target_date: Optional[date] = None,
+) -> bool:
+    """Check whether a RxCUI with the given history status is active.
+
+    Args:
+        status: the RxCUI status
+        active_start_date: active start date in MMYYYY format, if any
+        active_end_date: active end date in MMYYYY format, if any
+        target_date: If provided, checks if the RxCUI was active at that
+            time. Otherwise, just checks if it's currently active.
 
-        # otherwise check if it was active at the given target date
-        active_start_date = metadata.get("activeStartDate")
-        active_end_date = metadata.get("activeEndDate")
+    Returns:
+        boolean: Whether or not the RxCUI is active.
+    """
+    # If no target date, just check if currently active
+    if not target_date:
+        return status == RxCuiStatus.ACTIVE
 
-        # if no start date, was never active
-        if not active_start_date:
-            return False
+    # if no start date, was never active
+    if not active_start_date:
+        return False
 
-        # normalize the target date to the first of the month since
-        # we do not have day information from RxNorm
-        target_date_norm = target_date.replace(day=1)
-        start_date = datetime.strptime(active_start_date, "%m%Y").date()
+    # normalize the target date to the first of the month since
+    # we do not have day information from RxNorm
+    target_date_norm = target_date.replace(day=1)
+    start_date = datetime.strptime(active_start_date, "%m%Y").date()
 
-        # if no end date, just compare start date
-        if not active_end_date:
-            return start_date <= target_date_norm
+    # if no end date, just compare start date
+    if not active_end_date:
+        return start_date <= target_date_norm
 
-        # else needs to be between start and end date
-        end_date = datetime.strptime(active_end_date, "%m%Y").date()
-        return start_date <= target_date_norm <= end_date
+    # else needs to be between start and end date
+    end_date = datetime.strptime(active_end_date, "%m%Y").date()
+    return start_date <= target_date_norm <= end_date
 
 
 class RxClassConnection(RxNavConnection):
@@ -286,6 +330,7 @@ class RxClassConnection(RxNavConnection):
         rx_classes: List[str],
         rela_source: str = "ATCPROD",
         combination_rx_classes: Optional[List[str]] = None,
+        max_workers: int = RXNAV_MAX_WORKERS,
     ) -> MutableMapping:
         """Get all related members for the specified RxClasses (combo and non-
         combo classes have separate filters, so use separate lists). Assumes
@@ -300,41 +345,74 @@ class RxClassConnection(RxNavConnection):
                 - This will include the ingredients
                 - Filter out DF and DFG
 
+        The requests for each step are sent concurrently, and are bounded by
+        the rate limit on get_request. Related concepts are queried once
+        per RxCUI even if the RxCUI is a member of several classes.
+
         Args:
             rx_classes: List of the RxClasses to query and aggregate for
             rela_source: str, the class to drug member relation
                 (e.g. ATC or ATCPROD)
             combination_rx_classes: Combination RxClasses; will have certain
                 concepts filtered
+            max_workers: max number of concurrent requests
 
         Returns:
             Mapping of RxClass to the RxCUI members and their data
         """
-        results: MutableMapping = {}
-        for rxclass in rx_classes:
-            log.debug(f"Querying concepts for {rxclass}...")
-            results[rxclass] = {}
-            filter_single_ingredients = False
-
-            if combination_rx_classes:
-                filter_single_ingredients = rxclass in combination_rx_classes
+        combination = set(combination_rx_classes or [])
+        filters = {rxclass: rxclass in combination for rxclass in rx_classes}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            log.debug(f"Querying members for {len(rx_classes)} RxClasses...")
+            class_members = dict(
+                zip(
+                    rx_classes,
+                    pool.map(
+                        lambda rxclass: cls.get_rxclass_members(
+                            rxclass,
+                            rela_source=rela_source,
+                            filter_single_ingredients=filters[rxclass],
+                        ),
+                        rx_classes,
+                    ),
+                    strict=True,
+                )
+            )
 
-            members = cls.get_rxclass_members(
-                rxclass,
-                rela_source=rela_source,
-                filter_single_ingredients=filter_single_ingredients,
+            # the related concepts depend on the filter, so key on both
+            expand_keys: List[Tuple[str, bool]] = list(
+                dict.fromkeys(
+                    (rxcui, filters[rxclass])
+                    for rxclass, members in class_members.items()
+                    for rxcui in members
+                )
+            )
+            log.debug(f"Querying related concepts for {len(expand_keys)} RxCUIs...")
+            related = dict(
+                zip(
+                    expand_keys,
+                    pool.map(
+                        lambda key: cls.get_related_rxcuis(
+                            key[0], filter_single_ingredients=key[1]
+                        ),
+                        expand_keys,
+                    ),
+                    strict=True,
+                )
             )
 
-            for rxcui, data in members.items():
+        # assemble in member order, skipping members already included as a
+        # related concept of a previous member
+        results: MutableMapping = {}
+        for rxclass in rx_classes:
+            results[rxclass] = {}
+            for rxcui, data in class_members[rxclass].items():
                 if rxcui in results[rxclass]:
                     continue
 
                 results[rxclass][rxcui] = data
-                results[rxclass].update(
-                    cls.get_related_rxcuis(
-                        rxcui, filter_single_ingredients=filter_single_ingredients
-                    )
-                )
+                results[rxclass].update(related[(rxcui, filters[rxclass])])
 
         return results
 
@@ -356,3 +434,14 @@ def load_rxclass_concepts_from_file(stream) -> MutableMapping:
             results[rxclass][rxcui] = data
 
     return results
+
+
+def write_rxclass_concepts_to_file(concepts: MutableMapping, stream: IO[str]) -> None:
+    """Writes RxClass concepts to file, so that they can be loaded with
+    load_rxclass_concepts_from_file instead of querying.
+
+    Args:
+        concepts: Mapping of RxClass to the RxCUI members and their data
+        stream: output IO stream
+    """
+    json.dump(concepts, stream, indent=4)
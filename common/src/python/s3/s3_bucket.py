@@ -3,11 +3,13 @@
 import fnmatch
 import logging
 import re
-from io import StringIO
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO, StringIO
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 from botocore.exceptions import ClientError
 from inputs.environment import get_environment_variable
@@ -21,6 +23,10 @@ S3_PATH_RE = re.compile(
     r"(?P<key>[A-Za-z0-9._-]+(?:/[A-Za-z0-9._-]+)*)$"
 )
 
+# default number of concurrent requests when reading/downloading multiple
+# files, must not exceed the connection pool size of the client
+DEFAULT_MAX_WORKERS = 10
+
 
 class S3InterfaceError(Exception):
     pass
@@ -120,7 +126,11 @@ class S3BucketInterface:
         log.info("Results uploaded successfully")
 
     def upload_file(
-        self, local_file: Path, output_prefix: str, relative_path: Optional[str] = None
+        self,
+        local_file: Path,
+        output_prefix: str,
+        relative_path: Optional[str] = None,
+        transfer_config: Optional[TransferConfig] = None,
     ) -> None:
         """Upload a single file to the S3 bucket.
 
@@ -129,6 +139,7 @@ class S3BucketInterface:
             output_prefix: Path prefix in storage where file will be written
             relative_path: Optional relative path to preserve subdirectory structure.
                          If not provided, uses just the filename.
+            transfer_config: Optional config for multipart uploads
         """
         if not local_file.exists() or not local_file.is_file():
             raise S3InterfaceError(
@@ -143,7 +154,10 @@ class S3BucketInterface:
 
         try:
             self.__client.upload_file(
-                Filename=str(local_file), Bucket=self.__bucket, Key=remote_path
+                Filename=str(local_file),
+                Bucket=self.__bucket,
+                Key=remote_path,
+                Config=transfer_config,
             )
         except Exception as e:
             raise S3InterfaceError(
@@ -160,44 +174,72 @@ class S3BucketInterface:
         file_obj = self.get_file_object(filename)
         return StringIO(file_obj["Body"].read().decode("utf-8"))
 
-    def read_directory(self, prefix: str) -> Dict[str, Dict]:
+    def read_object(self, key: str) -> Dict[str, Any]:
+        """Retrieve the file object and read the body, so that the connection
+        is released back to the client connection pool.
+
+        Args:
+            key: Key within bucket of file to read
+        Returns:
+            Dict[str, Any]: The file object, with the body as an in-memory stream
+        """
+        s3_obj = self.__client.get_object(Bucket=self.bucket_name, Key=key)
+        if s3_obj and "Body" in s3_obj:
+            s3_obj["Body"] = BytesIO(s3_obj["Body"].read())
+
+        return s3_obj
+
+    def read_objects(
+        self, keys: Iterable[str], max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Retrieve the file objects for the keys concurrently.
+
+        Args:
+            keys: Keys within bucket of files to read
+            max_workers: Max number of concurrent requests
+        Returns:
+            Iterator of key and file object pairs, in the order of the keys
+        """
+        key_list = list(keys)
+        if not key_list:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(key_list))) as pool:
+            yield from zip(key_list, pool.map(self.read_object, key_list), strict=True)
+
+    def read_directory(
+        self, prefix: str, max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> Dict[str, Dict]:
         """Retrieve all file objects from the directory specified by the prefix
         within the S3 bucket.
 
         Args:
             prefix: directory prefix within the bucket
+            max_workers: Max number of concurrent requests
         Returns:
             Dict[str, Dict]: Set of file objects
         """
+        return {
+            key: s3_obj
+            for key, s3_obj in self.read_objects(
+                self.list_directory(prefix), max_workers=max_workers
+            )
+            if s3_obj
+        }
 
-        file_objects = {}
-        paginator = self.__client.get_paginator("list_objects_v2")
-        pages = paginator.paginate(Bucket=self.bucket_name, Prefix=prefix)
-        for page in pages:
-            if "Contents" not in page:
-                continue
-
-            for s3_obj_info in page["Contents"]:
-                # Skip paths ending in /
-                if not s3_obj_info["Key"].endswith("/"):
-                    s3_obj = self.__client.get_object(
-                        Bucket=self.bucket_name, Key=s3_obj_info["Key"]
-                    )
-                    if s3_obj:
-                        file_objects[s3_obj_info["Key"]] = s3_obj
-
-        return file_objects
-
-    def list_directory(self, prefix: str, glob: Optional[str] = None) -> List[str]:
-        """Lists the directory.
+    def list_objects(
+        self, prefix: str, glob: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Lists the object info (key, ETag, size, etc.) of the files in the
+        directory.
 
         Args:
             prefix: directory prefix within bucket
             glob: Glob to filter by, if specified
         Returns:
-            List of found files
+            List of object info for the found files
         """
-        found_keys = []
+        found_objects = []
         paginator = self.__client.get_paginator("list_objects_v2")
         pages = paginator.paginate(Bucket=self.bucket_name, Prefix=prefix)
         for page in pages:
@@ -213,38 +255,62 @@ class S3BucketInterface:
                     if glob and not fnmatch.fnmatch(key, glob):
                         continue
 
-                    found_keys.append(key)
+                    found_objects.append(s3_obj_info)
 
         with_glob_str = f" with glob '{glob}'" if glob else ""
-        if not found_keys:
+        if not found_objects:
             log.debug(f"No files found under {self.__bucket}/{prefix}{with_glob_str}")
         else:
             log.debug(
-                f"Found {len(found_keys)} files under {self.__bucket}/"
+                f"Found {len(found_objects)} files under {self.__bucket}/"
                 + f"{prefix}{with_glob_str}"
             )
 
-        return found_keys
+        return found_objects
+
+    def list_directory(self, prefix: str, glob: Optional[str] = None) -> List[str]:
+        """Lists the directory.
+
+        Args:
+            prefix: directory prefix within bucket
+            glob: Glob to filter by, if specified
+        Returns:
+            List of found files
+        """
+        return [s3_obj_info["Key"] for s3_obj_info in self.list_objects(prefix, glob)]
 
-    def download_file(self, key: str, target_path: Path) -> None:
+    def download_file(
+        self,
+        key: str,
+        target_path: Path,
+        transfer_config: Optional[TransferConfig] = None,
+    ) -> None:
         """Downloads file to specified location.
 
         Args:
             key: Key within bucket of file to download
             target_path: Target location to download file to
+            transfer_config: Optional config for multipart (byte-range) downloads
         """
         target_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            self.__client.download_file(self.__bucket, key, target_path)
+            self.__client.download_file(
+                self.__bucket, key, target_path, Config=transfer_config
+            )
         except Exception as e:
             raise S3InterfaceError(
                 f"Failed to download {self.__bucket}/{key}: {e}"
             ) from e
 
     def download_files(
-        self, prefix: str, target_dir: Path, glob: Optional[str] = None
-    ) -> None:
+        self,
+        prefix: str,
+        target_dir: Path,
+        glob: Optional[str] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        transfer_config: Optional[TransferConfig] = None,
+    ) -> List[Path]:
         """Download files from the prefix to the target directory. Preserves S3
         hierarchy under prefix.
 
@@ -252,19 +318,35 @@ class S3BucketInterface:
             prefix: Prefix within bucket to download files from
             target_dir: Target directory to download files to
             glob: Glob to filter by, if specified
+            max_workers: Max number of concurrent downloads
+            transfer_config: Optional config for multipart (byte-range) downloads
+        Returns:
+            List of downloaded file paths
         """
         # read directory and filter based on the glob
         found_files = self.list_directory(prefix, glob)
 
         if not found_files:
-            return
+            return []
+
+        # create relative path to preserve S3 hierarchy
+        target_paths = [
+            target_dir / Path(key).relative_to(prefix) for key in found_files
+        ]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(found_files))) as pool:
+            # consume the results to surface any download errors
+            list(
+                pool.map(
+                    lambda key, path: self.download_file(
+                        key, path, transfer_config=transfer_config
+                    ),
+                    found_files,
+                    target_paths,
+                )
+            )
 
-        # download files; this may be inefficient if downloading a lot of files
-        # since it's done one by one
-        for key in found_files:
-            # create relative path to preserve S3 hierarchy
-            relative_path = Path(key).relative_to(prefix)
-            self.download_file(key, target_dir / relative_path)
+        return target_paths
 
     @classmethod
     def create_from(cls, parameters: S3Parameters) -> Optional["S3BucketInterface"]:
@@ -1,9 +1,10 @@
 """Models to handle FW's datasets."""
 
-import io
 import json
 import logging
+import tempfile
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional, Set, Tuple
@@ -11,12 +12,19 @@ from typing import Any, Dict, List, Literal, Optional, Set, Tuple
 import pyarrow as pa
 import pyarrow.parquet as pq
 from pydantic import BaseModel, root_validator
-from s3.s3_bucket import S3BucketInterface
+from s3.s3_bucket import DEFAULT_MAX_WORKERS, S3BucketInterface, S3InterfaceError
 
 log = logging.getLogger(__name__)
 
 DATASET_DATE_FMT = "%Y-%m-%dT%H:%M:%S.%f%z"
 
+# max number of concurrent description reads per dataset; datasets are also
+# inspected concurrently, so this keeps the total within the client's pool
+DESCRIPTION_READ_WORKERS = 4
+
+# max number of rows read into memory at a time when aggregating a table
+DEFAULT_BATCH_SIZE = 100_000
+
 
 class FWDatasetError(Exception):
     pass
@@ -101,17 +109,25 @@ class AggregateDataset(ABC):
         """
         log.info(f"Grabbing latest datasets under {self.bucket}...")
         latest_versions: Dict[str, str] = {}
-        all_tables = set()
-
-        for center, dataset in datasets.items():
-            prefix, tables = self.get_latest_version(dataset)
-            if not prefix:
-                log.warning(f"No latest dataset found for {center}/{self.__project}")
-                continue
+        all_tables: Set[str] = set()
+        if not datasets:
+            return latest_versions, all_tables
+
+        # inspect the centers' datasets concurrently, results are in center order
+        with ThreadPoolExecutor(
+            max_workers=min(DEFAULT_MAX_WORKERS, len(datasets))
+        ) as pool:
+            results = pool.map(self.get_latest_version, datasets.values())
+            for center, (prefix, tables) in zip(datasets, results, strict=True):
+                if not prefix:
+                    log.warning(
+                        f"No latest dataset found for {center}/{self.__project}"
+                    )
+                    continue
 
-            latest_versions[center] = prefix
-            if tables:
-                all_tables.update(tables)
+                latest_versions[center] = prefix
+                if tables:
+                    all_tables.update(tables)
 
         return latest_versions, all_tables
 
@@ -135,23 +151,22 @@ class AggregateDataset(ABC):
         latest_dataset = None
         tables = None
 
+        filepath = dataset.prefix
         try:
-            # iterate over the description JSONs to get the creation dates
+            # read the description JSONs concurrently to get the creation dates
             found_descriptions = self.__s3_interface.list_directory(
                 dataset.prefix, glob=f"*{target_path}"
             )
 
-            for filepath in found_descriptions:
-                with self.__s3_interface.read_data(filepath) as fh:
-                    description = json.load(fh)
-
-                    created = datetime.strptime(
-                        description["created"], DATASET_DATE_FMT
-                    )
-                    if not latest_creation or latest_creation < created:
-                        latest_creation = created
-                        latest_dataset = filepath
-                        tables = list(description["tables"].keys())
+            for filepath, s3_obj in self.__s3_interface.read_objects(
+                found_descriptions, max_workers=DESCRIPTION_READ_WORKERS
+            ):
+                description = json.load(s3_obj["Body"])
+                created = datetime.strptime(description["created"], DATASET_DATE_FMT)
+                if not latest_creation or latest_creation < created:
+                    latest_creation = created
+                    latest_dataset = filepath
+                    tables = list(description["tables"].keys())
 
         except Exception as e:
             raise FWDatasetError(f"Failed to inspect '{filepath}': {e}") from e
@@ -177,9 +192,12 @@ class AggregateDataset(ABC):
         aggregate_dir: Path,
         file_prefix: str = "aggregate_",
         extra_columns: Optional[Dict[str, Any]] = None,
-    ) -> Path:
+    ) -> Optional[Path]:
         """Abstract method to handle the download and aggregation step for a
-        single table."""
+        single table.
+
+        Returns None if no center has data for the table.
+        """
         pass
 
 
@@ -187,16 +205,106 @@ class ParquetAggregateDataset(AggregateDataset):
     """Class to handle specifically downloading table parquets from
     datasets."""
 
+    def __init__(
+        self,
+        bucket: str,
+        project: str,
+        datasets: Dict[str, FWDataset],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Initializer.
+
+        Args:
+            bucket: Common bucket; assumes all datasets live in this bucket
+            project: Project the datasets are coming from
+            datasets: Mapping of keys (center name) to FW Datasets
+            max_workers: Max number of concurrent parquet downloads
+            batch_size: Max number of rows read into memory at a time
+                when writing the aggregate file
+        """
+        super().__init__(bucket=bucket, project=project, datasets=datasets)
+        self.__max_workers = max_workers
+        self.__batch_size = batch_size
+
+    def __list_table_files(self, table: str) -> List[Tuple[str, str]]:
+        """Lists the parquet files for the table in each center's latest
+        dataset.
+
+        Args:
+            table: the table
+        Returns:
+            List of center and S3 key pairs
+        """
+        table_files: List[Tuple[str, str]] = []
+        for center, prefix in self.latest_versions.items():
+            s3_files = self.s3_interface.list_directory(
+                f"{prefix}/tables/{table}", glob="*.parquet"
+            )
+            table_files.extend((center, key) for key in s3_files)
+
+        return table_files
+
+    def __download_table_files(
+        self, table: str, download_dir: Path
+    ) -> List[Tuple[str, Path, pa.Schema]]:
+        """Downloads the parquet files for the table concurrently.
+
+        Tried using pyarrow's s3filesystem at first for streaming but it
+        was incredibly slow, so files are downloaded to local disk rather
+        than held in memory.
+
+        Args:
+            table: the table
+            download_dir: the directory to download files to
+        Returns:
+            List of center, local file and file schema, in the order the
+            downloads completed
+        """
+        table_files = self.__list_table_files(table)
+        if not table_files:
+            return []
+
+        downloads = []
+        with ThreadPoolExecutor(
+            max_workers=min(self.__max_workers, len(table_files))
+        ) as pool:
+            futures = {}
+            for index, (center, key) in enumerate(table_files):
+                target = download_dir / f"{index}_{Path(key).name}"
+                future = pool.submit(self.s3_interface.download_file, key, target)
+                futures[future] = (center, key, target)
+
+            for future in as_completed(futures):
+                center, key, target = futures[future]
+                try:
+                    future.result()
+                    # only reads the file footer
+                    schema = pq.read_schema(target)
+                except (S3InterfaceError, pa.ArrowException) as e:
+                    raise FWDatasetError(
+                        f"Failed to download {table} data for {center} from {key}: {e}"
+                    ) from e
+
+                log.debug(f"Downloaded {key} for {center}")
+                downloads.append((center, target, schema))
+
+        return downloads
+
     def aggregate_table(
         self,
         table: str,
         aggregate_dir: Path,
         file_prefix: str = "aggregate_",
         extra_columns: Optional[Dict[str, Any]] = None,
-    ) -> Path:
+    ) -> Optional[Path]:
         """Download and write the specified table into the open table writer.
-        Assumes under tables/ directory, contains parquets, and that every
-        center's table has the same schema.
+        Assumes under tables/ directory and contains parquets. A center may
+        have more than one parquet for the table.
+
+        The parquets are downloaded concurrently and written in the order
+        they arrive. Schemas that differ across files are unified, with
+        columns missing from a file filled with nulls.
 
         Args:
             table: specific table to aggregate
@@ -207,7 +315,11 @@ class ParquetAggregateDataset(AggregateDataset):
                 Expects mapping of column name to value to fill in
 
         Returns:
-            Path to the aggregate file
+            Path to the aggregate file, None if no center has a parquet for
+            the table
+        Raises:
+            FWDatasetError if a file cannot be downloaded, or the schemas
+            cannot be unified
         """
         if table not in self.tables:
             raise FWDatasetError(f"Table is not defined in datasets {table}")
@@ -221,50 +333,99 @@ class ParquetAggregateDataset(AggregateDataset):
         aggregate_table_dir = aggregate_dir / "tables" / table
         aggregate_table_dir.mkdir(parents=True, exist_ok=True)
         outfile = aggregate_table_dir / f"{file_prefix}{table}.parquet"
-        writer = None
-
-        try:
-            for center, prefix in self.latest_versions.items():
-                log.debug(f"Downloading data for {center}...")
 
-                # assuming there is at most exactly one parquet for the table
-                s3_files = self.s3_interface.list_directory(
-                    f"{prefix}/tables/{table}", glob="*.parquet"
+        with tempfile.TemporaryDirectory(dir=aggregate_dir) as download_dir:
+            downloads = self.__download_table_files(table, Path(download_dir))
+            if not downloads:
+                # there is no schema for a table without files
+                log.info(f"No parquet files found for table {table}")
+                return None
+
+            try:
+                schema = pa.unify_schemas(
+                    [file_schema for _, _, file_schema in downloads],
+                    promote_options="permissive",
                 )
+            except pa.ArrowException as e:
+                raise FWDatasetError(
+                    f"Failed to unify schemas of table {table}: {e}"
+                ) from e
+
+            schema = add_constant_fields(schema, extra_columns)
+            with pq.ParquetWriter(outfile, schema=schema) as writer:
+                for center, local_file, _ in downloads:
+                    try:
+                        for batch in pq.ParquetFile(local_file).iter_batches(
+                            batch_size=self.__batch_size
+                        ):
+                            writer.write_batch(
+                                conform_batch(batch, schema, extra_columns)
+                            )
+                    except (ValueError, pa.ArrowException) as e:
+                        raise FWDatasetError(
+                            f"Failed to write {table} data for {center}: {e}"
+                        ) from e
+
+                    # free disk space as soon as a file is written
+                    local_file.unlink()
+
+        log.info(f"Successfully aggregated table {table} from {len(downloads)} files")
+        return outfile
 
-                if not s3_files:
-                    continue
-
-                if len(s3_files) != 1:
-                    raise FWDatasetError(
-                        "Did not find exactly one parquet file for table "
-                        + f"{table} for center {center}"
-                    )
-
-                # tried using pyarrow's s3filesystem at first for streaming
-                # but it was incredibly slow; for now the center-specific files
-                # are small enough it is probably okay to just load into memory
-                body = self.s3_interface.get_file_object(s3_files[0])["Body"]
-                data = pq.read_table(io.BytesIO(body.read()))
-
-                # add extra_columns if specified
-                if extra_columns:
-                    for field, value in extra_columns.items():
-                        arr = pa.array([value] * data.num_rows)
-                        data = data.append_column(field, arr)
 
-                if not writer:
-                    writer = pq.ParquetWriter(outfile, schema=data.schema)
+def add_constant_fields(
+    schema: pa.Schema, constants: Optional[Dict[str, Any]]
+) -> pa.Schema:
+    """Adds fields for the constant columns to the schema, replacing any
+    existing fields with the same names.
+
+    Args:
+        schema: the schema
+        constants: mapping of column name to value
+    Returns:
+        the schema with the constant fields
+    """
+    if not constants:
+        return schema
+
+    for name, value in constants.items():
+        index = schema.get_field_index(name)
+        if index >= 0:
+            schema = schema.remove(index)
+        schema = schema.append(pa.field(name, pa.scalar(value).type))
+
+    return schema
+
+
+def conform_batch(
+    batch: pa.RecordBatch, schema: pa.Schema, constants: Optional[Dict[str, Any]]
+) -> pa.RecordBatch:
+    """Conforms the batch to the unified schema.
+
+    Columns are cast to the schema types, and columns missing from the
+    batch are filled with nulls. Constant columns are filled with a
+    single repeated value instead of building a Python list of values.
+
+    Args:
+        batch: the batch
+        schema: the unified schema
+        constants: mapping of column name to value
+    Returns:
+        the batch with the schema
+    """
+    constants = constants if constants else {}
+    columns = []
+    for field in schema:
+        if field.name in constants:
+            columns.append(
+                pa.repeat(pa.scalar(constants[field.name], field.type), batch.num_rows)
+            )
+            continue
 
-                try:
-                    writer.write_table(data)
-                except ValueError as e:
-                    raise FWDatasetError(
-                        f"Failed to write {table} data for {center}"
-                    ) from e
-        finally:
-            if writer:
-                writer.close()
+        index = batch.schema.get_field_index(field.name)
+        if index < 0:
+            columns.append(pa.nulls(batch.num_rows, field.type))
+        else:
+            columns.append(batch.column(index).cast(field.type))
 
-        log.info(f"Successfully aggregated table {table}")
-        return outfile
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
@@ -0,0 +1,182 @@
+"""Harness for benchmarking gear code against the fake Flywheel client.
+
+A benchmark runs a function, usually a gear `run` entry point, against
+adaptors backed by a FakeFlywheel client, and records the calls to the
+adaptor methods with the adaptor profiler, the API requests to the fake
+client, the wall time and the peak memory. Results are checked against
+regression thresholds expressed per input row.
+
+The size of benchmark data can be scaled with the environment variable
+BENCHMARK_SCALE, so that the suite runs quickly by default and can be
+run with realistic project sizes locally.
+"""
+
+import os
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from flywheel_adaptor.instrumentation import ADAPTOR_CLASSES, profile_adaptors
+from pydantic import BaseModel
+
+from test_mocks.fake_flywheel import FakeFlywheel
+
+BENCHMARK_SCALE_VARIABLE = "BENCHMARK_SCALE"
+
+
+def benchmark_scale() -> float:
+    """Returns the scale factor for benchmark data sizes."""
+    return float(os.environ.get(BENCHMARK_SCALE_VARIABLE, "1"))
+
+
+def scaled(size: int) -> int:
+    """Returns the size multiplied by the benchmark scale factor."""
+    return max(1, int(size * benchmark_scale()))
+
+
+class BenchmarkResult(BaseModel):
+    """Measurements from a benchmark run."""
+
+    name: str
+    rows: int
+    wall_time: float
+    peak_memory: int
+    calls: Dict[str, int]
+    call_times: Dict[str, float]
+    requests: Dict[str, int]
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.requests.values())
+
+    def per_row(self, value: float) -> float:
+        """Returns the value divided by the number of rows."""
+        return value / max(self.rows, 1)
+
+    def report(self) -> str:
+        """Returns a text report of the benchmark results."""
+        lines = [
+            f"Benchmark {self.name}: {self.rows} rows, "
+            f"{self.wall_time:.3f}s wall time, "
+            f"{self.peak_memory / 1024 / 1024:.1f}MiB peak memory",
+            f"  API requests: {self.total_requests} "
+            f"({self.per_row(self.total_requests):.2f} per row)",
+        ]
+        lines.extend(
+            f"    {name}: {num_requests}"
+            for name, num_requests in sorted(
+                self.requests.items(), key=lambda item: -item[1]
+            )
+        )
+        lines.append(
+            f"  Adaptor calls: {self.total_calls} "
+            f"({self.per_row(self.total_calls):.2f} per row)"
+        )
+        lines.extend(
+            f"    {name}: {num_calls} ({self.call_times.get(name, 0.0):.3f}s)"
+            for name, num_calls in sorted(self.calls.items(), key=lambda item: -item[1])
+        )
+        return "\n".join(lines)
+
+
+class BenchmarkThresholds(BaseModel):
+    """Regression thresholds for a benchmark, per input row."""
+
+    max_requests_per_row: Optional[float] = None
+    max_calls_per_row: Dict[str, float] = {}
+    max_seconds_per_row: Optional[float] = None
+    max_peak_memory: Optional[int] = None
+
+    def check(self, result: BenchmarkResult) -> List[str]:
+        """Checks the result against the thresholds.
+
+        Args:
+          result: the benchmark result
+        Returns:
+          the list of threshold violations, empty if none
+        """
+        violations = []
+        requests_per_row = result.per_row(result.total_requests)
+        if (
+            self.max_requests_per_row is not None
+            and requests_per_row > self.max_requests_per_row
+        ):
+            violations.append(
+                f"{requests_per_row:.2f} API requests per row exceeds "
+                f"{self.max_requests_per_row}"
+            )
+
+        for name, max_calls in self.max_calls_per_row.items():
+            calls_per_row = result.per_row(result.calls.get(name, 0))
+            if calls_per_row > max_calls:
+                violations.append(
+                    f"{calls_per_row:.2f} calls per row to {name} exceeds {max_calls}"
+                )
+
+        seconds_per_row = result.per_row(result.wall_time)
+        if (
+            self.max_seconds_per_row is not None
+            and seconds_per_row > self.max_seconds_per_row
+        ):
+            violations.append(
+                f"{seconds_per_row:.4f}s per row exceeds {self.max_seconds_per_row}s"
+            )
+
+        if (
+            self.max_peak_memory is not None
+            and result.peak_memory > self.max_peak_memory
+        ):
+            violations.append(
+                f"peak memory {result.peak_memory} exceeds {self.max_peak_memory}"
+            )
+
+        return violations
+
+
+def run_benchmark(
+    name: str,
+    function: Callable[[], Any],
+    *,
+    client: FakeFlywheel,
+    rows: int,
+    classes: Sequence[type] = ADAPTOR_CLASSES,
+) -> BenchmarkResult:
+    """Runs the function and measures the calls, time and memory used.
+
+    Requests made to the client before the run, such as when creating
+    adaptors, are not included.
+
+    Args:
+      name: the benchmark name
+      function: the function to benchmark
+      client: the fake Flywheel client used by the function
+      rows: the number of input rows processed by the function
+      classes (optional): the classes whose method calls are recorded
+    Returns:
+      the benchmark result
+    """
+    client.reset_requests()
+    tracemalloc.start()
+    try:
+        with profile_adaptors(classes) as profiler:
+            start = time.perf_counter()
+            function()
+            wall_time = time.perf_counter() - start
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    profiles = profiler.method_profiles()
+    return BenchmarkResult(
+        name=name,
+        rows=rows,
+        wall_time=wall_time,
+        peak_memory=peak_memory,
+        calls={profile.method: profile.calls for profile in profiles},
+        call_times={profile.method: profile.total_seconds for profile in profiles},
+        requests=dict(client.requests),
+    )
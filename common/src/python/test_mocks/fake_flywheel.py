@@ -0,0 +1,600 @@
+"""In-process fake of the Flywheel SDK client for benchmarks.
+
+Unlike the mocks in mock_flywheel, the fake keeps a container hierarchy
+in memory, so that FlywheelProxy, ProjectAdaptor and SubjectAdaptor run
+unmodified against it. Each operation that would be a request to the
+Flywheel API is counted, and can be delayed by a configurable latency to
+approximate a remote instance.
+
+Only the parts of the SDK used by the adaptors are implemented. Finder
+queries support comma separated terms of the form `key=value` and
+`key=|[value1,value2]`, where key is a dotted attribute path. Dataviews
+are supported for acquisition files, as built by
+FlywheelProxy.get_matching_acquisition_files_info, with filters using
+the same terms over the view columns.
+"""
+
+import json
+import re
+import time
+from collections import Counter
+from datetime import datetime
+from fnmatch import fnmatch
+from io import BytesIO
+from itertools import count
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from flywheel.file_spec import FileSpec
+
+# number of items per page when iterating over a finder
+FINDER_PAGE_SIZE = 1000
+
+QUERY_TERM_PATTERN = re.compile(r"([^,=]+)=(\|\[[^\]]*\]|[^,]*)")
+
+
+class FakeFlywheel:
+    """Fake Flywheel SDK client that counts API requests."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        """Initializes the fake client.
+
+        Args:
+          latency: the delay in seconds added to each API request
+        """
+        self.latency = latency
+        self.requests: Counter[str] = Counter()
+        self.__ids = count(1)
+        self.__containers: Dict[str, "FakeContainer"] = {}
+        self.__files: Dict[str, "FakeFile"] = {}
+        self.files = FakeFinder(self, "files", lambda: list(self.__files.values()))
+        self.subjects = FakeFinder(
+            self,
+            "subjects",
+            lambda: [
+                container
+                for container in self.__containers.values()
+                if isinstance(container, FakeSubject)
+            ],
+        )
+
+    def request(self, name: str) -> None:
+        """Records an API request, and waits for the configured latency.
+
+        Args:
+          name: the name of the request
+        """
+        self.requests[name] += 1
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+    def reset_requests(self) -> None:
+        """Resets the request counts."""
+        self.requests.clear()
+
+    def next_id(self) -> str:
+        """Returns a new unique ID."""
+        return f"{next(self.__ids):024x}"
+
+    def add_container(self, container: "FakeContainer") -> None:
+        """Adds the container to the containers of this instance."""
+        self.__containers[container.id] = container
+
+    def add_file(self, file: "FakeFile") -> None:
+        """Adds the file to the files of this instance."""
+        self.__files[file.file_id] = file
+
+    def remove_file(self, file: "FakeFile") -> None:
+        """Removes the file from the files of this instance."""
+        self.__files.pop(file.file_id, None)
+
+    def add_project(self, *, group: str, label: str) -> "FakeProject":
+        """Adds a project to this instance, does not count as a request.
+
+        Args:
+          group: the group ID
+          label: the project label
+        Returns:
+          the project
+        """
+        project = FakeProject(client=self, label=label, group=group)
+        self.add_container(project)
+        return project
+
+    def get(self, container_id: str) -> "FakeContainer":
+        self.request("get")
+        return self.__containers[container_id]
+
+    def get_file(self, file_id: str) -> "FakeFile":
+        self.request("get_file")
+        return self.__files[file_id]
+
+    def get_acquisition(self, acquisition_id: str) -> "FakeContainer":
+        self.request("get_acquisition")
+        return self.__containers[acquisition_id]
+
+    def read_view_data(self, view: Any, container_id: str) -> BytesIO:
+        """Runs the dataview over the acquisition files in the container.
+
+        Args:
+          view: the dataview, with columns, filename pattern, filter and
+            missing data strategy
+          container_id: the ID of a container above the acquisitions
+        Returns:
+          the JSON view data with a row per matching file
+        """
+        self.request("read_view_data")
+        name_filter = view.file_spec.filter if view.file_spec else None
+        pattern = name_filter.value if name_filter and name_filter.value else "*"
+        terms = parse_query(view.filter)
+
+        rows = []
+        for file in self.__files.values():
+            if file.parent_ref.type != "acquisition":
+                continue
+            if container_id not in vars(file.parents).values():
+                continue
+            if not fnmatch(file.name, pattern):
+                continue
+
+            sources = {
+                "file": file,
+                "acquisition": self.__containers[file.parent_ref.id],
+            }
+            if not all(
+                str(get_view_value(sources, key)) in values for key, values in terms
+            ):
+                continue
+
+            row = {
+                column.dst or column.src: get_view_value(sources, column.src)
+                for column in view.columns
+            }
+            if view.missing_data_strategy == "drop-row" and None in row.values():
+                continue
+
+            rows.append(row)
+
+        return BytesIO(json.dumps({"data": rows}, default=str).encode("utf-8"))
+
+    def delete_subject(self, subject_id: str) -> None:
+        self.request("delete_subject")
+        subject = self.__containers.pop(subject_id)
+        assert isinstance(subject, FakeSubject)
+        subject.project.remove_subject(subject)
+
+
+class FakeParents:
+    """Parent references of a container or file."""
+
+    def __init__(self, **parents: Optional[str]) -> None:
+        self.group = parents.get("group")
+        self.project = parents.get("project")
+        self.subject = parents.get("subject")
+        self.session = parents.get("session")
+        self.acquisition = parents.get("acquisition")
+
+
+class FakeParentRef:
+    """Reference to the container of a file."""
+
+    def __init__(self, *, container_id: str, container_type: str) -> None:
+        self.id = container_id
+        self.type = container_type
+
+
+def get_attribute(item: Any, path: str) -> Any:
+    """Returns the value of the dotted attribute path for the item."""
+    value = item
+    for name in path.split("."):
+        if name == "_id":
+            name = "id"
+        value = getattr(value, name, None)
+        if value is None:
+            return None
+
+    return value
+
+
+def get_view_value(sources: Dict[str, Any], column: str) -> Any:
+    """Returns the value of a dataview column, where the column is a dotted
+    path starting with the container type, and continuing into info.
+
+    Args:
+      sources: the file and containers of a row by container type
+      column: the column path
+    Returns:
+      the value, None if missing
+    """
+    source, _, path = column.partition(".")
+    value = sources.get(source)
+    for name in path.split("."):
+        if isinstance(value, dict):
+            value = value.get(name)
+        else:
+            value = get_attribute(value, name)
+        if value is None:
+            return None
+
+    return value
+
+
+def parse_query(query: Optional[str]) -> List[Tuple[str, Set[str]]]:
+    """Parses the finder query into attribute paths and accepted values.
+
+    Args:
+      query: the finder query
+    Returns:
+      the list of attribute path and accepted values for each term
+    """
+    if not query:
+        return []
+
+    terms = []
+    for key, value in QUERY_TERM_PATTERN.findall(query):
+        choices = value[2:-1].split(",") if value.startswith("|[") else [value]
+        terms.append((key.strip(), {choice.strip().strip('"') for choice in choices}))
+
+    return terms
+
+
+def match_query(item: Any, terms: List[Tuple[str, Set[str]]]) -> bool:
+    """Indicates whether the item matches all terms of a parsed query.
+
+    Args:
+      item: the container or file
+      terms: the parsed finder query
+    Returns:
+      True if the item matches all terms
+    """
+    return all(str(get_attribute(item, key)) in values for key, values in terms)
+
+
+class FakeFinder:
+    """Finder over a collection of containers or files."""
+
+    def __init__(
+        self, client: FakeFlywheel, name: str, items: Callable[[], Sequence[Any]]
+    ) -> None:
+        self.__client = client
+        self.__name = name
+        self.__items = items
+
+    def find(self, query: Optional[str] = None, **kwargs) -> List[Any]:
+        self.__client.request(f"find_{self.__name}")
+        terms = parse_query(query)
+        return [item for item in self.__items() if match_query(item, terms)]
+
+    def find_first(self, query: Optional[str] = None, **kwargs) -> Optional[Any]:
+        self.__client.request(f"find_{self.__name}")
+        terms = parse_query(query)
+        return next((item for item in self.__items() if match_query(item, terms)), None)
+
+    def iter(self) -> Iterator[Any]:
+        items = list(self.__items())
+        for start in range(0, max(len(items), 1), FINDER_PAGE_SIZE):
+            self.__client.request(f"find_{self.__name}")
+            yield from items[start : start + FINDER_PAGE_SIZE]
+
+    def __call__(self) -> List[Any]:
+        self.__client.request(f"find_{self.__name}")
+        return list(self.__items())
+
+
+class FakeFile:
+    """File attached to a container."""
+
+    def __init__(
+        self,
+        *,
+        client: FakeFlywheel,
+        name: str,
+        contents: bytes,
+        parent: "FakeContainer",
+        info: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.__client = client
+        self.name = name
+        self.file_id = client.next_id()
+        self.id = self.file_id
+        self.contents = contents
+        self.size = len(contents)
+        self.info: Dict[str, Any] = info if info is not None else {}
+        self.tags: List[str] = []
+        self.modality: Optional[str] = None
+        self.created = datetime.now()
+        self.modified = self.created
+        self.parents = FakeParents(**parent.parents_ref())
+        self.parent_ref = FakeParentRef(
+            container_id=parent.id, container_type=parent.container_type
+        )
+
+    def reload(self, *args, **kwargs) -> "FakeFile":
+        self.__client.request("get_file")
+        return self
+
+    def read(self, *args, **kwargs) -> bytes:
+        self.__client.request("download_file")
+        return self.contents
+
+    def update(self, *args, **kwargs) -> None:
+        self.__client.request("modify_file")
+        updates = args[0] if args else kwargs
+        for key, value in updates.items():
+            setattr(self, key, value)
+
+    def update_info(self, info: Dict[str, Any], **kwargs) -> None:
+        self.__client.request("modify_file_info")
+        self.info.update(info)
+
+    def replace_info(self, info: Dict[str, Any]) -> None:
+        self.__client.request("modify_file_info")
+        self.info = dict(info)
+
+    def add_tag(self, tag: str) -> None:
+        self.__client.request("add_file_tag")
+        self.tags.append(tag)
+
+    def delete_tag(self, tag: str) -> None:
+        self.__client.request("delete_file_tag")
+        self.tags.remove(tag)
+
+
+class FakeContainer:
+    """Base class for fake containers with files and info."""
+
+    container_type = "container"
+
+    def __init__(
+        self, *, client: FakeFlywheel, label: str, parents: Dict[str, Optional[str]]
+    ) -> None:
+        self._client = client
+        self.id = client.next_id()
+        self.label = label
+        self.info: Dict[str, Any] = {}
+        self.tags: List[str] = []
+        self.parents = FakeParents(**parents)
+        self.__files: Dict[str, FakeFile] = {}
+
+    def parents_ref(self) -> Dict[str, Optional[str]]:
+        """Returns the parent references for children of this container."""
+        parents = dict(vars(self.parents))
+        parents[self.container_type] = self.id
+        return parents
+
+    @property
+    def files(self) -> List[FakeFile]:
+        return list(self.__files.values())
+
+    def get_file(self, name: str) -> Optional[FakeFile]:
+        return self.__files.get(name)
+
+    def add_file(
+        self,
+        name: str,
+        contents: str | bytes,
+        info: Optional[Dict[str, Any]] = None,
+    ) -> FakeFile:
+        """Adds a file to this container, does not count as a request.
+
+        Args:
+          name: the file name
+          contents: the file contents
+          info (optional): the file info
+        Returns:
+          the new file
+        """
+        if isinstance(contents, str):
+            contents = contents.encode("utf-8")
+
+        previous = self.__files.get(name)
+        if previous is not None:
+            self._client.remove_file(previous)
+
+        file = FakeFile(
+            client=self._client, name=name, contents=contents, parent=self, info=info
+        )
+        self.__files[name] = file
+        self._client.add_file(file)
+        return file
+
+    def upload_file(self, file_spec: FileSpec, **kwargs) -> List[Dict[str, Any]]:
+        self._client.request("upload_file")
+        contents = getattr(file_spec, "contents", None)
+        if not isinstance(contents, (str, bytes)):
+            contents = b""
+
+        file = self.add_file(file_spec.name, contents)
+        return [{"name": file.name, "file_id": file.file_id, "_id": file.id}]
+
+    def delete_file(self, name: str) -> None:
+        self._client.request("delete_file")
+        file = self.__files.pop(name)
+        self._client.remove_file(file)
+
+    def read_file(self, name: str) -> bytes:
+        self._client.request("download_file")
+        return self.__files[name].contents
+
+    def reload(self, *args, **kwargs):
+        self._client.request(f"get_{self.container_type}")
+        return self
+
+    def update(self, *args, **kwargs) -> None:
+        self._client.request(f"modify_{self.container_type}")
+        updates = args[0] if args else kwargs
+        for key, value in updates.items():
+            if key == "info":
+                self.info.update(value)
+            else:
+                setattr(self, key, value)
+
+    def update_info(self, info: Dict[str, Any], **kwargs) -> None:
+        self._client.request(f"modify_{self.container_type}_info")
+        self.info.update(info)
+
+    def replace_info(self, info: Dict[str, Any]) -> None:
+        self._client.request(f"modify_{self.container_type}_info")
+        self.info = dict(info)
+
+    def add_tag(self, tag: str) -> None:
+        self._client.request(f"add_{self.container_type}_tag")
+        self.tags.append(tag)
+
+
+class FakeAcquisition(FakeContainer):
+    container_type = "acquisition"
+
+
+class FakeSession(FakeContainer):
+    container_type = "session"
+
+    def __init__(
+        self,
+        *,
+        client: FakeFlywheel,
+        label: str,
+        parents: Dict[str, Optional[str]],
+        timestamp: Optional[datetime] = None,
+    ) -> None:
+        super().__init__(client=client, label=label, parents=parents)
+        self.timestamp = timestamp
+        self.timezone: Optional[str] = None
+        self.__acquisitions: Dict[str, FakeAcquisition] = {}
+        self.acquisitions = FakeFinder(
+            client, "acquisitions", lambda: list(self.__acquisitions.values())
+        )
+
+    def create_acquisition(self, label: str) -> FakeAcquisition:
+        """Adds an acquisition, does not count as a request."""
+        acquisition = FakeAcquisition(
+            client=self._client, label=label, parents=self.parents_ref()
+        )
+        self.__acquisitions[acquisition.id] = acquisition
+        self._client.add_container(acquisition)
+        return acquisition
+
+    def add_acquisition(self, label: str, **kwargs) -> FakeAcquisition:
+        self._client.request("add_acquisition")
+        return self.create_acquisition(label)
+
+
+class FakeSubject(FakeContainer):
+    container_type = "subject"
+
+    def __init__(
+        self,
+        *,
+        client: FakeFlywheel,
+        label: str,
+        project: "FakeProject",
+    ) -> None:
+        super().__init__(client=client, label=label, parents=project.parents_ref())
+        self.project = project
+        self.__sessions: Dict[str, FakeSession] = {}
+        self.sessions = FakeFinder(
+            client, "sessions", lambda: list(self.__sessions.values())
+        )
+
+    def create_session(
+        self, label: str, timestamp: Optional[datetime] = None
+    ) -> FakeSession:
+        """Adds a session, does not count as a request."""
+        session = FakeSession(
+            client=self._client,
+            label=label,
+            parents=self.parents_ref(),
+            timestamp=timestamp,
+        )
+        self.__sessions[session.id] = session
+        self._client.add_container(session)
+        return session
+
+    def add_session(
+        self, label: str, timestamp: Optional[datetime] = None, **kwargs
+    ) -> FakeSession:
+        self._client.request("add_session")
+        return self.create_session(label, timestamp=timestamp)
+
+
+class FakeProject(FakeContainer):
+    container_type = "project"
+
+    def __init__(self, *, client: FakeFlywheel, label: str, group: str) -> None:
+        super().__init__(client=client, label=label, parents={"group": group})
+        self.group = group
+        self.__subjects: Dict[str, FakeSubject] = {}
+        self.subjects = FakeFinder(
+            client, "subjects", lambda: list(self.__subjects.values())
+        )
+
+    def create_subject(self, label: str) -> FakeSubject:
+        """Adds a subject, does not count as a request."""
+        subject = FakeSubject(client=self._client, label=label, project=self)
+        self.__subjects[subject.id] = subject
+        self._client.add_container(subject)
+        return subject
+
+    def add_subject(self, label: str, **kwargs) -> FakeSubject:
+        self._client.request("add_subject")
+        return self.create_subject(label)
+
+    def remove_subject(self, subject: FakeSubject) -> None:
+        """Removes the subject from this project."""
+        self.__subjects.pop(subject.id, None)
+
+
+def populate_form_project(
+    project: FakeProject,
+    *,
+    num_subjects: int,
+    visits_per_subject: int,
+    module: str = "UDS",
+    subject_prefix: str = "NACC",
+) -> None:
+    """Populates the project with form visits, does not count as requests.
+
+    Each subject gets one session per visit, with an acquisition for the
+    module holding the visit JSON file, with an initial packet for the
+    first visit and followup packets after, and the project gets a QC
+    status log per visit.
+
+    Args:
+      project: the project
+      num_subjects: the number of subjects
+      visits_per_subject: the number of visits for each subject
+      module (optional): the module label
+      subject_prefix (optional): the prefix for the subject labels
+    """
+    for subject_num in range(num_subjects):
+        subject = project.create_subject(f"{subject_prefix}{subject_num:06d}")
+        for visitnum in range(1, visits_per_subject + 1):
+            session_label = f"FORMS-VISIT-{visitnum}"
+            session = subject.create_session(session_label)
+            acquisition = session.create_acquisition(module)
+            record = {
+                "naccid": subject.label,
+                "module": module,
+                "visitnum": str(visitnum),
+                "visitdate": f"{2000 + visitnum}-01-01",
+                "packet": "I" if visitnum == 1 else "F",
+            }
+            acquisition.add_file(
+                f"{subject.label}_{session_label}_{module}.json",
+                json.dumps(record),
+                info={"forms": {"json": record}},
+            )
+            project.add_file(
+                f"{subject_num}_{2000 + visitnum}-01-01_{module.lower()}_qc-status.log",
+                "",
+                info={"qc": {}},
+            )
@@ -11,6 +11,7 @@ from typing import Any, Dict, List, Optional, Union
 
 from flywheel.file_spec import FileSpec
 from flywheel.models.file_entry import FileEntry
+from flywheel.models.job import Job
 from flywheel_adaptor.flywheel_proxy import FlywheelProxy, ProjectAdaptor
 from pydantic import BaseModel, field_validator
 
@@ -180,6 +181,11 @@ class MockProjectAdaptor(ProjectAdaptor):
         """
         return None
 
+    def load_subjects(self, labels=None, batch_size: int = 100) -> List:
+        """Mock implementation of load_subjects, there are no subjects to
+        load."""
+        return []
+
     def reload(self, *args, **kwargs):
         return self
 
@@ -257,6 +263,22 @@ class MockFlywheelProxy(FlywheelProxy):
             raise KeyError(f"Container {container_id} not found")
         return self._containers[container_id]
 
+    def find_job(self, search_str: str, **kwargs) -> Optional[Job]:
+        """Find the first job matching the search string.
+
+        Returns:
+            None, no jobs are running in the mock
+        """
+        return None
+
+    def find_jobs(self, search_str: str) -> List[Job]:
+        """Find all jobs matching the search string.
+
+        Returns:
+            Empty list, no jobs are running in the mock
+        """
+        return []
+
 
 def create_mock_file_with_parent(
     name: str,
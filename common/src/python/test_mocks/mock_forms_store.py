@@ -46,6 +46,10 @@ class MockFormsStore(FormsStore):
     def is_new_subject(self, subject_lbl: str) -> bool:
         return subject_lbl not in self.__subjects
 
+    def prefetch_visits(self, *, subject_lbls: List[str], **kwargs) -> None:
+        # visits are stored locally, nothing to prefetch
+        pass
+
     def query_form_data(
         self, subject_lbl: str, module: str, **kwargs
     ) -> Optional[List[Dict[str, Any]]]:
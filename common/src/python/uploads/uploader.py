@@ -257,6 +257,7 @@ class FormJSONUploader:
         """
 
         success = True
+        self.__project.load_subjects(participant_records.keys())
         for subject_lbl, visits_info in participant_records.items():
             subject = self.__project.find_subject(label=subject_lbl)
             if not subject:
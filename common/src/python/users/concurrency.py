@@ -0,0 +1,209 @@
+"""Concurrency limits for the backends used in user management.
+
+User entries are processed by worker threads, and each backend (COmanage
+and the Authorization API) has its own limit on the number of calls in
+flight. Clients for a backend are wrapped with LimitedClient, so that every
+call takes a slot for the backend, and calls to idempotent methods are
+retried on transient errors for backends whose clients do not retry.
+"""
+
+import functools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar, cast
+
+from pydantic import BaseModel, Field
+from utils.http_session import RETRY_STATUS_CODES
+
+log = logging.getLogger(__name__)
+
+C = TypeVar("C")
+
+COMANAGE = "comanage"
+AUTHORIZATION = "authorization"
+
+DEFAULT_BACKEND_LIMITS = {COMANAGE: 4, AUTHORIZATION: 4}
+
+# the authorization client retries on its own, so only COmanage is retried
+DEFAULT_RETRY_BACKENDS = [COMANAGE]
+
+# methods with these prefixes only read, and are retried on transient errors
+IDEMPOTENT_PREFIXES = ("get", "find", "lookup", "list", "search", "read")
+
+
+class ConcurrencyConfig(BaseModel):
+    """Configuration of the worker threads, the calls in flight per
+    backend, and the retries for idempotent calls.
+
+    Backends without a limit are not limited, and idempotent calls are
+    only retried for the retry backends.
+    """
+
+    max_workers: int = 1
+    backend_limits: Dict[str, int] = Field(
+        default_factory=lambda: dict(DEFAULT_BACKEND_LIMITS)
+    )
+    retry_backends: List[str] = Field(
+        default_factory=lambda: list(DEFAULT_RETRY_BACKENDS)
+    )
+    max_retries: int = 2
+    retry_backoff: float = 1.0
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Indicates whether the error, or the error it was raised from, is a
+    connection error or a throttled or unavailable response.
+
+    Args:
+      error: the error
+    Returns:
+      True if the call may succeed when retried
+    """
+    for cause in (error, error.__cause__):
+        if isinstance(cause, (ConnectionError, TimeoutError)):
+            return True
+        if getattr(cause, "status", None) in RETRY_STATUS_CODES:
+            return True
+
+    return False
+
+
+def is_idempotent(method_name: str) -> bool:
+    """Indicates whether the client method only reads, and so can be
+    retried."""
+    return method_name.startswith(IDEMPOTENT_PREFIXES)
+
+
+class BackendLimiter:
+    """Limits the calls in flight per backend.
+
+    Slots are reentrant per thread, so that a call that makes nested
+    calls to the same backend holds a single slot.
+    """
+
+    def __init__(
+        self,
+        config: Optional[ConcurrencyConfig] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.__config = config if config is not None else ConcurrencyConfig()
+        self.__sleep = sleep
+        self.__semaphores = {
+            backend: threading.BoundedSemaphore(max(limit, 1))
+            for backend, limit in self.__config.backend_limits.items()
+        }
+        self.__held = threading.local()
+
+    @contextmanager
+    def slot(self, backend: str) -> Iterator[None]:
+        """Context manager that holds a slot for the backend, waiting until
+        one is available.
+
+        Args:
+          backend: the backend name
+        """
+        semaphore = self.__semaphores.get(backend)
+        held: Dict[str, int] = self.__held.__dict__.setdefault("counts", {})
+        if semaphore is None or held.get(backend, 0) > 0:
+            held[backend] = held.get(backend, 0) + 1
+            try:
+                yield
+            finally:
+                held[backend] -= 1
+            return
+
+        with semaphore:
+            held[backend] = 1
+            try:
+                yield
+            finally:
+                held[backend] = 0
+
+    def call(
+        self,
+        backend: str,
+        function: Callable[..., Any],
+        *args: Any,
+        idempotent: bool = False,
+        **kwargs: Any,
+    ) -> Any:
+        """Calls the function while holding a slot for the backend.
+
+        Idempotent calls to a retry backend are retried with exponential
+        backoff on transient errors. The slot is released while waiting to
+        retry.
+
+        Args:
+          backend: the backend name
+          function: the function to call
+          idempotent: whether the call can be retried
+        Returns:
+          the result of the call
+        """
+        retry = idempotent and backend in self.__config.retry_backends
+        attempt = 0
+        while True:
+            try:
+                with self.slot(backend):
+                    return function(*args, **kwargs)
+            except Exception as error:
+                if (
+                    not retry
+                    or attempt >= self.__config.max_retries
+                    or not is_transient_error(error)
+                ):
+                    raise
+
+                delay = self.__config.retry_backoff * 2**attempt
+                attempt += 1
+                log.warning(
+                    "Retrying %s call %s in %.1fs: %s",
+                    backend,
+                    getattr(function, "__name__", function),
+                    delay,
+                    error,
+                )
+                self.__sleep(delay)
+
+
+class LimitedClient:
+    """Wrapper for a backend client that makes each method call through the
+    limiter.
+
+    Attributes that are not methods are returned unchanged.
+    """
+
+    def __init__(self, client: Any, backend: str, limiter: BackendLimiter) -> None:
+        self.__client = client
+        self.__backend = backend
+        self.__limiter = limiter
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.__client, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+
+        idempotent = is_idempotent(name)
+
+        @functools.wraps(attribute)
+        def call(*args, **kwargs):
+            return self.__limiter.call(
+                self.__backend, attribute, *args, idempotent=idempotent, **kwargs
+            )
+
+        return call
+
+
+def limit_client(client: C, backend: str, limiter: BackendLimiter) -> C:
+    """Returns the client wrapped so that calls are limited for the backend.
+
+    Args:
+      client: the backend client
+      backend: the backend name
+      limiter: the limiter
+    Returns:
+      the wrapped client, typed as the client
+    """
+    return cast(C, LimitedClient(client, backend, limiter))
@@ -1,5 +1,6 @@
 """Event models for user process events (both successes and errors)."""
 
+import threading
 import uuid
 from collections import defaultdict
 from datetime import datetime
@@ -238,10 +239,13 @@ class UserEventCollector:
     def __init__(self):
         """Initialize an empty event collector."""
         self._events: Dict[EventCategory, List[UserProcessEvent]] = defaultdict(list)
+        self._lock = threading.Lock()
 
     def collect(self, event: UserProcessEvent) -> None:
         """Add an event to the collection, automatically categorizing it.
 
+        Events may be collected from concurrent user processing threads.
+
         Args:
             event: The event to add to the collection
         """
@@ -252,9 +256,11 @@ class UserEventCollector:
                 None,
             )
             if category_enum:
-                self._events[category_enum].append(event)
+                with self._lock:
+                    self._events[category_enum].append(event)
         else:
-            self._events[event.category].append(event)
+            with self._lock:
+                self._events[event.category].append(event)
 
     def get_events(self) -> List[UserProcessEvent]:
         """Get all collected events as a flat list.
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from abc import ABC, abstractmethod
 from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import TYPE_CHECKING, Dict, Generic, List, Optional, TypeVar
 
@@ -39,6 +40,19 @@ log = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+def user_key(entry: object) -> str:
+    """Returns the key identifying the user of a queue entry.
+
+    Entries with the same email address are for the same user. Entries
+    without an email address are distinct.
+    """
+    email = getattr(entry, "email", None)
+    if isinstance(email, str):
+        return email.lower()
+
+    return f"entry-{id(entry)}"
+
+
 def _try_sync_profile(
     sync_service: "AuthorizationSyncService",
     registry_id: str,
@@ -81,19 +95,26 @@ class BaseUserProcess(ABC, Generic[T]):
     Subclasses should apply the process as a visitor to the queue.
     """
 
-    def __init__(self, collector: UserEventCollector) -> None:
+    def __init__(self, collector: UserEventCollector, max_workers: int = 1) -> None:
         """Initialize the base user process.
 
         Args:
             collector: Error collector for capturing error events
+            max_workers: The number of users processed concurrently
         """
         self.__collector = collector
+        self.__max_workers = max_workers
 
     @property
     def collector(self) -> UserEventCollector:
         """Get the error collector (read-only access)."""
         return self.__collector
 
+    @property
+    def max_workers(self) -> int:
+        """The number of users processed concurrently."""
+        return self.__max_workers
+
     @abstractmethod
     def visit(self, entry: T) -> None:
         pass
@@ -132,33 +153,64 @@ class UserQueue(Generic[T]):
         assert self.__queue, "only dequeue with nonempty queue"
         return self.__queue.popleft()
 
-    def apply(self, process: BaseUserProcess[T]) -> None:
+    def apply(self, process: BaseUserProcess[T], max_workers: int = 1) -> None:
         """Applies the user process to the entries of the queue.
 
         Destroys the queue. Individual entry processing errors are logged
         but do not stop the batch processing.
 
+        With more than one worker, entries for different users are
+        processed concurrently. Entries for the same user are processed
+        in queue order by a single worker. Entries added to the queue
+        while it is processed are applied after the current entries.
+
         Args:
           process: the user process
+          max_workers: the number of users processed concurrently
         """
+        if max_workers <= 1:
+            while self.__queue:
+                self.__visit(process, self.__dequeue())
+            return
+
         while self.__queue:
-            entry = self.__dequeue()
-            try:
-                process.visit(entry)
-            except (
-                FlywheelError,
-                RegistryError,
-                ValueError,
-                KeyError,
-                AttributeError,
-            ) as error:
-                # Individual user processing errors should not stop the batch
-                # Log the error and continue with the next user
-                log.error(
-                    "Error processing user entry: %s. Continuing with remaining users.",
-                    error,
-                    exc_info=True,
-                )
+            entries_by_user: Dict[str, List[T]] = {}
+            while self.__queue:
+                entry = self.__dequeue()
+                entries_by_user.setdefault(user_key(entry), []).append(entry)
+
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = [
+                    pool.submit(self.__visit_all, process, entries)
+                    for entries in entries_by_user.values()
+                ]
+                for future in futures:
+                    future.result()
+
+    def __visit_all(self, process: BaseUserProcess[T], entries: List[T]) -> None:
+        """Applies the user process to the entries in order."""
+        for entry in entries:
+            self.__visit(process, entry)
+
+    def __visit(self, process: BaseUserProcess[T], entry: T) -> None:
+        """Applies the user process to the entry, logging errors for the
+        entry."""
+        try:
+            process.visit(entry)
+        except (
+            FlywheelError,
+            RegistryError,
+            ValueError,
+            KeyError,
+            AttributeError,
+        ) as error:
+            # Individual user processing errors should not stop the batch
+            # Log the error and continue with the next user
+            log.error(
+                "Error processing user entry: %s. Continuing with remaining users.",
+                error,
+                exc_info=True,
+            )
 
 
 class InactiveUserProcess(BaseUserProcess[UserEntry]):
@@ -168,14 +220,16 @@ class InactiveUserProcess(BaseUserProcess[UserEntry]):
         self,
         environment: UserProcessEnvironment,
         collector: UserEventCollector,
+        max_workers: int = 1,
     ) -> None:
         """Initialize the inactive user process.
 
         Args:
             environment: The user process environment
             collector: Error collector for capturing error events
+            max_workers: The number of users processed concurrently
         """
-        super().__init__(collector)
+        super().__init__(collector, max_workers)
         self.__env = environment
 
     def __resolve_redcap_username(
@@ -578,7 +632,7 @@ class InactiveUserProcess(BaseUserProcess[UserEntry]):
           queue: the user entry queue
         """
         log.info("**Processing inactive entries")
-        queue.apply(self)
+        queue.apply(self, max_workers=self.max_workers)
 
 
 class CreatedUserProcess(BaseUserProcess[ActiveUserEntry]):
@@ -639,9 +693,12 @@ class UpdateCenterUserProcess(BaseUserProcess[CenterUserEntry]):
     users."""
 
     def __init__(
-        self, environment: UserProcessEnvironment, collector: UserEventCollector
+        self,
+        environment: UserProcessEnvironment,
+        collector: UserEventCollector,
+        max_workers: int = 1,
     ) -> None:
-        super().__init__(collector)
+        super().__init__(collector, max_workers)
         self.__env = environment
         self.__failure_analyzer = FailureAnalyzer(environment)
 
@@ -761,7 +818,7 @@ class UpdateCenterUserProcess(BaseUserProcess[CenterUserEntry]):
 
     def execute(self, queue: UserQueue[CenterUserEntry]) -> None:
         log.info("**Processing center users")
-        queue.apply(self)
+        queue.apply(self, max_workers=self.max_workers)
 
 
 class UpdateUserProcess(BaseUserProcess[ActiveUserEntry]):
@@ -772,14 +829,16 @@ class UpdateUserProcess(BaseUserProcess[ActiveUserEntry]):
         self,
         environment: UserProcessEnvironment,
         collector: UserEventCollector,
+        max_workers: int = 1,
     ) -> None:
         """Initialize the update user process.
 
         Args:
             environment: The user process environment
             collector: Error collector for capturing error events
+            max_workers: The number of users processed concurrently
         """
-        super().__init__(collector)
+        super().__init__(collector, max_workers)
         self.__env = environment
         self.__failure_analyzer = FailureAnalyzer(environment)
         self.__center_queue: UserQueue[CenterUserEntry] = UserQueue()
@@ -933,9 +992,11 @@ class UpdateUserProcess(BaseUserProcess[ActiveUserEntry]):
           queue: the user entry queue
         """
         log.info("**Update Flywheel users")
-        queue.apply(self)
+        queue.apply(self, max_workers=self.max_workers)
 
-        update_process = UpdateCenterUserProcess(self.__env, self.collector)
+        update_process = UpdateCenterUserProcess(
+            self.__env, self.collector, max_workers=self.max_workers
+        )
         update_process.execute(self.__center_queue)
 
 
@@ -947,6 +1008,7 @@ class ClaimedUserProcess(BaseUserProcess[ActiveUserEntry]):
         environment: UserProcessEnvironment,
         claimed_queue: UserQueue[ActiveUserEntry],
         collector: UserEventCollector,
+        max_workers: int = 1,
     ) -> None:
         """Initialize the claimed user process.
 
@@ -954,8 +1016,9 @@ class ClaimedUserProcess(BaseUserProcess[ActiveUserEntry]):
             environment: The user process environment
             claimed_queue: Queue for claimed user entries
             collector: Event collector for capturing events
+            max_workers: The number of users processed concurrently
         """
-        super().__init__(collector)
+        super().__init__(collector, max_workers)
         self.__failed_count: Dict[str, int] = defaultdict(int)
         self.__claimed_queue: UserQueue[ActiveUserEntry] = claimed_queue
         self.__created_queue: UserQueue[ActiveUserEntry] = UserQueue()
@@ -1052,14 +1115,16 @@ class ClaimedUserProcess(BaseUserProcess[ActiveUserEntry]):
           queue: the user entry queue
         """
         log.info("**Processing claimed users")
-        queue.apply(self)
+        queue.apply(self, max_workers=self.max_workers)
 
         created_process = CreatedUserProcess(
             self.__env.notification_client, self.collector
         )
         created_process.execute(self.__created_queue)
 
-        update_process = UpdateUserProcess(self.__env, self.collector)
+        update_process = UpdateUserProcess(
+            self.__env, self.collector, max_workers=self.max_workers
+        )
         update_process.execute(self.__update_queue)
 
 
@@ -1126,14 +1191,16 @@ class ActiveUserProcess(BaseUserProcess[ActiveUserEntry]):
         self,
         environment: UserProcessEnvironment,
         collector: UserEventCollector,
+        max_workers: int = 1,
     ) -> None:
         """Initialize the active user process.
 
         Args:
             environment: The user process environment
             collector: Event collector for capturing events
+            max_workers: The number of users processed concurrently
         """
-        super().__init__(collector)
+        super().__init__(collector, max_workers)
         self.__env = environment
         self.__claimed_queue: UserQueue[ActiveUserEntry] = UserQueue()
         self.__unclaimed_queue: UserQueue[ActiveUserEntry] = UserQueue()
@@ -1487,12 +1554,13 @@ class ActiveUserProcess(BaseUserProcess[ActiveUserEntry]):
           queue: the active user queue
         """
         log.info("**Processing active entries")
-        queue.apply(self)
+        queue.apply(self, max_workers=self.max_workers)
 
         claimed_process = ClaimedUserProcess(
             environment=self.__env,
             claimed_queue=self.__claimed_queue,
             collector=self.collector,
+            max_workers=self.max_workers,
         )
         claimed_process.execute(self.__claimed_queue)
 
@@ -1510,14 +1578,16 @@ class UserProcess(BaseUserProcess[UserEntry]):
         self,
         environment: UserProcessEnvironment,
         collector: UserEventCollector,
+        max_workers: int = 1,
     ) -> None:
         """Initialize the user process.
 
         Args:
             environment: The user process environment
             collector: Event collector for capturing events
+            max_workers: The number of users processed concurrently
         """
-        super().__init__(collector)
+        super().__init__(collector, max_workers)
         self.__active_queue: UserQueue[ActiveUserEntry] = UserQueue()
         self.__inactive_queue: UserQueue[UserEntry] = UserQueue()
         self.__env = environment
@@ -1550,5 +1620,9 @@ class UserProcess(BaseUserProcess[UserEntry]):
         log.info("**Processing directory entries")
         queue.apply(self)
 
-        ActiveUserProcess(self.__env, self.collector).execute(self.__active_queue)
-        InactiveUserProcess(self.__env, self.collector).execute(self.__inactive_queue)
+        ActiveUserProcess(
+            self.__env, self.collector, max_workers=self.max_workers
+        ).execute(self.__active_queue)
+        InactiveUserProcess(
+            self.__env, self.collector, max_workers=self.max_workers
+        ).execute(self.__inactive_queue)
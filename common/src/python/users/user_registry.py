@@ -1,6 +1,7 @@
 """Defines repository as interface to user registry."""
 
 import logging
+import threading
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
@@ -353,8 +354,10 @@ class RegistryPerson:
             return False
 
         identifiers = self.identifiers(
-            predicate=lambda identifier: identifier.type == "oidcsub"
-            and identifier.identifier.startswith("http://cilogon.org")
+            predicate=lambda identifier: (
+                identifier.type == "oidcsub"
+                and identifier.identifier.startswith("http://cilogon.org")
+            )
         )
         return bool(identifiers)
 
@@ -505,6 +508,7 @@ class UserRegistry:
         self.__api_instance = api_instance
         self.__coid = coid
         self.__loaded = False
+        self.__load_lock = threading.Lock()
         self.__registry_map: Dict[str, List[RegistryPerson]] = {}
         self.__bad_claims: Dict[str, List[RegistryPerson]] = {}
         self.__registry_map_by_id: Dict[str, RegistryPerson] = {}
@@ -662,8 +666,7 @@ class UserRegistry:
         Returns:
           the list of person objects with the email address
         """
-        if not self.__loaded:
-            self.__list()
+        self.__ensure_loaded()
 
         return self.__registry_map[email.lower()]
 
@@ -677,8 +680,7 @@ class UserRegistry:
           the registry person objects if a match found, else None
         """
 
-        if not self.__loaded:
-            self.__list()
+        self.__ensure_loaded()
 
         return self.__registry_map_by_id.get(registry_id)
 
@@ -693,8 +695,7 @@ class UserRegistry:
         Returns:
           True if the name corresponds to an incomplete claim
         """
-        if not self.__loaded:
-            self.__list()
+        self.__ensure_loaded()
 
         return name in self.__bad_claims
 
@@ -707,8 +708,7 @@ class UserRegistry:
         Returns:
           the list of RegistryPerson objects with incomplete claims, empty list if none
         """
-        if not self.__loaded:
-            self.__list()
+        self.__ensure_loaded()
 
         return self.__bad_claims.get(name, [])
 
@@ -724,8 +724,7 @@ class UserRegistry:
         Returns:
           list of DomainCandidate objects with match context
         """
-        if not self.__loaded:
-            self.__list()
+        self.__ensure_loaded()
 
         if "@" not in email:
             return []
@@ -772,12 +771,20 @@ class UserRegistry:
         Returns:
           list of RegistryPerson objects with matching normalized name
         """
-        if not self.__loaded:
-            self.__list()
+        self.__ensure_loaded()
 
         normalized = self.__name_normalizer(full_name)
         return self.__name_map.get(normalized, [])
 
+    def __ensure_loaded(self) -> None:
+        """Loads the registry on first use.
+
+        Concurrent callers wait for the load to complete.
+        """
+        with self.__load_lock:
+            if not self.__loaded:
+                self.__list()
+
     def __list(self) -> None:
         """Returns the dictionary of RegistryPerson objects for records in the
         comanage registry.
@@ -0,0 +1,151 @@
+"""Shared HTTP sessions for REST clients.
+
+Sessions are created once per service and shared within the process, so
+that connections are kept alive and reused across requests and threads
+rather than opening a new connection for each request. Each session has
+a connection pool sized for the number of concurrent workers, retries
+with backoff for connection errors and throttled or unavailable
+responses, and a default timeout.
+"""
+
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# status codes that are retried
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# methods that are retried, other methods are only retried on connection errors
+RETRY_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class HTTPSessionConfig(BaseModel):
+    """Configuration of the connection pool, retries and timeout for a
+    session.
+
+    The pool size should be at least the number of threads that use the
+    session concurrently. Clients that handle throttled or unavailable
+    responses themselves can set no retry status codes, so that only
+    connection errors are retried.
+    """
+
+    pool_connections: int = 10
+    pool_size: int = 10
+    max_retries: int = 3
+    retry_status_codes: Tuple[int, ...] = RETRY_STATUS_CODES
+    backoff_factor: float = 0.5
+    connect_timeout: float = 10
+    read_timeout: float = 60
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        return (self.connect_timeout, self.read_timeout)
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTP adapter that applies a default timeout to requests without
+    one."""
+
+    def __init__(self, *args, timeout: Tuple[float, float], **kwargs) -> None:
+        self.__timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs) -> Any:  # type: ignore[override]
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.__timeout
+        return super().send(request, **kwargs)
+
+
+def create_session(config: Optional[HTTPSessionConfig] = None) -> requests.Session:
+    """Creates a session with a pooled, retrying adapter for HTTP and HTTPS.
+
+    Retried responses are returned after the last retry rather than
+    raising an error, so that clients can handle the response status.
+
+    Args:
+      config (optional): the session configuration
+    Returns:
+      the session
+    """
+    config = config if config is not None else HTTPSessionConfig()
+    retry = Retry(
+        total=config.max_retries,
+        connect=config.max_retries,
+        read=config.max_retries,
+        status=config.max_retries,
+        backoff_factor=config.backoff_factor,
+        status_forcelist=config.retry_status_codes,
+        allowed_methods=RETRY_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = TimeoutHTTPAdapter(
+        pool_connections=config.pool_connections,
+        pool_maxsize=config.pool_size,
+        max_retries=retry,
+        timeout=config.timeout,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class HTTPSessionRegistry:
+    """Shared sessions by service name.
+
+    The session for a service is created on first use with the config
+    given at that time.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__sessions: Dict[str, requests.Session] = {}
+
+    def get(
+        self, name: str, config: Optional[HTTPSessionConfig] = None
+    ) -> requests.Session:
+        """Returns the session for the service, creating it if needed.
+
+        Args:
+          name: the service name
+          config (optional): the session configuration
+        Returns:
+          the shared session for the service
+        """
+        with self.__lock:
+            session = self.__sessions.get(name)
+            if session is None:
+                session = create_session(config)
+                self.__sessions[name] = session
+
+            return session
+
+    def close(self) -> None:
+        """Closes and removes all sessions."""
+        with self.__lock:
+            for session in self.__sessions.values():
+                session.close()
+            self.__sessions.clear()
+
+
+HTTP_SESSIONS = HTTPSessionRegistry()
+
+
+def get_session(
+    name: str, config: Optional[HTTPSessionConfig] = None
+) -> requests.Session:
+    """Returns the shared session for the service.
+
+    Args:
+      name: the service name
+      config (optional): the session configuration, used if the session is
+        created by this call
+    Returns:
+      the shared session for the service
+    """
+    return HTTP_SESSIONS.get(name, config)
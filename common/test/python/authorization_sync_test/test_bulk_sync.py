@@ -0,0 +1,295 @@
+"""Unit tests for bulk sync against a snapshot of the current grants."""
+
+import threading
+from dataclasses import dataclass, field
+
+import pytest
+from authorization.exceptions import BatchChunkError, UnexpectedError
+from authorization.models import (
+    BatchError,
+    BatchOperation,
+    BatchResult,
+    ResourceAccessEntry,
+    ResourceAccessList,
+    ResourceListItem,
+    ResourceListResponse,
+    UserPermissions,
+)
+from authorization_sync.models import DesiredGrant
+from authorization_sync.snapshot import GrantSnapshot
+from authorization_sync.sync_service import AuthorizationSyncService
+from authorization_sync.translator import translate
+from users.authorizations import (
+    Activities,
+    Activity,
+    Authorizations,
+    PageResource,
+)
+from users.event_models import UserEventCollector
+
+
+def create_page_authorizations(*page_names: str) -> Authorizations:
+    """Create Authorizations with view activities for the pages."""
+    activities = Activities()
+    for page_name in page_names:
+        resource = PageResource(page=page_name)
+        activities.add(resource, Activity(resource=resource, action="view"))
+    return Authorizations(activities=activities)
+
+
+def page_grant(user_id: str, page_name: str) -> DesiredGrant:
+    """Return the grant for viewing the page."""
+    (grant,) = translate(user_id, create_page_authorizations(page_name))
+    return grant
+
+
+@dataclass
+class SnapshotClient:
+    """Mock client holding grants on pages, listed two resources per page
+    of results.
+
+    Access entries are ``(user_id, relation, access)`` by resource ID.
+    """
+
+    access: dict[str, list[tuple[str, str, str]]]
+    batch_result: BatchResult | None = None
+    batch_error: Exception | None = None
+    access_error: Exception | None = None
+    list_calls: list[str | None] = field(default_factory=list)
+    access_calls: list[str] = field(default_factory=list)
+    permission_calls: list[str] = field(default_factory=list)
+    batch_calls: list[list[BatchOperation]] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def list_resources(
+        self,
+        resource_type: str,
+        parent_type: str | None = None,
+        parent_id: str | None = None,
+        search: str | None = None,
+        limit: int | None = None,
+        next_token: str | None = None,
+    ) -> ResourceListResponse:
+        self.list_calls.append(next_token)
+        resource_ids = sorted(self.access) if resource_type == "page" else []
+        start = int(next_token) if next_token else 0
+        end = start + 2
+        return ResourceListResponse(
+            resources=[
+                ResourceListItem(resource_id=resource_id)
+                for resource_id in resource_ids[start:end]
+            ],
+            next_token=str(end) if end < len(resource_ids) else None,
+            limit=2,
+        )
+
+    def get_resource_access(
+        self,
+        resource_type: str,
+        resource_id: str,
+        relation_filter: str | None = None,
+    ) -> ResourceAccessList:
+        with self.lock:
+            self.access_calls.append(resource_id)
+        if self.access_error is not None:
+            raise self.access_error
+        return ResourceAccessList(
+            type=resource_type,
+            resource_id=resource_id,
+            users=[
+                ResourceAccessEntry(user_id=user_id, relation=relation, access=access)
+                for user_id, relation, access in self.access[resource_id]
+            ],
+        )
+
+    def get_user_permissions(
+        self,
+        user_id: str,
+        type_filter: str,
+        relation_filter: str | None = None,
+    ) -> UserPermissions:
+        self.permission_calls.append(user_id)
+        return UserPermissions(user_id=user_id, permissions={})
+
+    def batch(self, operations: list[BatchOperation]) -> BatchResult:
+        self.batch_calls.append(operations)
+        if self.batch_error is not None:
+            raise self.batch_error
+        if self.batch_result is not None:
+            return self.batch_result
+        return BatchResult(
+            total=len(operations), succeeded=len(operations), failed=0, errors=[]
+        )
+
+
+def create_client(**kwargs) -> SnapshotClient:
+    """Create a client where alice views pages a and b, bob views page b
+    directly and page c through inheritance, and carol views page d."""
+    resource_ids = {
+        name: page_grant("user", name).resource_id for name in ("a", "b", "c", "d")
+    }
+    return SnapshotClient(
+        access={
+            resource_ids["a"]: [("alice", "viewer", "direct")],
+            resource_ids["b"]: [
+                ("alice", "viewer", "both"),
+                ("bob", "viewer", "direct"),
+            ],
+            resource_ids["c"]: [("bob", "viewer", "inherited")],
+            resource_ids["d"]: [("carol", "viewer", "direct")],
+        },
+        **kwargs,
+    )
+
+
+class TestGrantSnapshot:
+    """Tests for loading the grant snapshot."""
+
+    def test_load_pages_resources(self) -> None:
+        """The snapshot pages through resources and skips inherited
+        access."""
+        client = create_client()
+
+        snapshot = GrantSnapshot.load(client, ["page"], max_workers=2)
+
+        assert client.list_calls == [None, "2"]
+        assert sorted(client.access_calls) == sorted(client.access)
+        assert len(snapshot) == 4
+        assert snapshot.users() == {"alice", "bob", "carol"}
+        assert snapshot.grants_for("alice") == {
+            page_grant("alice", "a"),
+            page_grant("alice", "b"),
+        }
+        assert snapshot.grants_for("bob") == {page_grant("bob", "b")}
+        assert snapshot.grants_for("dave") == set()
+
+    def test_load_stops_on_failure(self) -> None:
+        """The remaining reads are cancelled once a read fails."""
+        client = SnapshotClient(
+            access={f"resource-{i:02d}": [] for i in range(20)},
+            access_error=ConnectionError("connection reset"),
+        )
+
+        with pytest.raises(ConnectionError):
+            GrantSnapshot.load(client, ["page"], max_workers=1)
+
+        assert len(client.access_calls) < len(client.access)
+
+
+class TestBulkSync:
+    """Tests for syncing users against the snapshot."""
+
+    def test_merged_batch(self) -> None:
+        """Diffs are computed from the snapshot and applied as one batch."""
+        client = create_client()
+        service = AuthorizationSyncService(client, UserEventCollector())
+
+        assert service.start_bulk_sync()
+        service.sync_user("alice", create_page_authorizations("a"))
+        service.sync_user("alice", create_page_authorizations("b"))
+        service.sync_user("bob", create_page_authorizations("c"))
+        service.finish_bulk_sync()
+
+        assert not client.permission_calls
+        assert len(client.batch_calls) == 1
+        operations = {
+            (op.action, op.user_id, op.resource_id) for op in client.batch_calls[0]
+        }
+        assert operations == {
+            ("grant", "bob", page_grant("bob", "c").resource_id),
+            ("revoke", "bob", page_grant("bob", "b").resource_id),
+        }
+
+        # after the bulk sync, users are synced individually
+        service.sync_user("carol", create_page_authorizations("d"))
+        assert client.permission_calls
+
+    def test_batch_errors_reported_per_user(self) -> None:
+        """Failed operations are reported for the user they belong to."""
+        client = create_client(
+            batch_result=BatchResult(
+                total=2,
+                succeeded=1,
+                failed=1,
+                errors=[BatchError(index=1, error="validation_error", message="x")],
+            )
+        )
+        collector = UserEventCollector()
+        service = AuthorizationSyncService(client, collector)
+
+        service.start_bulk_sync()
+        service.sync_user("alice", create_page_authorizations("a", "b", "c"))
+        service.sync_user("dave", create_page_authorizations("a"))
+        service.finish_bulk_sync()
+
+        failed_user = client.batch_calls[0][1].user_id
+        errors = collector.get_errors()
+        assert [error.user_context.registry_id for error in errors] == [failed_user]
+
+    def test_failed_chunks_reported(self) -> None:
+        """Users with operations in failed chunks are reported."""
+        client = create_client()
+        collector = UserEventCollector()
+        service = AuthorizationSyncService(client, collector)
+        service.start_bulk_sync()
+        service.sync_user("dave", create_page_authorizations("a"))
+        operation = page_grant("dave", "a").to_batch_op("grant")
+        client.batch_error = BatchChunkError(
+            message="1 of 2 batch chunks failed",
+            result=BatchResult(total=0, succeeded=0, failed=0, errors=[]),
+            chunk_errors={1: UnexpectedError(status_code=500, message="error")},
+            failed_operations=[operation],
+        )
+
+        service.finish_bulk_sync()
+
+        errors = collector.get_errors()
+        assert [error.user_context.registry_id for error in errors] == ["dave"]
+
+    def test_snapshot_failure_falls_back(self) -> None:
+        """Users are synced individually if the snapshot cannot be
+        loaded."""
+
+        class FailingClient(SnapshotClient):
+            def list_resources(self, *args, **kwargs) -> ResourceListResponse:
+                raise UnexpectedError(status_code=500, message="error")
+
+        client = FailingClient(access={})
+        service = AuthorizationSyncService(client, UserEventCollector())
+
+        assert not service.start_bulk_sync()
+        service.sync_user("alice", create_page_authorizations("a"))
+        service.finish_bulk_sync()
+
+        assert client.permission_calls
+        assert len(client.batch_calls) == 1
+
+    def test_snapshot_network_failure_falls_back(self) -> None:
+        """Unexpected errors while loading the snapshot also fall back to
+        syncing users individually."""
+        client = create_client(access_error=ConnectionError("connection reset"))
+        service = AuthorizationSyncService(client, UserEventCollector())
+
+        assert not service.start_bulk_sync()
+        client.access_error = None
+        service.sync_user("alice", create_page_authorizations("a"))
+
+        assert client.permission_calls
+
+    def test_unexpected_batch_failure_reported(self) -> None:
+        """Unexpected errors applying the changes are reported per user
+        without raising."""
+        client = create_client(batch_error=TimeoutError("timed out"))
+        collector = UserEventCollector()
+        service = AuthorizationSyncService(client, collector)
+
+        service.start_bulk_sync()
+        service.sync_user("alice", create_page_authorizations("c"))
+        service.sync_user("dave", create_page_authorizations("a"))
+        service.finish_bulk_sync()
+
+        errors = collector.get_errors()
+        assert [error.user_context.registry_id for error in errors] == [
+            "alice",
+            "dave",
+        ]
@@ -444,3 +444,25 @@ class TestBatchAggregation:
         # Only non-idempotent errors
         assert len(result.errors) == 1
         assert result.errors[0].error == "internal_error"
+        # Index is the position of the operation in the whole batch
+        assert result.errors[0].index == 10
+
+    def test_error_indexes_offset_by_chunk(self) -> None:
+        """Error indexes in later chunks refer to the whole batch."""
+        ops = _make_operations(150)
+        transport = MockTransport(
+            [
+                _batch_success_response(total=100, succeeded=100, failed=0),
+                _batch_success_response(
+                    total=50,
+                    succeeded=49,
+                    failed=1,
+                    errors=[{"index": 3, "error": "internal_error", "message": "x"}],
+                ),
+            ]
+        )
+        client = AuthorizationClient(transport, sleep=no_sleep)
+
+        result = client.batch(ops)
+
+        assert [error.index for error in result.errors] == [103]
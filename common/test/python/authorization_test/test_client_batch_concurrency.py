@@ -0,0 +1,227 @@
+"""Unit tests for concurrent chunk execution in AuthorizationClient.batch()."""
+
+import json
+import threading
+import time
+
+import pytest
+from authorization.client import AuthorizationClient
+from authorization.concurrency import AdaptiveLimit
+from authorization.exceptions import (
+    BatchChunkError,
+    TransportError,
+    ValidationError,
+)
+from authorization.models import BatchOperation
+
+from .conftest import MockResponse, no_sleep
+
+
+def _make_operations(count: int) -> list[BatchOperation]:
+    """Create a list of grant operations for testing."""
+    return [
+        BatchOperation(
+            action="grant",
+            user_id=f"user-{i}",
+            resource_type="study",
+            resource_id=f"resource-{i}",
+            relation="member",
+        )
+        for i in range(count)
+    ]
+
+
+class ChunkTransport:
+    """Thread-safe transport that responds to each chunk by its first user.
+
+    Each chunk reports one failed operation for its first user, so that
+    the order of the aggregated errors can be checked. Chunks starting
+    with a user in ``rejected`` receive a 400 response, and chunks
+    starting with a user in ``unavailable`` receive one 503 response
+    before succeeding. Chunks starting with a user in ``unreachable``
+    raise a TransportError.
+    """
+
+    def __init__(
+        self,
+        rejected: set[str] | None = None,
+        unavailable: set[str] | None = None,
+        unreachable: set[str] | None = None,
+        delay: float = 0.0,
+    ) -> None:
+        self.rejected = rejected or set()
+        self.unreachable = unreachable or set()
+        self.unavailable = set(unavailable or set())
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests: list[str] = []
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: bytes | None = None,
+        query_params: dict[str, str] | None = None,
+    ) -> MockResponse:
+        assert body is not None
+        operations = json.loads(body)["operations"]
+        first_user = operations[0]["userId"]
+        with self._lock:
+            self.requests.append(first_user)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            unavailable = first_user in self.unavailable
+            self.unavailable.discard(first_user)
+
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+
+        if first_user in self.unreachable:
+            raise TransportError("connection refused")
+        if unavailable:
+            return MockResponse(status_code=503, body=b"")
+        if first_user in self.rejected:
+            body = json.dumps({"message": "invalid"}).encode()
+            return MockResponse(status_code=400, body=body)
+
+        result = {
+            "total": len(operations),
+            "succeeded": len(operations) - 1,
+            "failed": 1,
+            "errors": [
+                {
+                    "index": 0,
+                    "error": "validation_error",
+                    "message": first_user,
+                }
+            ],
+        }
+        return MockResponse(status_code=200, body=json.dumps(result).encode())
+
+
+class TestConcurrentBatch:
+    """Tests for batches with more than one chunk in flight."""
+
+    def test_results_in_chunk_order(self) -> None:
+        """Results are aggregated in chunk order with bounded concurrency."""
+        transport = ChunkTransport(delay=0.02)
+        client = AuthorizationClient(transport, sleep=no_sleep, max_concurrency=3)
+
+        result = client.batch(_make_operations(950))
+
+        assert len(transport.requests) == 10
+        assert 1 < transport.max_in_flight <= 3
+        assert result.total == 950
+        assert result.succeeded == 940
+        assert result.failed == 10
+        assert [error.message for error in result.errors] == [
+            f"user-{i * 100}" for i in range(10)
+        ]
+
+    def test_partial_failure_reported_per_chunk(self) -> None:
+        """Failed chunks are reported without losing the other chunks."""
+        transport = ChunkTransport(rejected={"user-100", "user-300"})
+        client = AuthorizationClient(transport, sleep=no_sleep, max_concurrency=4)
+        operations = _make_operations(450)
+
+        with pytest.raises(BatchChunkError) as exc_info:
+            client.batch(operations)
+
+        error = exc_info.value
+        assert sorted(error.chunk_errors) == [1, 3]
+        assert all(
+            isinstance(chunk_error, ValidationError)
+            for chunk_error in error.chunk_errors.values()
+        )
+        assert error.failed_operations == operations[100:200] + operations[300:400]
+        assert error.result.total == 250
+        assert [item.message for item in error.result.errors] == [
+            "user-0",
+            "user-200",
+            "user-400",
+        ]
+        assert len(transport.requests) == 5
+
+    def test_transport_failure_reported_per_chunk(self) -> None:
+        """A chunk failing without a response is reported as a chunk
+        error."""
+        transport = ChunkTransport(unreachable={"user-200"})
+        client = AuthorizationClient(transport, sleep=no_sleep, max_concurrency=4)
+        operations = _make_operations(400)
+
+        with pytest.raises(BatchChunkError) as exc_info:
+            client.batch(operations)
+
+        error = exc_info.value
+        assert list(error.chunk_errors) == [2]
+        assert isinstance(error.chunk_errors[2], TransportError)
+        assert error.failed_operations == operations[200:300]
+        assert error.result.total == 300
+
+    def test_unavailable_chunk_retried(self) -> None:
+        """A chunk receiving 503 is retried and included in the result."""
+        transport = ChunkTransport(unavailable={"user-200"})
+        client = AuthorizationClient(transport, sleep=no_sleep, max_concurrency=4)
+
+        result = client.batch(_make_operations(400))
+
+        assert transport.requests.count("user-200") == 2
+        assert result.total == 400
+
+    def test_sequential_by_default(self) -> None:
+        """Clients send one chunk at a time unless concurrency is set."""
+        transport = ChunkTransport(delay=0.01)
+        client = AuthorizationClient(transport, sleep=no_sleep)
+
+        client.batch(_make_operations(300))
+
+        assert transport.max_in_flight == 1
+        assert transport.requests == ["user-0", "user-100", "user-200"]
+
+
+class TestAdaptiveLimit:
+    """Tests for the adaptive concurrency limit."""
+
+    def test_halved_on_unavailable(self) -> None:
+        """The limit is halved on each 503, down to one."""
+        limit = AdaptiveLimit(8)
+        limit.record(503)
+        assert limit.limit == 4
+        limit.record(503)
+        limit.record(503)
+        limit.record(503)
+        assert limit.limit == 1
+
+    def test_grows_after_successes(self) -> None:
+        """The limit grows by one after consecutive successes, up to the
+        maximum."""
+        limit = AdaptiveLimit(4, increase_after=2)
+        limit.record(503)
+        assert limit.limit == 2
+        limit.record(200)
+        limit.record(503)
+        limit.record(200)
+        assert limit.limit == 1
+        for _ in range(10):
+            limit.record(200)
+        assert limit.limit == 4
+
+    def test_slot_waits_for_limit(self) -> None:
+        """Slots beyond the limit wait until a slot is released."""
+        limit = AdaptiveLimit(1)
+        acquired = threading.Event()
+
+        def acquire() -> None:
+            with limit.slot():
+                acquired.set()
+
+        with limit.slot():
+            thread = threading.Thread(target=acquire)
+            thread.start()
+            assert not acquired.wait(0.05)
+
+        assert acquired.wait(1)
+        thread.join()
@@ -1,7 +1,7 @@
 """Tests for new AuthorizationClient methods.
 
 Covers: get_resource_parents, delete_resource_parents, list_resources,
-get_model, check_permission, search_user_profiles.
+get_resource_access, get_model, check_permission, search_user_profiles.
 """
 
 import json
@@ -16,6 +16,7 @@ from authorization.exceptions import (
 )
 from authorization.models import (
     AuthorizationModelMetadata,
+    ResourceAccessList,
     ResourceListResponse,
     ResourceParents,
 )
@@ -268,6 +269,77 @@ class TestListResources:
             client.list_resources("nonexistent_type")
 
 
+# --- get_resource_access ---
+
+
+class TestGetResourceAccess:
+    """Tests for get_resource_access."""
+
+    def test_returns_resource_access_on_200(self) -> None:
+        """Sends GET /resources/{type}/{id}/access and parses the users."""
+        response = MockResponse(
+            status_code=200,
+            body=json.dumps(
+                {
+                    "type": "page",
+                    "resourceId": "page-web",
+                    "users": [
+                        {"userId": "alice", "relation": "viewer", "access": "direct"},
+                        {
+                            "userId": "bob",
+                            "relation": "viewer",
+                            "access": "inherited",
+                            "inheritedFrom": {
+                                "parentType": "study",
+                                "parentId": "study1",
+                                "parentRole": "admin",
+                            },
+                        },
+                    ],
+                }
+            ).encode(),
+        )
+        transport = MockTransport(response)
+        client = AuthorizationClient(transport=transport, sleep=no_sleep)
+
+        result = client.get_resource_access("page", "page-web")
+
+        method, path, body, query_params = transport.requests[0]
+        assert method == "GET"
+        assert path == "/resources/page/page-web/access"
+        assert body is None
+        assert query_params is None
+        assert isinstance(result, ResourceAccessList)
+        assert [entry.user_id for entry in result.users] == ["alice", "bob"]
+        assert result.users[1].inherited_from is not None
+
+    def test_sends_relation_filter(self) -> None:
+        """Includes relation in query params."""
+        response = MockResponse(
+            status_code=200,
+            body=b'{"type":"page","resourceId":"page-web","users":[]}',
+        )
+        transport = MockTransport(response)
+        client = AuthorizationClient(transport=transport, sleep=no_sleep)
+
+        client.get_resource_access("page", "page-web", relation_filter="viewer")
+
+        _, _, _, query_params = transport.requests[0]
+        assert query_params == {"relation": "viewer"}
+
+    def test_raises_not_found_on_404(self) -> None:
+        """Raises NotFoundError on 404."""
+        response = MockResponse(
+            status_code=404,
+            body=b'{"error":"not_found","message":"resource not found"}',
+        )
+        transport = MockTransport(response)
+        client = AuthorizationClient(transport=transport, sleep=no_sleep)
+
+        with pytest.raises(NotFoundError):
+            client.get_resource_access("page", "missing")
+
+
 # --- get_model ---
 
 
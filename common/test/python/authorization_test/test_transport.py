@@ -6,14 +6,30 @@ Uses moto for credential mocking.
 Requirements: 1.4
 """
 
+import hmac
 import json
-from unittest.mock import patch
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar
+from unittest.mock import Mock, patch
 from urllib.parse import urlparse
 
+import pytest
+import requests
+from authorization.exceptions import AuthorizationClientError, TransportError
 from authorization.sigv4_transport import SigV4Transport
 from moto import mock_aws
 
 
+def _mock_response(status_code: int, content: bytes) -> Mock:
+    """Create a mock session response."""
+    response = Mock()
+    response.status_code = status_code
+    response.content = content
+    return response
+
+
 @mock_aws
 class TestSigV4TransportSigning:
     """Tests for SigV4Transport request signing.
@@ -42,21 +58,17 @@ class TestSigV4TransportSigning:
         """
         transport = self._create_transport()
 
-        # Patch urlopen to capture the signed request
-        with patch("urllib.request.urlopen") as mock_urlopen:
-            # Set up mock response
-            mock_response = mock_urlopen.return_value.__enter__.return_value
-            mock_response.status = 200
-            mock_response.read.return_value = b'{"status": "healthy"}'
+        # Patch the session to capture the signed request
+        with patch.object(requests.Session, "request") as mock_request:
+            mock_request.return_value = _mock_response(200, b'{"status": "healthy"}')
 
             transport.request(method="GET", path="/health", body=None)
 
-            # Get the Request object passed to urlopen
-            call_args = mock_urlopen.call_args
-            request_obj = call_args[0][0]
+            # Get the request sent over the session
+            request_kwargs = mock_request.call_args.kwargs
 
             # Verify Authorization header is present
-            auth_header = request_obj.get_header("Authorization")
+            auth_header = request_kwargs["headers"]["Authorization"]
             assert auth_header is not None
             assert "AWS4-HMAC-SHA256" in auth_header
 
@@ -64,45 +76,39 @@ class TestSigV4TransportSigning:
         """Authorization header contains Credential component."""
         transport = self._create_transport()
 
-        with patch("urllib.request.urlopen") as mock_urlopen:
-            mock_response = mock_urlopen.return_value.__enter__.return_value
-            mock_response.status = 200
-            mock_response.read.return_value = b"{}"
+        with patch.object(requests.Session, "request") as mock_request:
+            mock_request.return_value = _mock_response(200, b"{}")
 
             transport.request(method="GET", path="/health", body=None)
 
-            request_obj = mock_urlopen.call_args[0][0]
-            auth_header = request_obj.get_header("Authorization")
+            request_kwargs = mock_request.call_args.kwargs
+            auth_header = request_kwargs["headers"]["Authorization"]
             assert "Credential=" in auth_header
 
     def test_authorization_header_contains_signed_headers(self) -> None:
         """Authorization header contains SignedHeaders component."""
         transport = self._create_transport()
 
-        with patch("urllib.request.urlopen") as mock_urlopen:
-            mock_response = mock_urlopen.return_value.__enter__.return_value
-            mock_response.status = 200
-            mock_response.read.return_value = b"{}"
+        with patch.object(requests.Session, "request") as mock_request:
+            mock_request.return_value = _mock_response(200, b"{}")
 
             transport.request(method="GET", path="/health", body=None)
 
-            request_obj = mock_urlopen.call_args[0][0]
-            auth_header = request_obj.get_header("Authorization")
+            request_kwargs = mock_request.call_args.kwargs
+            auth_header = request_kwargs["headers"]["Authorization"]
             assert "SignedHeaders=" in auth_header
 
     def test_authorization_header_contains_signature(self) -> None:
         """Authorization header contains Signature component."""
         transport = self._create_transport()
 
-        with patch("urllib.request.urlopen") as mock_urlopen:
-            mock_response = mock_urlopen.return_value.__enter__.return_value
-            mock_response.status = 200
-            mock_response.read.return_value = b"{}"
+        with patch.object(requests.Session, "request") as mock_request:
+            mock_request.return_value = _mock_response(200, b"{}")
 
             transport.request(method="GET", path="/health", body=None)
 
-            request_obj = mock_urlopen.call_args[0][0]
-            auth_header = request_obj.get_header("Authorization")
+            request_kwargs = mock_request.call_args.kwargs
+            auth_header = request_kwargs["headers"]["Authorization"]
             assert "Signature=" in auth_header
 
     def test_signs_against_execute_api_service(self) -> None:
@@ -112,15 +118,13 @@ class TestSigV4TransportSigning:
         """
         transport = self._create_transport()
 
-        with patch("urllib.request.urlopen") as mock_urlopen:
-            mock_response = mock_urlopen.return_value.__enter__.return_value
-            mock_response.status = 200
-            mock_response.read.return_value = b"{}"
+        with patch.object(requests.Session, "request") as mock_request:
+            mock_request.return_value = _mock_response(200, b"{}")
 
             transport.request(method="GET", path="/health", body=None)
 
-            request_obj = mock_urlopen.call_args[0][0]
-            auth_header = request_obj.get_header("Authorization")
+            request_kwargs = mock_request.call_args.kwargs
+            auth_header = request_kwargs["headers"]["Authorization"]
             # Credential format: AKID/date/region/service/aws4_request
             assert "execute-api" in auth_header
 
@@ -129,39 +133,33 @@ class TestSigV4TransportSigning:
         transport = self._create_transport()
         body = json.dumps({"key": "value"}).encode()
 
-        with patch("urllib.request.urlopen") as mock_urlopen:
-            mock_response = mock_urlopen.return_value.__enter__.return_value
-            mock_response.status = 200
-            mock_response.read.return_value = b"{}"
+        with patch.object(requests.Session, "request") as mock_request:
+            mock_request.return_value = _mock_response(200, b"{}")
 
             transport.request(method="POST", path="/grants", body=body)
 
-            request_obj = mock_urlopen.call_args[0][0]
-            content_type = request_obj.get_header("Content-type")
+            request_kwargs = mock_request.call_args.kwargs
+            content_type = request_kwargs["headers"]["Content-Type"]
             assert content_type == "application/json"
 
     def test_constructs_correct_url(self) -> None:
         """Transport constructs the full URL from base_url and path."""
         transport = self._create_transport(base_url="https://api.example.com/v1")
 
-        with patch("urllib.request.urlopen") as mock_urlopen:
-            mock_response = mock_urlopen.return_value.__enter__.return_value
-            mock_response.status = 200
-            mock_response.read.return_value = b"{}"
+        with patch.object(requests.Session, "request") as mock_request:
+            mock_request.return_value = _mock_response(200, b"{}")
 
             transport.request(method="GET", path="/health", body=None)
 
-            request_obj = mock_urlopen.call_args[0][0]
-            assert request_obj.full_url == "https://api.example.com/v1/health"
+            request_kwargs = mock_request.call_args.kwargs
+            assert request_kwargs["url"] == "https://api.example.com/v1/health"
 
     def test_constructs_url_with_query_params(self) -> None:
         """Transport appends query parameters to the URL."""
         transport = self._create_transport(base_url="https://api.example.com/v1")
 
-        with patch("urllib.request.urlopen") as mock_urlopen:
-            mock_response = mock_urlopen.return_value.__enter__.return_value
-            mock_response.status = 200
-            mock_response.read.return_value = b"{}"
+        with patch.object(requests.Session, "request") as mock_request:
+            mock_request.return_value = _mock_response(200, b"{}")
 
             transport.request(
                 method="GET",
@@ -170,8 +168,8 @@ class TestSigV4TransportSigning:
                 query_params={"type": "study", "relation": "member"},
             )
 
-            request_obj = mock_urlopen.call_args[0][0]
-            parsed = urlparse(request_obj.full_url)
+            request_kwargs = mock_request.call_args.kwargs
+            parsed = urlparse(request_kwargs["url"])
             assert "type=study" in parsed.query
             assert "relation=member" in parsed.query
 
@@ -179,15 +177,13 @@ class TestSigV4TransportSigning:
         """Transport uses the specified HTTP method."""
         transport = self._create_transport()
 
-        with patch("urllib.request.urlopen") as mock_urlopen:
-            mock_response = mock_urlopen.return_value.__enter__.return_value
-            mock_response.status = 200
-            mock_response.read.return_value = b"{}"
+        with patch.object(requests.Session, "request") as mock_request:
+            mock_request.return_value = _mock_response(200, b"{}")
 
             transport.request(method="DELETE", path="/grants", body=b"{}")
 
-            request_obj = mock_urlopen.call_args[0][0]
-            assert request_obj.method == "DELETE"
+            request_kwargs = mock_request.call_args.kwargs
+            assert request_kwargs["method"] == "DELETE"
 
     def test_different_requests_produce_different_signatures(self) -> None:
         """Different request bodies produce different signatures."""
@@ -195,16 +191,14 @@ class TestSigV4TransportSigning:
 
         signatures = []
         for i in range(2):
-            with patch("urllib.request.urlopen") as mock_urlopen:
-                mock_response = mock_urlopen.return_value.__enter__.return_value
-                mock_response.status = 200
-                mock_response.read.return_value = b"{}"
+            with patch.object(requests.Session, "request") as mock_request:
+                mock_request.return_value = _mock_response(200, b"{}")
 
                 body = json.dumps({"userId": f"user{i}"}).encode()
                 transport.request(method="POST", path="/grants", body=body)
 
-                request_obj = mock_urlopen.call_args[0][0]
-                auth_header = request_obj.get_header("Authorization")
+                request_kwargs = mock_request.call_args.kwargs
+                auth_header = request_kwargs["headers"]["Authorization"]
                 # Extract signature value
                 sig_part = next(
                     p.strip() for p in auth_header.split(",") if "Signature=" in p
@@ -213,3 +207,110 @@ class TestSigV4TransportSigning:
 
         # Different payloads should produce different signatures
         assert signatures[0] != signatures[1]
+
+    def test_wraps_request_exceptions(self) -> None:
+        """Connection errors and timeouts are raised as TransportError."""
+        transport = self._create_transport()
+
+        for error in (
+            requests.exceptions.ConnectionError("connection refused"),
+            requests.exceptions.Timeout("timed out"),
+        ):
+            with (
+                patch.object(requests.Session, "request", side_effect=error),
+                pytest.raises(TransportError) as excinfo,
+            ):
+                transport.request(method="GET", path="/health", body=None)
+
+            assert isinstance(excinfo.value, AuthorizationClientError)
+            assert excinfo.value.__cause__ is error
+
+
+class _RecordingHandler(BaseHTTPRequestHandler):
+    """Handler that records the client port and Authorization header of each
+    request."""
+
+    protocol_version = "HTTP/1.1"
+    ports: ClassVar[list[int]] = []
+    signatures: ClassVar[list[str]] = []
+
+    def do_GET(self) -> None:
+        _RecordingHandler.ports.append(self.client_address[1])
+        _RecordingHandler.signatures.append(self.headers.get("Authorization", ""))
+        status = 404 if self.path.endswith("/missing") else 200
+        body = b'{"status": "healthy"}'
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class TestSigV4TransportPooling:
+    """Tests for connection reuse and signing key caching."""
+
+    def _create_transport(self, base_url: str) -> SigV4Transport:
+        with patch.dict(
+            "os.environ",
+            {
+                "AWS_ACCESS_KEY_ID": "testing",
+                "AWS_SECRET_ACCESS_KEY": "testing",
+                "AWS_DEFAULT_REGION": "us-east-1",
+            },
+        ):
+            return SigV4Transport(base_url=base_url, region="us-east-1")
+
+    def test_reuses_connections(self) -> None:
+        """Sequential requests are sent over one kept-alive connection, and
+        concurrent requests are all sent."""
+        _RecordingHandler.ports = []
+        _RecordingHandler.signatures = []
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _RecordingHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            transport = self._create_transport(
+                f"http://127.0.0.1:{server.server_address[1]}/v1"
+            )
+            for _ in range(5):
+                assert (
+                    transport.request(method="GET", path="/health").status_code == 200
+                )
+            assert len(set(_RecordingHandler.ports)) == 1
+
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                statuses = list(
+                    pool.map(
+                        lambda _: transport.request(method="GET", path="/health"),
+                        range(20),
+                    )
+                )
+            assert all(response.status_code == 200 for response in statuses)
+            assert len(_RecordingHandler.ports) == 25
+            assert all(
+                "AWS4-HMAC-SHA256" in signature
+                for signature in _RecordingHandler.signatures
+            )
+
+            response = transport.request(method="GET", path="/missing")
+            assert response.status_code == 404
+            assert response.body == b'{"status": "healthy"}'
+            transport.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_signing_key_cached(self) -> None:
+        """The signing key is derived once for repeated requests."""
+        transport = self._create_transport("https://api.example.com/v1")
+        with (
+            patch.object(requests.Session, "request") as mock_request,
+            patch("hmac.new", wraps=hmac.new) as mock_sign,
+        ):
+            mock_request.return_value = _mock_response(200, b"{}")
+            transport.request(method="GET", path="/health")
+            transport.request(method="GET", path="/health")
+
+        # four HMACs to derive the key, then one per request
+        assert mock_sign.call_count == 6
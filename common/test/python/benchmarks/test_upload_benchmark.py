@@ -0,0 +1,117 @@
+"""Benchmarks FormJSONUploader against a fake Flywheel project."""
+
+import logging
+
+import pytest
+from flywheel_adaptor.flywheel_proxy import FlywheelProxy, ProjectAdaptor
+from flywheel_adaptor.subject_index import SUBJECT_INDEXES
+from outputs.error_writer import ListErrorWriter
+from test_mocks.benchmark import (
+    BenchmarkResult,
+    BenchmarkThresholds,
+    run_benchmark,
+    scaled,
+)
+from test_mocks.fake_flywheel import FakeFlywheel, populate_form_project
+from test_mocks.mock_configs import uds_ingest_configs
+from uploads.uploader import FormJSONUploader
+
+log = logging.getLogger(__name__)
+
+NUM_SUBJECTS = 2000
+VISITS_PER_SUBJECT = 5
+
+UPLOAD_THRESHOLDS = BenchmarkThresholds(
+    max_requests_per_row=16,
+    max_calls_per_row={
+        "ProjectAdaptor.find_subject": 1,
+        "ProjectAdaptor.upload_file_contents": 1,
+    },
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_subject_indexes():
+    SUBJECT_INDEXES.clear()
+    yield
+    SUBJECT_INDEXES.clear()
+
+
+def create_records(num_rows: int, num_subjects: int):
+    """Creates new visits for existing and new subjects, by subject."""
+    records = {}
+    for row in range(num_rows):
+        # every other row is for a new subject
+        subject_num = row if row % 2 == 0 else num_subjects + row
+        naccid = f"NACC{subject_num:06d}"
+        visitnum = VISITS_PER_SUBJECT + 1
+        records[naccid] = {
+            f"{subject_num}_2030-01-01_uds_qc-status.log": {
+                "naccid": naccid,
+                "module": "UDS",
+                "visitnum": str(visitnum),
+                "visitdate": "2030-01-01",
+                "ptid": str(subject_num),
+                "adcid": 0,
+            }
+        }
+
+    return records
+
+
+class TestUploadBenchmark:
+    def test_form_upload(self):
+        client = FakeFlywheel()
+        fake_project = client.add_project(group="adrc", label="ingest-form")
+        num_subjects = scaled(NUM_SUBJECTS)
+        populate_form_project(
+            fake_project,
+            num_subjects=num_subjects,
+            visits_per_subject=VISITS_PER_SUBJECT,
+        )
+        proxy = FlywheelProxy(client=client, dry_run=False)  # type: ignore
+        project = ProjectAdaptor(project=fake_project, proxy=proxy)  # type: ignore
+
+        num_rows = scaled(100)
+        uploader = FormJSONUploader(
+            project=project,
+            module="UDS",
+            gear_name="form-transformer",
+            hierarchy_labels=uds_ingest_configs().hierarchy_labels,
+            error_writer=ListErrorWriter(container_id="id", fw_path="path"),
+        )
+        records = create_records(num_rows, num_subjects)
+
+        result = run_benchmark(
+            "form-upload",
+            lambda: uploader.upload(records),  # type: ignore
+            client=client,
+            rows=num_rows,
+        )
+        log.info(result.report())
+
+        assert not UPLOAD_THRESHOLDS.check(result)
+        assert result.requests["add_subject"] == num_rows // 2
+        assert result.requests["upload_file"] >= 2 * num_rows
+
+
+class TestBenchmarkHarness:
+    def test_thresholds(self):
+        result = BenchmarkResult(
+            name="test",
+            rows=10,
+            wall_time=1.0,
+            peak_memory=100,
+            calls={"ProjectAdaptor.find_subject": 20},
+            call_times={},
+            requests={"find_subjects": 50},
+        )
+        assert not BenchmarkThresholds().check(result)
+        violations = BenchmarkThresholds(
+            max_requests_per_row=4,
+            max_calls_per_row={"ProjectAdaptor.find_subject": 1},
+            max_seconds_per_row=0.01,
+            max_peak_memory=10,
+        ).check(result)
+        assert len(violations) == 4
+        assert "find_subjects: 50" in result.report()
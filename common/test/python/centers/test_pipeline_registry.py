@@ -0,0 +1,120 @@
+"""Tests for the pipeline ADCID registry of NACCGroup."""
+
+from typing import Any, Dict
+from unittest.mock import MagicMock
+
+import pytest
+from centers.center_group import (
+    CenterGroup,
+    CenterMetadata,
+    CenterStudyMetadata,
+    IngestProjectMetadata,
+)
+from centers.center_info import PipelineCenterInfo, PipelineRegistryInfo
+from centers.nacc_group import PIPELINE_REGISTRY_KEY, NACCGroup
+
+
+class FakeMetadataProject:
+    """Metadata project that keeps info in memory and counts reads."""
+
+    def __init__(self, info: Dict[str, Any]) -> None:
+        self.info = info
+        self.reads = 0
+
+    def get_info(self) -> Dict[str, Any]:
+        self.reads += 1
+        return self.info
+
+    def update_info(self, info: Dict[str, Any]) -> None:
+        self.info.update(info)
+
+
+def center_metadata(adcid: int, pipeline_adcids: list[int]) -> CenterMetadata:
+    return CenterMetadata(
+        adcid=adcid,
+        active=True,
+        studies={
+            "adrc": CenterStudyMetadata(
+                study_id="adrc",
+                study_name="ADRC",
+                ingest_projects={
+                    f"ingest-form-{pipeline_adcid}": IngestProjectMetadata(
+                        study_id="adrc",
+                        project_id=f"p{pipeline_adcid}",
+                        project_label=f"ingest-form-{pipeline_adcid}",
+                        pipeline_adcid=pipeline_adcid,
+                        datatype="form",
+                    )
+                    for pipeline_adcid in pipeline_adcids
+                },
+            )
+        },
+    )
+
+
+@pytest.fixture
+def metadata_project() -> FakeMetadataProject:
+    return FakeMetadataProject(
+        {
+            "centers": {
+                "1": {"adcid": 1, "name": "Alpha", "group": "alpha"},
+                "2": {"adcid": 2, "name": "Beta", "group": "beta"},
+            }
+        }
+    )
+
+
+@pytest.fixture
+def admin_group(monkeypatch, metadata_project) -> NACCGroup:
+    pipelines = {1: [1, 11], 2: [2, 11]}
+
+    def get_project_info(center: CenterGroup) -> CenterMetadata:
+        return center_metadata(center.adcid, pipelines[center.adcid])
+
+    monkeypatch.setattr(CenterGroup, "get_project_info", get_project_info)
+    monkeypatch.setattr(NACCGroup, "get_metadata", lambda self: metadata_project)
+
+    proxy = MagicMock()
+    proxy.find_group.side_effect = lambda group_id: MagicMock(id=group_id)
+    return NACCGroup(group=MagicMock(), proxy=proxy)
+
+
+class TestPipelineRegistryInfo:
+    def test_registry(self):
+        registry = PipelineRegistryInfo()
+        registry.add(5, PipelineCenterInfo(adcid=1, group="alpha"))
+        registry.add(5, PipelineCenterInfo(adcid=2, group="beta"))
+        registry.add(1, PipelineCenterInfo(adcid=1, group="alpha"))
+
+        assert registry.get_pipeline_adcids() == [5, 1]
+        assert registry.get(5) == PipelineCenterInfo(adcid=1, group="alpha")
+        assert registry.get(7) is None
+
+        dumped = registry.model_dump()
+        assert PipelineRegistryInfo.model_validate(dumped) == registry
+
+
+class TestNACCGroupPipelineRegistry:
+    def test_computed_without_stored_registry(self, admin_group, metadata_project):
+        assert admin_group.get_all_ingest_pipeline_adcids() == [1, 11, 2]
+        assert PIPELINE_REGISTRY_KEY not in metadata_project.info
+
+    def test_update_pipeline_registry(self, admin_group, metadata_project):
+        registry = admin_group.update_pipeline_registry()
+        assert registry.version == 1
+        assert metadata_project.info[PIPELINE_REGISTRY_KEY]["version"] == 1
+
+        registry = admin_group.update_pipeline_registry()
+        assert registry.version == 2
+        assert registry.get(11) == PipelineCenterInfo(adcid=1, group="alpha")
+
+    def test_stored_registry_read_once(self, admin_group, metadata_project):
+        metadata_project.info[PIPELINE_REGISTRY_KEY] = PipelineRegistryInfo(
+            version=3,
+            pipelines={"42": PipelineCenterInfo(adcid=2, group="beta")},
+        ).model_dump()
+
+        assert admin_group.get_all_ingest_pipeline_adcids() == [42]
+        assert admin_group.get_all_ingest_pipeline_adcids() == [42]
+        assert admin_group.get_pipeline_registry().version == 3
+        assert metadata_project.reads == 1
@@ -0,0 +1,335 @@
+"""Tests for datastore.visit_snapshot and the FormsStore visit queries."""
+
+from unittest.mock import Mock
+
+from datastore.forms_store import FormFilter, FormsStore
+from datastore.visit_snapshot import (
+    SubjectVisitSnapshot,
+    VisitFilter,
+    compare_values,
+)
+from flywheel_adaptor.flywheel_proxy import FlywheelProxy, ProjectAdaptor
+from flywheel_adaptor.subject_index import SUBJECT_INDEXES
+from test_mocks.fake_flywheel import FakeFlywheel, populate_form_project
+
+DATE = "file.info.forms.json.visitdate"
+VISITNUM = "file.info.forms.json.visitnum"
+PACKET = "file.info.forms.json.packet"
+
+
+def create_visit(
+    *,
+    module: str,
+    visitdate: str,
+    visitnum: str | None = None,
+    packet: str | None = None,
+    tags: list[str] | None = None,
+):
+    return {
+        "file.name": f"{module}_{visitdate}.json",
+        "file.file_id": f"{module}-{visitdate}",
+        "file.parents.acquisition": f"acq-{module}-{visitdate}",
+        "file.parents.session": f"ses-{visitdate}",
+        "file.parents.subject": "subject-id",
+        "file.tags": tags or [],
+        "acquisition.label": module,
+        DATE: visitdate,
+        VISITNUM: visitnum,
+        PACKET: packet,
+    }
+
+
+VISITS = [
+    create_visit(
+        module="UDS",
+        visitdate="2024-01-10",
+        visitnum="1",
+        packet="I",
+        tags=["form-qc-checker-PASS"],
+    ),
+    create_visit(
+        module="UDS",
+        visitdate="2024-06-10",
+        visitnum="2",
+        packet="F",
+        tags=["form-qc-checker-FAIL"],
+    ),
+    create_visit(
+        module="UDS",
+        visitdate="2025-01-10",
+        visitnum="10",
+        packet="F",
+        tags=["form-qc-checker-PASS"],
+    ),
+    create_visit(module="MLST", visitdate="2024-03-01"),
+]
+
+COLUMNS = [
+    "file.name",
+    "file.file_id",
+    "file.parents.acquisition",
+    "file.parents.session",
+]
+
+
+def create_snapshot() -> SubjectVisitSnapshot:
+    return SubjectVisitSnapshot(
+        subject_id="subject-id",
+        columns=[*COLUMNS, "acquisition.label", "file.tags", DATE, VISITNUM, PACKET],
+        visits=VISITS,
+    )
+
+
+class TestCompareValues:
+    def test_numeric(self):
+        assert compare_values("10", ">", "2")
+        assert compare_values("1", "=", "1.0")
+
+    def test_string(self):
+        assert compare_values("2024-06-10", "<", "2025-01-01")
+        assert compare_values("I4", "!=", "I")
+
+
+class TestSubjectVisitSnapshot:
+    def test_module_filter(self):
+        snapshot = create_snapshot()
+        visits = snapshot.find(modules=["UDS"], columns=[*COLUMNS, DATE], order_by=DATE)
+        assert visits
+        assert [visit[DATE] for visit in visits] == [
+            "2025-01-10",
+            "2024-06-10",
+            "2024-01-10",
+        ]
+        assert set(visits[0].keys()) == {*COLUMNS, DATE}
+
+    def test_drops_missing_columns(self):
+        """Visits missing a requested column are dropped, same as the
+        dataview drop-row strategy."""
+        snapshot = create_snapshot()
+        assert not snapshot.find(
+            modules=["MLST"], columns=[*COLUMNS, DATE, VISITNUM], order_by=DATE
+        )
+        assert snapshot.find(modules=["MLST"], columns=[*COLUMNS, DATE], order_by=DATE)
+
+    def test_filters(self):
+        snapshot = create_snapshot()
+        visits = snapshot.find(
+            modules=["UDS"],
+            columns=[*COLUMNS, DATE, VISITNUM],
+            order_by=DATE,
+            filters=[VisitFilter(column=VISITNUM, operator=">=", value="2")],
+        )
+        assert visits
+        assert [visit[VISITNUM] for visit in visits] == ["10", "2"]
+
+        visits = snapshot.find(
+            modules=["UDS"],
+            columns=[*COLUMNS, DATE, PACKET],
+            order_by=DATE,
+            filters=[VisitFilter(column=PACKET, operator="=|", value=["I", "I4"])],
+        )
+        assert visits
+        assert len(visits) == 1
+        assert visits[0][DATE] == "2024-01-10"
+
+    def test_tags(self):
+        snapshot = create_snapshot()
+        visits = snapshot.find(
+            modules=["UDS"],
+            columns=[*COLUMNS, DATE],
+            order_by=DATE,
+            tags=["form-qc-checker-PASS"],
+        )
+        assert visits
+        assert [visit[DATE] for visit in visits] == ["2025-01-10", "2024-01-10"]
+
+
+def create_forms_store():
+    subject = Mock()
+    subject.id = "subject-id"
+    subject.label = "NACC000000"
+
+    proxy = Mock()
+    proxy.get_matching_acquisition_files_info.return_value = VISITS
+
+    project = Mock()
+    project.id = "project-id"
+    project.proxy = proxy
+    project.find_subject.return_value = subject
+
+    return FormsStore(ingest_project=project), proxy
+
+
+class TestFormsStoreSnapshot:
+    def test_single_dataview_per_subject(self):
+        forms_store, proxy = create_forms_store()
+
+        visits = forms_store.query_form_data(
+            subject_lbl="NACC000000",
+            module="UDS",
+            legacy=False,
+            search_col="visitdate",
+            search_val="2024-06-10",
+            search_op="<",
+            extra_columns=["visitnum"],
+        )
+        assert visits
+        assert len(visits) == 1
+        assert visits[0][VISITNUM] == "1"
+
+        visits = forms_store.query_form_data_with_custom_filters(
+            subject_lbl="NACC000000",
+            module="UDS",
+            legacy=False,
+            order_by="visitdate",
+            list_filters=[FormFilter(field="packet", value="F", operator="=")],
+        )
+        assert visits
+        assert len(visits) == 2
+
+        assert proxy.get_matching_acquisition_files_info.call_count == 1
+
+    def test_reload_for_new_fields(self):
+        forms_store, proxy = create_forms_store()
+
+        forms_store.query_form_data(
+            subject_lbl="NACC000000",
+            module="UDS",
+            legacy=False,
+            search_col="visitdate",
+            find_all=True,
+        )
+        forms_store.query_form_data(
+            subject_lbl="NACC000000",
+            module="MLST",
+            legacy=False,
+            search_col="visitdate",
+            extra_columns=["deceased"],
+            find_all=True,
+        )
+        assert proxy.get_matching_acquisition_files_info.call_count == 2
+        columns = proxy.get_matching_acquisition_files_info.call_args.kwargs["columns"]
+        assert "file.info.forms.json.deceased" in columns
+
+        forms_store.clear_snapshots()
+        forms_store.query_form_data(
+            subject_lbl="NACC000000",
+            module="UDS",
+            legacy=False,
+            search_col="visitdate",
+            find_all=True,
+        )
+        assert proxy.get_matching_acquisition_files_info.call_count == 3
+
+
+class TestPrefetchVisits:
+    def test_batched_prefetch(self):
+        subjects = []
+        for index in range(3):
+            subject = Mock()
+            subject.id = f"subject-{index}"
+            subject.label = str(index)
+            subjects.append(subject)
+
+        visits = []
+        for subject in subjects:
+            visit = create_visit(module="UDS", visitdate="2024-01-10")
+            visit["file.parents.subject"] = subject.id
+            visits.append(visit)
+
+        proxy = Mock()
+        proxy.get_matching_acquisition_files_info.return_value = visits
+
+        project = Mock()
+        project.id = "project-id"
+        project.proxy = proxy
+        project.load_subjects.return_value = subjects
+        project.find_subject.return_value = None
+
+        forms_store = FormsStore(ingest_project=project)
+        forms_store.prefetch_visits(
+            subject_lbls=["0", "1", "2", "1"], fields=["visitnum"], batch_size=2
+        )
+
+        project.load_subjects.assert_called_once_with(["0", "1", "2"], batch_size=2)
+        assert proxy.get_matching_acquisition_files_info.call_count == 2
+        filters = [
+            call.kwargs["filters"]
+            for call in proxy.get_matching_acquisition_files_info.call_args_list
+        ]
+        assert filters == [
+            "file.parents.subject=|[subject-0,subject-1]",
+            "file.parents.subject=|[subject-2]",
+        ]
+
+        for label in ["0", "1", "2"]:
+            result = forms_store.query_form_data(
+                subject_lbl=label,
+                module="UDS",
+                legacy=False,
+                search_col="visitdate",
+                find_all=True,
+            )
+            assert result
+            assert len(result) == 1
+            assert result[0]["file.file_id"] == "UDS-2024-01-10"
+
+        assert not forms_store.is_new_subject("1")
+        assert forms_store.is_new_subject("3")
+        assert proxy.get_matching_acquisition_files_info.call_count == 2
+        project.find_subject.assert_called_once_with("3")
+
+
+class TestFakeFlywheelVisits:
+    def test_queries_from_prefetched_dataview(self):
+        """Runs the visit queries against the dataviews of the fake
+        client."""
+        SUBJECT_INDEXES.clear()
+        client = FakeFlywheel()
+        fake_project = client.add_project(group="adrc", label="ingest-form")
+        populate_form_project(fake_project, num_subjects=3, visits_per_subject=3)
+        proxy = FlywheelProxy(client=client, dry_run=False)  # type: ignore
+        project = ProjectAdaptor(project=fake_project, proxy=proxy)  # type: ignore
+
+        forms_store = FormsStore(ingest_project=project)
+        forms_store.prefetch_visits(
+            subject_lbls=["NACC000000", "NACC000002"],
+            fields=["visitdate", "visitnum", "packet"],
+        )
+        assert client.requests["read_view_data"] == 1
+
+        visits = forms_store.query_form_data(
+            subject_lbl="NACC000002",
+            module="UDS",
+            legacy=False,
+            search_col="packet",
+            search_val=["I", "I4"],
+            search_op="=|",
+            extra_columns=["visitnum", "visitdate"],
+        )
+        assert visits
+        assert len(visits) == 1
+        assert visits[0][VISITNUM] == "1"
+        assert visits[0][DATE] == "2001-01-01"
+
+        visits = forms_store.query_form_data_with_custom_filters(
+            subject_lbl="NACC000000",
+            module="UDS",
+            legacy=False,
+            order_by="visitdate",
+            list_filters=[FormFilter(field="visitnum", value="1", operator=">")],
+        )
+        assert visits
+        assert [visit[DATE] for visit in visits] == ["2003-01-01", "2002-01-01"]
+        assert client.requests["read_view_data"] == 1
+
+        # subjects not prefetched are loaded with a dataview per subject
+        assert forms_store.query_form_data(
+            subject_lbl="NACC000001",
+            module="UDS",
+            legacy=False,
+            search_col="visitdate",
+            find_all=True,
+        )
+        assert client.requests["read_view_data"] == 2
+        SUBJECT_INDEXES.clear()
@@ -0,0 +1,172 @@
+"""Tests for QC status log compaction and QC metadata updates."""
+
+from typing import Iterable
+
+from error_logging.error_logger import (
+    compact_error_log,
+    compact_log_contents,
+    split_log_entries,
+    update_error_log_and_qc_metadata,
+)
+from nacc_common.error_models import FileError, FileErrorList, FileQCModel
+from test_mocks.mock_flywheel import MockFile, MockProjectAdaptor
+
+LOG_NAME = "123_2024-01-15_001_uds_qc-status.log"
+
+
+def create_errors(*codes: str) -> FileErrorList:
+    return FileErrorList(
+        [
+            FileError(error_type="error", error_code=code, message="bad")
+            for code in codes
+        ]  # type: ignore
+    )
+
+
+def create_log(num_entries: int, failed: Iterable[int] = ()) -> str:
+    """Creates a log with entries for three gears, where the entries with
+    the given indexes have failed with an error."""
+    failed = set(failed)
+    contents = ""
+    for index in range(num_entries):
+        gear = f"gear-{index % 3}"
+        status = "FAIL" if index in failed else "PASS"
+        contents += (
+            f"2024-01-15 10:00:{index % 60:02d} QC Status: {gear.upper()} - {status}\n"
+        )
+        if index in failed:
+            contents += f'{{"code": "e{index}"}}\n'
+    return contents
+
+
+class TestLogCompaction:
+    def test_split_log_entries(self):
+        contents = "header\n" + create_log(3, failed=range(3))
+        entries = split_log_entries(contents)
+        assert len(entries) == 4
+        assert entries[0] == "header\n"
+        assert entries[1].endswith('{"code": "e0"}\n')
+        assert "".join(entries) == contents
+
+    def test_below_threshold_unchanged(self):
+        contents = create_log(5)
+        assert compact_log_contents(contents, threshold=5) == contents
+
+    def test_compaction(self):
+        contents = create_log(12, failed=[1, 5])
+        compacted = compact_log_contents(contents, threshold=10, tail_entries=4)
+
+        entries = split_log_entries(compacted)
+        summary = "QC Log Compacted: 4 earlier entries removed, 0 with errors"
+        assert summary in entries[0]
+        # the latest entry and the latest errors of each gear are kept
+        assert [entry[11:19] for entry in entries[1:5]] == [
+            "10:00:01",
+            "10:00:05",
+            "10:00:06",
+            "10:00:07",
+        ]
+        assert entries[1].endswith('{"code": "e1"}\n')
+        assert entries[2].endswith('{"code": "e5"}\n')
+        # the tail is kept in full
+        assert "".join(entries[5:]) == "".join(split_log_entries(contents)[-4:])
+
+        # compacting again stays bounded and keeps counting removed entries
+        recompacted = compact_log_contents(
+            compacted + create_log(10), threshold=10, tail_entries=4
+        )
+        entries = split_log_entries(recompacted)
+        assert len(entries) <= 1 + 2 * 3 + 4
+        summary = "QC Log Compacted: 13 earlier entries removed, 0 with errors"
+        assert summary in entries[0]
+        assert '{"code": "e1"}' in recompacted
+        assert '{"code": "e5"}' in recompacted
+
+    def test_failures_bounded(self):
+        contents = create_log(24, failed=range(24))
+        compacted = compact_log_contents(contents, threshold=10, tail_entries=4)
+
+        entries = split_log_entries(compacted)
+        assert len(entries) == 1 + 3 + 4
+        assert "17 earlier entries removed, 17 with errors" in entries[0]
+        assert [entry.splitlines()[1] for entry in entries[1:4]] == [
+            '{"code": "e17"}',
+            '{"code": "e18"}',
+            '{"code": "e19"}',
+        ]
+        assert compact_log_contents(compacted, threshold=5, tail_entries=4) == (
+            compacted
+        )
+
+
+class TestMetadataUpdate:
+    def test_update_resets_gears(self):
+        project = MockProjectAdaptor(label="ingest-form")
+        assert update_error_log_and_qc_metadata(
+            error_log_name=LOG_NAME,
+            destination_prj=project,
+            gear_name="gear-a",
+            state="fail",
+            errors=create_errors("a1"),
+        )
+
+        assert update_error_log_and_qc_metadata(
+            error_log_name=LOG_NAME,
+            destination_prj=project,
+            gear_name="gear-b",
+            state="fail",
+            errors=create_errors("b1"),
+            reset_qc_metadata="GEAR",
+            reset_gears=["gear-a"],
+        )
+
+        log_file = project.get_file(LOG_NAME)
+        assert log_file
+        contents = log_file.read().decode("utf-8")
+        assert len(split_log_entries(contents)) == 2
+        assert "GEAR-B - FAIL" in contents
+
+        qc_info = FileQCModel.create(log_file)
+        assert set(qc_info.qc.keys()) == {"gear-b"}
+        assert [error.error_code for error in qc_info.get_errors("gear-b")] == ["b1"]
+
+    def test_update_compacts_log(self):
+        project = MockProjectAdaptor(
+            label="ingest-form",
+            files=[MockFile(name=LOG_NAME, contents=create_log(60))],
+        )
+        assert update_error_log_and_qc_metadata(
+            error_log_name=LOG_NAME,
+            destination_prj=project,
+            gear_name="gear-a",
+            state="pass",
+            errors=create_errors(),
+        )
+
+        log_file = project.get_file(LOG_NAME)
+        assert log_file
+        entries = split_log_entries(log_file.read().decode("utf-8"))
+        assert len(entries) < 60
+        assert "GEAR-A - PASS" in entries[-1]
+
+    def test_compact_error_log(self):
+        qc_info = FileQCModel(qc={})
+        qc_info.set_errors(gear_name="gear-a", status="FAIL", errors=[])
+        project = MockProjectAdaptor(
+            label="ingest-form",
+            files=[
+                MockFile(
+                    name=LOG_NAME,
+                    contents=create_log(60),
+                    info=qc_info.model_dump(by_alias=True),
+                )
+            ],
+        )
+
+        assert compact_error_log(error_log_name=LOG_NAME, destination_prj=project)
+        log_file = project.get_file(LOG_NAME)
+        assert log_file
+        assert "QC Log Compacted" in log_file.read().decode("utf-8")
+        assert FileQCModel.create(log_file).get_status("gear-a") == "FAIL"
+
+        assert not compact_error_log(error_log_name="missing", destination_prj=project)
@@ -0,0 +1,110 @@
+"""Tests for profiling of the Flywheel adaptors."""
+
+import csv
+import io
+import json
+from unittest.mock import Mock
+
+import pytest
+from flywheel.file_spec import FileSpec
+from flywheel.rest import ApiException
+from flywheel_adaptor.flywheel_proxy import ProjectAdaptor
+from flywheel_adaptor.instrumentation import (
+    ALL_CALLERS,
+    AdaptorProfiler,
+    is_profiling_enabled,
+    percentile,
+    profile_adaptors,
+)
+
+
+def create_project() -> Mock:
+    """Creates a mock project."""
+    project = Mock()
+    project.reload.return_value = project
+    project.read_file.return_value = b"0123456789"
+    return project
+
+
+def read_twice(adaptor: ProjectAdaptor) -> None:
+    adaptor.read_file("a.csv")
+    adaptor.read_file("a.csv")
+
+
+class TestAdaptorProfiler:
+    def test_percentile(self):
+        samples = [float(value) for value in range(1, 101)]
+        assert percentile(samples, 50) == 50
+        assert percentile(samples, 95) == 95
+        assert percentile(samples, 99) == 99
+        assert percentile([], 50) == 0
+        assert percentile([3.0], 99) == 3
+
+    def test_profile_adaptors(self):
+        adaptor = ProjectAdaptor(project=create_project(), proxy=Mock())
+        original = ProjectAdaptor.read_file
+        with profile_adaptors() as profiler:
+            assert ProjectAdaptor.read_file is not original
+            read_twice(adaptor)
+            adaptor.upload_file(FileSpec(name="b.csv", contents="abc"))
+            adaptor.add_subject("label-with-a-long-name")
+        assert ProjectAdaptor.read_file is original
+
+        adaptor.read_file("a.csv")
+        methods = {profile.method: profile for profile in profiler.method_profiles()}
+        assert methods["ProjectAdaptor.read_file"].calls == 2
+        assert methods["ProjectAdaptor.read_file"].bytes_received == 20
+        assert methods["ProjectAdaptor.read_file"].caller == ALL_CALLERS
+        assert methods["ProjectAdaptor.upload_file"].bytes_sent == 3
+
+        # labels are not file contents
+        assert methods["ProjectAdaptor.add_subject"].bytes_sent == 0
+
+        callers = {
+            (profile.method, profile.caller) for profile in profiler.caller_profiles()
+        }
+        assert (
+            "ProjectAdaptor.read_file",
+            f"{__name__}.read_twice",
+        ) in callers
+
+    def test_errors_recorded(self):
+        project = create_project()
+        project.delete_file.side_effect = ApiException(status=500)
+        adaptor = ProjectAdaptor(project=project, proxy=Mock())
+        with profile_adaptors([ProjectAdaptor]) as profiler:
+            assert not adaptor.delete_file("a.csv")
+            project.read_file.side_effect = ValueError("failed")
+            with pytest.raises(ValueError):
+                adaptor.read_file("a.csv")
+
+        methods = {profile.method: profile for profile in profiler.method_profiles()}
+        assert methods["ProjectAdaptor.delete_file"].errors == 0
+        assert methods["ProjectAdaptor.read_file"].errors == 1
+
+    def test_outputs(self):
+        profiler = AdaptorProfiler()
+        profiler.record(method="A.get", caller="x.f", seconds=0.5, bytes_sent=10)
+        profiler.record(method="A.get", caller="y.g", seconds=1.0)
+        profiler.record(method="A.put", caller="x.f", seconds=0.1)
+
+        document = json.loads(profiler.to_json())
+        assert [item["method"] for item in document["methods"]] == ["A.get", "A.put"]
+        assert document["methods"][0]["calls"] == 2
+        assert document["methods"][0]["p50_seconds"] == 0.5
+        assert document["methods"][0]["bytes_sent"] == 10
+        assert len(document["callers"]) == 3
+
+        rows = list(csv.DictReader(io.StringIO(profiler.to_csv())))
+        assert len(rows) == 5
+        assert rows[0]["caller"] == ALL_CALLERS
+
+        profiler.clear()
+        assert not profiler.method_profiles()
+
+    def test_is_profiling_enabled(self, monkeypatch):
+        monkeypatch.delenv("PROFILE_ADAPTORS", raising=False)
+        assert not is_profiling_enabled()
+
+        monkeypatch.setenv("PROFILE_ADAPTORS", "true")
+        assert is_profiling_enabled()
@@ -0,0 +1,109 @@
+"""Tests for the file index of ProjectAdaptor."""
+
+from unittest.mock import Mock
+
+from flywheel.rest import ApiException
+from flywheel_adaptor.flywheel_proxy import ProjectAdaptor
+
+
+def create_file(name: str, file_id: str = "") -> Mock:
+    """Creates a mock file entry."""
+    file_entry = Mock()
+    file_entry.name = name
+    file_entry.file_id = file_id or f"{name}-id"
+    file_entry.reload.return_value = file_entry
+    return file_entry
+
+
+def create_adaptor(files=None, upload_response=None):
+    """Creates a project adaptor for a mock project with the files."""
+    project = Mock()
+    project.id = "project-id"
+    project.group = "group"
+    project.label = "project"
+    project.files = files if files is not None else []
+    project.reload.return_value = project
+    project.upload_file.return_value = upload_response
+
+    proxy = Mock()
+    proxy.get_files.return_value = []
+    return ProjectAdaptor(project=project, proxy=proxy), project, proxy
+
+
+class TestProjectFileIndex:
+    def test_get_file(self):
+        adaptor, project, _ = create_adaptor(
+            files=[create_file("a.csv"), create_file("b.csv")]
+        )
+        assert adaptor.get_file("a.csv").name == "a.csv"  # type: ignore
+        assert adaptor.get_file("c.csv") is None
+        assert [file.name for file in adaptor.files] == ["a.csv", "b.csv"]
+        project.get_file.assert_not_called()
+
+    def test_upload_uses_response(self):
+        uploaded = create_file("a.csv", file_id="new-id")
+        adaptor, project, proxy = create_adaptor(
+            files=[create_file("b.csv")],
+            upload_response=[{"name": "a.csv", "file_id": "new-id"}],
+        )
+        proxy.get_file.return_value = uploaded
+        assert adaptor.get_file("a.csv") is None
+        project.reload.reset_mock()
+
+        assert (
+            adaptor.upload_file_contents(
+                filename="a.csv", contents="x", content_type="text/csv"
+            )
+            == uploaded
+        )
+        proxy.get_file.assert_called_once_with("new-id")
+        proxy.get_files.assert_not_called()
+        project.reload.assert_not_called()
+        assert adaptor.get_file("a.csv") == uploaded
+
+    def test_upload_without_response(self):
+        uploaded = create_file("a.csv")
+        adaptor, project, proxy = create_adaptor()
+        proxy.get_files.return_value = [uploaded]
+        project.reload.reset_mock()
+
+        assert (
+            adaptor.upload_file_contents(
+                filename="a.csv", contents="x", content_type="text/csv"
+            )
+            == uploaded
+        )
+        proxy.get_files.assert_called_once_with(
+            'parents.project=project-id,parent_ref.type=project,name="a.csv"'
+        )
+        project.reload.assert_not_called()
+
+    def test_upload_not_found(self):
+        adaptor, _, _ = create_adaptor()
+        assert (
+            adaptor.upload_file_contents(
+                filename="a.csv", contents="x", content_type="text/csv"
+            )
+            is None
+        )
+
+    def test_delete_file(self):
+        adaptor, project, _ = create_adaptor(files=[create_file("a.csv")])
+        assert adaptor.get_file("a.csv")
+        assert adaptor.delete_file("a.csv")
+        assert adaptor.get_file("a.csv") is None
+
+        adaptor, project, _ = create_adaptor(files=[create_file("a.csv")])
+        project.delete_file.side_effect = ApiException(status=500)
+        assert not adaptor.delete_file("a.csv")
+        assert adaptor.get_file("a.csv")
+
+    def test_reload_rebuilds_index(self):
+        adaptor, project, _ = create_adaptor(files=[create_file("a.csv")])
+        assert adaptor.get_file("a.csv")
+        project.files = [create_file("b.csv")]
+        assert adaptor.get_file("b.csv") is None
+
+        adaptor.reload()
+        assert adaptor.get_file("a.csv") is None
+        assert adaptor.get_file("b.csv")
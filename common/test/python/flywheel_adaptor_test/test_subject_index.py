@@ -0,0 +1,113 @@
+"""Tests for the subject index shared by ProjectAdaptors."""
+
+from unittest.mock import Mock
+
+import pytest
+from flywheel_adaptor.flywheel_proxy import FlywheelProxy, ProjectAdaptor
+from flywheel_adaptor.subject_index import SUBJECT_INDEXES
+
+
+def create_subject(label: str) -> Mock:
+    """Creates a mock subject."""
+    subject = Mock()
+    subject.label = label
+    subject.id = f"{label}-id"
+    return subject
+
+
+class MockSubjectFinder:
+    """Subject finder for a list of subjects that records queries."""
+
+    def __init__(self, subjects) -> None:
+        self.subjects = subjects
+        self.queries = []
+
+    def find_first(self, query: str):
+        self.queries.append(query)
+        label = query.removeprefix("label=")
+        return next((s for s in self.subjects if s.label == label), None)
+
+    def find(self, query: str):
+        self.queries.append(query)
+        labels = query.removeprefix("label=|[").removesuffix("]").split(",")
+        return [s for s in self.subjects if s.label in labels]
+
+    def iter(self):
+        self.queries.append("iter")
+        return iter(self.subjects)
+
+
+def create_adaptor(finder: MockSubjectFinder) -> ProjectAdaptor:
+    """Creates a project adaptor for a mock project using the finder."""
+    project = Mock()
+    project.id = "project-id"
+    project.subjects = finder
+    project.reload.return_value = project
+    project.add_subject.side_effect = lambda label: create_subject(label)
+    return ProjectAdaptor(project=project, proxy=Mock())
+
+
+@pytest.fixture(autouse=True)
+def clear_subject_indexes():
+    SUBJECT_INDEXES.clear()
+    yield
+    SUBJECT_INDEXES.clear()
+
+
+class TestSubjectIndex:
+    def test_find_subject_cached(self):
+        finder = MockSubjectFinder([create_subject("NACC000001")])
+        adaptor = create_adaptor(finder)
+
+        assert adaptor.find_subject("NACC000001").label == "NACC000001"  # type: ignore
+        assert adaptor.find_subject("NACC000001")
+        assert adaptor.find_subject("NACC000002") is None
+        assert adaptor.find_subject("NACC000002") is None
+        assert len(finder.queries) == 2
+
+        # shared by adaptors for the same project
+        other = create_adaptor(finder)
+        assert other.find_subject("NACC000001")
+        assert len(finder.queries) == 2
+
+    def test_add_subject(self):
+        finder = MockSubjectFinder([])
+        adaptor = create_adaptor(finder)
+        assert adaptor.find_subject("NACC000001") is None
+
+        adaptor.add_subject("NACC000001")
+        assert adaptor.find_subject("NACC000001").id == "NACC000001-id"  # type: ignore
+        assert len(finder.queries) == 1
+
+    def test_load_subjects(self):
+        subjects = [create_subject(f"NACC{num:06d}") for num in range(250)]
+        finder = MockSubjectFinder(subjects)
+        adaptor = create_adaptor(finder)
+
+        labels = [subject.label for subject in subjects] + ["NACC999999"]
+        loaded = adaptor.load_subjects(labels)
+        assert len(finder.queries) == 3
+        assert [subject.label for subject in loaded] == labels[:-1]
+
+        assert len(adaptor.load_subjects(labels)) == 250
+        assert adaptor.find_subject("NACC000123").label == "NACC000123"  # type: ignore
+        assert adaptor.find_subject("NACC999999") is None
+        assert len(finder.queries) == 3
+
+    def test_load_all_subjects(self):
+        finder = MockSubjectFinder([create_subject("NACC000001")])
+        adaptor = create_adaptor(finder)
+        adaptor.load_subjects()
+        assert adaptor.find_subject("NACC000001")
+        assert finder.queries == ["iter"]
+
+    def test_delete_subject(self):
+        finder = MockSubjectFinder([create_subject("NACC000001")])
+        adaptor = create_adaptor(finder)
+        assert adaptor.find_subject("NACC000001")
+
+        proxy = FlywheelProxy(client=Mock(), dry_run=False)
+        assert proxy.delete_subject("NACC000001-id")
+        finder.subjects = []
+        assert adaptor.find_subject("NACC000001") is None
+        assert len(finder.queries) == 2
@@ -0,0 +1,333 @@
+"""Tests for paging and indexing in IdentifiersLambdaRepository."""
+
+import json
+import threading
+from typing import List
+
+import pytest
+from identifiers.identifier_index import IdentifierIndex
+from identifiers.identifiers_lambda_repository import (
+    LIST_PAGE_LIMIT,
+    SEARCH_RESULT_CACHE,
+    IdentifiersLambdaRepository,
+)
+from identifiers.identifiers_repository import (
+    IdentifierRepositoryError,
+    IdentifierUpdateObject,
+)
+from identifiers.model import IdentifierObject
+from lambdas.lambda_function import (
+    BaseRequest,
+    LambdaThrottlingError,
+    ResponseObject,
+)
+
+
+def make_identifier(
+    num: int, adcid: int = 1, active: bool = True, guid: bool = True
+) -> IdentifierObject:
+    return IdentifierObject(
+        naccid=f"NACC{num:06d}",
+        adcid=adcid,
+        ptid=f"P{num}",
+        guid=f"GUID{num}" if guid else None,
+        naccadc=adcid,
+        active=active,
+    )
+
+
+class MockLambdaClient:
+    """Lambda client that serves list requests from a list of
+    identifiers.
+
+    Searches records the NACCIDs of each searched batch, and search
+    offsets records the offset of each search page.
+    """
+
+    def __init__(self, identifiers: List[IdentifierObject]) -> None:
+        self.identifiers = identifiers
+        self.invocations: List[str] = []
+        self.offsets: List[int] = []
+        self.searches: List[List[str]] = []
+        self.search_offsets: List[int] = []
+        self.__lock = threading.Lock()
+
+    def invoke(self, name: str, request: BaseRequest) -> ResponseObject:
+        with self.__lock:
+            self.invocations.append(name)
+
+        if name == "add-update-identifier-lambda-function":
+            return ResponseObject(statusCode=200, headers={}, body="updated")
+
+        payload = request.model_dump()
+        if name == "identifier-search-naccids-lambda-function":
+            offset = payload["offset"]
+            limit = payload["limit"]
+            with self.__lock:
+                if offset == 0:
+                    self.searches.append(payload["naccids"])
+                self.search_offsets.append(offset)
+            data = [
+                identifier.model_dump(mode="json")
+                for identifier in self.identifiers
+                if identifier.naccid in payload["naccids"]
+                and (identifier.active or not payload["active_only"])
+            ][offset : offset + limit]
+            body = json.dumps({"offset": offset, "limit": limit, "data": data})
+            return ResponseObject(statusCode=200, headers={}, body=body)
+
+        if "offset" in payload:
+            offset = payload["offset"]
+            limit = payload["limit"]
+            with self.__lock:
+                self.offsets.append(offset)
+            data = [
+                identifier.model_dump(mode="json")
+                for identifier in self.identifiers[offset : offset + limit]
+            ]
+            body = json.dumps({"offset": offset, "limit": limit, "data": data})
+            return ResponseObject(statusCode=200, headers={}, body=body)
+
+        for identifier in self.identifiers:
+            if (
+                payload.get("naccid") == identifier.naccid
+                or payload.get("guid") == identifier.guid
+                or (
+                    payload.get("adcid") == identifier.adcid
+                    and payload.get("ptid") == identifier.ptid
+                )
+            ):
+                return ResponseObject(
+                    statusCode=200, headers={}, body=identifier.model_dump_json()
+                )
+
+        return ResponseObject(statusCode=404, headers={}, body="not found")
+
+
+class ErrorLambdaClient(MockLambdaClient):
+    """Lambda client that fails on the page at the given offset."""
+
+    def __init__(self, identifiers: List[IdentifierObject], offset: int) -> None:
+        super().__init__(identifiers)
+        self.error_offset = offset
+
+    def invoke(self, name: str, request: BaseRequest) -> ResponseObject:
+        if request.model_dump().get("offset") == self.error_offset:
+            return ResponseObject(statusCode=500, headers={}, body="failed")
+
+        return super().invoke(name, request)
+
+
+class ThrottlingLambdaClient(MockLambdaClient):
+    """Lambda client that throttles the first invocations."""
+
+    def __init__(self, identifiers: List[IdentifierObject], throttled: int) -> None:
+        super().__init__(identifiers)
+        self.throttled = throttled
+
+    def invoke(self, name: str, request: BaseRequest) -> ResponseObject:
+        if self.throttled > 0:
+            self.throttled -= 1
+            raise LambdaThrottlingError("Rate Exceeded")
+
+        return super().invoke(name, request)
+
+
+@pytest.fixture(autouse=True)
+def clear_search_cache(monkeypatch):
+    """Clears the process-wide search cache, and disables retry sleeps."""
+    monkeypatch.setattr("utils.decorators.time.sleep", lambda _: None)
+    SEARCH_RESULT_CACHE.clear()
+    yield
+    SEARCH_RESULT_CACHE.clear()
+
+
+class TestIdentifiersLambdaRepositoryList:
+    @pytest.mark.parametrize("count", [0, 1, 99, 100, 101, 450, 800, 801])
+    def test_list_for_adcid(self, count):
+        identifiers = [make_identifier(num) for num in range(count)]
+        client = MockLambdaClient(identifiers)
+        repo = IdentifiersLambdaRepository(
+            client=client,  # type: ignore
+            mode="prod",
+            max_workers=4,
+        )
+
+        result = repo.list(adcid=1)
+        assert result == identifiers
+
+        # never reads more than one group of pages past the last page
+        last_offset = (count // LIST_PAGE_LIMIT) * LIST_PAGE_LIMIT
+        assert max(client.offsets) < last_offset + 4 * LIST_PAGE_LIMIT
+        assert sorted(set(client.offsets)) == sorted(client.offsets)
+
+    def test_list_single_page_single_invocation(self):
+        client = MockLambdaClient([make_identifier(1)])
+        repo = IdentifiersLambdaRepository(client=client, mode="prod")  # type: ignore
+
+        assert repo.list(naccid="NACC000001") == [make_identifier(1)]
+        assert client.offsets == [0]
+
+    def test_list_page_error(self):
+        identifiers = [make_identifier(num) for num in range(350)]
+        client = ErrorLambdaClient(identifiers, offset=200)
+        repo = IdentifiersLambdaRepository(client=client, mode="prod")  # type: ignore
+
+        with pytest.raises(IdentifierRepositoryError):
+            repo.list(adcid=1)
+
+
+class TestIdentifiersLambdaRepositoryIndex:
+    def test_get_after_list(self):
+        identifiers = [make_identifier(num) for num in range(250)]
+        client = MockLambdaClient(identifiers)
+        repo = IdentifiersLambdaRepository(client=client, mode="prod")  # type: ignore
+        repo.list(adcid=1)
+        invocations = len(client.invocations)
+
+        assert repo.get(adcid=1, ptid="P7") == identifiers[7]
+        assert repo.get(adcid=1, ptid="0P7") == identifiers[7]
+        assert repo.get(naccid="NACC000042") == identifiers[42]
+        assert repo.get(guid="GUID200") == identifiers[200]
+        assert len(client.invocations) == invocations
+
+    def test_get_miss_invokes_once(self):
+        identifier = make_identifier(1)
+        client = MockLambdaClient([identifier])
+        repo = IdentifiersLambdaRepository(client=client, mode="prod")  # type: ignore
+
+        assert repo.get(naccid="NACC000001") == identifier
+        assert repo.get(naccid="NACC000001") == identifier
+        assert repo.get(adcid=1, ptid="P1") == identifier
+        assert len(client.invocations) == 1
+
+        # not found is not cached
+        assert repo.get(naccid="NACC000002") is None
+        assert repo.get(naccid="NACC000002") is None
+        assert len(client.invocations) == 3
+
+    def test_index_cleared_on_update(self):
+        identifier = make_identifier(1)
+        client = MockLambdaClient([identifier])
+        repo = IdentifiersLambdaRepository(client=client, mode="prod")  # type: ignore
+        repo.get(naccid="NACC000001")
+        repo.get(naccid="NACC000001")
+        assert len(client.invocations) == 1
+
+        assert repo.add_or_update(
+            IdentifierUpdateObject.create_from_identifier(identifier, active=True)
+        )
+        assert repo.get(naccid="NACC000001") == identifier
+        assert len(client.invocations) == 3
+
+
+class TestIdentifiersLambdaRepositorySearch:
+    def test_search_naccids_batches(self):
+        identifiers = [make_identifier(num) for num in range(450)]
+        client = MockLambdaClient(identifiers)
+        repo = IdentifiersLambdaRepository(client=client, mode="prod")  # type: ignore
+
+        naccids = [x.naccid for x in reversed(identifiers)]
+        result = repo.search_naccids(naccids)
+
+        # results are in the order of the requested NACCIDs
+        assert result == list(reversed(identifiers))
+        assert sorted(len(batch) for batch in client.searches) == [
+            50,
+            100,
+            100,
+            100,
+            100,
+        ]
+
+    def test_search_naccids_cached(self):
+        identifiers = [make_identifier(num) for num in range(10)]
+        client = MockLambdaClient(identifiers)
+        repo = IdentifiersLambdaRepository(client=client, mode="prod")  # type: ignore
+
+        naccids = [x.naccid for x in identifiers]
+        repo.search_naccids(naccids[:5])
+
+        # the cache is shared by repositories in the same process
+        other_repo = IdentifiersLambdaRepository(client=client, mode="prod")  # type: ignore
+        result = other_repo.search_naccids([*naccids, "NACC999999"])
+        assert result == identifiers
+        assert client.searches[-1] == [*naccids[5:], "NACC999999"]
+
+        # missing NACCIDs are searched again, cached ones are not
+        other_repo.search_naccids(["NACC999999", naccids[0]])
+        assert client.searches[-1] == ["NACC999999"]
+
+        # different search options are cached separately
+        other_repo.search_naccids([naccids[0]], allow_multiple=True, active_only=False)
+        assert client.searches[-1] == [naccids[0]]
+        other_repo.search_naccids([naccids[1]], allow_missing=False)
+        assert client.searches[-1] == [naccids[1]]
+
+    def test_search_naccids_multiple(self):
+        inactive = make_identifier(1, adcid=1, active=False)
+        active = make_identifier(1, adcid=2)
+        client = MockLambdaClient([inactive, active])
+        repo = IdentifiersLambdaRepository(client=client, mode="prod")  # type: ignore
+
+        assert repo.search_naccids(["NACC000001"]) == [active]
+        assert repo.search_naccids(
+            ["NACC000001"], allow_multiple=True, active_only=False
+        ) == [inactive, active]
+
+    def test_search_naccids_pages_batch(self):
+        """A batch matching more records than a page is read in pages."""
+        identifiers = [
+            make_identifier(num, adcid=adcid, active=adcid == 3)
+            for num in range(LIST_PAGE_LIMIT)
+            for adcid in (1, 2, 3)
+        ]
+        client = MockLambdaClient(identifiers)
+        repo = IdentifiersLambdaRepository(client=client, mode="prod")  # type: ignore
+
+        naccids = [make_identifier(num).naccid for num in range(LIST_PAGE_LIMIT)]
+        result = repo.search_naccids(naccids, allow_multiple=True, active_only=False)
+
+        assert result == identifiers
+        assert client.searches == [naccids]
+        assert client.search_offsets == [0, 100, 200, 300]
+
+        # the cached results are complete
+        assert (
+            repo.search_naccids(naccids[:1], allow_multiple=True, active_only=False)
+            == identifiers[:3]
+        )
+        assert len(client.searches) == 1
+
+    def test_search_naccids_throttled(self):
+        identifier = make_identifier(1)
+        client = ThrottlingLambdaClient([identifier], throttled=2)
+        repo = IdentifiersLambdaRepository(client=client, mode="prod")  # type: ignore
+        assert repo.search_naccids(["NACC000001"]) == [identifier]
+
+        SEARCH_RESULT_CACHE.clear()
+        client.throttled = 10
+        with pytest.raises(IdentifierRepositoryError):
+            repo.search_naccids(["NACC000001"])
+
+
+class TestIdentifierIndex:
+    def test_inactive_not_indexed_by_naccid(self):
+        index = IdentifierIndex()
+        inactive = make_identifier(1, adcid=1, active=False)
+        active = make_identifier(1, adcid=2, active=True)
+        index.add_all([active, inactive])
+
+        assert index.get(naccid="NACC000001") == active
+        assert index.get(guid="GUID1") == active
+        assert index.get(adcid=1, ptid="P1") == inactive
+        assert index.get(adcid=2, ptid="P1") == active
+        assert len(index) == 2
+
+    def test_clear(self):
+        index = IdentifierIndex()
+        index.add(make_identifier(1, guid=False))
+        assert index.get(guid="GUID1") is None
+        index.clear()
+        assert index.get(naccid="NACC000001") is None
+        assert len(index) == 0
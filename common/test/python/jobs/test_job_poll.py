@@ -0,0 +1,140 @@
+"""Tests for JobPoll job waiting."""
+
+from typing import Dict, List, Optional
+from unittest.mock import patch
+
+import pytest
+from jobs.job_poll import JobPoll, PollBackoff
+
+
+class MockJob:
+    def __init__(
+        self, job_id: str, states: List[str], retried: Optional[str] = None
+    ) -> None:
+        self.id = job_id
+        self.__states = states
+        self.retried = retried
+
+    @property
+    def state(self) -> str:
+        return self.__states[0]
+
+    def advance(self) -> None:
+        if len(self.__states) > 1:
+            self.__states.pop(0)
+
+    def reload(self) -> "MockJob":
+        self.advance()
+        return self
+
+
+class MockJobProxy:
+    """Returns the current job states, each job search advances the state of
+    the returned jobs."""
+
+    def __init__(self, jobs: List[MockJob]) -> None:
+        self.__jobs: Dict[str, MockJob] = {job.id: job for job in jobs}
+        self.searches: List[str] = []
+
+    def add_job(self, job: MockJob) -> None:
+        self.__jobs[job.id] = job
+
+    def find_jobs(self, search_str: str) -> List[MockJob]:
+        self.searches.append(search_str)
+        job_ids = search_str.removeprefix("_id=|[").removesuffix("]").split(",")
+        found = [self.__jobs[job_id] for job_id in job_ids if job_id in self.__jobs]
+        result = [MockJob(job.id, [job.state], job.retried) for job in found]
+        for job in found:
+            job.advance()
+        return result
+
+    def find_job(self, search_str: str) -> Optional[MockJob]:
+        previous_id = search_str.split('"')[1]
+        return self.__jobs.get(f"{previous_id}-retry")
+
+
+@pytest.fixture
+def mock_sleep():
+    with patch("jobs.job_poll.time.sleep") as sleep:
+        yield sleep
+
+
+class TestPollBackoff:
+    def test_intervals(self):
+        intervals = PollBackoff(initial_interval=1, max_interval=5).intervals()
+        assert [next(intervals) for _ in range(5)] == [1, 2, 4, 5, 5]
+
+
+class TestJobPoll:
+    def test_poll_job_status(self, mock_sleep):
+        job = MockJob("job1", ["pending", "running", "running", "complete"])
+        assert JobPoll.poll_job_status(job) == "complete"  # type: ignore
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [2, 4, 8]
+
+    def test_wait_for_jobs(self, mock_sleep):
+        proxy = MockJobProxy(
+            [
+                MockJob("job1", ["running", "running", "complete"]),
+                MockJob("job2", ["complete"]),
+                MockJob("job3", ["running", "failed"]),
+            ]
+        )
+
+        finished = JobPoll.wait_for_jobs(
+            proxy,  # type: ignore
+            ["job1", "job2", "job3"],
+            backoff=PollBackoff(initial_interval=1),
+        )
+        # the failed job is checked again on the next poll before it is
+        # reported
+        assert [(job.id, job.state) for job in finished] == [
+            ("job2", "complete"),
+            ("job1", "complete"),
+            ("job3", "failed"),
+        ]
+
+        # single search per poll
+        assert proxy.searches == [
+            "_id=|[job1,job2,job3]",
+            "_id=|[job1,job3]",
+            "_id=|[job1,job3]",
+        ]
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [1, 2]
+
+    def test_wait_for_retried_job(self, mock_sleep):
+        proxy = MockJobProxy(
+            [
+                MockJob("job1", ["failed"], retried="2026-01-01"),
+                MockJob("job1-retry", ["running", "complete"]),
+            ]
+        )
+
+        finished = list(JobPoll.wait_for_jobs(proxy, ["job1"]))  # type: ignore
+        assert [(job.id, job.state) for job in finished] == [("job1-retry", "complete")]
+
+    def test_wait_for_job_retried_after_failure(self, mock_sleep):
+        class LateRetryJob(MockJob):
+            """Job that is marked retried after it is first seen failed."""
+
+            def advance(self) -> None:
+                super().advance()
+                self.retried = "2026-01-01"
+
+        proxy = MockJobProxy(
+            [
+                LateRetryJob("job1", ["failed"]),
+                MockJob("job1-retry", ["running", "complete"]),
+            ]
+        )
+
+        finished = list(JobPoll.wait_for_jobs(proxy, ["job1"]))  # type: ignore
+        assert [(job.id, job.state) for job in finished] == [("job1-retry", "complete")]
+
+    def test_batched_search(self, mock_sleep):
+        job_ids = [f"job{i}" for i in range(150)]
+        proxy = MockJobProxy([MockJob(job_id, ["complete"]) for job_id in job_ids])
+
+        finished = list(JobPoll.wait_for_jobs(proxy, job_ids))  # type: ignore
+        assert len(finished) == 150
+        assert len(proxy.searches) == 2
+        mock_sleep.assert_not_called()
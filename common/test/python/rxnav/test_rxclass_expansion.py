@@ -0,0 +1,70 @@
+"""Tests the RxClass expansion and concepts file, RxNav requests are
+mocked."""
+
+from io import StringIO
+from unittest.mock import patch
+
+from rxnav.rxnav_connection import (
+    RxClassConnection,
+    load_rxclass_concepts_from_file,
+    write_rxclass_concepts_to_file,
+)
+
+CLASS_MEMBERS = {
+    "A01": {"1": {"name": "one", "tty": "SCD"}, "2": {"name": "two", "tty": "SCD"}},
+    "B02": {"2": {"name": "two", "tty": "SCD"}, "3": {"name": "three", "tty": "IN"}},
+}
+
+RELATED = {
+    "1": {"2": {"name": "two", "tty": "SCD"}, "10": {"name": "ten", "tty": "IN"}},
+    "2": {"20": {"name": "twenty", "tty": "IN"}},
+    "3": {"30": {"name": "thirty", "tty": "IN"}},
+}
+
+
+def mock_class_members(rxclass, rela_source="ATCPROD", filter_single_ingredients=False):
+    return dict(CLASS_MEMBERS[rxclass])
+
+
+def mock_related(rxcui, filter_single_ingredients=False):
+    return dict(RELATED[rxcui])
+
+
+@patch.object(RxClassConnection, "get_related_rxcuis", side_effect=mock_related)
+@patch.object(RxClassConnection, "get_rxclass_members", side_effect=mock_class_members)
+class TestRxClassExpansion:
+    def test_get_all_rxclass_members(self, mock_members, mock_related):
+        result = RxClassConnection.get_all_rxclass_members(["A01", "B02"])
+
+        # 2 is a related concept of 1, so is not expanded for A01
+        assert list(result["A01"].keys()) == ["1", "2", "10"]
+        assert list(result["B02"].keys()) == ["2", "20", "3", "30"]
+
+        # related concepts queried once per RxCUI across classes
+        assert mock_members.call_count == 2
+        assert sorted(call.args[0] for call in mock_related.call_args_list) == [
+            "1",
+            "2",
+            "3",
+        ]
+
+    def test_combination_classes(self, mock_members, mock_related):
+        RxClassConnection.get_all_rxclass_members(
+            ["A01", "B02"], combination_rx_classes=["B02"]
+        )
+
+        # 2 is a member of both, expanded with and without the filter
+        calls = sorted(
+            (call.args[0], call.kwargs["filter_single_ingredients"])
+            for call in mock_related.call_args_list
+        )
+        assert calls == [("1", False), ("2", False), ("2", True), ("3", True)]
+
+    def test_concepts_file(self, mock_members, mock_related):
+        result = RxClassConnection.get_all_rxclass_members(["A01", "B02"])
+
+        stream = StringIO()
+        write_rxclass_concepts_to_file(result, stream)
+        stream.seek(0)
+
+        assert load_rxclass_concepts_from_file(stream) == result
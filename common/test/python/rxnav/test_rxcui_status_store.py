@@ -0,0 +1,90 @@
+"""Tests the RxCuiStatusStore, RxNav requests are mocked."""
+
+from datetime import date, datetime, timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from rxnav.rxcui_status_store import RxCuiStatusStore
+
+METADATA = {
+    "1801289": {"status": "Active", "activeStartDate": "082016", "activeEndDate": ""},
+    "861765": {
+        "status": "Obsolete",
+        "activeStartDate": "092009",
+        "activeEndDate": "062017",
+    },
+    "3686": {"status": "NotCurrent"},
+}
+
+
+def mock_history_metadata(rxcui):
+    return METADATA[str(rxcui)]
+
+
+@patch(
+    "rxnav.rxcui_status_store.RxCuiConnection.get_rxcui_history_metadata",
+    side_effect=mock_history_metadata,
+)
+class TestRxCuiStatusStore:
+    def test_is_rxcui_active(self, mock_request):
+        store = RxCuiStatusStore()
+        assert store.is_rxcui_active(1801289)
+        assert store.is_rxcui_active(1801289, date(2026, 4, 16))
+        assert store.is_rxcui_active(861765, date(2009, 9, 1))
+        assert not store.is_rxcui_active(861765, date(2017, 7, 5))
+        assert not store.is_rxcui_active(861765)
+        assert not store.is_rxcui_active(3686, date(2010, 2, 9))
+        assert not store.is_rxcui_active("not-a-number")
+
+        # one request per RxCUI
+        assert mock_request.call_count == 3
+
+    def test_warm(self, mock_request):
+        store = RxCuiStatusStore()
+        assert store.warm(["1801289", 1801289, " 861765", "3686", ""]) == 3
+        assert mock_request.call_count == 3
+
+        assert store.warm([861765]) == 0
+        assert store.is_rxcui_active("861765", date(2010, 1, 1))
+        assert mock_request.call_count == 3
+
+    def test_lru_eviction(self, mock_request):
+        store = RxCuiStatusStore(max_size=2)
+        store.warm(["1801289", "861765"])
+        store.is_rxcui_active("1801289")
+        store.warm(["3686"])
+        assert len(store) == 2
+
+        # 861765 was least recently used
+        assert store.warm(["1801289", "3686"]) == 0
+        assert store.warm(["861765"]) == 1
+
+    def test_snapshot(self, mock_request):
+        store = RxCuiStatusStore()
+        store.warm(METADATA.keys())
+        assert store.modified
+
+        snapshot = StringIO()
+        store.dump(snapshot)
+        assert not store.modified
+        snapshot.seek(0)
+
+        loaded = RxCuiStatusStore()
+        loaded.load(snapshot)
+        assert len(loaded) == 3
+        assert loaded.is_rxcui_active("1801289")
+        assert loaded.is_rxcui_active(861765, date(2009, 9, 1))
+        assert mock_request.call_count == 3
+
+    def test_expired(self, mock_request):
+        store = RxCuiStatusStore(ttl=timedelta(days=1))
+        retrieved = (datetime.now() - timedelta(days=2)).isoformat()
+        snapshot = StringIO(
+            '{"1801289": {"status": "Active", "active_start_date": "082016", '
+            f'"retrieved": "{retrieved}"}}}}'
+        )
+        store.load(snapshot)
+        assert len(store) == 0
+
+        assert store.is_rxcui_active("1801289")
+        assert mock_request.call_count == 1
@@ -48,3 +48,35 @@ class TestS3BucketInterface:
         )
         prefix_objects = testing_bucket.read_directory("one")
         assert len(prefix_objects) == 2
+
+    def test_read_objects(self, testing_bucket: S3BucketInterface):
+        keys = [f"rules/form{i}_rules.json" for i in range(15)]
+        for index, key in enumerate(keys):
+            testing_bucket.put_file_object(filename=key, contents=f'{{"v{index}": 1}}')
+
+        results = list(testing_bucket.read_objects(reversed(keys), max_workers=4))
+        assert [key for key, _ in results] == list(reversed(keys))
+        for key, s3_obj in results:
+            index = keys.index(key)
+            assert s3_obj["Body"].read().decode("utf-8") == f'{{"v{index}": 1}}'
+
+        assert list(testing_bucket.read_objects([])) == []
+
+        prefix_objects = testing_bucket.read_directory("rules/")
+        assert sorted(prefix_objects.keys()) == sorted(keys)
+
+    def test_download_files(self, testing_bucket: S3BucketInterface, tmp_path):
+        for name in ["a.parquet", "sub/b.parquet", "c.csv"]:
+            testing_bucket.put_file_object(filename=f"data/{name}", contents=name)
+
+        downloaded = testing_bucket.download_files(
+            "data", tmp_path, glob="*.parquet", max_workers=2
+        )
+        assert sorted(downloaded) == [
+            tmp_path / "a.parquet",
+            tmp_path / "sub/b.parquet",
+        ]
+        assert (tmp_path / "sub/b.parquet").read_text() == "sub/b.parquet"
+        assert not (tmp_path / "c.csv").exists()
+
+        assert testing_bucket.download_files("missing", tmp_path) == []
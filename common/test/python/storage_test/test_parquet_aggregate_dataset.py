@@ -0,0 +1,183 @@
+"""Tests for aggregating dataset tables from S3."""
+
+import io
+import json
+
+import boto3
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from moto import mock_aws
+from storage.dataset import (
+    FWDataset,
+    FWDatasetError,
+    ParquetAggregateDataset,
+)
+
+BUCKET = "test-bucket"
+
+
+@pytest.fixture
+def s3_client(monkeypatch):
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with mock_aws():
+        client = boto3.client("s3")
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+
+
+def put_parquet(s3_client, key: str, table: pa.Table) -> None:
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer)
+    s3_client.put_object(Bucket=BUCKET, Key=key, Body=buffer.getvalue())
+
+
+def put_dataset(s3_client, center: str, tables: dict) -> FWDataset:
+    """Writes a dataset version for the center with the tables, where each
+    table is a list of parquet files."""
+    prefix = f"{center}/dataset"
+    version = f"{prefix}/versions/1"
+    description = {
+        "created": "2025-01-01T00:00:00.000000+0000",
+        "tables": {table: {} for table in tables},
+    }
+    s3_client.put_object(
+        Bucket=BUCKET,
+        Key=f"{version}/provenance/dataset_description.json",
+        Body=json.dumps(description),
+    )
+    for table, files in tables.items():
+        for index, data in enumerate(files):
+            put_parquet(s3_client, f"{version}/tables/{table}/{index}.parquet", data)
+
+    return FWDataset(
+        bucket=BUCKET, prefix=prefix, storage_id="id", label=center, type="s3"
+    )
+
+
+class TestParquetAggregateDataset:
+    def test_aggregate_table(self, s3_client, tmp_path):
+        datasets = {
+            "center1": put_dataset(
+                s3_client,
+                "center1",
+                {
+                    "visits": [
+                        pa.table({"naccid": ["A", "B"], "visitnum": [1, 2]}),
+                        pa.table({"naccid": ["C"], "visitnum": [3]}),
+                    ]
+                },
+            ),
+            "center2": put_dataset(
+                s3_client,
+                "center2",
+                {
+                    "visits": [
+                        pa.table(
+                            {
+                                "naccid": ["D"],
+                                "visitnum": [None],
+                                "adcid": [2],
+                            }
+                        )
+                    ]
+                },
+            ),
+        }
+        aggregate = ParquetAggregateDataset(
+            bucket=BUCKET,
+            project="dataset-project",
+            datasets=datasets,
+            max_workers=2,
+            batch_size=1,
+        )
+
+        outfile = aggregate.aggregate_table(
+            "visits", tmp_path, extra_columns={"freeze_date": "20250101"}
+        )
+        result = pq.read_table(outfile).sort_by("naccid")
+        assert result.column_names == ["naccid", "visitnum", "adcid", "freeze_date"]
+        assert result["naccid"].to_pylist() == ["A", "B", "C", "D"]
+        assert result["visitnum"].to_pylist() == [1, 2, 3, None]
+        assert result["adcid"].to_pylist() == [None, None, None, 2]
+        assert set(result["freeze_date"].to_pylist()) == {"20250101"}
+
+        # downloaded files are removed
+        assert [path.name for path in tmp_path.iterdir()] == ["tables"]
+
+    def test_incompatible_schemas(self, s3_client, tmp_path):
+        datasets = {
+            "center1": put_dataset(
+                s3_client, "center1", {"visits": [pa.table({"visitnum": [1]})]}
+            ),
+            "center2": put_dataset(
+                s3_client, "center2", {"visits": [pa.table({"visitnum": [[1]]})]}
+            ),
+        }
+        aggregate = ParquetAggregateDataset(
+            bucket=BUCKET, project="dataset-project", datasets=datasets
+        )
+        with pytest.raises(FWDatasetError):
+            aggregate.aggregate_table("visits", tmp_path)
+
+    def test_table_without_files(self, s3_client, tmp_path):
+        datasets = {
+            "center1": put_dataset(
+                s3_client, "center1", {"visits": [pa.table({"visitnum": [1]})]}
+            ),
+            "center2": put_dataset(s3_client, "center2", {"drugs": []}),
+        }
+        aggregate = ParquetAggregateDataset(
+            bucket=BUCKET, project="dataset-project", datasets=datasets
+        )
+        assert aggregate.aggregate_table("drugs", tmp_path) is None
+        assert not list((tmp_path / "tables" / "drugs").iterdir())
+
+    def test_unknown_table(self, s3_client, tmp_path):
+        datasets = {
+            "center1": put_dataset(
+                s3_client, "center1", {"visits": [pa.table({"visitnum": [1]})]}
+            ),
+        }
+        aggregate = ParquetAggregateDataset(
+            bucket=BUCKET, project="dataset-project", datasets=datasets
+        )
+        with pytest.raises(FWDatasetError):
+            aggregate.aggregate_table("other", tmp_path)
+
+    def test_latest_versions(self, s3_client, tmp_path):
+        datasets = {
+            center: put_dataset(
+                s3_client, center, {"visits": [pa.table({"visitnum": [1]})]}
+            )
+            for center in ("center1", "center2", "center3")
+        }
+        # a newer version of center2's dataset with another table
+        description = {
+            "created": "2025-02-01T00:00:00.000000+0000",
+            "tables": {"visits": {}, "drugs": {}},
+        }
+        s3_client.put_object(
+            Bucket=BUCKET,
+            Key="center2/dataset/versions/2/provenance/dataset_description.json",
+            Body=json.dumps(description),
+        )
+        datasets["center4"] = FWDataset(
+            bucket=BUCKET,
+            prefix="center4/dataset",
+            storage_id="id",
+            label="center4",
+            type="s3",
+        )
+
+        aggregate = ParquetAggregateDataset(
+            bucket=BUCKET, project="dataset-project", datasets=datasets
+        )
+        assert aggregate.latest_versions == {
+            "center1": "center1/dataset/versions/1",
+            "center2": "center2/dataset/versions/2",
+            "center3": "center3/dataset/versions/1",
+        }
+        assert aggregate.tables == {"visits", "drugs"}
@@ -0,0 +1,199 @@
+"""Tests for concurrent user processing and the backend limiter."""
+
+import threading
+import time
+from typing import ClassVar, Dict, List, Tuple
+
+import pytest
+from users.concurrency import (
+    BackendLimiter,
+    ConcurrencyConfig,
+    is_transient_error,
+    limit_client,
+)
+from users.event_models import UserEventCollector
+from users.user_processes import BaseUserProcess, UserQueue
+from users.user_registry import RegistryError
+
+
+class StatusError(Exception):
+    """Error with an HTTP status, like the SDK API exceptions."""
+
+    def __init__(self, status: int) -> None:
+        super().__init__(f"status {status}")
+        self.status = status
+
+
+class Entry:
+    """Queue entry for a user."""
+
+    def __init__(self, email: str, step: int) -> None:
+        self.email = email
+        self.step = step
+
+
+class RecordingProcess(BaseUserProcess[Entry]):
+    """Process that records the steps visited per user, and the number of
+    users visited concurrently."""
+
+    def __init__(self, max_workers: int) -> None:
+        super().__init__(UserEventCollector(), max_workers)
+        self.lock = threading.Lock()
+        self.steps: Dict[str, List[int]] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def visit(self, entry: Entry) -> None:
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        with self.lock:
+            self.in_flight -= 1
+            self.steps.setdefault(entry.email.lower(), []).append(entry.step)
+        if entry.step < 0:
+            raise RegistryError("failed")
+
+    def execute(self, queue: UserQueue[Entry]) -> None:
+        queue.apply(self, max_workers=self.max_workers)
+
+
+class Client:
+    """Backend client that fails with the queued errors."""
+
+    errors: ClassVar[List[Exception]] = []
+
+    def __init__(self) -> None:
+        self.calls: List[Tuple[str, str]] = []
+        self.label = "client"
+
+    def get_person(self, name: str) -> str:
+        self.calls.append(("get_person", name))
+        if Client.errors:
+            raise Client.errors.pop(0)
+        return name
+
+    def add_person(self, name: str) -> str:
+        self.calls.append(("add_person", name))
+        if Client.errors:
+            raise Client.errors.pop(0)
+        return name
+
+
+class TestUserQueue:
+    def test_parallel_apply_orders_entries_per_user(self):
+        queue: UserQueue[Entry] = UserQueue()
+        for step in range(3):
+            for user in range(6):
+                queue.enqueue(Entry(f"User{user}@example.org", step))
+        queue.enqueue(Entry("user0@EXAMPLE.org", -1))
+        queue.enqueue(Entry("user0@example.org", 3))
+
+        process = RecordingProcess(max_workers=4)
+        process.execute(queue)
+
+        assert len(queue) == 0
+        assert 1 < process.max_in_flight <= 4
+        assert process.steps["user0@example.org"] == [0, 1, 2, -1, 3]
+        for user in range(1, 6):
+            assert process.steps[f"user{user}@example.org"] == [0, 1, 2]
+
+    def test_sequential_by_default(self):
+        queue: UserQueue[Entry] = UserQueue()
+        for user in range(3):
+            queue.enqueue(Entry(f"user{user}@example.org", 0))
+
+        process = RecordingProcess(max_workers=1)
+        process.execute(queue)
+
+        assert process.max_in_flight == 1
+        assert list(process.steps) == [f"user{user}@example.org" for user in range(3)]
+
+
+class TestBackendLimiter:
+    @pytest.fixture(autouse=True)
+    def clear_errors(self):
+        Client.errors = []
+        yield
+        Client.errors = []
+
+    def test_limits_calls_per_backend(self):
+        limiter = BackendLimiter(ConcurrencyConfig(backend_limits={"slow": 2}))
+        lock = threading.Lock()
+        counts = {"in_flight": 0, "max": 0}
+
+        def call() -> None:
+            with lock:
+                counts["in_flight"] += 1
+                counts["max"] = max(counts["max"], counts["in_flight"])
+            time.sleep(0.01)
+            with lock:
+                counts["in_flight"] -= 1
+
+        threads = [
+            threading.Thread(target=limiter.call, args=("slow", call)) for _ in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counts["max"] == 2
+
+    def test_slots_reentrant(self):
+        limiter = BackendLimiter(ConcurrencyConfig(backend_limits={"backend": 1}))
+        with limiter.slot("backend"), limiter.slot("backend"):
+            pass
+        with limiter.slot("backend"):
+            pass
+
+    def test_retries_idempotent_calls(self):
+        delays: List[float] = []
+        limiter = BackendLimiter(
+            ConcurrencyConfig(max_retries=2, retry_backoff=0.5), sleep=delays.append
+        )
+        client = Client()
+        limited = limit_client(client, "comanage", limiter)
+
+        Client.errors = [StatusError(503), ConnectionError("reset")]
+        assert limited.get_person("a") == "a"
+        assert delays == [0.5, 1.0]
+        assert limited.label == "client"
+
+        Client.errors = [StatusError(503)]
+        with pytest.raises(StatusError):
+            limited.add_person("b")
+
+        Client.errors = [StatusError(404)]
+        with pytest.raises(StatusError):
+            limited.get_person("c")
+
+        assert client.calls == [
+            ("get_person", "a"),
+            ("get_person", "a"),
+            ("get_person", "a"),
+            ("add_person", "b"),
+            ("get_person", "c"),
+        ]
+
+    def test_self_retrying_backend_not_retried(self):
+        limiter = BackendLimiter(ConcurrencyConfig(), sleep=lambda _: None)
+        client = Client()
+        limited = limit_client(client, "authorization", limiter)
+
+        Client.errors = [StatusError(503)]
+        with pytest.raises(StatusError):
+            limited.get_person("a")
+
+        assert client.calls == [("get_person", "a")]
+
+    def test_transient_cause(self):
+        try:
+            try:
+                raise StatusError(429)
+            except StatusError as cause:
+                raise RegistryError("failed") from cause
+        except RegistryError as error:
+            assert is_transient_error(error)
+
+        assert not is_transient_error(RegistryError("failed"))
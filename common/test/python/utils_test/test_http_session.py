@@ -0,0 +1,81 @@
+"""Tests for the shared HTTP sessions, against a local HTTP server."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar, List
+
+import pytest
+from utils.http_session import (
+    HTTPSessionConfig,
+    HTTPSessionRegistry,
+    create_session,
+)
+
+
+class RecordingHandler(BaseHTTPRequestHandler):
+    """Handler that records the client port of each request, and responds
+    with the next queued status code."""
+
+    protocol_version = "HTTP/1.1"
+    ports: ClassVar[List[int]] = []
+    statuses: ClassVar[List[int]] = []
+
+    def do_GET(self):
+        RecordingHandler.ports.append(self.client_address[1])
+        status = RecordingHandler.statuses.pop(0) if RecordingHandler.statuses else 200
+        body = b"ok"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    RecordingHandler.ports = []
+    RecordingHandler.statuses = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RecordingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestHTTPSession:
+    def test_connection_reused(self, server_url):
+        session = create_session()
+        for _ in range(5):
+            assert session.get(f"{server_url}/path").ok
+
+        # all requests are sent over the same kept-alive connection
+        assert len(RecordingHandler.ports) == 5
+        assert len(set(RecordingHandler.ports)) == 1
+
+    def test_retry_unavailable(self, server_url):
+        RecordingHandler.statuses = [503, 503]
+        session = create_session(HTTPSessionConfig(backoff_factor=0))
+        response = session.get(f"{server_url}/path")
+        assert response.ok
+        assert len(RecordingHandler.ports) == 3
+
+    def test_retries_exhausted_returns_response(self, server_url):
+        RecordingHandler.statuses = [503] * 5
+        session = create_session(HTTPSessionConfig(max_retries=1, backoff_factor=0))
+        response = session.get(f"{server_url}/path")
+        assert response.status_code == 503
+        assert len(RecordingHandler.ports) == 2
+
+    def test_registry(self):
+        registry = HTTPSessionRegistry()
+        session = registry.get("service", HTTPSessionConfig(pool_size=4))
+        assert registry.get("service") is session
+        assert registry.get("other") is not session
+        adapter = session.get_adapter("https://example.org")
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 4  # type: ignore
+
+        registry.close()
+        assert registry.get("service") is not session
@@ -18,7 +18,15 @@ from gear_execution.gear_execution import (
     get_project_from_destination,
 )
 from inputs.parameter_store import ParameterStore
-from rxnav.rxnav_connection import load_rxclass_concepts_from_file
+from nacc_attribute_deriver.utils.constants import (
+    ALL_RX_CLASSES,
+    COMBINATION_RX_CLASSES,
+)
+from rxnav.rxnav_connection import (
+    RxClassConnection,
+    load_rxclass_concepts_from_file,
+    write_rxclass_concepts_to_file,
+)
 from utils.utils import parse_string_to_list
 
 from .form_curator import FormCurator
@@ -26,6 +34,8 @@ from .main import run
 
 log = logging.getLogger(__name__)
 
+RXCLASS_CONCEPTS_FILENAME = "rxclass-concepts.json"
+
 
 class AttributeCuratorVisitor(GearExecutionEnvironment):
     """Visitor for the UDS Curator gear."""
@@ -152,6 +162,17 @@ class AttributeCuratorVisitor(GearExecutionEnvironment):
                 self.__rxclass_concepts_file.filepath, mode="r", encoding="utf-8-sig"
             ) as fh:
                 rxclass_concepts = load_rxclass_concepts_from_file(fh)
+        else:
+            log.info("Querying RxClass concepts...")
+            rxclass_concepts = RxClassConnection.get_all_rxclass_members(
+                ALL_RX_CLASSES, combination_rx_classes=COMBINATION_RX_CLASSES
+            )
+
+            # save the concepts so they can be provided as input to later runs
+            with context.open_output(
+                RXCLASS_CONCEPTS_FILENAME, mode="w", encoding="utf-8"
+            ) as fh:
+                write_rxclass_concepts_to_file(rxclass_concepts, fh)
 
         dataview = FileModel.create_dataview(self.__filename_patterns)
         curator = FormCurator(
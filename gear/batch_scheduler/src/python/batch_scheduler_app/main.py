@@ -5,16 +5,25 @@ import time
 from datetime import date, timedelta
 from functools import total_ordering
 from heapq import heappop, heappush
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional
 
 from flywheel.rest import ApiException
 from flywheel_adaptor.flywheel_proxy import FlywheelProxy
 from gear_execution.gear_trigger import BatchRunInfo, trigger_gear
-from jobs.job_poll import JobPoll
+from jobs.job_poll import ACTIVE_JOB_STATES, JobPoll, PollBackoff
 from notifications.email import EmailClient, create_ses_client
 
 log = logging.getLogger(__name__)
 
+# interval between polls of the jobs in flight
+POLL_BACKOFF = PollBackoff(initial_interval=10, max_interval=60)
+
+# delay before retrying a failed job, grows with each retry of the job
+RETRY_BACKOFF = PollBackoff(initial_interval=60, max_interval=600)
+
+# max number of times a failed job is retried by the scheduler
+MAX_JOB_RETRIES = 2
+
 
 @total_ordering
 class Element:
@@ -76,117 +85,242 @@ def trigger_gear_for_center(
     return job_id
 
 
-def get_batch(centers: List[Element], batch_size: int) -> List[Element]:
-    """Get a batch of centers depending on the batch size.
+class ScheduledJob:
+    """A gear job triggered for a center."""
 
-    Args:
-        centers: list of centers in the ascending order of acquisition files
-        batch_size: number of projects or files to queue for one batch
-
-    Returns:
-        List[Element]: current batch
-    """
-    batch = []
-    total_count = 0
-    while len(centers) > 0 and total_count < batch_size:
-        element = heappop(centers)
-        batch.append(element)
-        total_count += element.count
-    return batch
+    def __init__(self, center: Element, job_id: str) -> None:
+        self.center = center
+        self.job_id = job_id
+        self.retries = 0
+        self.retry_at = 0.0
+        self.failure_seen = False
 
 
-def check_batch_run_status(
-    proxy: FlywheelProxy, jobs_list: List[str], failed_list: List[str]
-):
-    """Checks the job completion status of the jobs in current batch Keeps
-    polling job status until all jobs in the current batch complete.
+class CenterScheduler:
+    """Schedules the gear on centers continuously within a budget of
+    projects or files in flight.
 
-    Args:
-        proxy: Flywheel proxy
-        jobs_list: list of job ids in current batch
-        failed_list: list of failed jobs
+    The next center is triggered as soon as finished jobs free enough of
+    the budget, rather than waiting for a whole batch to finish. The states
+    of the jobs in flight are retrieved with one query per poll. A failed
+    job is checked again on the next poll, in case Flywheel retries it, and
+    is otherwise retried after a delay that grows with each retry.
     """
-    if not jobs_list:
-        return
 
-    for job_id in jobs_list:
-        if not JobPoll.is_job_complete(proxy, job_id):
-            failed_list.append(job_id)
+    def __init__(
+        self,
+        *,
+        proxy: FlywheelProxy,
+        batch_configs: BatchRunInfo,
+        retry_jobs: bool = True,
+        max_retries: int = MAX_JOB_RETRIES,
+        poll_backoff: PollBackoff = POLL_BACKOFF,
+        retry_backoff: PollBackoff = RETRY_BACKOFF,
+    ) -> None:
+        self.__proxy = proxy
+        self.__batch_configs = batch_configs
+        self.__max_retries = max_retries if retry_jobs else 0
+        self.__poll_backoff = poll_backoff
+        self.__retry_backoff = retry_backoff
+        self.__in_flight: Dict[str, ScheduledJob] = {}
+        self.__waiting: List[ScheduledJob] = []
+        self.__failed: List[str] = []
+        self.__in_use = 0
 
+    @property
+    def in_use(self) -> int:
+        """The number of projects or files in flight."""
+        return self.__in_use
+
+    def run(self, centers: List[Element]) -> List[str]:
+        """Triggers the gear on the centers, smallest first, and waits for
+        all jobs to finish.
+
+        Args:
+            centers: heap of centers to trigger the gear on
+        Returns:
+            List of the IDs of the jobs that failed
+        """
+        intervals = self.__poll_backoff.intervals()
+        while centers or self.__in_flight or self.__waiting:
+            dispatched = self.__dispatch(centers)
+            if not self.__in_flight and not self.__waiting:
+                continue
 
-def schedule_batch_copy(
-    proxy: FlywheelProxy,
-    centers: List[Element],
-    batch_configs: BatchRunInfo,
-    retry_jobs: bool = True,
-) -> Optional[List[str]]:
-    """Schedule the centers in batches depending on the batch mode and batch
-    size.
-
-    Args:
-        proxy: Flywheel proxy
-        centers: list of centers to copy data
-        batch_configs: batch run configurations
-        retry_jobs: whether or not to retry failed jobs
+            if dispatched:
+                # poll quickly again after starting new jobs
+                intervals = self.__poll_backoff.intervals()
+
+            time.sleep(self.__sleep_interval(next(intervals)))
+            if self.__poll():
+                intervals = self.__poll_backoff.intervals()
+
+        return self.__failed
+
+    def __sleep_interval(self, interval: float) -> float:
+        """Returns the time to sleep before the next poll, shortened if a
+        retry is due sooner and there are no jobs in flight."""
+        if self.__in_flight or not self.__waiting:
+            return interval
+
+        next_retry = min(job.retry_at for job in self.__waiting)
+        return max(min(interval, next_retry - time.monotonic()), 0)
+
+    def __dispatch(self, centers: List[Element]) -> int:
+        """Triggers due retries and then centers until the budget is used.
+
+        Args:
+            centers: heap of centers to trigger the gear on
+        Returns:
+            the number of jobs started
+        """
+        started = 0
+        now = time.monotonic()
+        for job in [job for job in self.__waiting if job.retry_at <= now]:
+            if self.__in_use >= self.__batch_configs.batch_size:
+                return started
+
+            self.__waiting.remove(job)
+            new_job_id = self.__proxy.retry_job(job.job_id)
+            if not new_job_id:
+                self.__failed.append(job.job_id)
+                continue
 
-    Returns:
-        Optional[List[str]]: list of failed job IDs if any
-    """
+            log.info("Retrying job %s as %s", job.job_id, new_job_id)
+            job.job_id = new_job_id
+            job.failure_seen = False
+            self.__start(job)
+            started += 1
 
-    failed_list: List[str] = []
-    jobs_list: List[str] = []
-    batch = get_batch(centers=centers, batch_size=batch_configs.batch_size)
-    while len(batch) > 0:
-        log.info("Scheduling %s on %s centers", batch_configs.gear_name, len(batch))
-        for center in batch:
-            group_id = center.source.group
-            project_lbl = center.source.label
+        while centers and self.__in_use < self.__batch_configs.batch_size:
+            center = heappop(centers)
             job_id = trigger_gear_for_center(
-                proxy=proxy, center=center, batch_configs=batch_configs
+                proxy=self.__proxy, center=center, batch_configs=self.__batch_configs
             )
             if not job_id:
                 log.error(
                     "Failed to trigger gear %s for  %s/%s",
-                    batch_configs.gear_name,
-                    group_id,
-                    project_lbl,
+                    self.__batch_configs.gear_name,
+                    center.source.group,
+                    center.source.label,
                 )
                 continue
 
             log.info(
                 "Gear %s queued for %s/%s - Job ID %s",
-                batch_configs.gear_name,
-                group_id,
-                project_lbl,
+                self.__batch_configs.gear_name,
+                center.source.group,
+                center.source.label,
                 job_id,
             )
-            jobs_list.append(job_id)
+            self.__start(ScheduledJob(center=center, job_id=job_id))
+            started += 1
+            if not centers:
+                log.info("All centers scheduled")
+
+        return started
+
+    def __start(self, job: ScheduledJob) -> None:
+        """Tracks the job as in flight."""
+        self.__in_flight[job.job_id] = job
+        self.__in_use += job.center.count
+
+    def __finish(self, job: ScheduledJob) -> None:
+        """Stops tracking the job as in flight."""
+        del self.__in_flight[job.job_id]
+        self.__in_use -= job.center.count
+
+    def __poll(self) -> int:
+        """Checks the states of the jobs in flight with one query.
+
+        Returns:
+            the number of jobs that finished
+        """
+        jobs = JobPoll.find_jobs_by_id(self.__proxy, list(self.__in_flight))
+        finished = 0
+        for job_id, scheduled in list(self.__in_flight.items()):
+            job = jobs.get(job_id)
+            if job and job.state in ACTIVE_JOB_STATES:
+                continue
 
-        check_batch_run_status(proxy, jobs_list=jobs_list, failed_list=failed_list)
+            if job and job.state == "failed" and job.retried is not None:
+                retried_job = self.__proxy.find_job(f'previous_job_id="{job_id}"')
+                if retried_job:
+                    log.info("Job %s was retried as %s", job_id, retried_job.id)
+                    del self.__in_flight[job_id]
+                    scheduled.job_id = retried_job.id
+                    scheduled.failure_seen = False
+                    self.__in_flight[retried_job.id] = scheduled
+                    continue
+
+            if job and job.state == "failed" and not scheduled.failure_seen:
+                # check again on the next poll, since Flywheel may not have
+                # retried the job yet
+                scheduled.failure_seen = True
+                continue
 
-        # clear the jobs list
-        # all the jobs in current batch are finished when it gets to this point
-        jobs_list.clear()
-        log.info("Number of remaining centers: %s", len(centers))
-        batch = get_batch(centers=centers, batch_size=batch_configs.batch_size)
+            self.__finish(scheduled)
+            finished += 1
+            if not job:
+                log.warning("Unable to find job: %s", job_id)
+                self.__failed.append(job_id)
+                continue
 
-    if len(failed_list) > 0:
-        if retry_jobs:
-            log.error(
-                "Retrying %s failed gear jobs: %s", len(failed_list), str(failed_list)
-            )
-            new_jobs, failed_jobs = retry_failed_jobs(
-                proxy=proxy, failed_ids=failed_list, batch_size=batch_configs.batch_size
-            )
-            if new_jobs:
-                check_batch_run_status(
-                    proxy=proxy, jobs_list=new_jobs, failed_list=failed_jobs
-                )
+            log.info("Job %s finished with status: %s", job_id, job.state)
+            if job.state == "complete":
+                continue
+
+            if job.state == "failed" and scheduled.retries < self.__max_retries:
+                delay = self.__retry_delay(scheduled.retries)
+                log.warning("Job %s failed, retrying in %.0fs", job_id, delay)
+                scheduled.retries += 1
+                scheduled.retry_at = time.monotonic() + delay
+                self.__waiting.append(scheduled)
+                continue
+
+            self.__failed.append(job_id)
 
-            return failed_jobs
-        return failed_list
+        return finished
 
-    return None
+    def __retry_delay(self, retries: int) -> float:
+        """Returns the delay before retrying a job that has been retried the
+        given number of times."""
+        intervals = self.__retry_backoff.intervals()
+        for _ in range(retries):
+            next(intervals)
+        return next(intervals)
+
+
+def schedule_batch_copy(
+    proxy: FlywheelProxy,
+    centers: List[Element],
+    batch_configs: BatchRunInfo,
+    retry_jobs: bool = True,
+) -> Optional[List[str]]:
+    """Schedule the centers continuously, keeping the number of projects or
+    files in flight within the batch size.
+
+    Args:
+        proxy: Flywheel proxy
+        centers: list of centers to copy data
+        batch_configs: batch run configurations
+        retry_jobs: whether or not to retry failed jobs
+
+    Returns:
+        Optional[List[str]]: list of failed job IDs if any
+    """
+    log.info(
+        "Scheduling %s on %s centers, with at most %s %s in flight",
+        batch_configs.gear_name,
+        len(centers),
+        batch_configs.batch_size,
+        batch_configs.batch_mode,
+    )
+    scheduler = CenterScheduler(
+        proxy=proxy, batch_configs=batch_configs, retry_jobs=retry_jobs
+    )
+    failed_list = scheduler.run(centers)
+    return failed_list if failed_list else None
 
 
 def get_centers_to_batch(
@@ -221,37 +355,6 @@ def get_centers_to_batch(
     return centers_to_copy
 
 
-def retry_failed_jobs(
-    proxy: FlywheelProxy, failed_ids: List[str], batch_size: int
-) -> Tuple[List[str], List[str]]:
-    """Retry the failed jobs.
-
-    Args:
-        proxy: Flywheel proxy object
-        failed_ids: List of failed job IDs to retry
-        batch_size: Number of jobs to retry in one batch
-
-    Returns:
-        Tuple[List[str], List[str]]: List of new job IDs, List of failed retries
-    """
-    new_jobs: List[str] = []
-    failed_retries: List[str] = []
-    num_retried = 0
-    wait_time = (batch_size / 5) * 60
-    for failed_id in failed_ids:
-        new_job = proxy.retry_job(failed_id)
-        if new_job:
-            new_jobs.append(new_job)
-            num_retried += 1
-        else:
-            failed_retries.append(failed_id)
-
-        if num_retried % batch_size == 0:
-            time.sleep(wait_time)  # wait before starting the next batch
-
-    return new_jobs, failed_retries
-
-
 def send_email(
     sender_email: str, target_emails: List[str], gear_name: str, failed_count: int
 ) -> None:
@@ -0,0 +1,219 @@
+"""Unit tests for CenterScheduler."""
+
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Set, Tuple
+
+import pytest
+from batch_scheduler_app import main
+from batch_scheduler_app.main import MAX_JOB_RETRIES, CenterScheduler, Element
+
+
+class FakeClock:
+    """Clock where sleeping advances the time."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class FakeJob:
+    """Job that moves through its states, one state per poll."""
+
+    def __init__(self, job_id: str, states: List[str]) -> None:
+        self.id = job_id
+        self.states = states
+        self.retried: Optional[str] = None
+
+    @property
+    def state(self) -> str:
+        return self.states[0]
+
+    def snapshot(self) -> "FakeJob":
+        job = FakeJob(self.id, [self.state])
+        job.retried = self.retried
+        return job
+
+    def advance(self) -> None:
+        if len(self.states) > 1:
+            self.states.pop(0)
+
+
+class FakeProxy:
+    """Proxy that runs a job for each attempt of a center.
+
+    Attempts are the job states for the triggered job and each retry of
+    the center. Failed jobs of the centers in flywheel_retries are retried
+    by Flywheel after they are first reported failed, and triggered jobs of
+    the centers in missing cannot be found.
+    """
+
+    def __init__(
+        self,
+        clock: FakeClock,
+        attempts: Dict[str, List[List[str]]],
+        flywheel_retries: Optional[Set[str]] = None,
+        missing: Optional[Set[str]] = None,
+    ) -> None:
+        self.clock = clock
+        self.attempts = attempts
+        self.flywheel_retries = flywheel_retries or set()
+        self.missing = missing or set()
+        self.scheduler: Optional[CenterScheduler] = None
+        self.jobs: Dict[str, FakeJob] = {}
+        self.retried_jobs: Dict[str, FakeJob] = {}
+        self.counts: Dict[str, int] = {}
+        self.triggered: List[Tuple[str, int]] = []
+        self.retries: List[Tuple[str, float]] = []
+        self.polls: List[float] = []
+
+    def __new_job(self, label: str) -> FakeJob:
+        attempt = self.counts.get(label, 0)
+        self.counts[label] = attempt + 1
+        job = FakeJob(f"{label}-{attempt}", list(self.attempts[label][attempt]))
+        self.jobs[job.id] = job
+        return job
+
+    def trigger(self, center: Element) -> str:
+        label = center.source.label
+        assert self.scheduler is not None
+        self.triggered.append((label, self.scheduler.in_use))
+        if label in self.missing:
+            return f"{label}-missing"
+
+        return self.__new_job(label).id
+
+    def find_jobs(self, search_str: str) -> List[FakeJob]:
+        self.polls.append(self.clock.now)
+        job_ids = search_str.removeprefix("_id=|[").removesuffix("]").split(",")
+        result = []
+        for job_id in job_ids:
+            job = self.jobs.get(job_id)
+            if not job:
+                continue
+
+            result.append(job.snapshot())
+            label = job_id.rsplit("-", 1)[0]
+            if (
+                job.state == "failed"
+                and job.retried is None
+                and label in self.flywheel_retries
+            ):
+                job.retried = "retried"
+                self.retried_jobs[job_id] = self.__new_job(label)
+            job.advance()
+
+        return result
+
+    def find_job(self, search_str: str) -> Optional[FakeJob]:
+        previous_id = search_str.split('"')[1]
+        return self.retried_jobs.get(previous_id)
+
+    def retry_job(self, job_id: str) -> Optional[str]:
+        self.retries.append((job_id, self.clock.now))
+        return self.__new_job(job_id.rsplit("-", 1)[0]).id
+
+
+def create_center(label: str, files: int) -> Element:
+    """Creates a center with the number of acquisition files."""
+    project = SimpleNamespace(
+        id=f"{label}-project",
+        label=label,
+        group=label,
+        stats=SimpleNamespace(number_of=SimpleNamespace(acquisition_files=files)),
+    )
+    return Element(source=project, target=project)
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(main, "time", clock)
+    monkeypatch.setattr(
+        main,
+        "trigger_gear_for_center",
+        lambda proxy, batch_configs, center: proxy.trigger(center),
+    )
+    return clock
+
+
+def run_scheduler(
+    proxy: FakeProxy, centers: List[Element], batch_size: int = 10
+) -> List[str]:
+    """Runs the scheduler on the centers, smallest first."""
+    scheduler = CenterScheduler(
+        proxy=proxy,  # type: ignore
+        batch_configs=SimpleNamespace(  # type: ignore
+            batch_size=batch_size, gear_name="gear"
+        ),
+    )
+    proxy.scheduler = scheduler
+    failed = scheduler.run(sorted(centers))
+    assert scheduler.in_use == 0
+    return failed
+
+
+class TestCenterScheduler:
+    def test_budget(self, clock):
+        proxy = FakeProxy(
+            clock,
+            {
+                "a": [["running", "complete"]],
+                "b": [["running"] * 4 + ["complete"]],
+                "c": [["running", "running", "complete"]],
+                "d": [["complete"]],
+            },
+        )
+        centers = [
+            create_center("a", 2),
+            create_center("b", 3),
+            create_center("c", 20),
+            create_center("d", 30),
+        ]
+
+        assert run_scheduler(proxy, centers) == []
+
+        # the last center dispatched overshoots the budget, and the next
+        # center waits until finished jobs bring the budget under the limit
+        assert proxy.triggered == [("a", 0), ("b", 2), ("c", 5), ("d", 3)]
+
+    def test_retry_delay_and_cutoff(self, clock):
+        proxy = FakeProxy(clock, {"a": [["running", "failed"], ["failed"], ["failed"]]})
+
+        assert run_scheduler(proxy, [create_center("a", 1)]) == ["a-2"]
+
+        assert [job_id for job_id, _ in proxy.retries] == ["a-0", "a-1"]
+        assert len(proxy.retries) == MAX_JOB_RETRIES
+        for (_, retry_time), delay in zip(proxy.retries, [60, 120], strict=True):
+            failed_time = max(time for time in proxy.polls if time < retry_time)
+            assert retry_time - failed_time == pytest.approx(delay)
+
+    def test_flywheel_retry_tracked(self, clock):
+        proxy = FakeProxy(
+            clock,
+            {"a": [["running", "failed"], ["running", "complete"]]},
+            flywheel_retries={"a"},
+        )
+
+        assert run_scheduler(proxy, [create_center("a", 1)]) == []
+
+        # the failed job is checked again before it is retried, and the
+        # job retried by Flywheel is tracked in place of it
+        assert not proxy.retries
+        assert proxy.counts == {"a": 2}
+
+    def test_missing_job_failed(self, clock):
+        proxy = FakeProxy(
+            clock, {"a": [["complete"]], "b": [["complete"]]}, missing={"a"}
+        )
+
+        failed = run_scheduler(
+            proxy, [create_center("a", 5), create_center("b", 10)], batch_size=5
+        )
+
+        assert failed == ["a-missing"]
+        assert proxy.triggered == [("a", 0), ("b", 0)]
@@ -28,6 +28,8 @@ def run(
     - the center is added to the admin group center map
     - the center-portal project is added to the center group
 
+    The pipeline ADCID registry of the admin group is then updated.
+
     Args:
       proxy: the proxy for the Flywheel instance
       admin_group: the administrative group
@@ -61,3 +63,5 @@ def run(
         if admin_access:
             center_group.add_permissions(admin_access)
             center_group.add_center_portal()
+
+    admin_group.update_pipeline_registry()
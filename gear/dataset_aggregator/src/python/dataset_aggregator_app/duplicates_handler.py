@@ -3,9 +3,10 @@
 import json
 import logging
 import os
+import threading
 from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Literal, Optional, Set, Tuple
 
 import pyarrow as pa
 import pyarrow.compute as pc
@@ -28,6 +29,135 @@ from pydantic import BaseModel
 log = logging.getLogger(__name__)
 
 
+# column added while counting keys
+COUNT_COLUMN = "__count__"
+
+# min number of per-batch key count rows collected before they are merged
+COUNTS_MERGE_ROWS = 1_000_000
+
+
+def merge_counts(counts: List[pa.Table], criteria: List[str]) -> pa.Table:
+    """Merges key count tables by summing the counts of each key.
+
+    Args:
+        counts: tables with the criteria columns and a count column
+        criteria: the key columns
+    Returns:
+        table with the count of each distinct key
+    """
+    merged = (
+        pa.concat_tables(counts)
+        .group_by(criteria, use_threads=False)
+        .aggregate([(COUNT_COLUMN, "sum")])
+    )
+    return merged.rename_columns({f"{COUNT_COLUMN}_sum": COUNT_COLUMN})
+
+
+def count_keys(batches: Iterable[pa.RecordBatch], criteria: List[str]) -> pa.Table:
+    """Counts the occurrences of each key across the batches.
+
+    Keys with null values are counted as equal, matching tuple equality.
+    Per-batch counts are merged once they outgrow the merged counts, so
+    that memory is proportional to the number of distinct keys.
+
+    Args:
+        batches: record batches with the criteria columns
+        criteria: the key columns
+    Returns:
+        table with the criteria columns and the count of each distinct key
+    """
+    merged: Optional[pa.Table] = None
+    pending: List[pa.Table] = []
+    pending_rows = 0
+    for batch in batches:
+        batch_counts = (
+            pa.Table.from_batches([batch])
+            .group_by(criteria, use_threads=False)
+            .aggregate([([], "count_all")])
+        )
+        pending.append(batch_counts.rename_columns({"count_all": COUNT_COLUMN}))
+        pending_rows += batch_counts.num_rows
+
+        merged_rows = merged.num_rows if merged is not None else 0
+        if pending_rows >= max(merged_rows, COUNTS_MERGE_ROWS):
+            merged = merge_counts(
+                ([merged] if merged is not None else []) + pending, criteria
+            )
+            pending = []
+            pending_rows = 0
+
+    if merged is not None:
+        pending.append(merged)
+    if not pending:
+        return pa.table({COUNT_COLUMN: pa.array([], type=pa.int64())})
+
+    return merge_counts(pending, criteria)
+
+
+class KeyMatcher:
+    """Matches rows to a set of keys over multiple columns.
+
+    Each key column is encoded as its index in the distinct key values, and
+    the codes are combined column by column into a single integer code for
+    each key. Rows are matched by encoding their columns the same way, so
+    matching is a few hash lookups per column rather than a join. Null
+    values in keys are matched as equal, like tuple equality.
+    """
+
+    def __init__(self, keys: pa.Table, criteria: List[str]) -> None:
+        """Initializer.
+
+        Args:
+            keys: table of the keys to match, with the criteria columns
+            criteria: the key columns
+        """
+        self.__criteria = criteria
+        self.__values: List[pa.Array] = []
+        self.__codes: List[pa.Array] = []
+
+        codes = None
+        for column in criteria:
+            values = pc.unique(keys[column])
+            self.__values.append(values)
+            column_codes = pc.index_in(keys[column], value_set=values, skip_nulls=False)
+            codes = self.__combine(codes, column_codes, len(values))
+            self.__codes.append(pc.unique(codes))
+            codes = pc.index_in(codes, value_set=self.__codes[-1])
+
+    @staticmethod
+    def __combine(
+        codes: Optional[pa.ChunkedArray], column_codes: pa.ChunkedArray, size: int
+    ) -> pa.ChunkedArray:
+        """Combines the codes of the previous columns with the column
+        codes."""
+        column_codes = column_codes.cast(pa.int64())
+        if codes is None:
+            return column_codes
+
+        return pc.add(pc.multiply(codes.cast(pa.int64()), size), column_codes)
+
+    def matches(self, table: pa.Table) -> pa.ChunkedArray:
+        """Returns the mask of rows whose criteria values are one of the
+        keys.
+
+        Args:
+            table: the table to match
+        Returns:
+            boolean array that is True for the rows that match a key
+        """
+        codes = None
+        for index, column in enumerate(self.__criteria):
+            values = self.__values[index]
+            column_codes = pc.index_in(
+                table[column], value_set=values, skip_nulls=False
+            )
+            codes = self.__combine(codes, column_codes, len(values))
+            codes = pc.index_in(codes, value_set=self.__codes[index])
+
+        # rows with a value that is not part of a key have a null code
+        return pc.is_valid(codes)
+
+
 class DuplicatesCriteria(BaseModel):
     criteria: List[str]
     on_duplicate: Literal["active_only", "keep_all", "drop_all"] = "drop_all"
@@ -56,19 +186,23 @@ class DuplicatesHandler:
         )
 
         # cache to avoid requerying the identifiers repo over and over
-        # since it's done for each batch of a parquet file
+        # since it's done for each batch of a parquet file; tables may be
+        # handled concurrently, so loads are done under the lock
         self.__identifiers_cache: Dict[str, List[IdentifierObject]] = {}
+        self.__identifiers_lock = threading.Lock()
 
     def __find_duplicate_keys(
         self, table_name: str, aggregate_file: Path
-    ) -> Optional[Set[Tuple[Any]]]:
-        """Find duplicate tuple keys based on the duplicate_mapping criteria.
-        Since we are doing this in batches, we need to count unique key tuples
-        across each batch to detect duplicates.
+    ) -> Optional[pa.Table]:
+        """Find duplicate keys based on the duplicate_mapping criteria. Only
+        the criteria columns are read, and the keys are counted in batches,
+        so memory is proportional to the number of distinct keys.
 
         Args:
             table_name: name of the table being evaluated
             aggregate_file: The parquet file to check for duplicates
+        Returns:
+            Table of the criteria values that appear more than once
         """
         criteria_block = self.__duplicates_criteria.get(table_name)
 
@@ -88,21 +222,47 @@ class DuplicatesHandler:
                 f"Missing required headers for duplicates check: {missing}"
             )
 
-        # identify duplicates based on all criteria fields
-        value_counts: Dict[Tuple, int] = defaultdict(int)
+        if not parquet_file.metadata.num_rows:
+            return None
+
+        counts = count_keys(
+            parquet_file.iter_batches(batch_size=self.__batch_size, columns=criteria),
+            criteria,
+        )
+
+        # duplicates occur where a key appears more than once
+        return counts.filter(pc.greater(counts[COUNT_COLUMN], 1)).select(criteria)
 
-        for batch in parquet_file.iter_batches(batch_size=self.__batch_size):
-            table = pa.Table.from_batches([batch])
-            fields = [table[x].to_pylist() for x in criteria]
+    def __load_identifiers(self, naccids: List[str]) -> None:
+        """Loads the identifiers for the NACCIDs into the identifiers cache,
+        with a single bulk search for the NACCIDs not already cached.
 
-            for key in zip(*fields, strict=True):
-                value_counts[key] += 1
+        Args:
+            naccids: the NACCIDs to load identifiers for
+        Raises:
+            IdentifierRepositoryError: if no identifiers are found for a NACCID
+        """
+        with self.__identifiers_lock:
+            missing = [x for x in naccids if x not in self.__identifiers_cache]
+            if not missing:
+                return
+
+            # get all identifiers for each NACCID, both active and inactive
+            identifiers = self.__identifiers_repo.search_naccids(
+                missing, allow_missing=True, allow_multiple=True, active_only=False
+            )
 
-        # the zip creates a tuple "key" using all the fields in the criteria
-        # duplicates occur where a tuple key appears more than once
-        duplicates = {k for k, v in value_counts.items() if v > 1}
+            found: Dict[str, List[IdentifierObject]] = defaultdict(list)
+            for identifier in identifiers:
+                found[identifier.naccid].append(identifier)
+
+            for naccid in missing:
+                if naccid not in found:
+                    raise IdentifierRepositoryError(
+                        f"Failed to find identifiers info for {naccid}"
+                    )
 
-        return duplicates
+                self.__identifiers_cache[naccid] = found[naccid]
 
     def __apply_duplicate_rules(  # noqa: C901
         self, rule: str, keep_mask: pa.array, table: pa.Table
@@ -155,20 +315,11 @@ class DuplicatesHandler:
         # query the identifiers repo to get the active ADCID, and keep track of
         # NACCID/ADCID pairs to drop
         # if the NACCID has no current ADCID, drop all rows, as may be a data issue
+        self.__load_identifiers(list(grouped_identifiers.keys()))
         pairs_to_drop: Set[Tuple[str, int]] = set([])
 
         for naccid, adcids in grouped_identifiers.items():
             current_adcid = None
-
-            if naccid not in self.__identifiers_cache:
-                result = self.__identifiers_repo.list(naccid=naccid)
-                if not result:
-                    raise IdentifierRepositoryError(
-                        f"Failed to find identifiers info for {naccid}"
-                    )
-
-                self.__identifiers_cache[naccid] = result
-
             for identifier in self.__identifiers_cache[naccid]:
                 if identifier.active:
                     current_adcid = identifier.adcid
@@ -226,7 +377,7 @@ class DuplicatesHandler:
         return filtered_table, dropped_table
 
     def __filter_duplicates(
-        self, table_name: str, aggregate_file: Path, duplicate_keys: Set[Tuple[Any]]
+        self, table_name: str, aggregate_file: Path, duplicate_keys: pa.Table
     ) -> None:
         """Finds rows associated with the duplicate keys from the aggregate
         file and filters them out.
@@ -239,10 +390,15 @@ class DuplicatesHandler:
         criteria_block = self.__duplicates_criteria.get(table_name)
 
         # if nothing to correct, do nothing
-        if not duplicate_keys or not criteria_block or not criteria_block.criteria:
+        if (
+            not duplicate_keys.num_rows
+            or not criteria_block
+            or not criteria_block.criteria
+        ):
             return
 
         criteria = criteria_block.criteria
+        matcher = KeyMatcher(duplicate_keys, criteria)
 
         # write results to a tmp file while we're streaming
         # from the original aggregate file
@@ -255,17 +411,9 @@ class DuplicatesHandler:
         try:
             for batch in parquet_file.iter_batches(batch_size=self.__batch_size):
                 table = pa.Table.from_batches([batch])
-                fields = [table[x].to_pylist() for x in criteria]
-
-                # again, the zip creates a tuple "key" using all the fields
-                # make a mask of rows to keep
-                keep_mask = []
-                for key in zip(*fields, strict=True):
-                    keep_mask.append(key not in duplicate_keys)
-
                 filtered_table, dropped_table = self.__apply_duplicate_rules(
                     rule=criteria_block.on_duplicate,
-                    keep_mask=pa.array(keep_mask),
+                    keep_mask=pc.invert(matcher.matches(table)),
                     table=table,
                 )
 
@@ -295,12 +443,12 @@ class DuplicatesHandler:
             aggregate_file: Aggregate parquet file to clean
         """
         duplicate_keys = self.__find_duplicate_keys(table, aggregate_file)
-        if not duplicate_keys:
+        if duplicate_keys is None or not duplicate_keys.num_rows:
             log.info(f"No duplicates detected in {table}")
             return
 
         log.info(
-            f"{(len(duplicate_keys))} duplicate keys found for {table}, "
+            f"{duplicate_keys.num_rows} duplicate keys found for {table}, "
             + "handling duplicate logic"
         )
 
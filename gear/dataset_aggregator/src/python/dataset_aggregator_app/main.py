@@ -2,8 +2,12 @@
 
 import logging
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Optional
 
+from boto3.s3.transfer import TransferConfig
 from fw_gear import GearContext
 from s3.s3_bucket import S3BucketInterface
 from storage.dataset import AggregateDataset
@@ -12,6 +16,16 @@ from .duplicates_handler import DuplicatesHandler
 
 log = logging.getLogger(__name__)
 
+# number of concurrent table uploads
+UPLOAD_WORKERS = 2
+
+# aggregate parquets can be large, so upload in parallel multipart chunks
+UPLOAD_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=64 * 1024 * 1024,
+    multipart_chunksize=64 * 1024 * 1024,
+    max_concurrency=8,
+)
+
 
 def run(
     *,
@@ -23,6 +37,7 @@ def run(
     dry_run: bool = False,
     etl_date: str,
     freeze_date: str,
+    max_concurrent_tables: int = 1,
 ):
     """Runs the Dataset Aggregator process.
 
@@ -40,17 +55,17 @@ def run(
         freeze_date: Date of the freeze, in YYYYMMDD format;
             will use the ETL date (time of execution) if not
             provided
+        max_concurrent_tables: Max number of tables to aggregate
+            concurrently
     """
     work_dir = Path(context.work_dir)
     aggregate_dir = work_dir / "aggregate"
     aggregate_dir.mkdir(parents=True, exist_ok=True)
 
+    bucket, prefix = S3BucketInterface.parse_bucket_and_key(f"{output_uri}/{etl_date}")
     s3_output_interface = None
     if not dry_run:
         # make sure we have access to the output location first
-        bucket, prefix = S3BucketInterface.parse_bucket_and_key(
-            f"{output_uri}/{etl_date}"
-        )
         s3_output_interface = S3BucketInterface.create_from_environment(bucket)
 
         # write provenance
@@ -59,35 +74,99 @@ def run(
     log.info(f"Grabbing latest datasets under {aggregate.bucket}...")
 
     """
-    Due to how large these parquets get it's better to process
-    each table one at a time
+    Due to how large these parquets get each table is processed
+    separately, with a bounded number of tables in flight
         1. Aggregate data
-        2. Handle duplicate transfers
-        3. Upload to S3
+        2. Handle duplicate transfers, skipping tables without data
+        3. Upload to S3, overlapping with the next table
         4. Remove local aggregate file when done
+
+    A table holds a file slot from aggregation until its aggregate file
+    is removed, so that at most max_concurrent_tables aggregate files are
+    on local disk, including those waiting to be uploaded.
+    """
+    file_slots = threading.BoundedSemaphore(max(max_concurrent_tables, 1))
+    # the upload pool is shut down last, so that tables in flight can
+    # still hand off their uploads
+    with (
+        ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as upload_pool,
+        ThreadPoolExecutor(max_workers=max(max_concurrent_tables, 1)) as table_pool,
+    ):
+
+        def process_table(table: str) -> Optional[Future]:
+            file_slots.acquire()
+            try:
+                aggregate_file = aggregate.aggregate_table(
+                    table,
+                    aggregate_dir,
+                    extra_columns={
+                        "freeze_date": freeze_date,
+                        "etl_date": etl_date,
+                    },
+                )
+                if aggregate_file is None:
+                    log.info(f"No data found for {table}, skipping")
+                    file_slots.release()
+                    return None
+
+                duplicates_handler.handle(table, aggregate_file)
+
+                # hand off the upload so this worker can start the next table
+                upload_future = upload_pool.submit(
+                    upload_table,
+                    table=table,
+                    aggregate_file=aggregate_file,
+                    s3_output_interface=s3_output_interface,
+                    target_prefix=f"{prefix}/tables/{table}",
+                )
+            except BaseException:
+                file_slots.release()
+                raise
+
+            # the slot is released once the upload has removed the file
+            upload_future.add_done_callback(lambda _: file_slots.release())
+            return upload_future
+
+        table_futures = [
+            table_pool.submit(process_table, table) for table in aggregate.tables
+        ]
+
+        # surface errors from processing and uploading each table
+        try:
+            for table_future in as_completed(table_futures):
+                upload_future = table_future.result()
+                if upload_future is not None:
+                    upload_future.result()
+        except BaseException:
+            for table_future in table_futures:
+                table_future.cancel()
+            raise
+
+
+def upload_table(
+    *,
+    table: str,
+    aggregate_file: Path,
+    s3_output_interface: Optional[S3BucketInterface],
+    target_prefix: str,
+) -> None:
+    """Uploads the aggregate file for the table and removes the local file.
+
+    Args:
+        table: the table
+        aggregate_file: the aggregate file
+        s3_output_interface: the output bucket, None for a dry run
+        target_prefix: the prefix to upload to
     """
-    for table in aggregate.tables:
-        aggregate_file = aggregate.aggregate_table(
-            table,
-            aggregate_dir,
-            extra_columns={
-                "freeze_date": freeze_date,
-                "etl_date": etl_date,
-            },
+    if s3_output_interface is None:
+        log.info(
+            f"DRY RUN: would have uploaded aggregate results for {table} to "
+            + f"{target_prefix}"
         )
-        duplicates_handler.handle(table, aggregate_file)
-        target_prefix = f"{prefix}/tables/{table}"
-
-        # write results to S3
-        if dry_run:
-            log.info(
-                "DRY RUN: would have uploaded aggregate results to "
-                + f"{target_prefix}"
-            )
-        else:
-            log.info(f"Uploading results to {target_prefix}")
-            s3_output_interface.upload_file(  # type: ignore
-                aggregate_file, f"{target_prefix}"
-            )
-
-        os.remove(aggregate_file)
+    else:
+        log.info(f"Uploading {table} results to {target_prefix}")
+        s3_output_interface.upload_file(
+            aggregate_file, target_prefix, transfer_config=UPLOAD_TRANSFER_CONFIG
+        )
+
+    os.remove(aggregate_file)
@@ -42,12 +42,14 @@ class DatasetAggregatorVisitor(GearExecutionEnvironment):
         target_project: str,
         output_uri: str,
         freeze_date: Optional[str] = None,
+        max_concurrent_tables: int = 1,
     ):
         super().__init__(client=client)
         self.__duplicates_handler = duplicates_handler
         self.__target_project = target_project
         self.__output_uri = output_uri
         self.__freeze_date = freeze_date
+        self.__max_concurrent_tables = max_concurrent_tables
 
     @classmethod
     def create(
@@ -96,6 +98,7 @@ class DatasetAggregatorVisitor(GearExecutionEnvironment):
             target_project=target_project,
             output_uri=output_uri.rstrip("/"),
             freeze_date=options.get("freeze_date", None),
+            max_concurrent_tables=options.get("max_concurrent_tables", 2),
         )
 
     def __group_datasets(self, center_ids: List[str]) -> AggregateDataset:
@@ -198,6 +201,7 @@ class DatasetAggregatorVisitor(GearExecutionEnvironment):
             dry_run=self.client.dry_run,
             etl_date=etl_date,
             freeze_date=self.__freeze_date,
+            max_concurrent_tables=self.__max_concurrent_tables,
         )
 
 
@@ -0,0 +1,125 @@
+"""Unit tests for key counting and matching in the duplicates handler."""
+
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pytest
+from dataset_aggregator_app import duplicates_handler
+from dataset_aggregator_app.duplicates_handler import (
+    COUNT_COLUMN,
+    KeyMatcher,
+    count_keys,
+)
+
+CRITERIA = ["naccid", "visitdate"]
+
+
+def make_batches(
+    rows: List[Tuple[Any, ...]], batch_size: int, criteria: List[str] = CRITERIA
+) -> List[pa.RecordBatch]:
+    """Creates record batches of the rows, with string key columns."""
+    table = pa.table(
+        {
+            column: pa.array([row[index] for row in rows], type=pa.string())
+            for index, column in enumerate(criteria)
+        }
+    )
+    return table.to_batches(max_chunksize=batch_size)
+
+
+def as_counter(counts: pa.Table, criteria: List[str] = CRITERIA) -> Dict[Tuple, int]:
+    """Returns the key counts as a dictionary from key tuple to count."""
+    keys = zip(*(counts[column].to_pylist() for column in criteria), strict=True)
+    return dict(zip(keys, counts[COUNT_COLUMN].to_pylist(), strict=True))
+
+
+class TestCountKeys:
+    def test_multi_column_keys(self):
+        rows = [
+            ("NACC000001", "2024-01-01"),
+            ("NACC000001", "2024-02-01"),
+            ("NACC000001", "2024-01-01"),
+            ("NACC000002", "2024-01-01"),
+            ("NACC000002", "2024-01-01"),
+            ("NACC000002", "2024-01-01"),
+        ]
+
+        counts = count_keys(make_batches(rows, batch_size=4), CRITERIA)
+
+        assert as_counter(counts) == {
+            ("NACC000001", "2024-01-01"): 2,
+            ("NACC000001", "2024-02-01"): 1,
+            ("NACC000002", "2024-01-01"): 3,
+        }
+
+    def test_nulls_counted_as_equal(self):
+        rows = [
+            ("NACC000001", None),
+            ("NACC000001", None),
+            (None, None),
+            (None, "2024-01-01"),
+            (None, None),
+        ]
+
+        counts = count_keys(make_batches(rows, batch_size=2), CRITERIA)
+
+        assert as_counter(counts) == Counter(rows)
+
+    def test_no_batches(self):
+        counts = count_keys([], CRITERIA)
+        assert counts.num_rows == 0
+
+    @pytest.mark.parametrize("merge_rows", [1, 3, 1_000_000])
+    def test_merged_across_batches(self, monkeypatch, merge_rows):
+        monkeypatch.setattr(duplicates_handler, "COUNTS_MERGE_ROWS", merge_rows)
+        rows = [
+            (f"NACC{num % 7:06d}" if num % 11 else None, f"2024-0{num % 3 + 1}-01")
+            for num in range(200)
+        ]
+
+        counts = count_keys(make_batches(rows, batch_size=9), CRITERIA)
+
+        assert as_counter(counts) == Counter(rows)
+        assert counts.num_rows == len(set(rows))
+
+
+class TestKeyMatcher:
+    def test_matches_whole_keys(self):
+        keys = pa.table(
+            {
+                "naccid": ["NACC000001", "NACC000002", None],
+                "visitdate": ["2024-01-01", "2024-02-01", "2024-03-01"],
+            }
+        )
+        rows = [
+            ("NACC000001", "2024-01-01"),
+            ("NACC000002", "2024-02-01"),
+            # values that appear in different keys
+            ("NACC000001", "2024-02-01"),
+            ("NACC000002", "2024-01-01"),
+            # values that are not in any key
+            ("NACC000003", "2024-01-01"),
+            ("NACC000001", None),
+            # null matched as equal
+            (None, "2024-03-01"),
+            (None, "2024-01-01"),
+        ]
+        table = pa.Table.from_batches(make_batches(rows, batch_size=3))
+
+        mask = KeyMatcher(keys, CRITERIA).matches(table)
+
+        assert mask.to_pylist() == [True, True, False, False, False, False, True, False]
+
+    def test_matches_duplicates_from_counts(self):
+        rows = [(f"NACC{num % 5:06d}", f"2024-0{num % 4 + 1}-01") for num in range(40)]
+        rows += [("NACC000099", "2024-01-01")]
+        counts = count_keys(make_batches(rows, batch_size=8), CRITERIA)
+        duplicates = counts.filter(pc.greater(counts[COUNT_COLUMN], 1))
+
+        table = pa.Table.from_batches(make_batches(rows, batch_size=8))
+        mask = KeyMatcher(duplicates.select(CRITERIA), CRITERIA).matches(table)
+
+        frequency = Counter(rows)
+        assert mask.to_pylist() == [frequency[row] > 1 for row in rows]
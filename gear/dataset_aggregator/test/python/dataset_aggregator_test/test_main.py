@@ -0,0 +1,104 @@
+"""Unit tests for the table pipeline in dataset_aggregator_app.main."""
+
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+from unittest.mock import Mock, patch
+
+import pytest
+from dataset_aggregator_app import main
+
+
+class FakeAggregate:
+    """Aggregate that writes an aggregate file for each table, and records
+    the most files on disk at once."""
+
+    def __init__(
+        self, tables: List[str], failed: str = "", empty: Optional[Set[str]] = None
+    ) -> None:
+        self.tables = tables
+        self.bucket = "source-bucket"
+        self.failed = failed
+        self.empty = empty or set()
+        self.lock = threading.Lock()
+        self.files_on_disk = 0
+        self.max_files_on_disk = 0
+
+    def aggregate_table(
+        self, table: str, aggregate_dir: Path, extra_columns: Dict[str, str]
+    ) -> Optional[Path]:
+        if table == self.failed:
+            raise ValueError(f"failed to aggregate {table}")
+        if table in self.empty:
+            return None
+
+        aggregate_file = aggregate_dir / f"{table}.parquet"
+        aggregate_file.write_bytes(b"data")
+        with self.lock:
+            self.files_on_disk += 1
+            self.max_files_on_disk = max(self.max_files_on_disk, self.files_on_disk)
+        return aggregate_file
+
+
+def run_tables(
+    tmp_path: Path,
+    aggregate: FakeAggregate,
+    max_concurrent_tables: int,
+    duplicates_handler: Optional[Mock] = None,
+) -> None:
+    """Runs the dry run pipeline with slow uploads."""
+    original_upload = main.upload_table
+
+    def slow_upload(**kwargs) -> None:
+        time.sleep(0.02)
+        original_upload(**kwargs)
+        with aggregate.lock:
+            aggregate.files_on_disk -= 1
+
+    with patch.object(main, "upload_table", slow_upload):
+        main.run(
+            context=Mock(work_dir=str(tmp_path)),
+            aggregate=aggregate,  # type: ignore
+            output_uri="s3://bucket/output",
+            duplicates_handler=duplicates_handler or Mock(),
+            provenance_file=tmp_path / "provenance.json",
+            dry_run=True,
+            etl_date="20260101",
+            freeze_date="20260101",
+            max_concurrent_tables=max_concurrent_tables,
+        )
+
+
+class TestRun:
+    @pytest.mark.parametrize("max_concurrent_tables", [1, 3])
+    def test_files_on_disk_bounded(self, tmp_path, max_concurrent_tables):
+        aggregate = FakeAggregate([f"table{num}" for num in range(8)])
+
+        run_tables(tmp_path, aggregate, max_concurrent_tables)
+
+        assert aggregate.files_on_disk == 0
+        assert aggregate.max_files_on_disk <= max_concurrent_tables
+        assert not list((tmp_path / "aggregate").iterdir())
+
+    def test_failed_table_releases_slot(self, tmp_path):
+        aggregate = FakeAggregate(["table0", "table1", "table2"], failed="table0")
+
+        with pytest.raises(ValueError):
+            run_tables(tmp_path, aggregate, 1)
+
+        assert not list((tmp_path / "aggregate").iterdir())
+
+    def test_empty_tables_skipped(self, tmp_path):
+        aggregate = FakeAggregate(
+            [f"table{num}" for num in range(4)], empty={"table0", "table2"}
+        )
+        duplicates_handler = Mock()
+
+        run_tables(tmp_path, aggregate, 1, duplicates_handler)
+
+        assert [call.args[0] for call in duplicates_handler.handle.call_args_list] == [
+            "table1",
+            "table3",
+        ]
+        assert aggregate.files_on_disk == 0
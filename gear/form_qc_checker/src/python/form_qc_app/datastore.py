@@ -2,7 +2,7 @@
 
 import logging
 from datetime import date
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Set
 
 from centers.nacc_group import NACCGroup
 from configs.ingest_configs import FormProjectConfigs, ModuleConfigs
@@ -11,7 +11,7 @@ from flywheel_adaptor.flywheel_proxy import FlywheelProxy, ProjectAdaptor, Proje
 from keys.keys import DefaultValues, MetadataKeys
 from nacc_common.field_names import FieldNames
 from nacc_form_validator.datastore import Datastore
-from rxnav.rxnav_connection import RxCuiConnection
+from rxnav.rxcui_status_store import RxCuiStatusStore
 
 log = logging.getLogger(__name__)
 
@@ -38,6 +38,7 @@ class DatastoreHelper(Datastore):
         admin_group: NACCGroup,
         module_configs: ModuleConfigs,
         form_project_configs: FormProjectConfigs,
+        rxcui_store: Optional[RxCuiStatusStore] = None,
     ):
         """
 
@@ -51,6 +52,7 @@ class DatastoreHelper(Datastore):
             admin_group: Flywheel admin group
             module_configs: form ingest configs for the module
             form_project_configs: form ingest configs for all modules for the project
+            rxcui_store (optional): cache of RxCUI statuses
         """
 
         super().__init__(pk_field, module_configs.date_field)
@@ -63,6 +65,7 @@ class DatastoreHelper(Datastore):
         self.__admin_group = admin_group
         self.__module_configs = module_configs
         self.__form_configs = form_project_configs
+        self.__rxcui_store = rxcui_store if rxcui_store else RxCuiStatusStore()
 
         legacy_label = (
             self.__form_configs.legacy_project_label
@@ -562,7 +565,26 @@ class DatastoreHelper(Datastore):
         Returns:
             bool: True if provided drug ID is valid, else False
         """
-        return RxCuiConnection.is_rxcui_active(drugid, target_date)
+        return self.__rxcui_store.is_rxcui_active(drugid, target_date)
+
+    def warm_rxcui_cache(
+        self, *, schema: Dict[str, Mapping], input_record: Dict[str, Any]
+    ) -> None:
+        """Retrieve the statuses of all drug IDs in the input record in one
+        pass, so the RxNorm checks are answered from the cache.
+
+        Args:
+            schema: rule definition schema
+            input_record: input visit record
+        """
+        drug_ids: Set[str] = set()
+        for field in get_rxnorm_fields(schema):
+            value = input_record.get(field)
+            if value is not None and str(value).strip():
+                drug_ids.add(str(value))
+
+        if drug_ids:
+            self.__rxcui_store.warm(drug_ids)
 
     def is_valid_adcid(self, adcid: int, own: bool) -> bool:
         """Overriding the abstract method to check whether a given ADCID is
@@ -583,3 +605,30 @@ class DatastoreHelper(Datastore):
             return adcid in self.__current_adcids
 
         return False
+
+
+def get_rxnorm_fields(schema: Dict[str, Mapping]) -> List[str]:
+    """Get the list of fields validated against RxNorm in the given rule
+    definition schema.
+
+    Args:
+        schema: rule definition schema
+
+    Returns:
+        List[str]: list of field names with a rxnorm rule
+    """
+
+    def uses_rxnorm(definition: Any) -> bool:
+        if isinstance(definition, str):
+            return definition == "rxnorm"
+        if isinstance(definition, Mapping):
+            return any(
+                key == "rxnorm" or uses_rxnorm(value)
+                for key, value in definition.items()
+            )
+        if isinstance(definition, list):
+            return any(uses_rxnorm(item) for item in definition)
+
+        return False
+
+    return [field for field, definition in schema.items() if uses_rxnorm(definition)]
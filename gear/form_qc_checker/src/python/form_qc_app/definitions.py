@@ -15,6 +15,8 @@ from nacc_common.field_names import FieldNames
 from outputs.error_writer import ErrorWriter
 from s3.s3_bucket import S3BucketInterface
 
+from form_qc_app.definitions_cache import DefinitionsCache
+
 log = logging.getLogger(__name__)
 
 
@@ -33,6 +35,7 @@ class DefinitionsLoader:
         module_configs: ModuleConfigs,
         project: ProjectAdaptor,
         strict: bool = True,
+        definitions_cache: Optional[DefinitionsCache] = None,
     ):
         """
 
@@ -42,6 +45,7 @@ class DefinitionsLoader:
             module_configs: form ingest configs for the module
             project: Flywheel project adaptor
             strict (optional): Validation mode, defaults to True
+            definitions_cache (optional): cache for parsed definition schemas
         """
 
         self.__s3_bucket = s3_client
@@ -49,6 +53,9 @@ class DefinitionsLoader:
         self.__module_configs = module_configs
         self.__project = project
         self.__strict = strict
+        self.__definitions_cache = (
+            definitions_cache if definitions_cache else DefinitionsCache()
+        )
 
     def __get_s3_prefix(
         self,
@@ -239,16 +246,19 @@ class DefinitionsLoader:
         if not prefix.endswith("/"):
             prefix += "/"
 
-        rule_defs = self.__s3_bucket.read_directory(prefix)
-        if not rule_defs:
+        rule_def_objects = self.__s3_bucket.list_objects(prefix)
+        if not rule_def_objects:
             message = (
                 "Failed to load definitions from the S3 bucket: "
                 f"{self.__s3_bucket.bucket_name}/{prefix}"
             )
             raise DefinitionException(message)
 
-        parser_error = False
-        for key, file_object in rule_defs.items():
+        # select the definition files before reading, so that only the
+        # required files are retrieved from the bucket
+        selected_objects = []
+        for s3_obj_info in rule_def_objects:
+            key = s3_obj_info["Key"]
             filename = key.removeprefix(prefix)
             formname = filename.partition("_")[0]
 
@@ -275,7 +285,22 @@ class DefinitionsLoader:
                 if not optional_forms[formname] and not optional_def:
                     continue  # form not submitted, skip regular schema
 
-            if "Body" not in file_object:
+            selected_objects.append(s3_obj_info)
+
+        # the cache key changes if any of the selected files is modified
+        cache_key = DefinitionsCache.get_cache_key(
+            self.__s3_bucket.bucket_name, selected_objects
+        )
+        cached_schema = self.__definitions_cache.get(cache_key)
+        if cached_schema is not None:
+            log.info("Loaded cached definitions for %s", prefix)
+            return cached_schema
+
+        parser_error = False
+        for key, file_object in self.__s3_bucket.read_objects(
+            s3_obj_info["Key"] for s3_obj_info in selected_objects
+        ):
+            if not file_object or "Body" not in file_object:
                 log.error("Failed to load the definition file: %s", key)
                 parser_error = True
                 continue
@@ -315,6 +340,7 @@ class DefinitionsLoader:
                 "Error(s) occurred while loading definition schemas"
             )
 
+        self.__definitions_cache.put(cache_key, full_schema)
         return full_schema
 
     def get_optional_forms_submission_status(
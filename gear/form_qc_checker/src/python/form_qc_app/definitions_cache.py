@@ -0,0 +1,142 @@
+"""Module for caching the parsed rule definition schemas."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+log = logging.getLogger(__name__)
+
+
+class DefinitionsCache:
+    """Cache of parsed rule definition schemas.
+
+    Entries are keyed by the S3 key and ETag of each definition file
+    included in the schema, so a change to any of the files results in
+    a different key and stale entries are never used. Entries are kept
+    in memory, and also written to the cache directory if one is
+    specified, so that the schemas can be reused across jobs running on
+    the same engine.
+
+    Schemas are stored as JSON, so that a file written to a shared cache
+    directory can only ever be loaded as data.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None) -> None:
+        """
+        Args:
+            cache_dir (optional): directory to persist the cached schemas
+        """
+        self.__cache_dir = cache_dir
+        self.__entries: Dict[str, bytes] = {}
+
+        if self.__cache_dir:
+            try:
+                self.__cache_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as error:
+                log.warning(
+                    "Failed to create definitions cache directory %s: %s",
+                    self.__cache_dir,
+                    error,
+                )
+                self.__cache_dir = None
+
+    @staticmethod
+    def get_cache_key(bucket: str, s3_objects: List[Dict[str, Any]]) -> str:
+        """Compute the cache key for the given definition files.
+
+        Args:
+            bucket: S3 bucket name
+            s3_objects: S3 object info (as returned by list_objects_v2)
+                for the definition files included in the schema
+
+        Returns:
+            str: the cache key
+        """
+        digest = hashlib.sha256(bucket.encode("utf-8"))
+        for s3_obj_info in sorted(s3_objects, key=lambda obj: obj["Key"]):
+            digest.update(b"\0")
+            digest.update(s3_obj_info["Key"].encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(str(s3_obj_info.get("ETag", "")).encode("utf-8"))
+
+        return digest.hexdigest()
+
+    def __cache_file(self, cache_key: str) -> Optional[Path]:
+        if not self.__cache_dir:
+            return None
+
+        return self.__cache_dir / f"{cache_key}.json"
+
+    def get(self, cache_key: str) -> Optional[Dict[str, Mapping]]:
+        """Get the cached schema for the key.
+
+        Args:
+            cache_key: the cache key
+
+        Returns:
+            Dict[str, Mapping] (optional): a copy of the schema, None if not cached
+        """
+        data = self.__entries.get(cache_key)
+
+        cache_file = self.__cache_file(cache_key)
+        if data is None and cache_file and cache_file.exists():
+            try:
+                data = cache_file.read_bytes()
+            except OSError as error:
+                log.warning("Failed to read cached schema %s: %s", cache_file, error)
+
+        if data is None:
+            return None
+
+        try:
+            schema = json.loads(data)
+        except ValueError as error:
+            log.warning("Invalid cached schema %s: %s", cache_key, error)
+            return None
+
+        if not isinstance(schema, dict):
+            log.warning("Invalid cached schema %s: not a JSON object", cache_key)
+            return None
+
+        self.__entries[cache_key] = data
+        return schema
+
+    def put(self, cache_key: str, schema: Dict[str, Mapping]) -> None:
+        """Add the schema to the cache.
+
+        Args:
+            cache_key: the cache key
+            schema: the parsed schema
+        """
+        try:
+            data = json.dumps(schema).encode("utf-8")
+        except (TypeError, ValueError) as error:
+            log.warning("Schema %s cannot be cached: %s", cache_key, error)
+            return
+
+        # values such as dates, or keys other than strings, would not be
+        # read back as the same schema
+        if json.loads(data) != schema:
+            log.warning("Schema %s cannot be cached as JSON", cache_key)
+            return
+
+        self.__entries[cache_key] = data
+
+        cache_file = self.__cache_file(cache_key)
+        if not cache_file:
+            return
+
+        # write to a temp file and rename, so concurrent jobs never read
+        # a partially written file
+        try:
+            with tempfile.NamedTemporaryFile(
+                dir=cache_file.parent, delete=False
+            ) as temp_file:
+                temp_file.write(data)
+            os.replace(temp_file.name, cache_file)
+        except OSError as error:
+            log.warning("Failed to write cached schema %s: %s", cache_file, error)
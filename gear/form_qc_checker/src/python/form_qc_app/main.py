@@ -8,9 +8,12 @@ validator) for validating the inputs.
 import json
 import logging
 from datetime import datetime, timezone
+from io import StringIO
 from json.decoder import JSONDecodeError
+from pathlib import Path
 from typing import Any, Dict, Optional
 
+from botocore.exceptions import ClientError
 from centers.nacc_group import NACCGroup
 from configs.ingest_configs import FormProjectConfigs, ModuleConfigs
 from flywheel import FileEntry
@@ -31,10 +34,12 @@ from nacc_form_validator.quality_check import (
 )
 from outputs.error_writer import ListErrorWriter
 from redcap_api.redcap_connection import REDCapReportConnection
+from rxnav.rxcui_status_store import RxCuiStatusStore
 from s3.s3_bucket import S3BucketInterface
 
 from form_qc_app.datastore import DatastoreHelper
 from form_qc_app.definitions import DefinitionException, DefinitionsLoader
+from form_qc_app.definitions_cache import DefinitionsCache
 from form_qc_app.enrollment import CSVFileProcessor
 from form_qc_app.error_info import REDCapErrorStore
 from form_qc_app.processor import FileProcessor, JSONFileProcessor
@@ -109,6 +114,56 @@ def load_supplement_input(
     return input_data
 
 
+def load_rxcui_store(
+    s3_client: S3BucketInterface, cache_key: Optional[str]
+) -> RxCuiStatusStore:
+    """Create the RxCUI status cache, loads the snapshot from the S3 bucket if
+    a cache key is specified.
+
+    Args:
+        s3_client: boto3 client for QC rules S3 bucket
+        cache_key (optional): S3 key for the RxCUI status snapshot
+
+    Returns:
+        RxCuiStatusStore: the RxCUI status cache
+    """
+    rxcui_store = RxCuiStatusStore()
+    if not cache_key:
+        return rxcui_store
+
+    try:
+        rxcui_store.load(s3_client.read_data(cache_key))
+        log.info("Loaded %d RxCUI statuses from %s", len(rxcui_store), cache_key)
+    except ClientError as error:
+        log.warning("Failed to load RxCUI status snapshot %s: %s", cache_key, error)
+
+    return rxcui_store
+
+
+def save_rxcui_store(
+    s3_client: S3BucketInterface,
+    cache_key: Optional[str],
+    rxcui_store: RxCuiStatusStore,
+) -> None:
+    """Write the RxCUI status snapshot to the S3 bucket, if new statuses were
+    retrieved.
+
+    Args:
+        s3_client: boto3 client for QC rules S3 bucket
+        cache_key (optional): S3 key for the RxCUI status snapshot
+        rxcui_store: the RxCUI status cache
+    """
+    if not cache_key or not rxcui_store.modified:
+        return
+
+    contents = StringIO()
+    rxcui_store.dump(contents)
+    try:
+        s3_client.put_file_object(filename=cache_key, contents=contents.getvalue())
+    except ClientError as error:
+        log.warning("Failed to save RxCUI status snapshot %s: %s", cache_key, error)
+
+
 def run(  # noqa: C901
     *,
     gear_name: str,
@@ -120,6 +175,8 @@ def run(  # noqa: C901
     form_project_configs: FormProjectConfigs,
     redcap_connection: Optional[REDCapReportConnection] = None,
     supplement_input: Optional[InputFileWrapper] = None,
+    rxcui_cache_key: Optional[str] = None,
+    rules_cache_dir: Optional[str] = None,
 ):
     """Starts QC process for input file. Depending on the input file type calls
     the appropriate file processor.
@@ -134,6 +191,8 @@ def run(  # noqa: C901
         form_project_configs: module configurations
         redcap_connection (optional): REDCap project for NACC QC checks
         supplement_input (optional): input file for supplement module
+        rxcui_cache_key (optional): S3 key for the RxCUI status snapshot
+        rules_cache_dir (optional): local directory to cache parsed rule definitions
 
     Raises:
         GearExecutionError if any problem occurs while validating input file
@@ -207,6 +266,9 @@ def run(  # noqa: C901
         module_configs=module_configs,
         project=project_adaptor,
         strict=strict,
+        definitions_cache=DefinitionsCache(
+            cache_dir=Path(rules_cache_dir) if rules_cache_dir else None
+        ),
     )
 
     error_store = REDCapErrorStore(redcap_con=redcap_connection)
@@ -275,6 +337,7 @@ def run(  # noqa: C901
     except ProjectError as error:
         raise GearExecutionError(error) from error
 
+    rxcui_store = load_rxcui_store(s3_client=s3_client, cache_key=rxcui_cache_key)
     datastore = DatastoreHelper(
         pk_field=pk_field,
         proxy=proxy,
@@ -285,7 +348,9 @@ def run(  # noqa: C901
         admin_group=admin_group,
         module_configs=module_configs,
         form_project_configs=form_project_configs,
+        rxcui_store=rxcui_store,
     )
+    datastore.warm_rxcui_cache(schema=schema, input_record=input_data)
 
     try:
         qual_check = QualityCheck(pk_field, schema, strict, datastore)  # type: ignore
@@ -301,6 +366,9 @@ def run(  # noqa: C901
     )
 
     valid = file_processor.process_input(validator=validator)
+    save_rxcui_store(
+        s3_client=s3_client, cache_key=rxcui_cache_key, rxcui_store=rxcui_store
+    )
 
     update_input_file_qc_status(
         gear_context=gear_context,
@@ -154,6 +154,8 @@ class FormQCCheckerVisitor(GearExecutionEnvironment):
             form_project_configs=form_project_configs,
             redcap_connection=self.__redcap_con,
             supplement_input=self.__supplement_input,
+            rxcui_cache_key=context.config.opts.get("rxcui_cache_key"),
+            rules_cache_dir=context.config.opts.get("rules_cache_dir"),
         )
 
 
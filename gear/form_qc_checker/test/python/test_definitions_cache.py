@@ -0,0 +1,67 @@
+"""Tests for DefinitionsCache."""
+
+from datetime import date
+
+from form_qc_app.definitions_cache import DefinitionsCache
+
+OBJECTS = [
+    {"Key": "CLS/3.0/I/rules/b02_rules.json", "ETag": '"bbb"'},
+    {"Key": "CLS/3.0/I/rules/a01_rules.json", "ETag": '"aaa"'},
+]
+
+SCHEMA = {"ptid": {"type": "string", "required": True}, "visitnum": {"type": "integer"}}
+
+
+class TestDefinitionsCache:
+    def test_cache_key(self):
+        key = DefinitionsCache.get_cache_key("rules-bucket", OBJECTS)
+
+        # independent of the listing order
+        assert key == DefinitionsCache.get_cache_key(
+            "rules-bucket", list(reversed(OBJECTS))
+        )
+
+        # changes if any file is modified, added, or removed
+        modified = [OBJECTS[0], {**OBJECTS[1], "ETag": '"ccc"'}]
+        assert key != DefinitionsCache.get_cache_key("rules-bucket", modified)
+        assert key != DefinitionsCache.get_cache_key("rules-bucket", OBJECTS[:1])
+        assert key != DefinitionsCache.get_cache_key("other-bucket", OBJECTS)
+
+    def test_in_memory(self):
+        cache = DefinitionsCache()
+        key = DefinitionsCache.get_cache_key("rules-bucket", OBJECTS)
+        assert cache.get(key) is None
+
+        cache.put(key, SCHEMA)
+        schema = cache.get(key)
+        assert schema == SCHEMA
+
+        # returns a copy, so changes to the schema do not modify the cache
+        schema["ptid"]["nullable"] = True  # type: ignore
+        assert cache.get(key) == SCHEMA
+
+    def test_cache_dir(self, tmp_path):
+        key = DefinitionsCache.get_cache_key("rules-bucket", OBJECTS)
+        DefinitionsCache(cache_dir=tmp_path / "rules").put(key, SCHEMA)
+        assert (tmp_path / "rules" / f"{key}.json").exists()
+
+        # reused by another job on the same engine
+        assert DefinitionsCache(cache_dir=tmp_path / "rules").get(key) == SCHEMA
+
+        # invalid cache file is ignored
+        (tmp_path / "rules" / f"{key}.json").write_bytes(b"invalid")
+        assert DefinitionsCache(cache_dir=tmp_path / "rules").get(key) is None
+
+        # a cache file that is valid JSON but not a schema is ignored
+        (tmp_path / "rules" / f"{key}.json").write_text("[]")
+        assert DefinitionsCache(cache_dir=tmp_path / "rules").get(key) is None
+
+    def test_not_json_schema(self, tmp_path):
+        key = DefinitionsCache.get_cache_key("rules-bucket", OBJECTS)
+        cache = DefinitionsCache(cache_dir=tmp_path / "rules")
+
+        # schemas that would not be read back unchanged are not cached
+        cache.put(key, {"visitdate": {"max": date(2025, 1, 1)}})
+        cache.put(key, {"visitnum": {"allowed": {1: "one"}}})
+        assert cache.get(key) is None
+        assert not (tmp_path / "rules" / f"{key}.json").exists()
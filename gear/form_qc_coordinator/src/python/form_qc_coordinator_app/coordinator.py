@@ -10,9 +10,6 @@ from configs.ingest_configs import (
     FormProjectConfigs,
     SupplementModuleConfigs,
 )
-from error_logging.error_logger import (
-    reset_error_log_metadata_for_gears,
-)
 from error_logging.qc_status_log_creator import (
     FileVisitAnnotator,
     QCStatusLogManager,
@@ -335,6 +332,7 @@ class QCCoordinator:
             status=status,  # type: ignore[arg-type]
             errors=errors,
             reset_qc_metadata="GEAR",
+            reset_gears=reset_gears,
         )
 
         if not error_log_name:
@@ -342,14 +340,6 @@ class QCCoordinator:
                 f"Failed to update error log for visit {ptid}, {visitdate}"
             )
 
-        if reset_gears:
-            # Use the error log name from the update
-            reset_error_log_metadata_for_gears(
-                error_log_name=error_log_name,
-                destination_prj=project_adaptor,
-                gear_names=reset_gears,
-            )
-
     def __update_last_failed_visit(
         self,
         module: str,
@@ -9,10 +9,11 @@ the correct order with proper coordination between pipeline stages.
 import json
 import logging
 import re
+import time
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from json.decoder import JSONDecodeError
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from configs.ingest_configs import (
     FormProjectConfigs,
@@ -30,7 +31,7 @@ from gear_execution.gear_trigger import (
     trigger_gear,
 )
 from inputs.parameter_store import URLParameter
-from jobs.job_poll import JobPoll
+from jobs.job_poll import DEFAULT_BACKOFF, JobPoll
 from keys.keys import DefaultValues
 from nacc_common.qc_report import QCTransformerError
 from notifications.email import EmailClient
@@ -41,6 +42,10 @@ from form_scheduler_app.event_accumulator import EventAccumulator
 
 log = logging.getLogger(__name__)
 
+# default max number of subject pipelines in flight when processing a
+# queue by subject
+DEFAULT_MAX_SUBJECT_PIPELINES = 50
+
 
 def get_subject_from_input_file(filename: str, pipeline: PipelineType) -> Optional[str]:
     """Extract subject ID from the input filename."""
@@ -471,6 +476,7 @@ class FormSchedulerQueue:
         form_configs: Optional[FormProjectConfigs] = None,
         email_client: Optional[EmailClient] = None,
         portal_url: Optional[URLParameter] = None,
+        max_subject_pipelines: int = DEFAULT_MAX_SUBJECT_PIPELINES,
     ) -> None:
         """Initializer.
 
@@ -483,6 +489,8 @@ class FormSchedulerQueue:
                 module-specific date field for visit extraction
             email_client: EmailClient to send emails from
             portal_url: The portal URL
+            max_subject_pipelines: max number of subject pipelines in flight
+                when processing finalization/deletion queues
         """
         self.__proxy = proxy
         self.__project = project
@@ -492,6 +500,7 @@ class FormSchedulerQueue:
         self.__email_client = email_client
         self.__portal_url = portal_url
         self.__pipeline_queues: Dict[str, PipelineQueue] = {}
+        self.__max_subject_pipelines = max(1, max_subject_pipelines)
 
     def queue_files_for_pipeline(self, pipeline: Pipeline) -> int:
         """Queue the matching files for the given pipeline.
@@ -826,52 +835,83 @@ class FormSchedulerQueue:
                     pipeline_name=pipeline.name,
                 )
 
-    def _trigger_batch(
+    def _trigger_file(
         self,
         *,
-        batch: List[FileEntry],
+        file: FileEntry,
         pipeline: Pipeline,
         gear_input_info: Optional[Dict[str, list]],
         gear_inputs: Dict[str, FileEntry],
-    ):
-        """Trigger the starting gear for each file in a batch.
+    ) -> Optional[str]:
+        """Trigger the starting gear for a file.
 
-        Each file gets its own copy of gear_inputs so the 'matched' entry
+        The file gets its own copy of gear_inputs so the 'matched' entry
         can be set independently without affecting other files.
 
         Args:
-            batch: files to trigger
+            file: file to trigger
             pipeline: pipeline configs
             gear_input_info: gear input configuration by locator type
             gear_inputs: pre-populated fixed/module gear inputs (not mutated)
+
+        Returns:
+            Optional[str]: the Flywheel subject ID of the gear destination
         """
-        for file in batch:
-            log.info(
-                "Triggering %s for %s",
-                pipeline.starting_gear.gear_name,
-                file.name,
-            )
-            file_gear_inputs = dict(gear_inputs)
-            if gear_input_info and "matched" in gear_input_info:
-                set_gear_inputs(
-                    project=self.__project,
-                    gear_name=pipeline.starting_gear.gear_name,
-                    locator="matched",
-                    gear_inputs_list=gear_input_info["matched"],
-                    gear_inputs=file_gear_inputs,
-                    matched_file=file,
-                )
-            destination = self.__proxy.get_container_by_id(
-                file.parent_ref.id  # type: ignore
-            )
-            trigger_gear(
-                proxy=self.__proxy,
+        log.info(
+            "Triggering %s for %s",
+            pipeline.starting_gear.gear_name,
+            file.name,
+        )
+        file_gear_inputs = dict(gear_inputs)
+        if gear_input_info and "matched" in gear_input_info:
+            set_gear_inputs(
+                project=self.__project,
                 gear_name=pipeline.starting_gear.gear_name,
-                log_args=False,
-                inputs=file_gear_inputs,
-                config=pipeline.starting_gear.configs.model_dump(),
-                destination=destination,
+                locator="matched",
+                gear_inputs_list=gear_input_info["matched"],
+                gear_inputs=file_gear_inputs,
+                matched_file=file,
             )
+        destination = self.__proxy.get_container_by_id(
+            file.parent_ref.id  # type: ignore
+        )
+        trigger_gear(
+            proxy=self.__proxy,
+            gear_name=pipeline.starting_gear.gear_name,
+            log_args=False,
+            inputs=file_gear_inputs,
+            config=pipeline.starting_gear.configs.model_dump(),
+            destination=destination,
+        )
+
+        parents = getattr(destination, "parents", None)
+        subject_id = getattr(parents, "subject", None)
+        return str(subject_id) if subject_id else None
+
+    def _find_active_subjects(
+        self, *, job_search: str, subject_ids: List[str]
+    ) -> Set[str]:
+        """Find the subjects with running/pending pipeline jobs, with a single
+        job search for all given subjects.
+
+        Args:
+            job_search: search string for running/pending pipeline jobs
+            subject_ids: Flywheel subject IDs to check
+
+        Returns:
+            Set[str]: IDs of the subjects with running/pending jobs
+        """
+        if not subject_ids:
+            return set()
+
+        jobs = self.__proxy.find_jobs(
+            f"{job_search},parents.subject=|[{','.join(subject_ids)}]"
+        )
+        return {
+            str(job.parents.subject)
+            for job in jobs
+            if job.parents and job.parents.subject
+        }
 
     def _capture_events_and_notify(
         self,
@@ -927,20 +967,23 @@ class FormSchedulerQueue:
             Callable[[FileEntry, PipelineType], None]
         ] = None,
     ):
-        """Process a module subqueue grouped by subject in parallel batches.
+        """Process a module subqueue grouped by subject using a sliding
+        window of subject pipelines.
 
         Files that belong to different subjects are independent and can be
         processed concurrently. Within a subject, files are processed in
         order (oldest first, as sorted by sort_subqueues).
 
-        For each round:
-        1. One file per subject is popped into a batch
-        2. All files in the batch have their queue tags removed and are
-           reloaded
-        3. The starting gear is triggered for every file in the batch
-           (no waiting between triggers)
-        4. wait_for_pipeline blocks until all batch jobs complete
-        5. Events are captured and emails sent for each file in the batch
+        Up to max_subject_pipelines subjects are in flight at a time:
+        1. The next file is popped for each subject that is not in flight,
+           its queue tags removed, and the starting gear triggered
+        2. The in-flight subjects are polled with a single job search, a
+           subject's pipeline is complete when it has no running/pending
+           pipeline jobs
+        3. For each completed subject, events are captured and emails
+           sent, and the subject's next file is dispatched in the next
+           iteration without waiting for the other subjects
+        4. wait_for_pipeline blocks until all pipeline jobs complete
 
         Args:
             pipeline: pipeline configs
@@ -974,35 +1017,63 @@ class FormSchedulerQueue:
         # Clear the original subqueue so pipeline_queue.empty() is accurate
         subqueue.clear()
 
-        while any(subject_queues.values()):
-            # Collect one file per subject for this round
-            batch: List[FileEntry] = []
-            for files in subject_queues.values():
-                if files:
-                    file = files.pop(0)
-                    for tag in pipeline_queue.tags:
-                        file.delete_tag(tag)
-                    file = file.reload()
-                    batch.append(file)
-
-            # Trigger all files in the batch before waiting
-            self._trigger_batch(
-                batch=batch,
-                pipeline=pipeline,
-                gear_input_info=gear_input_info,
-                gear_inputs=gear_inputs,
-            )
+        # in-flight files and Flywheel subject IDs keyed by subject
+        in_flight: Dict[str, Tuple[FileEntry, Optional[str]]] = {}
+        intervals = DEFAULT_BACKOFF.intervals()
+        while in_flight or any(subject_queues.values()):
+            # Dispatch the next file for the subjects not in flight
+            for subject, files in subject_queues.items():
+                if len(in_flight) >= self.__max_subject_pipelines:
+                    break
+                if subject in in_flight or not files:
+                    continue
 
-            # Wait for all batch jobs to complete before the next round
-            JobPoll.wait_for_pipeline(self.__proxy, job_search)
+                file = files.pop(0)
+                for tag in pipeline_queue.tags:
+                    file.delete_tag(tag)
+                file = file.reload()
+                in_flight[subject] = (
+                    file,
+                    self._trigger_file(
+                        file=file,
+                        pipeline=pipeline,
+                        gear_input_info=gear_input_info,
+                        gear_inputs=gear_inputs,
+                    ),
+                )
+
+            time.sleep(next(intervals))
+            active_subjects = self._find_active_subjects(
+                job_search=job_search,
+                subject_ids=[
+                    subject_id for _, subject_id in in_flight.values() if subject_id
+                ],
+            )
+            # if the destination subject is unknown, the file's pipeline
+            # is complete only when no pipeline jobs are running
+            pipeline_running = any(
+                subject_id is None for _, subject_id in in_flight.values()
+            ) and bool(self.__proxy.find_job(job_search))
+            completed = [
+                subject
+                for subject, (_, subject_id) in in_flight.items()
+                if (subject_id is None and not pipeline_running)
+                or (subject_id is not None and subject_id not in active_subjects)
+            ]
+            if not completed:
+                continue
 
-            # Capture events and send emails for the completed batch
+            # Capture events and send emails for the completed subjects
             self._capture_events_and_notify(
-                batch=batch,
+                batch=[in_flight.pop(subject)[0] for subject in completed],
                 pipeline=pipeline,
                 notify_user=notify_user,
                 event_capture_callback=event_capture_callback,
             )
+            intervals = DEFAULT_BACKOFF.intervals()
+
+        # Ensure no pipeline jobs are still running before the next module
+        JobPoll.wait_for_pipeline(self.__proxy, job_search)
 
 
 class FormSchedulerError(Exception):
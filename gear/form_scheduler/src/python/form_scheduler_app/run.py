@@ -33,6 +33,7 @@ from pydantic import ValidationError
 from s3.s3_bucket import S3BucketInterface
 
 from form_scheduler_app.form_scheduler_queue import (
+    DEFAULT_MAX_SUBJECT_PIPELINES,
     FormSchedulerError,
     FormSchedulerQueue,
 )
@@ -53,6 +54,7 @@ class FormSchedulerVisitor(GearExecutionEnvironment):
         form_configs_input: Optional[InputFileWrapper] = None,
         source_email: Optional[str] = None,
         portal_url: Optional[URLParameter] = None,
+        max_subject_pipelines: int = DEFAULT_MAX_SUBJECT_PIPELINES,
     ):
         super().__init__(client=client)
 
@@ -62,6 +64,7 @@ class FormSchedulerVisitor(GearExecutionEnvironment):
         self.__portal_url = portal_url
         self.__event_bucket = event_bucket
         self.__event_environment = event_environment
+        self.__max_subject_pipelines = max_subject_pipelines
 
     @classmethod
     def create(
@@ -109,6 +112,9 @@ class FormSchedulerVisitor(GearExecutionEnvironment):
 
         event_bucket_name = options.get("event_bucket", "submission-events")
         event_environment = options.get("event_environment", "prod")
+        max_subject_pipelines = options.get(
+            "max_subject_pipelines", DEFAULT_MAX_SUBJECT_PIPELINES
+        )
 
         try:
             event_bucket = S3BucketInterface.create_from_environment(event_bucket_name)
@@ -126,6 +132,7 @@ class FormSchedulerVisitor(GearExecutionEnvironment):
             form_configs_input=form_configs_input,
             source_email=source_email,
             portal_url=portal_url,
+            max_subject_pipelines=max_subject_pipelines,
         )
 
     def run(self, context: GearContext) -> None:
@@ -210,6 +217,7 @@ class FormSchedulerVisitor(GearExecutionEnvironment):
             form_configs=form_configs,
             email_client=email_client,
             portal_url=self.__portal_url,
+            max_subject_pipelines=self.__max_subject_pipelines,
         )
 
         try:
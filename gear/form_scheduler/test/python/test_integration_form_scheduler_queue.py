@@ -1098,6 +1098,11 @@ class TestSubjectParallelProcessing:
     def mock_event_capture(self) -> MockVisitEventCapture:
         return MockVisitEventCapture()
 
+    @pytest.fixture(autouse=True)
+    def mock_sleep(self):
+        with patch("form_scheduler_app.form_scheduler_queue.time.sleep") as sleep:
+            yield sleep
+
     @pytest.fixture
     def finalization_pipeline_config(self) -> PipelineConfigs:
         pipeline = Pipeline(
@@ -1254,7 +1259,7 @@ class TestSubjectParallelProcessing:
         finalization_pipeline_config: PipelineConfigs,
     ):
         """Two finalization files from the same subject must be triggered in
-        separate rounds: wait → trigger → wait → trigger → wait."""
+        order, the second only after the first pipeline completes."""
         file_1 = create_mock_json_file_for_queue(
             name="NACC100010_FORMS-VISIT-1F_UDS.json",
             ptid="adrc1010",
@@ -1289,6 +1294,12 @@ class TestSubjectParallelProcessing:
         )
 
         call_order, trigger_se, wait_se = self._make_call_recorder()
+        triggered: List[str] = []
+
+        def record_trigger(*args, **kwargs):
+            trigger_se()
+            triggered.append(kwargs["inputs"]["json_file"].name)
+
         dv_patch, gf_patch = self._setup_finalization_dataview(
             project,
             [(file_1, "file-id-1", "UDS"), (file_2, "file-id-2", "UDS")],
@@ -1297,7 +1308,7 @@ class TestSubjectParallelProcessing:
         with (
             patch(
                 "form_scheduler_app.form_scheduler_queue.trigger_gear",
-                side_effect=trigger_se,
+                side_effect=record_trigger,
             ),
             patch(
                 "form_scheduler_app.form_scheduler_queue.JobPoll.wait_for_pipeline",
@@ -1311,8 +1322,10 @@ class TestSubjectParallelProcessing:
             )
             scheduler.process_pipeline_queues()
 
-        # Pre-module wait, then each file in its own round (same subject)
-        assert call_order == ["wait", "trigger", "wait", "trigger", "wait"]
+        # Pre-module wait, the second file is triggered only after the
+        # subject's first pipeline completes, then one final wait
+        assert call_order == ["wait", "trigger", "trigger", "wait"]
+        assert triggered == [file_1.name, file_2.name]
 
     def test_deletion_different_subjects_triggered_in_parallel(
         self,
@@ -1367,3 +1380,108 @@ class TestSubjectParallelProcessing:
 
         # Pre-module wait, then both subjects triggered together, then one wait
         assert call_order == ["wait", "trigger", "trigger", "wait"]
+
+    def test_finalization_slow_subject_does_not_block_others(
+        self,
+        mock_proxy: MockFlywheelProxy,
+        mock_event_capture: MockVisitEventCapture,
+        finalization_pipeline_config: PipelineConfigs,
+    ):
+        """Subject A's files are dispatched as soon as its previous pipeline
+        completes, while subject B's pipeline is still running. At most
+        max_subject_pipelines subjects are in flight."""
+        files_a = [
+            create_mock_json_file_for_queue(
+                name=f"NACC100010_FORMS-VISIT-{visitnum}_UDS.json",
+                ptid="adrc1010",
+                visitdate=f"2025-0{index + 1}-01",
+                visitnum=visitnum,
+                module="UDS",
+                packet="F",
+                parent_id="acquisition-a",
+                tags=["submission-completed"],
+            )
+            for index, visitnum in enumerate(["1F", "2F", "3F"])
+        ]
+        files_b = [
+            create_mock_json_file_for_queue(
+                name=f"NACC1000{subject}_FORMS-VISIT-1F_UDS.json",
+                ptid=f"adrc10{subject}",
+                visitdate="2025-01-01",
+                visitnum="1F",
+                module="UDS",
+                packet="I",
+                parent_id=f"acquisition-{subject}",
+                tags=["submission-completed"],
+            )
+            for subject in ["11", "12"]
+        ]
+
+        project = MockProjectAdaptorForQueue(
+            label="ingest-form-alpha", project_id="project-123"
+        )
+        for acquisition_id, subject_id in [
+            ("acquisition-a", "subject-a"),
+            ("acquisition-11", "subject-11"),
+            ("acquisition-12", "subject-12"),
+        ]:
+            mock_acquisition = MagicMock()
+            mock_acquisition.id = acquisition_id
+            mock_acquisition.parents.subject = subject_id
+            mock_proxy.add_container(acquisition_id, mock_acquisition)
+
+        scheduler = FormSchedulerQueue(
+            proxy=mock_proxy,
+            project=project,
+            pipeline_configs=finalization_pipeline_config,
+            event_capture=mock_event_capture,
+            max_subject_pipelines=2,
+        )
+
+        # subject-11 pipeline runs for 4 polls, others complete in one poll
+        polls: List[str] = []
+        triggered: List[str] = []
+
+        def find_jobs(search_str: str):
+            polls.append(search_str)
+            if len(polls) > 4 or "subject-11" not in search_str:
+                return []
+            job = MagicMock()
+            job.parents.subject = "subject-11"
+            return [job]
+
+        dv_patch, gf_patch = self._setup_finalization_dataview(
+            project,
+            [
+                (file, f"file-id-{index}", "UDS")
+                for index, file in enumerate([*files_a, *files_b])
+            ],
+        )
+
+        with (
+            patch(
+                "form_scheduler_app.form_scheduler_queue.trigger_gear",
+                side_effect=lambda *a, **kw: triggered.append(
+                    kw["inputs"]["json_file"].name
+                ),
+            ),
+            patch("form_scheduler_app.form_scheduler_queue.JobPoll.wait_for_pipeline"),
+            patch.object(mock_proxy, "find_jobs", side_effect=find_jobs),
+            dv_patch,
+            gf_patch,
+        ):
+            scheduler.queue_files_for_pipeline(
+                finalization_pipeline_config.pipelines[0]
+            )
+            scheduler.process_pipeline_queues()
+
+        # all of subject A's files are processed, in order, while the
+        # subject-11 pipeline is still running; subject-12 waits for a slot
+        assert triggered == [
+            files_a[0].name,
+            files_b[0].name,
+            files_a[1].name,
+            files_a[2].name,
+            files_b[1].name,
+        ]
+        assert all("subject-12" not in search for search in polls[:3])
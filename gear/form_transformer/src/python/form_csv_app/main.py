@@ -2,6 +2,7 @@
 
 import logging
 from collections import defaultdict
+from csv import DictReader
 from datetime import datetime
 from enum import Enum
 from typing import Any, DefaultDict, Dict, List, MutableMapping, Optional, TextIO
@@ -942,6 +943,24 @@ class CSVTransformVisitor(CSVVisitor):
         )
 
 
+def get_subject_labels(input_file: TextIO, id_column: str) -> List[str]:
+    """Get the unique subject labels in the input file, rewinds the file
+    after reading.
+
+    Args:
+        input_file: the input file
+        id_column: the subject identifier column
+
+    Returns:
+        List[str]: list of subject labels in the order they appear
+    """
+    reader = DictReader(input_file)
+    subject_lbls = [row[id_column] for row in reader if row.get(id_column)]
+    input_file.seek(0)
+
+    return list(dict.fromkeys(subject_lbls))
+
+
 def notify_upload_errors():
     # TODO: send an email to nacc_dev@uw.edu
     pass
@@ -982,6 +1001,13 @@ def run(
     Returns:
         bool: True if transformation/upload successful
     """
+    # load the subjects and existing visits for all subjects in the file in
+    # batches rather than querying per visit in the checks and upload, the
+    # visit prefetch resolves subjects from the subject index loaded here
+    subject_lbls = get_subject_labels(input_file=input_file, id_column=id_column)
+    destination.load_subjects(subject_lbls)
+    preprocessor.prefetch_visits(subject_lbls=subject_lbls)
+
     visitor = CSVTransformVisitor(
         id_column=id_column,
         module=module,
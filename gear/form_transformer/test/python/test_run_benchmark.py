@@ -0,0 +1,131 @@
+"""Benchmarks the form transformer run against a fake Flywheel project."""
+
+import logging
+from csv import DictWriter
+from io import StringIO
+
+import pytest
+from configs.ingest_configs import FormProjectConfigs
+from datastore.forms_store import FormsStore
+from flywheel_adaptor.flywheel_proxy import FlywheelProxy, ProjectAdaptor
+from flywheel_adaptor.subject_index import SUBJECT_INDEXES
+from form_csv_app.main import run
+from keys.keys import DefaultValues
+from nacc_common.field_names import FieldNames
+from outputs.error_writer import ListErrorWriter
+from preprocess.preprocessor import FormPreprocessor
+from test_mocks.benchmark import BenchmarkThresholds, run_benchmark, scaled
+from test_mocks.fake_flywheel import FakeFlywheel, populate_form_project
+from test_mocks.mock_configs import uds_ingest_configs
+from transform.transformer import TransformationSchema, TransformerFactory
+
+log = logging.getLogger(__name__)
+
+NUM_SUBJECTS = 2000
+VISITS_PER_SUBJECT = 5
+
+# the preprocessing checks query the subject and its visits several times
+# per row, these must be answered from the subjects and visits prefetched
+# for the file, leaving the subject lookup for the upload
+RUN_THRESHOLDS = BenchmarkThresholds(
+    max_requests_per_row=20,
+    max_calls_per_row={
+        "ProjectAdaptor.find_subject": 1,
+        "ProjectAdaptor.upload_file_contents": 1,
+        "FlywheelProxy.get_matching_acquisition_files_info": 0.1,
+    },
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_subject_indexes():
+    SUBJECT_INDEXES.clear()
+    yield
+    SUBJECT_INDEXES.clear()
+
+
+def create_input_file(num_rows: int, num_subjects: int) -> StringIO:
+    """Creates an input CSV with a visit per row, every other row an initial
+    visit for a subject that is not in the project, and the others the next
+    followup visit for a subject in the project."""
+    rows = []
+    for row in range(num_rows):
+        existing = row % 2 == 0
+        subject_num = row if existing else num_subjects + row
+        rows.append(
+            {
+                FieldNames.NACCID: f"NACC{subject_num:06d}",
+                FieldNames.MODULE: "uds",
+                FieldNames.FORMVER: "4.0",
+                FieldNames.VISITNUM: str(VISITS_PER_SUBJECT + 1) if existing else "1",
+                FieldNames.PACKET: "F" if existing else "I",
+                FieldNames.PTID: str(subject_num + 1000),
+                FieldNames.ADCID: 0,
+                "visitdate": "2025-01-01",
+                "modea1a": 0,
+                "modea2": 0,
+                "modeb1": 0,
+                "modeb3": 0,
+                "modeb5": 0,
+                "modeb6": 0,
+                "modeb7": 0,
+            }
+        )
+
+    input_file = StringIO()
+    writer = DictWriter(input_file, fieldnames=list(rows[0].keys()))
+    writer.writeheader()
+    writer.writerows(rows)
+    input_file.seek(0)
+    return input_file
+
+
+class TestRunBenchmark:
+    def test_uds_run(self):
+        client = FakeFlywheel()
+        fake_project = client.add_project(group="adrc", label="ingest-form")
+        num_subjects = scaled(NUM_SUBJECTS)
+        populate_form_project(
+            fake_project,
+            num_subjects=num_subjects,
+            visits_per_subject=VISITS_PER_SUBJECT,
+        )
+        proxy = FlywheelProxy(client=client, dry_run=False)  # type: ignore
+        destination = ProjectAdaptor(project=fake_project, proxy=proxy)  # type: ignore
+
+        num_rows = scaled(100)
+        input_file = create_input_file(num_rows, num_subjects)
+        module_configs = uds_ingest_configs()
+        error_writer = ListErrorWriter(container_id="id", fw_path="path")
+        preprocessor = FormPreprocessor(
+            form_configs=FormProjectConfigs(
+                primary_key=FieldNames.NACCID,
+                accepted_modules=["UDS"],
+                module_configs={"UDS": module_configs},
+            ),
+            forms_store=FormsStore(ingest_project=destination),
+            module=DefaultValues.UDS_MODULE,
+            module_configs=module_configs,
+            error_writer=error_writer,
+        )
+
+        def run_transformer() -> None:
+            assert run(
+                input_file=input_file,
+                id_column=FieldNames.NACCID,
+                module=DefaultValues.UDS_MODULE,
+                destination=destination,
+                transformer_factory=TransformerFactory(TransformationSchema()),
+                preprocessor=preprocessor,
+                module_configs=module_configs,
+                error_writer=error_writer,
+                gear_name="form-transformer",
+            )
+
+        result = run_benchmark(
+            "form-transformer-uds", run_transformer, client=client, rows=num_rows
+        )
+        log.info(result.report())
+
+        assert not RUN_THRESHOLDS.check(result)
+        assert result.requests["add_subject"] == num_rows // 2
@@ -112,6 +112,9 @@ def run(
     for study in study_list:
         visitor.visit_study(study)
 
+    # ingest projects may have changed, so update the pipeline registry
+    admin_group.update_pipeline_registry()
+
     if seeder and seeder.failure_count > 0:
         log.warning(
             "Authorization hierarchy seeding completed with %d failure(s)",
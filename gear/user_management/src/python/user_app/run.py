@@ -27,6 +27,13 @@ from notifications.email import EmailClient, EmailSendError, create_ses_client
 from pydantic import ValidationError
 from redcap_api.redcap_repository import REDCapParametersRepository
 from users.authorizations import AuthMap
+from users.concurrency import (
+    AUTHORIZATION,
+    COMANAGE,
+    BackendLimiter,
+    ConcurrencyConfig,
+    limit_client,
+)
 from users.csv_export import export_errors_to_csv
 from users.domain_config import (
     DomainRelationshipConfig,
@@ -48,6 +55,8 @@ from user_app.main import run
 
 log = logging.getLogger(__name__)
 
+DEFAULT_CONCURRENT_USERS = 4
+
 
 class UserManagementVisitor(GearExecutionEnvironment):
     """Defines the user management gear."""
@@ -68,6 +77,7 @@ class UserManagementVisitor(GearExecutionEnvironment):
         domain_config_filepath: Optional[Path] = None,
         parameter_store: Optional[ParameterStore] = None,
         authorization_path: Optional[str] = None,
+        max_concurrent_users: int = 1,
     ):
         super().__init__(client=client)
         self.__admin_id = admin_id
@@ -83,6 +93,7 @@ class UserManagementVisitor(GearExecutionEnvironment):
         self.__domain_config_filepath = domain_config_filepath
         self.__parameter_store = parameter_store
         self.__authorization_path = authorization_path
+        self.__max_concurrent_users = max_concurrent_users
 
     @classmethod
     def create(
@@ -160,6 +171,9 @@ class UserManagementVisitor(GearExecutionEnvironment):
             domain_config_filepath=domain_config_filepath,
             parameter_store=parameter_store,
             authorization_path=context.config.opts.get("authorization_path"),
+            max_concurrent_users=context.config.opts.get(
+                "max_concurrent_users", DEFAULT_CONCURRENT_USERS
+            ),
         )
 
     @staticmethod
@@ -288,8 +302,14 @@ class UserManagementVisitor(GearExecutionEnvironment):
 
         collector = UserEventCollector()
 
+        # Users are processed concurrently, with separate limits on the calls
+        # in flight to COmanage and the Authorization API
+        limiter = BackendLimiter(
+            ConcurrencyConfig(max_workers=self.__max_concurrent_users)
+        )
+
         # Create authorization sync service if configured
-        authorization_sync = self.__create_authorization_sync(collector)
+        authorization_sync = self.__create_authorization_sync(collector, limiter)
 
         with ApiClient(configuration=self.__comanage_config) as comanage_client:
             admin_group = self.admin_group(admin_id=self.__admin_id)
@@ -314,6 +334,10 @@ class UserManagementVisitor(GearExecutionEnvironment):
             )
 
             try:
+                # Diff all users against one snapshot of the current grants
+                if authorization_sync is not None:
+                    authorization_sync.start_bulk_sync()
+
                 run(
                     user_queue=user_queue,
                     user_process=UserProcess(
@@ -328,7 +352,9 @@ class UserManagementVisitor(GearExecutionEnvironment):
                             ),
                             proxy=self.proxy,
                             registry=UserRegistry(
-                                api_instance=DefaultApi(comanage_client),
+                                api_instance=limit_client(
+                                    DefaultApi(comanage_client), COMANAGE, limiter
+                                ),
                                 coid=self.__comanage_coid,
                                 name_normalizer=normalize_person_name,
                                 domain_config=domain_config,
@@ -339,6 +365,7 @@ class UserManagementVisitor(GearExecutionEnvironment):
                             authorization_sync=authorization_sync,
                         ),
                         collector=collector,
+                        max_workers=self.__max_concurrent_users,
                     ),
                 )
             except RegistryError as error:
@@ -346,6 +373,9 @@ class UserManagementVisitor(GearExecutionEnvironment):
                 raise GearExecutionError(
                     f"Critical service failure - User registry error: {error}"
                 ) from error
+            finally:
+                if authorization_sync is not None:
+                    authorization_sync.finish_bulk_sync()
 
         # Send REDCap disable notification if any roles were removed
         self.__send_redcap_disable_notification(
@@ -396,6 +426,7 @@ class UserManagementVisitor(GearExecutionEnvironment):
     def __create_authorization_sync(
         self,
         collector: UserEventCollector,
+        limiter: BackendLimiter,
     ) -> Optional[AuthorizationSyncService]:
         """Create AuthorizationSyncService if configured.
 
@@ -404,6 +435,7 @@ class UserManagementVisitor(GearExecutionEnvironment):
 
         Args:
             collector: Event collector for the sync service.
+            limiter: Limiter for the calls to the Authorization API.
 
         Returns:
             AuthorizationSyncService if configured, None otherwise.
@@ -417,7 +449,11 @@ class UserManagementVisitor(GearExecutionEnvironment):
 
         try:
             url_param = self.__parameter_store.get_url(self.__authorization_path)
-            client = create_authorization_client(base_url=url_param["url"])
+            client = limit_client(
+                create_authorization_client(base_url=url_param["url"]),
+                AUTHORIZATION,
+                limiter,
+            )
             service = AuthorizationSyncService(client=client, collector=collector)
             service.validate_model()
             return service
@@ -1,5 +1,7 @@
 from typing import Any
 
+from flywheel.models.container_parents import ContainerParents
+
 
 class Job:
 
@@ -15,6 +17,10 @@ class Job:
     def retried(self) -> str:
         ...
 
+    @property
+    def parents(self) -> ContainerParents:
+        ...
+
     def __getitem__(self, key: str) -> Any:
         ...
 